@@ -8,15 +8,17 @@ event monitoring for async operations.
 
 import asyncio
 import hashlib
-import json
+import multiprocessing
 from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
+from datetime import date, datetime, timedelta, timezone
 from enum import Enum
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
 from uuid import uuid4
 
+from fapilog.core.canonical import canonical_json
 from fapilog.core.errors import (
     AsyncErrorContext,
     ErrorCategory,
@@ -25,6 +27,22 @@ from fapilog.core.errors import (
 )
 from pydantic import BaseModel, Field, ValidationError
 
+from .checkpoint import (
+    CHECKPOINT_FILENAME,
+    ChainCheckpoint,
+    ChainRun,
+    SegmentScan,
+    anchor_intact,
+    scan_segment,
+)
+from .index import (
+    AuditFileIndex,
+    IndexFields,
+    IndexRow,
+    index_fields,
+    timestamp_key,
+)
+
 
 class AuditEventType(str, Enum):
     """Types of audit events for compliance tracking."""
@@ -197,6 +215,9 @@ class AuditTrail:
         self,
         policy: CompliancePolicy | None = None,
         storage_path: Path | None = None,
+        *,
+        batch_max_size: int = 256,
+        checkpoint_key: bytes | None = None,
     ) -> None:
         """
         Initialize audit trail system.
@@ -204,9 +225,14 @@ class AuditTrail:
         Args:
             policy: Compliance policy configuration
             storage_path: Path for audit log storage
+            batch_max_size: Maximum events stored per writer wakeup
+            checkpoint_key: HMAC key for signing chain verification
+                checkpoints; enables incremental verify_chain_from_storage
         """
         self.policy = policy or CompliancePolicy()
         self.storage_path = storage_path or Path("audit_logs")
+        self._batch_max_size = max(1, batch_max_size)
+        self._checkpoint_key = checkpoint_key
 
         # Warn if encryption requested but not implemented
         if self.policy.encrypt_audit_logs:
@@ -221,7 +247,8 @@ class AuditTrail:
             )
 
         # Event queue for async processing
-        self._event_queue: asyncio.Queue[AuditEvent] = asyncio.Queue()
+        # None is a wake-up sentinel put by stop(), never an event
+        self._event_queue: asyncio.Queue[AuditEvent | None] = asyncio.Queue()
         self._processing_task: asyncio.Task | None = None
 
         # Statistics and monitoring
@@ -233,9 +260,16 @@ class AuditTrail:
         self._lock = asyncio.Lock()
         self._stopping = False
 
-        # Integrity chain
+        # Integrity chain; _write_lock keeps file order equal to sequence order
         self._seq_counter: int = 0
         self._last_hash: str | None = None
+        self._write_lock = asyncio.Lock()
+
+        # Day file and its query index kept open between batches; both are
+        # reopened at the date boundary
+        self._file: BinaryIO | None = None
+        self._file_path: Path | None = None
+        self._index: AuditFileIndex | None = None
 
         # Initialize storage
         self._init_storage()
@@ -270,34 +304,54 @@ class AuditTrail:
             self._processing_task = asyncio.create_task(self._process_events())
 
     async def stop(self) -> None:
-        """Stop audit trail processing."""
+        """Stop audit trail processing.
+
+        The processing loop is asked to finish rather than cancelled, so a
+        batch write running in a worker thread completes before the day
+        file is closed.
+        """
         self._stopping = True
-        # Drain queued events before cancellation
-        await self.drain()
-        if self._processing_task and not self._processing_task.done():
-            self._processing_task.cancel()
+        task = self._processing_task
+        if task is not None and not task.done():
+            # Wake the loop if it is waiting on an empty queue
+            await self._event_queue.put(None)
             try:
-                # Wait for cancellation with timeout to prevent hanging
-                await asyncio.wait_for(self._processing_task, timeout=0.5)
-            except (asyncio.CancelledError, asyncio.TimeoutError):
+                await task
+            except Exception:
                 pass
         self._processing_task = None
+        # Events queued after the loop exited, or with no loop running
+        await self.drain()
         self._stopping = False
+        async with self._write_lock:
+            await asyncio.to_thread(self._close_file)
 
     async def drain(self) -> None:
         """Flush any queued audit events to storage."""
         while True:
-            try:
-                event = self._event_queue.get_nowait()
-            except asyncio.QueueEmpty:
+            batch = self._take_batch()
+            if not batch:
                 break
             try:
-                await self._store_event(event)
-                await self._check_compliance_alerts(event)
+                await self._store_batch(batch)
+                for event in batch:
+                    await self._check_compliance_alerts(event)
             except Exception:
                 # Contain drain failures
                 pass
 
+    def _take_batch(self, first: AuditEvent | None = None) -> list[AuditEvent]:
+        """Collect up to ``batch_max_size`` queued events without waiting."""
+        batch = [first] if first is not None else []
+        while len(batch) < self._batch_max_size:
+            try:
+                event = self._event_queue.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+            if event is not None:
+                batch.append(event)
+        return batch
+
     async def log_event(
         self,
         event_type: AuditEventType,
@@ -510,21 +564,21 @@ class AuditTrail:
         )
 
     async def _process_events(self) -> None:
-        """Process audit events from the queue."""
+        """Process audit events from the queue in batches."""
         while True:
             try:
                 if self._stopping and self._event_queue.empty():
                     break
-                # Get event from queue with shorter timeout for CI compatibility
-                event = await asyncio.wait_for(self._event_queue.get(), timeout=0.1)
+                # Wake on the first event, then take whatever else is queued
+                first = await self._event_queue.get()
+                if first is None:
+                    continue
+                batch = self._take_batch(first)
 
-                # Process the event
-                await self._store_event(event)
-                await self._check_compliance_alerts(event)
+                await self._store_batch(batch)
+                for event in batch:
+                    await self._check_compliance_alerts(event)
 
-            except asyncio.TimeoutError:
-                # Check if we should continue or exit
-                continue
             except asyncio.CancelledError:
                 # Properly handle cancellation
                 break
@@ -533,36 +587,99 @@ class AuditTrail:
                 pass
 
     async def _store_event(self, event: AuditEvent) -> None:
-        """Store audit event to configured storage."""
+        """Store a single audit event to configured storage."""
+        await self._store_batch([event])
+
+    async def _store_batch(self, events: list[AuditEvent]) -> None:
+        """Chain, serialize and append a batch of events with one file write."""
         try:
-            async with self._lock:
-                self._seq_counter += 1
-                event.sequence_number = self._seq_counter
-                event.previous_hash = self._last_hash
-
-                payload = event.model_dump(mode="json", exclude_none=False)
-                checksum = self._compute_checksum(payload)
-                event.checksum = checksum
-                payload["checksum"] = checksum
-                payload["previous_hash"] = event.previous_hash
-                payload["sequence_number"] = event.sequence_number
-                self._last_hash = checksum
-
-                json_line = self._canonical_json(payload)
-
-            # Store to file - offload to thread pool to avoid blocking event loop
-            date_str = event.timestamp.strftime("%Y-%m-%d")
-            log_file = self.storage_path / f"audit_{date_str}.jsonl"
-            await asyncio.to_thread(self._write_to_file, log_file, json_line)
+            async with self._write_lock:
+                chunks: list[tuple[Path, list[bytes], list[IndexFields]]] = []
+                for event in events:
+                    self._seq_counter += 1
+                    event.sequence_number = self._seq_counter
+                    event.previous_hash = self._last_hash
+
+                    payload = event.model_dump(mode="json", exclude_none=False)
+                    checksum = self._compute_checksum(payload)
+                    event.checksum = checksum
+                    payload["checksum"] = checksum
+                    self._last_hash = checksum
+
+                    date_str = event.timestamp.strftime("%Y-%m-%d")
+                    log_file = self.storage_path / f"audit_{date_str}.jsonl"
+                    if not chunks or chunks[-1][0] != log_file:
+                        chunks.append((log_file, [], []))
+                    chunks[-1][1].append(self._canonical_json(payload))
+                    chunks[-1][2].append(index_fields(event))
+
+                # Store to file - offload to thread pool to avoid blocking event loop
+                await asyncio.to_thread(self._write_to_file, chunks)
 
         except Exception:
             # Storage failure - critical for compliance
             pass
 
-    def _write_to_file(self, path: Path, content: str) -> None:
-        """Synchronous file write, called via to_thread."""
-        with open(path, "a", encoding="utf-8") as f:
-            f.write(content + "\n")
+    def _write_to_file(
+        self, chunks: list[tuple[Path, list[bytes], list[IndexFields]]]
+    ) -> None:
+        """Synchronous buffered append, called via to_thread.
+
+        The day file stays open across batches and is reopened when the
+        target path changes (date rollover). Flushed once per batch so
+        readers see complete lines before the byte offsets of the new
+        lines are recorded in the file's query index.
+        """
+        for path, lines, fields in chunks:
+            if self._file is None or self._file_path != path:
+                self._close_file()
+                self._file = open(path, "ab")
+                self._file_path = path
+            start = self._file.seek(0, 2)
+            offset = start
+            rows: list[IndexRow] = []
+            for line, row in zip(lines, fields, strict=True):
+                size = len(line) + 1
+                rows.append((offset, size, *row))
+                offset += size
+            self._file.write(b"\n".join(lines) + b"\n")
+            self._file.flush()
+            self._update_index(path, start, rows, offset)
+
+    def _update_index(
+        self, path: Path, start: int, rows: list[IndexRow], end: int
+    ) -> None:
+        # The index only speeds up queries and readers rescan whatever it
+        # missed, so index failures must never fail the audit write
+        try:
+            if self._index is None:
+                index = AuditFileIndex(path)
+                if not index.index_path.exists():
+                    # Built by the first query on this file; until then
+                    # writes skip index upkeep entirely
+                    return
+                self._index = index
+            self._index.append(start, rows, end)
+        except Exception:
+            self._close_index()
+
+    def _close_file(self) -> None:
+        self._close_index()
+        if self._file is not None:
+            try:
+                self._file.close()
+            finally:
+                self._file = None
+                self._file_path = None
+
+    def _close_index(self) -> None:
+        if self._index is not None:
+            try:
+                self._index.close()
+            except Exception:
+                pass
+            finally:
+                self._index = None
 
     async def _check_compliance_alerts(self, event: AuditEvent) -> None:
         """Check if event should trigger compliance alerts."""
@@ -650,46 +767,153 @@ class AuditTrail:
 
         return AuditChainVerificationResult(valid=True, events_checked=checked)
 
-    async def verify_chain_from_storage(self) -> AuditChainVerificationResult:
-        """Load events from storage_path and verify their hash chain."""
-        events: list[AuditEvent] = []
+    async def verify_chain_from_storage(
+        self, *, workers: int = 1, full: bool = False
+    ) -> AuditChainVerificationResult:
+        """Verify the hash chain of the events in storage_path.
+
+        With a ``checkpoint_key``, a successful run saves a signed checkpoint
+        and later runs only hash records appended since it; ``full=True``
+        ignores the checkpoint and re-verifies everything. ``workers > 1``
+        hashes day files in parallel processes before stitching the chain
+        across file boundaries by sequence number.
+        """
+        checkpoint: ChainCheckpoint | None = None
         try:
-            for file in sorted(self.storage_path.glob("audit_*.jsonl")):
-                with open(file, encoding="utf-8") as f:
-                    for line in f:
-                        line = line.strip()
-                        if not line:
-                            continue
-                        try:
-                            events.append(AuditEvent.model_validate_json(line))
-                        except ValidationError:
-                            return AuditChainVerificationResult(
-                                valid=False,
-                                events_checked=len(events),
-                                first_invalid_sequence=len(events) + 1,
-                                error_message="invalid event payload",
-                            )
+            if self._checkpoint_key is not None and not full:
+                checkpoint = await asyncio.to_thread(self._load_checkpoint)
+            offsets = checkpoint.files if checkpoint else {}
+            segments = [
+                (path, offsets.get(path.name, 0))
+                for path in sorted(self.storage_path.glob("audit_*.jsonl"))
+                if path.stat().st_size > offsets.get(path.name, 0)
+            ]
+            scans = await self._scan_segments(segments, workers)
         except Exception as exc:
             return AuditChainVerificationResult(
-                valid=False,
-                events_checked=len(events),
-                error_message=str(exc),
+                valid=False, events_checked=0, error_message=str(exc)
             )
-        # Sort by sequence number to handle async writes completing out of order
-        events.sort(key=lambda e: e.sequence_number or 0)
-        return self.verify_chain(events)
+
+        result, tail = self._stitch_runs(scans, checkpoint)
+        if result.valid and tail is not None and self._checkpoint_key is not None:
+            files = dict(offsets)
+            files.update({scan.file: scan.end_offset for scan in scans})
+            new_checkpoint = ChainCheckpoint(
+                file=tail.last_file,
+                offset=tail.last_offset,
+                sequence_number=tail.last_seq,
+                last_hash=tail.last_hash,
+                files={
+                    name: offset
+                    for name, offset in files.items()
+                    if (self.storage_path / name).exists()
+                },
+            )
+            new_checkpoint.sign(self._checkpoint_key)
+            try:
+                await asyncio.to_thread(
+                    new_checkpoint.save, self.storage_path / CHECKPOINT_FILENAME
+                )
+            except OSError:
+                pass  # verification result stands; next run just redoes work
+        return result
+
+    def _load_checkpoint(self) -> ChainCheckpoint | None:
+        """Return the stored checkpoint if it is authentic and still anchored.
+
+        A missing, forged or stale checkpoint degrades to a full verification.
+        """
+        assert self._checkpoint_key is not None
+        checkpoint = ChainCheckpoint.load(
+            self.storage_path / CHECKPOINT_FILENAME, self._checkpoint_key
+        )
+        if checkpoint is None or not anchor_intact(self.storage_path, checkpoint):
+            return None
+        return checkpoint
+
+    async def _scan_segments(
+        self, segments: list[tuple[Path, int]], workers: int
+    ) -> list[SegmentScan]:
+        if workers <= 1 or len(segments) <= 1:
+            return [
+                await asyncio.to_thread(scan_segment, str(path), start)
+                for path, start in segments
+            ]
+        loop = asyncio.get_running_loop()
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(segments)),
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as pool:
+            return list(
+                await asyncio.gather(
+                    *(
+                        loop.run_in_executor(pool, scan_segment, str(path), start)
+                        for path, start in segments
+                    )
+                )
+            )
+
+    @staticmethod
+    def _stitch_runs(
+        scans: list[SegmentScan], checkpoint: ChainCheckpoint | None
+    ) -> tuple[AuditChainVerificationResult, ChainRun | None]:
+        """Join per-file runs into one chain continuing from ``checkpoint``."""
+        checked = sum(scan.records for scan in scans)
+        for scan in scans:
+            if scan.error is not None:
+                return (
+                    AuditChainVerificationResult(
+                        valid=False,
+                        events_checked=checked + 1,
+                        first_invalid_sequence=scan.error_sequence,
+                        error_message=scan.error,
+                    ),
+                    None,
+                )
+
+        expected_seq = checkpoint.sequence_number + 1 if checkpoint else 1
+        last_hash = checkpoint.last_hash if checkpoint else None
+        runs = sorted(
+            (run for scan in scans for run in scan.runs),
+            key=lambda run: run.first_seq,
+        )
+        checked = 0
+        for run in runs:
+            error = None
+            if run.first_seq != expected_seq:
+                error = "sequence mismatch"
+            elif run.first_prev != last_hash:
+                error = "previous hash mismatch"
+            if error is not None:
+                return (
+                    AuditChainVerificationResult(
+                        valid=False,
+                        events_checked=checked + 1,
+                        first_invalid_sequence=expected_seq,
+                        error_message=error,
+                    ),
+                    None,
+                )
+            checked += run.last_seq - run.first_seq + 1
+            expected_seq = run.last_seq + 1
+            last_hash = run.last_hash
+
+        return (
+            AuditChainVerificationResult(valid=True, events_checked=checked),
+            runs[-1] if runs else None,
+        )
 
     @staticmethod
-    def _canonical_json(payload: dict[str, Any]) -> str:
-        return json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    def _canonical_json(payload: dict[str, Any]) -> bytes:
+        # ASCII-only escaping keeps checksums identical to earlier releases
+        return canonical_json(payload, ascii_only=True)
 
     @staticmethod
     def _compute_checksum(payload: dict[str, Any]) -> str:
         # Do not include checksum itself in hash computation
         stripped = dict(payload)
         stripped.pop("checksum", None)
-        canon = AuditTrail._canonical_json(stripped)
-        return hashlib.sha256(canon.encode("utf-8")).hexdigest()
+        return hashlib.sha256(AuditTrail._canonical_json(stripped)).hexdigest()
 
     async def get_events(
         self,
@@ -717,48 +941,97 @@ class AuditTrail:
         Returns:
             List of matching audit events
         """
-        # Implementation would query storage backend
-        # This is a simplified version
-        events = []
+        return await asyncio.to_thread(
+            self._query_events,
+            start_time,
+            end_time,
+            event_type.value if event_type else None,
+            log_level.value if log_level else None,
+            user_id or None,
+            component or None,
+            limit,
+        )
 
-        # Read from files (simplified implementation)
-        for log_file in self.storage_path.glob("audit_*.jsonl"):
+    def _query_events(
+        self,
+        start_time: datetime | None,
+        end_time: datetime | None,
+        event_type: str | None,
+        log_level: str | None,
+        user_id: str | None,
+        component: str | None,
+        limit: int,
+    ) -> list[AuditEvent]:
+        """Query the per-day indexes newest file first, reading only hits.
+
+        Files whose date lies outside the time range are skipped by name.
+        Once ``limit`` events are collected, older files can only contribute
+        if their date reaches the oldest collected event, so the scan stops
+        there instead of touching every day of retention.
+        """
+        if limit <= 0:
+            return []
+        start_ts = timestamp_key(start_time) if start_time else None
+        end_ts = timestamp_key(end_time) if end_time else None
+        # File dates follow each event's own timestamp, so allow a day of
+        # slack for events logged with a non-UTC offset
+        slack = timedelta(days=1)
+        first_day = (start_time - slack).date() if start_time else None
+        last_day = (end_time + slack).date() if end_time else None
+
+        events: list[AuditEvent] = []
+        for day, log_file in self._day_files():
+            if first_day is not None and day < first_day:
+                break
+            if last_day is not None and day > last_day:
+                continue
+            if (
+                len(events) >= limit
+                and day < events[limit - 1].timestamp.date() - slack
+            ):
+                break
             try:
-                with open(log_file, encoding="utf-8") as f:
-                    for line in f:
+                index = AuditFileIndex(log_file)
+                try:
+                    index.refresh()
+                    hits = index.query(
+                        start_ts=start_ts,
+                        end_ts=end_ts,
+                        event_type=event_type,
+                        log_level=log_level,
+                        user_id=user_id,
+                        component=component,
+                        limit=limit,
+                    )
+                finally:
+                    index.close()
+                with open(log_file, "rb") as f:
+                    for offset, length in hits:
+                        f.seek(offset)
                         try:
-                            event_data = json.loads(line.strip())
-                            event = AuditEvent(**event_data)
-
-                            # Apply filters
-                            if start_time and event.timestamp < start_time:
-                                continue
-                            if end_time and event.timestamp > end_time:
-                                continue
-                            if event_type and event.event_type != event_type:
-                                continue
-                            if log_level and event.log_level != log_level:
-                                continue
-                            if user_id and event.user_id != user_id:
-                                continue
-                            if component and event.component != component:
-                                continue
-
-                            events.append(event)
-
-                            if len(events) >= limit:
-                                break
-
-                        except Exception:
+                            events.append(
+                                AuditEvent.model_validate_json(f.read(length))
+                            )
+                        except ValidationError:
                             continue
-
             except Exception:
                 continue
+            events.sort(key=lambda e: timestamp_key(e.timestamp), reverse=True)
 
-        # Sort by timestamp (newest first)
-        events.sort(key=lambda e: e.timestamp, reverse=True)
         return events[:limit]
 
+    def _day_files(self) -> list[tuple[date, Path]]:
+        """Daily audit files with their dates, newest first."""
+        files: list[tuple[date, Path]] = []
+        for log_file in self.storage_path.glob("audit_*.jsonl"):
+            try:
+                day = date.fromisoformat(log_file.stem[len("audit_") :])
+            except ValueError:
+                continue
+            files.append((day, log_file))
+        files.sort(reverse=True)
+        return files
+
     async def get_statistics(self) -> dict[str, Any]:
         """Get audit trail statistics."""
         return {
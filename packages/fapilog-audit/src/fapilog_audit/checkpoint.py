@@ -0,0 +1,173 @@
+"""
+Incremental hash-chain verification for stored audit trails.
+
+Each daily file is scanned independently into *runs*: maximal stretches of
+records whose sequence numbers are consecutive and whose ``previous_hash``
+links to the prior record's checksum. Only run endpoints are kept, so files
+can be verified in parallel and stitched afterwards by sequence number,
+whatever order the records were spread across files.
+
+After a successful verification a signed :class:`ChainCheckpoint` records how
+far each file was verified and where the chain ended, so the next run only
+hashes records appended since.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import hmac
+import json
+import os
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+from fapilog.core.canonical import canonical_json
+from fapilog.core.jsonl import iter_lines
+from pydantic import ValidationError
+
+CHECKPOINT_FILENAME = "audit_checkpoint.json"
+
+
+@dataclass
+class ChainRun:
+    """Consecutive, correctly linked records found in one file."""
+
+    first_seq: int
+    first_prev: str | None
+    last_seq: int
+    last_hash: str
+    # Location of the last record, used to anchor checkpoints
+    last_file: str
+    last_offset: int
+
+
+@dataclass
+class SegmentScan:
+    """Result of hashing one file from a byte offset to its last full line."""
+
+    file: str
+    end_offset: int
+    runs: list[ChainRun] = field(default_factory=list)
+    records: int = 0
+    error: str | None = None
+    error_sequence: int | None = None
+
+
+@dataclass
+class ChainCheckpoint:
+    """Signed resume point for storage verification.
+
+    ``files`` maps each day file name to the byte offset verified so far;
+    ``file``/``offset`` locate the record holding ``sequence_number`` and
+    ``last_hash`` so a resume can confirm it is still in place.
+    """
+
+    file: str
+    offset: int
+    sequence_number: int
+    last_hash: str
+    files: dict[str, int]
+    signature: str = ""
+
+    def _payload(self) -> bytes:
+        body = asdict(self)
+        body.pop("signature")
+        return canonical_json(body)
+
+    def sign(self, key: bytes) -> None:
+        self.signature = hmac.new(key, self._payload(), hashlib.sha256).hexdigest()
+
+    def verify(self, key: bytes) -> bool:
+        expected = hmac.new(key, self._payload(), hashlib.sha256).hexdigest()
+        return hmac.compare_digest(expected, self.signature)
+
+    @classmethod
+    def load(cls, path: Path, key: bytes) -> ChainCheckpoint | None:
+        """Return the stored checkpoint, or None if absent, unreadable or forged."""
+        try:
+            checkpoint = cls(**json.loads(path.read_text(encoding="utf-8")))
+        except (OSError, ValueError, TypeError):
+            return None
+        return checkpoint if checkpoint.verify(key) else None
+
+    def save(self, path: Path) -> None:
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_text(json.dumps(asdict(self), sort_keys=True), encoding="utf-8")
+        os.replace(tmp, path)
+
+
+def scan_segment(path: str, start: int) -> SegmentScan:
+    """Verify each record's checksum from ``start`` and collect its runs.
+
+    Module-level so it can run in a worker process. A trailing line without
+    a newline is an in-progress write: it is left for the next scan.
+    """
+    from .audit import AuditEvent, AuditTrail
+
+    scan = SegmentScan(file=Path(path).name, end_offset=start)
+    run: ChainRun | None = None
+    for offset, view in iter_lines(path, start, partial=False):
+        line = bytes(view)  # pydantic does not accept memoryviews
+        scan.end_offset = offset + len(line) + 1
+        if not line.strip():
+            continue
+        try:
+            event = AuditEvent.model_validate_json(line)
+        except (ValidationError, ValueError):
+            scan.end_offset = offset
+            scan.error = "invalid event payload"
+            scan.error_sequence = run.last_seq + 1 if run else None
+            return scan
+        seq = event.sequence_number or 0
+        checksum = AuditTrail._compute_checksum(
+            event.model_dump(mode="json", exclude_none=False)
+        )
+        if event.checksum != checksum:
+            scan.end_offset = offset
+            scan.error = "checksum mismatch"
+            scan.error_sequence = seq
+            return scan
+        if (
+            run is not None
+            and seq == run.last_seq + 1
+            and event.previous_hash == run.last_hash
+        ):
+            run.last_seq = seq
+            run.last_hash = checksum
+            run.last_offset = offset
+        else:
+            run = ChainRun(
+                first_seq=seq,
+                first_prev=event.previous_hash,
+                last_seq=seq,
+                last_hash=checksum,
+                last_file=scan.file,
+                last_offset=offset,
+            )
+            scan.runs.append(run)
+        scan.records += 1
+    return scan
+
+
+def anchor_intact(storage_path: Path, checkpoint: ChainCheckpoint) -> bool:
+    """Check the checkpointed record is still where the checkpoint says."""
+    from .audit import AuditEvent, AuditTrail
+
+    try:
+        for name, offset in checkpoint.files.items():
+            path = storage_path / name
+            # Files removed by retention are fine; shrunken ones are not
+            if path.exists() and path.stat().st_size < offset:
+                return False
+        with open(storage_path / checkpoint.file, "rb") as f:
+            f.seek(checkpoint.offset)
+            event = AuditEvent.model_validate_json(f.readline())
+    except (OSError, ValidationError, ValueError):
+        return False
+    payload: dict[str, Any] = event.model_dump(mode="json", exclude_none=False)
+    return (
+        event.sequence_number == checkpoint.sequence_number
+        and event.checksum == checkpoint.last_hash
+        and AuditTrail._compute_checksum(payload) == checkpoint.last_hash
+    )
@@ -0,0 +1,194 @@
+"""
+Sidecar query index for daily audit files.
+
+Each ``audit_YYYY-MM-DD.jsonl`` gets an ``audit_YYYY-MM-DD.jsonl.idx`` SQLite
+database mapping the filterable fields of every record to its byte offset and
+length. The writer appends rows as it writes lines; readers catch up on any
+unindexed tail (files written before the index existed, crashes between the
+file write and the index update) before querying.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from fapilog.core.jsonl import iter_lines
+from pydantic import ValidationError
+
+INDEX_SUFFIX = ".idx"
+
+# (ts, event_type, log_level, user_id, component)
+IndexFields = tuple[float, str, str, str | None, str | None]
+# (offset, length, *IndexFields)
+IndexRow = tuple[int, int, float, str, str, str | None, str | None]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    id INTEGER PRIMARY KEY CHECK (id = 0),
+    indexed_bytes INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS events (
+    offset INTEGER PRIMARY KEY,
+    length INTEGER NOT NULL,
+    ts REAL NOT NULL,
+    event_type TEXT NOT NULL,
+    log_level TEXT NOT NULL,
+    user_id TEXT,
+    component TEXT
+);
+CREATE INDEX IF NOT EXISTS events_ts ON events (ts);
+CREATE INDEX IF NOT EXISTS events_type_ts ON events (event_type, ts);
+CREATE INDEX IF NOT EXISTS events_user_ts ON events (user_id, ts);
+CREATE INDEX IF NOT EXISTS events_component_ts ON events (component, ts);
+INSERT OR IGNORE INTO meta (id, indexed_bytes) VALUES (0, 0);
+"""
+
+_INSERT = "INSERT OR REPLACE INTO events VALUES (?, ?, ?, ?, ?, ?, ?)"
+
+
+def timestamp_key(value: datetime) -> float:
+    """Epoch seconds used for index range queries; naive values are UTC."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+def index_fields(event: Any) -> IndexFields:
+    """Extract the indexed columns from an ``AuditEvent``."""
+    return (
+        timestamp_key(event.timestamp),
+        str(getattr(event.event_type, "value", event.event_type)),
+        str(getattr(event.log_level, "value", event.log_level)),
+        event.user_id,
+        event.component,
+    )
+
+
+class AuditFileIndex:
+    """SQLite sidecar index for one daily audit file.
+
+    Not thread-safe; callers serialize access (the writer holds the trail's
+    write lock, readers open their own short-lived instance). SQLite's WAL
+    mode lets a reader's catch-up and the writer's appends interleave.
+    """
+
+    def __init__(self, log_path: Path) -> None:
+        self.log_path = log_path
+        self.index_path = Path(str(log_path) + INDEX_SUFFIX)
+        self._conn: sqlite3.Connection | None = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            # Writer calls arrive on different to_thread workers
+            conn = sqlite3.connect(self.index_path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            # One transaction for the whole schema: a commit per statement
+            # made the first write of each day noticeably slow
+            conn.executescript(f"BEGIN;{_SCHEMA}COMMIT;")
+            self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        if self._conn is not None:
+            try:
+                self._conn.close()
+            finally:
+                self._conn = None
+
+    def indexed_bytes(self) -> int:
+        row = self._connect().execute("SELECT indexed_bytes FROM meta").fetchone()
+        return int(row[0]) if row else 0
+
+    def append(self, start: int, rows: list[IndexRow], end: int) -> None:
+        """Record rows for lines written at ``[start, end)`` of the log file.
+
+        Rows are keyed by offset, so a reader that already caught up past
+        ``start`` simply gets the same rows rewritten.
+        """
+        conn = self._connect()
+        indexed = self.indexed_bytes()
+        with conn:
+            if start == 0 and indexed > 0:
+                # Fresh file next to a stale sidecar: drop the old rows
+                conn.execute("DELETE FROM events")
+                indexed = 0
+            if indexed < start:
+                self._scan(conn, indexed, start)
+            conn.executemany(_INSERT, rows)
+            conn.execute("UPDATE meta SET indexed_bytes = ?", (max(indexed, end),))
+
+    def refresh(self) -> None:
+        """Index any complete lines appended since the last update."""
+        try:
+            size = self.log_path.stat().st_size
+        except OSError:
+            return
+        conn = self._connect()
+        indexed = self.indexed_bytes()
+        if indexed == size:
+            return
+        with conn:
+            if indexed > size:
+                # File was truncated or replaced underneath us: rebuild
+                conn.execute("DELETE FROM events")
+                indexed = 0
+            end = self._scan(conn, indexed, size)
+            conn.execute("UPDATE meta SET indexed_bytes = ?", (end,))
+
+    def query(
+        self,
+        *,
+        start_ts: float | None = None,
+        end_ts: float | None = None,
+        event_type: str | None = None,
+        log_level: str | None = None,
+        user_id: str | None = None,
+        component: str | None = None,
+        limit: int | None = None,
+    ) -> list[tuple[int, int]]:
+        """Return ``(offset, length)`` of matching records, newest first."""
+        clauses: list[str] = []
+        params: list[Any] = []
+        for column, op, value in (
+            ("ts", ">=", start_ts),
+            ("ts", "<=", end_ts),
+            ("event_type", "=", event_type),
+            ("log_level", "=", log_level),
+            ("user_id", "=", user_id),
+            ("component", "=", component),
+        ):
+            if value is not None:
+                clauses.append(f"{column} {op} ?")
+                params.append(value)
+        sql = "SELECT offset, length FROM events"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY ts DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return [(int(o), int(n)) for o, n in self._connect().execute(sql, params)]
+
+    def _scan(self, conn: sqlite3.Connection, start: int, stop: int) -> int:
+        """Index complete lines in ``[start, stop)``; return the new watermark."""
+        from .audit import AuditEvent
+
+        rows: list[IndexRow] = []
+        watermark = start
+        # A partial trailing line is skipped until the writer completes it
+        for offset, line in iter_lines(self.log_path, start, stop, partial=False):
+            length = len(line) + 1
+            try:
+                # pydantic does not accept memoryviews
+                event = AuditEvent.model_validate_json(bytes(line))
+            except (ValidationError, ValueError):
+                event = None
+            if event is not None:
+                rows.append((offset, length, *index_fields(event)))
+            watermark = offset + length
+        conn.executemany(_INSERT, rows)
+        return watermark
@@ -112,3 +112,88 @@ async def test_write_error_contained_with_invalid_path(tmp_path: Path) -> None:
     assert stats["total_events"] == 2, "Trail should have counted both events"
 
     await trail.stop()
+
+
+@pytest.mark.asyncio
+async def test_drain_writes_batch_with_single_thread_hop(tmp_path: Path) -> None:
+    """Queued events are chained and written together, in sequence order."""
+    trail = AuditTrail(
+        policy=CompliancePolicy(), storage_path=tmp_path, batch_max_size=4
+    )
+
+    with patch(
+        "fapilog_audit.audit.asyncio.to_thread", new_callable=AsyncMock
+    ) as mock_to_thread:
+        mock_to_thread.side_effect = lambda func, *args: func(*args)
+        for i in range(10):
+            await trail.log_event(AuditEventType.DATA_ACCESS, f"event {i}")
+        await trail.drain()
+
+        # 10 events with batch_max_size=4 -> batches of 4, 4, 2
+        assert mock_to_thread.call_count == 3
+
+    await trail.stop()
+    result = await trail.verify_chain_from_storage()
+    assert result.valid is True
+    assert result.events_checked == 10
+
+
+@pytest.mark.asyncio
+async def test_day_file_stays_open_and_rolls_over_at_date_boundary(
+    tmp_path: Path,
+) -> None:
+    """The writer reuses its handle within a day and reopens for a new date."""
+    from datetime import datetime, timezone
+
+    from fapilog_audit import AuditEvent
+
+    trail = AuditTrail(policy=CompliancePolicy(), storage_path=tmp_path)
+
+    def _event(day: int) -> AuditEvent:
+        return AuditEvent(
+            event_type=AuditEventType.DATA_ACCESS,
+            message=f"day {day}",
+            timestamp=datetime(2025, 1, day, 23, 59, tzinfo=timezone.utc),
+        )
+
+    await trail._store_batch([_event(1)])
+    first_handle = trail._file
+    await trail._store_batch([_event(1), _event(2)])
+    assert trail._file is not first_handle
+    await trail._store_batch([_event(2)])
+    second_handle = trail._file
+    await trail.stop()
+
+    assert second_handle is not None and second_handle.closed
+    assert len((tmp_path / "audit_2025-01-01.jsonl").read_text().splitlines()) == 2
+    assert len((tmp_path / "audit_2025-01-02.jsonl").read_text().splitlines()) == 2
+    result = await trail.verify_chain_from_storage()
+    assert result.valid is True
+    assert result.events_checked == 4
+
+
+@pytest.mark.asyncio
+async def test_stop_waits_for_in_flight_write(tmp_path: Path) -> None:
+    """stop() lets a batch write running in a thread finish before closing."""
+    import time
+
+    trail = AuditTrail(policy=CompliancePolicy(), storage_path=tmp_path)
+    await trail.start()
+    original = trail._write_to_file
+    started = asyncio.Event()
+    loop = asyncio.get_running_loop()
+
+    def slow_write(chunks: Any) -> None:
+        loop.call_soon_threadsafe(started.set)
+        time.sleep(0.2)
+        original(chunks)
+
+    trail._write_to_file = slow_write  # type: ignore[method-assign]
+    for i in range(5):
+        await trail.log_event(AuditEventType.DATA_ACCESS, f"event {i}")
+    await started.wait()
+    await trail.stop()
+
+    lines = next(tmp_path.glob("audit_*.jsonl")).read_text().splitlines()
+    assert len(lines) == 5
+    assert trail._file is None
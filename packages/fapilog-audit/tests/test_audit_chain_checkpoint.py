@@ -0,0 +1,132 @@
+"""Tests for incremental, checkpointed storage chain verification."""
+
+from __future__ import annotations
+
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from fapilog_audit import AuditEvent, AuditEventType, AuditTrail, CompliancePolicy
+from fapilog_audit import checkpoint as checkpoint_module
+from fapilog_audit.checkpoint import CHECKPOINT_FILENAME
+
+KEY = b"checkpoint-test-key"
+
+
+def _event(day: int, message: str = "event") -> AuditEvent:
+    return AuditEvent(
+        event_type=AuditEventType.DATA_ACCESS,
+        message=message,
+        timestamp=datetime(2025, 1, day, 12, tzinfo=timezone.utc),
+    )
+
+
+def _trail(path: Path) -> AuditTrail:
+    return AuditTrail(policy=CompliancePolicy(), storage_path=path, checkpoint_key=KEY)
+
+
+@pytest.mark.asyncio
+async def test_resumes_from_checkpoint_and_hashes_only_new_records(
+    tmp_path: Path,
+) -> None:
+    trail = _trail(tmp_path)
+    await trail._store_batch([_event(1) for _ in range(5)])
+
+    first = await trail.verify_chain_from_storage()
+    assert first.valid is True
+    assert first.events_checked == 5
+    stored = json.loads((tmp_path / CHECKPOINT_FILENAME).read_text())
+    assert stored["sequence_number"] == 5
+
+    await trail._store_batch([_event(1), _event(2)])
+    await trail.stop()
+
+    with patch(
+        "fapilog_audit.audit.scan_segment", wraps=checkpoint_module.scan_segment
+    ) as spy:
+        second = await trail.verify_chain_from_storage()
+
+    assert second.valid is True
+    assert second.events_checked == 2
+    starts = {Path(call.args[0]).name: call.args[1] for call in spy.call_args_list}
+    assert starts == {
+        "audit_2025-01-01.jsonl": stored["files"]["audit_2025-01-01.jsonl"],
+        "audit_2025-01-02.jsonl": 0,
+    }
+
+    full = await trail.verify_chain_from_storage(full=True)
+    assert full.valid is True
+    assert full.events_checked == 7
+
+
+@pytest.mark.asyncio
+async def test_tampered_record_after_checkpoint_is_detected(tmp_path: Path) -> None:
+    trail = _trail(tmp_path)
+    await trail._store_batch([_event(1) for _ in range(3)])
+    assert (await trail.verify_chain_from_storage()).valid is True
+    await trail._store_batch([_event(1, "original")])
+    await trail.stop()
+
+    log_file = tmp_path / "audit_2025-01-01.jsonl"
+    log_file.write_text(log_file.read_text().replace("original", "rewritten"))
+
+    result = await trail.verify_chain_from_storage()
+    assert result.valid is False
+    assert result.error_message == "checksum mismatch"
+    assert result.first_invalid_sequence == 4
+
+
+@pytest.mark.asyncio
+async def test_forged_checkpoint_falls_back_to_full_verification(
+    tmp_path: Path,
+) -> None:
+    trail = _trail(tmp_path)
+    await trail._store_batch([_event(1) for _ in range(3)])
+    await trail.stop()
+    assert (await trail.verify_chain_from_storage()).valid is True
+
+    checkpoint_path = tmp_path / CHECKPOINT_FILENAME
+    forged = json.loads(checkpoint_path.read_text())
+    forged["files"]["audit_2025-01-01.jsonl"] = 10**9
+    checkpoint_path.write_text(json.dumps(forged))
+
+    result = await trail.verify_chain_from_storage()
+    assert result.valid is True
+    assert result.events_checked == 3
+
+
+@pytest.mark.asyncio
+async def test_tampered_anchor_invalidates_checkpoint(tmp_path: Path) -> None:
+    trail = _trail(tmp_path)
+    await trail._store_batch([_event(1, "first"), _event(1, "anchor")])
+    await trail.stop()
+    assert (await trail.verify_chain_from_storage()).valid is True
+
+    log_file = tmp_path / "audit_2025-01-01.jsonl"
+    log_file.write_text(log_file.read_text().replace("anchor", "edited"))
+
+    result = await trail.verify_chain_from_storage()
+    assert result.valid is False
+    assert result.error_message == "checksum mismatch"
+    assert result.first_invalid_sequence == 2
+
+
+@pytest.mark.asyncio
+async def test_parallel_files_are_stitched_by_sequence(tmp_path: Path) -> None:
+    trail = AuditTrail(policy=CompliancePolicy(), storage_path=tmp_path)
+    # Records alternate between day files, so no file holds a contiguous chain
+    await trail._store_batch([_event(1 + i % 3, f"event {i}") for i in range(9)])
+    await trail.stop()
+
+    result = await trail.verify_chain_from_storage(workers=3)
+    assert result.valid is True
+    assert result.events_checked == 9
+
+    (tmp_path / "audit_2025-01-02.jsonl").unlink()
+    broken = await trail.verify_chain_from_storage(workers=3)
+    assert broken.valid is False
+    assert broken.error_message == "sequence mismatch"
+    assert broken.first_invalid_sequence == 2
@@ -0,0 +1,131 @@
+"""Tests for indexed audit event queries."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from fapilog_audit import AuditEvent, AuditEventType, AuditTrail, CompliancePolicy
+from fapilog_audit.index import AuditFileIndex
+
+
+def _event(
+    day: int, hour: int, *, user_id: str | None = None, component: str | None = None
+) -> AuditEvent:
+    return AuditEvent(
+        event_type=AuditEventType.DATA_ACCESS,
+        message=f"day {day} hour {hour}",
+        timestamp=datetime(2025, 1, day, hour, tzinfo=timezone.utc),
+        user_id=user_id,
+        component=component,
+    )
+
+
+@pytest.mark.asyncio
+async def test_limit_returns_newest_events_across_files(tmp_path: Path) -> None:
+    trail = AuditTrail(policy=CompliancePolicy(), storage_path=tmp_path)
+    await trail._store_batch(
+        [_event(day, hour) for day in (1, 2, 3) for hour in (1, 2)]
+    )
+    await trail.stop()
+
+    events = await trail.get_events(limit=3)
+
+    assert [e.message for e in events] == [
+        "day 3 hour 2",
+        "day 3 hour 1",
+        "day 2 hour 2",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_filters_are_answered_from_sidecar_index(tmp_path: Path) -> None:
+    trail = AuditTrail(policy=CompliancePolicy(), storage_path=tmp_path)
+    log_file = tmp_path / "audit_2025-01-01.jsonl"
+    index = AuditFileIndex(log_file)
+
+    await trail._store_batch([_event(1, 1, user_id="alice", component="api")])
+    # No index until the file is first queried
+    assert not index.index_path.exists()
+    assert len(await trail.get_events()) == 1
+
+    await trail._store_batch(
+        [
+            _event(1, 2, user_id="bob", component="api"),
+            _event(1, 3, user_id="alice", component="db"),
+        ]
+    )
+    await trail.stop()
+    try:
+        # The writer kept the index current after the first query built it
+        assert index.indexed_bytes() == log_file.stat().st_size
+    finally:
+        index.close()
+
+    alice = await trail.get_events(user_id="alice")
+    assert [e.message for e in alice] == ["day 1 hour 3", "day 1 hour 1"]
+    api_bob = await trail.get_events(user_id="bob", component="api")
+    assert [e.message for e in api_bob] == ["day 1 hour 2"]
+    window = await trail.get_events(
+        start_time=datetime(2025, 1, 1, 2, tzinfo=timezone.utc),
+        end_time=datetime(2025, 1, 1, 2, 30, tzinfo=timezone.utc),
+    )
+    assert [e.message for e in window] == ["day 1 hour 2"]
+
+
+@pytest.mark.asyncio
+async def test_unindexed_file_is_caught_up_on_query(tmp_path: Path) -> None:
+    good = _event(5, 1, user_id="carol")
+    log_file = tmp_path / "audit_2025-01-05.jsonl"
+    log_file.write_text(
+        good.model_dump_json()
+        + "\n"
+        + "not json\n"
+        + '{"valid": "json"}\n'
+        + _event(5, 2, user_id="carol").model_dump_json()  # torn trailing write
+    )
+    trail = AuditTrail(policy=CompliancePolicy(), storage_path=tmp_path)
+
+    events = await trail.get_events(user_id="carol")
+
+    assert [e.message for e in events] == ["day 5 hour 1"]
+    index = AuditFileIndex(log_file)
+    try:
+        # Watermark stops before the partial line so it is indexed once complete
+        assert index.indexed_bytes() < log_file.stat().st_size
+    finally:
+        index.close()
+
+
+@pytest.mark.asyncio
+async def test_time_range_skips_files_by_date(tmp_path: Path) -> None:
+    trail = AuditTrail(policy=CompliancePolicy(), storage_path=tmp_path)
+    await trail._store_batch([_event(day, 12) for day in (1, 10, 20)])
+    await trail.stop()
+    events = await trail.get_events(
+        start_time=datetime(2025, 1, 10, tzinfo=timezone.utc),
+        end_time=datetime(2025, 1, 10, 23, tzinfo=timezone.utc),
+    )
+
+    assert [e.message for e in events] == ["day 10 hour 12"]
+    assert sorted(p.name for p in tmp_path.glob("*.idx")) == [
+        "audit_2025-01-10.jsonl.idx"
+    ]
+
+
+@pytest.mark.asyncio
+async def test_index_failure_does_not_fail_audit_write(tmp_path: Path) -> None:
+    trail = AuditTrail(policy=CompliancePolicy(), storage_path=tmp_path)
+    await trail._store_batch([_event(1, 1)])
+    await trail.get_events()  # builds the index so the writer maintains it
+    with patch.object(AuditFileIndex, "append", side_effect=OSError("disk full")):
+        await trail._store_batch([_event(1, 2)])
+    await trail.stop()
+
+    log_file = tmp_path / "audit_2025-01-01.jsonl"
+    assert len(log_file.read_text().splitlines()) == 2
+    events = await trail.get_events()
+    assert [e.message for e in events] == ["day 1 hour 2", "day 1 hour 1"]
@@ -67,3 +67,22 @@ async def test_audit_chain_fields_and_verify(tmp_path) -> None:
     tampered_events[0].checksum = "deadbeef"
     tampered = AuditTrail.verify_chain(tampered_events)
     assert not tampered.valid
+
+
+@pytest.mark.asyncio
+async def test_stored_lines_and_checksums_match_stdlib_encoding(tmp_path) -> None:
+    """Chains written before the shared canonical encoder must still verify."""
+    import hashlib
+
+    audit = AuditTrail(policy=CompliancePolicy(), storage_path=tmp_path)
+    await audit._store_batch(
+        [AuditEvent(event_type=AuditEventType.DATA_ACCESS, message="naïve ☃ 𝄞 \x7f")]
+    )
+    await audit.stop()
+
+    (line,) = next(tmp_path.glob("audit_*.jsonl")).read_text().splitlines()
+    stored = json.loads(line)
+    assert line == json.dumps(stored, sort_keys=True, separators=(",", ":"))
+    checksum = stored.pop("checksum")
+    legacy = json.dumps(stored, sort_keys=True, separators=(",", ":"))
+    assert checksum == hashlib.sha256(legacy.encode("utf-8")).hexdigest()
@@ -5,27 +5,19 @@ Canonical serialization and base64url helpers for tamper-evident logging.
 from __future__ import annotations
 
 import base64
-import json
 from typing import Any
 
+from fapilog.core.canonical import canonical_json
+
 
 def canonicalize(event: dict[str, Any]) -> bytes:
     """
     Produce deterministic JSON bytes for the given event.
 
-    - Sorts keys for stability
-    - Uses compact separators
-    - UTF-8 encoding
-    - Excludes any pre-existing ``integrity`` field
+    Uses the core canonical encoding (sorted keys, compact separators,
+    UTF-8) and excludes any pre-existing ``integrity`` field.
     """
-    payload = {k: v for k, v in event.items() if k != "integrity"}
-    serialized = json.dumps(
-        payload,
-        sort_keys=True,
-        separators=(",", ":"),
-        ensure_ascii=False,
-    )
-    return serialized.encode("utf-8")
+    return canonical_json({k: v for k, v in event.items() if k != "integrity"})
 
 
 def b64url_encode(data: bytes) -> str:
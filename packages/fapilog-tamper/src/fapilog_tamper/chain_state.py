@@ -10,6 +10,8 @@ import os
 from datetime import datetime, timezone
 from pathlib import Path
 
+from fapilog.core.canonical import canonical_json
+
 from .canonical import b64url_decode, b64url_encode
 from .types import ChainState
 
@@ -56,11 +58,11 @@ class ChainStatePersistence:
             .isoformat()
             .replace("+00:00", "Z"),
         }
-        serialized = json.dumps(data, separators=(",", ":"), sort_keys=True)
+        serialized = canonical_json(data)
         temp_path = self._path.with_suffix(".tmp")
 
         def _write_atomic() -> None:
-            with open(temp_path, "w", encoding="utf-8") as f:
+            with open(temp_path, "wb") as f:
                 f.write(serialized)
                 f.flush()
                 os.fsync(f.fileno())
@@ -22,6 +22,7 @@ class TamperConfig(BaseModel):
     key_file_path: str | None = None
     key_cache_ttl_seconds: int = 300
     use_kms_signing: bool = False
+    kms_sign_concurrency: int = Field(default=8, ge=1)
     aws_region: str | None = None
     vault_addr: str | None = None
     vault_auth_method: Literal["token", "approle", "kubernetes"] = "token"
@@ -30,11 +31,13 @@ class TamperConfig(BaseModel):
     azure_client_id: str | None = None
     state_dir: str = ".fapilog-chainstate"
     fsync_on_write: bool = False
+    fsync_max_delay_ms: float = Field(default=0.0, ge=0.0)
     fsync_on_rotate: bool = True
     compress_rotated: bool = False
     rotate_chain: bool = False
     verify_on_close: bool = False
     alert_on_failure: bool = True
+    merkle_batch: bool = False
 
 
 class IntegrityEnricherConfig(BaseModel):
@@ -52,6 +55,15 @@ class IntegrityEnricherConfig(BaseModel):
     )
     rotate_chain: bool = False
     use_kms_signing: bool = False
+    kms_sign_concurrency: int = Field(
+        default=8,
+        ge=1,
+        description="Remote signing calls in flight at once for a batch",
+    )
+    merkle_batch: bool = Field(
+        default=False,
+        description="Sign one Merkle root per flush batch instead of every record",
+    )
 
 
 class SealedSinkConfig(BaseModel):
@@ -81,9 +93,22 @@ class SealedSinkConfig(BaseModel):
     )
     rotate_chain: bool = False
     fsync_on_write: bool = False
+    fsync_max_delay_ms: float = Field(
+        default=0.0,
+        ge=0.0,
+        description=(
+            "With fsync_on_write, how long a group commit waits for more "
+            "writers before syncing (0 = sync as soon as the previous one ends)"
+        ),
+    )
     fsync_on_rotate: bool = True
     compress_rotated: bool = False
     use_kms_signing: bool = False
+    kms_sign_concurrency: int = Field(
+        default=8,
+        ge=1,
+        description="Remote signing calls in flight at once for a batch",
+    )
 
 
 def _normalize_algorithm(value: str | None) -> str:
@@ -20,6 +20,7 @@ from .config import (
     TamperConfig,
     coerce_tamper_config,
 )
+from .merkle import build_tree, leaf_hash
 from .providers import KeyProvider, create_key_provider
 
 try:  # Optional Ed25519 dependency
@@ -50,6 +51,9 @@ class IntegrityEnricher(BaseEnricher):
         self._state: ChainState | None = None
         self._persistence: ChainStatePersistence | None = None
         self._provider = provider
+        # Providers built in start() are closed in stop(); injected ones
+        # belong to the caller
+        self._owns_provider = provider is None
 
     async def start(self) -> None:
         self._persistence = ChainStatePersistence(
@@ -68,64 +72,99 @@ class IntegrityEnricher(BaseEnricher):
         # Best-effort clearing of sensitive material
         self._key = None
         self._signing_key = None
+        if self._owns_provider and self._provider is not None:
+            close = getattr(self._provider, "close", None)
+            self._provider = None
+            if close is not None:
+                await close()
 
     async def enrich(self, event: dict[str, Any]) -> dict[str, Any]:
-        if not self._config.enabled:
+        if not self._can_seal():
             return {}
+        sealed = await self._seal([event])
+        return sealed[0]
+
+    async def enrich_batch(self, events: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Seal a whole flush batch, returning one ``integrity`` mapping per event.
+
+        Canonicalization and MACs are computed for the batch before the chain
+        lock is taken; only the sequential chain-link step runs under it. With
+        ``merkle_batch`` enabled a single signature covers the batch root and
+        each record carries its audit path so it stays verifiable on its own.
+        """
+        if not events:
+            return []
+        if not self._can_seal():
+            return [{} for _ in events]
+        return await self._seal(events)
+
+    def _can_seal(self) -> bool:
+        if not self._config.enabled:
+            return False
         if self._config.algorithm == "Ed25519" and not self._signing_key:
-            return {}
+            return False
         if (
             self._config.algorithm == "HMAC-SHA256"
             and not self._config.use_kms_signing
             and not self._key
         ):
-            return {}
+            return False
+        return True
+
+    async def _seal(self, events: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        payloads = [canonicalize(event) for event in events]
+        timestamps = [_timestamp_bytes(event) for event in events]
+
+        merkle: tuple[list[bytes], list[list[bytes]]] | None = None
+        if self._config.merkle_batch:
+            leaves = [leaf_hash(payload) for payload in payloads]
+            root, paths = build_tree(leaves)
+            macs = [await self._compute_mac(root)] * len(events)
+            # Chain over the leaves so every record is still linked individually
+            links = leaves
+            merkle = (leaves, paths)
+        else:
+            macs = await self._compute_macs(payloads)
+            links = macs
 
         # Ensure state exists
         if self._state is None:
             self._state = ChainState(seq=0, prev_chain_hash=GENESIS_HASH, key_id="")
 
-        payload = canonicalize(event)
-        timestamp_value = event.get("timestamp") or datetime.now(timezone.utc)
-        if isinstance(timestamp_value, datetime):
-            ts_str = (
-                timestamp_value.astimezone(timezone.utc)
-                .isoformat()
-                .replace("+00:00", "Z")
-            )
-        else:
-            ts_str = str(timestamp_value)
-
+        chain: list[tuple[int, bytes, bytes]] = []
         async with self._lock:
-            seq = self._state.seq + 1
-
-            mac = await self._compute_mac(payload)
-
-            chain_input = (
-                self._state.prev_chain_hash
-                + mac
-                + seq.to_bytes(8, "big")
-                + ts_str.encode("utf-8")
-            )
-            chain_hash = hashlib.sha256(chain_input).digest()
+            seq = self._state.seq
             prev_chain_hash = self._state.prev_chain_hash
+            for link, ts_bytes in zip(links, timestamps, strict=True):
+                seq += 1
+                chain_hash = hashlib.sha256(
+                    prev_chain_hash + link + seq.to_bytes(8, "big") + ts_bytes
+                ).digest()
+                chain.append((seq, chain_hash, prev_chain_hash))
+                prev_chain_hash = chain_hash
 
             # Update state
             self._state.seq = seq
-            self._state.prev_chain_hash = chain_hash
+            self._state.prev_chain_hash = prev_chain_hash
             if self._state.key_id == "":
                 self._state.key_id = self._config.key_id
 
-        return {
-            "integrity": {
+        results: list[dict[str, Any]] = []
+        for idx, (seq, chain_hash, prev_hash) in enumerate(chain):
+            integrity: dict[str, Any] = {
                 "seq": seq,
-                "mac": b64url_encode(mac),
+                "mac": b64url_encode(macs[idx]),
                 "algo": self._config.algorithm,
                 "key_id": self._config.key_id,
                 "chain_hash": b64url_encode(chain_hash),
-                "prev_chain_hash": b64url_encode(prev_chain_hash),
+                "prev_chain_hash": b64url_encode(prev_hash),
             }
-        }
+            if merkle is not None:
+                integrity["merkle_index"] = idx
+                integrity["merkle_size"] = len(chain)
+                integrity["merkle_path"] = [b64url_encode(h) for h in merkle[1][idx]]
+            results.append({"integrity": integrity})
+        return results
 
     async def _load_keys(self) -> tuple[bytes | None, SigningKey | None]:
         """Load key material based on configuration."""
@@ -174,6 +213,27 @@ class IntegrityEnricher(BaseEnricher):
         self._warn("invalid key length", length=len(raw))
         return None
 
+    async def _compute_macs(self, payloads: list[bytes]) -> list[bytes]:
+        if self._config.use_kms_signing and self._provider:
+            # Providers with a bulk API sign the whole batch in one round trip
+            sign_many = getattr(self._provider, "sign_many", None)
+            if sign_many is not None:
+                return list(await sign_many(self._config.key_id, payloads))
+            return [await self._compute_mac(payload) for payload in payloads]
+        if self._config.algorithm == "HMAC-SHA256":
+            assert self._key is not None  # for type checkers
+            # Key the HMAC once and copy it per payload instead of re-deriving
+            # the inner/outer pads for every record.
+            keyed = hmac.new(self._key, digestmod=hashlib.sha256)
+            macs = []
+            for payload in payloads:
+                mac = keyed.copy()
+                mac.update(payload)
+                macs.append(mac.digest())
+            return macs
+        assert self._signing_key is not None  # pragma: no cover - guarded above
+        return [self._signing_key.sign(payload).signature for payload in payloads]
+
     async def _compute_mac(self, payload: bytes) -> bytes:
         if self._config.use_kms_signing and self._provider:
             return await self._provider.sign(self._config.key_id, payload)
@@ -190,3 +250,14 @@ class IntegrityEnricher(BaseEnricher):
             diagnostics.warn("tamper", message, **fields)
         except Exception:
             pass
+
+
+def _timestamp_bytes(event: dict[str, Any]) -> bytes:
+    timestamp_value = event.get("timestamp") or datetime.now(timezone.utc)
+    if isinstance(timestamp_value, datetime):
+        ts_str = (
+            timestamp_value.astimezone(timezone.utc).isoformat().replace("+00:00", "Z")
+        )
+    else:
+        ts_str = str(timestamp_value)
+    return ts_str.encode("utf-8")
@@ -0,0 +1,72 @@
+"""
+Merkle tree helpers for batch sealing.
+
+Leaves and interior nodes are domain-separated (RFC 6962 style) so a leaf
+hash can never be replayed as an interior node. When a level has an odd
+number of nodes the last one is promoted unchanged to the next level.
+"""
+
+from __future__ import annotations
+
+import hashlib
+
+_LEAF_PREFIX = b"\x00"
+_NODE_PREFIX = b"\x01"
+
+
+def leaf_hash(payload: bytes) -> bytes:
+    """Hash canonical record bytes into a Merkle leaf."""
+    return hashlib.sha256(_LEAF_PREFIX + payload).digest()
+
+
+def _node_hash(left: bytes, right: bytes) -> bytes:
+    return hashlib.sha256(_NODE_PREFIX + left + right).digest()
+
+
+def build_tree(leaves: list[bytes]) -> tuple[bytes, list[list[bytes]]]:
+    """Return the root and the audit path (sibling hashes) for every leaf."""
+    if not leaves:
+        raise ValueError("cannot build a Merkle tree without leaves")
+    paths: list[list[bytes]] = [[] for _ in leaves]
+    # positions[i] is the index of leaf i's ancestor within the current level
+    positions = list(range(len(leaves)))
+    level = list(leaves)
+    while len(level) > 1:
+        for leaf_idx, pos in enumerate(positions):
+            sibling = pos ^ 1
+            if sibling < len(level):
+                paths[leaf_idx].append(level[sibling])
+            positions[leaf_idx] = pos // 2
+        level = [
+            _node_hash(level[i], level[i + 1]) if i + 1 < len(level) else level[i]
+            for i in range(0, len(level), 2)
+        ]
+    return level[0], paths
+
+
+def root_from_path(leaf: bytes, index: int, size: int, path: list[bytes]) -> bytes:
+    """Fold an audit path back into the root it was generated from.
+
+    Raises ``ValueError`` when the path length does not match the tree shape.
+    """
+    if size < 1 or not 0 <= index < size:
+        raise ValueError("leaf index out of range")
+    node = leaf
+    remaining = iter(path)
+    width = size
+    while width > 1:
+        sibling_idx = index ^ 1
+        if sibling_idx < width:
+            try:
+                sibling = next(remaining)
+            except StopIteration:
+                raise ValueError("audit path too short") from None
+            if index & 1:
+                node = _node_hash(sibling, node)
+            else:
+                node = _node_hash(node, sibling)
+        index //= 2
+        width = (width + 1) // 2
+    if next(remaining, None) is not None:
+        raise ValueError("audit path too long")
+    return node
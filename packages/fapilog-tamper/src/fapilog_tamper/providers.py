@@ -10,6 +10,7 @@ import hashlib
 import hmac
 import importlib
 import os
+import random
 import time
 from pathlib import Path
 from typing import Protocol
@@ -26,12 +27,25 @@ class KeyProvider(Protocol):
     async def sign(self, key_id: str, data: bytes) -> bytes:
         """Sign data using key (remote or local)."""
 
+    async def sign_many(self, key_id: str, items: list[bytes]) -> list[bytes]:
+        """Sign several payloads in one call, in order.
+
+        Optional: callers fall back to ``sign`` per item for providers
+        without it.
+        """
+
     async def verify(self, key_id: str, data: bytes, signature: bytes) -> bool:
         """Verify signature using key."""
 
     async def rotate_check(self) -> bool:
         """Check for rotation and refresh cache."""
 
+    async def close(self) -> None:
+        """Release background work and clients.
+
+        Optional: owners call it on stop when present.
+        """
+
 
 def _decode_key(raw: bytes | None) -> bytes | None:
     """Decode base64url or raw key material to 32 bytes."""
@@ -50,11 +64,72 @@ def _decode_key(raw: bytes | None) -> bytes | None:
     return None
 
 
+# Background refresh starts at a random point in this fraction of the TTL so
+# processes sharing a key source do not all hit it at once
+_REFRESH_AHEAD = (0.75, 0.9)
+
+# Default cap on remote signing calls in flight for one sign_many batch
+_SIGN_CONCURRENCY = 8
+
+
 class _CachedProvider:
-    def __init__(self, cache_ttl: int) -> None:
+    """Key cache with jittered refresh-ahead and stale-while-revalidate.
+
+    Once a cached key passes its refresh point, the next lookup starts a
+    background refresh and keeps returning the cached key. Past the TTL the
+    cached key is still served while that refresh is in flight; only a cold
+    or fully expired cache fetches inline, with concurrent callers sharing
+    one fetch. Subclasses implement ``_fetch_key``.
+    """
+
+    def __init__(
+        self, cache_ttl: int, sign_concurrency: int = _SIGN_CONCURRENCY
+    ) -> None:
         self._cache_ttl = cache_ttl
         self._cached_key: bytes | None = None
         self._cache_expires: float = 0.0
+        self._refresh_at: float = 0.0
+        self._refresh_task: asyncio.Task[None] | None = None
+        self._fetch_lock = asyncio.Lock()
+        self._sign_slots = asyncio.Semaphore(max(1, sign_concurrency))
+
+    async def _fetch_key(self, key_id: str) -> bytes | None:
+        raise NotImplementedError
+
+    async def _get_cached(self, key_id: str) -> bytes | None:
+        now = time.time()
+        key = self._cached_key
+        if key and now < self._cache_expires:
+            if now >= self._refresh_at:
+                self._start_refresh(key_id)
+            return key
+        if key and self._refresh_task is not None and not self._refresh_task.done():
+            return key
+        async with self._fetch_lock:
+            cached = self._cache_get()
+            if cached:
+                return cached
+            key = await self._fetch_key(key_id)
+            self._cache_set(key)
+            return key
+
+    def _start_refresh(self, key_id: str) -> None:
+        if self._refresh_task is not None and not self._refresh_task.done():
+            return
+        self._refresh_task = asyncio.get_running_loop().create_task(
+            self._refresh(key_id)
+        )
+
+    async def _refresh(self, key_id: str) -> None:
+        try:
+            key = await self._fetch_key(key_id)
+        except Exception:
+            key = None
+        if key:
+            self._cache_set(key)
+        else:
+            # Keep serving the cached key; retry after a short back-off
+            self._refresh_at = time.time() + max(1.0, self._cache_ttl * 0.05)
 
     def _cache_get(self) -> bytes | None:
         if self._cached_key and time.time() < self._cache_expires:
@@ -63,11 +138,14 @@ class _CachedProvider:
 
     def _cache_set(self, key: bytes | None) -> None:
         if key:
+            now = time.time()
             self._cached_key = key
-            self._cache_expires = time.time() + self._cache_ttl
+            self._cache_expires = now + self._cache_ttl
+            self._refresh_at = now + self._cache_ttl * random.uniform(*_REFRESH_AHEAD)
         else:
             self._cached_key = None
             self._cache_expires = 0.0
+            self._refresh_at = 0.0
 
     async def rotate_check(self) -> bool:
         if self._cached_key and time.time() >= self._cache_expires:
@@ -75,6 +153,45 @@ class _CachedProvider:
             return True
         return False
 
+    async def sign(self, key_id: str, data: bytes) -> bytes:
+        raise NotImplementedError
+
+    async def sign_many(self, key_id: str, items: list[bytes]) -> list[bytes]:
+        """Sign items concurrently; local-key providers override this.
+
+        At most ``sign_concurrency`` remote calls run at once, so a large
+        batch does not flood the worker-thread pool or the backend's quota.
+        """
+
+        async def _sign(data: bytes) -> bytes:
+            async with self._sign_slots:
+                return await self.sign(key_id, data)
+
+        return list(await asyncio.gather(*(_sign(d) for d in items)))
+
+    async def close(self) -> None:
+        """Cancel a background key refresh that is still running."""
+        task = self._refresh_task
+        self._refresh_task = None
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except (asyncio.CancelledError, Exception):
+                pass
+
+
+def _hmac_many(key: bytes | None, items: list[bytes]) -> list[bytes]:
+    if not key:
+        return [b"" for _ in items]
+    keyed = hmac.new(key, digestmod=hashlib.sha256)
+    macs = []
+    for data in items:
+        mac = keyed.copy()
+        mac.update(data)
+        macs.append(mac.digest())
+    return macs
+
 
 class EnvKeyProvider(_CachedProvider):
     """Key provider backed by environment variables."""
@@ -83,14 +200,12 @@ class EnvKeyProvider(_CachedProvider):
         super().__init__(cache_ttl)
         self._env_var = env_var
 
-    async def get_key(self, key_id: str) -> bytes | None:  # noqa: ARG002
-        cached = self._cache_get()
-        if cached:
-            return cached
+    async def get_key(self, key_id: str) -> bytes | None:
+        return await self._get_cached(key_id)
+
+    async def _fetch_key(self, key_id: str) -> bytes | None:  # noqa: ARG002
         val = os.getenv(self._env_var)
-        key = _decode_key(val.encode("utf-8")) if val else None
-        self._cache_set(key)
-        return key
+        return _decode_key(val.encode("utf-8")) if val else None
 
     async def sign(self, key_id: str, data: bytes) -> bytes:  # noqa: ARG002
         key = await self.get_key(self._env_var)
@@ -98,6 +213,9 @@ class EnvKeyProvider(_CachedProvider):
             return b""
         return hmac.new(key, data, hashlib.sha256).digest()
 
+    async def sign_many(self, key_id: str, items: list[bytes]) -> list[bytes]:  # noqa: ARG002
+        return _hmac_many(await self.get_key(self._env_var), items)
+
     async def verify(self, key_id: str, data: bytes, signature: bytes) -> bool:  # noqa: ARG002
         key = await self.get_key(self._env_var)
         if not key:
@@ -113,10 +231,10 @@ class FileKeyProvider(_CachedProvider):
         super().__init__(cache_ttl)
         self._path = Path(path)
 
-    async def get_key(self, key_id: str) -> bytes | None:  # noqa: ARG002
-        cached = self._cache_get()
-        if cached:
-            return cached
+    async def get_key(self, key_id: str) -> bytes | None:
+        return await self._get_cached(key_id)
+
+    async def _fetch_key(self, key_id: str) -> bytes | None:
         raw: bytes | None = None
         if self._path.is_file():
             try:
@@ -127,9 +245,7 @@ class FileKeyProvider(_CachedProvider):
             candidate = self._path / f"{key_id}.key"
             if candidate.exists():
                 raw = await asyncio.to_thread(candidate.read_bytes)
-        key = _decode_key(raw)
-        self._cache_set(key)
-        return key
+        return _decode_key(raw)
 
     async def sign(self, key_id: str, data: bytes) -> bytes:  # noqa: ARG002
         key = await self.get_key(key_id)
@@ -137,6 +253,9 @@ class FileKeyProvider(_CachedProvider):
             return b""
         return hmac.new(key, data, hashlib.sha256).digest()
 
+    async def sign_many(self, key_id: str, items: list[bytes]) -> list[bytes]:
+        return _hmac_many(await self.get_key(key_id), items)
+
     async def verify(self, key_id: str, data: bytes, signature: bytes) -> bool:  # noqa: ARG002
         key = await self.get_key(key_id)
         if not key:
@@ -155,8 +274,9 @@ class AwsKmsProvider(_CachedProvider):
         cache_ttl: int = 300,
         use_kms_signing: bool = False,
         client: object | None = None,
+        sign_concurrency: int = _SIGN_CONCURRENCY,
     ) -> None:
-        super().__init__(cache_ttl)
+        super().__init__(cache_ttl, sign_concurrency)
         self._key_id = key_id
         self._use_kms_signing = use_kms_signing
         if client is None:
@@ -164,20 +284,17 @@ class AwsKmsProvider(_CachedProvider):
             client = boto3.client("kms", region_name=region)
         self._client = client
 
-    async def get_key(self, key_id: str) -> bytes | None:  # noqa: ARG002
+    async def get_key(self, key_id: str) -> bytes | None:
         if self._use_kms_signing:
             return None
-        cached = self._cache_get()
-        if cached:
-            return cached
+        return await self._get_cached(key_id)
+
+    async def _fetch_key(self, key_id: str) -> bytes | None:  # noqa: ARG002
         response = await asyncio.to_thread(
             self._client.generate_data_key, KeyId=self._key_id, KeySpec="AES_256"
         )
         key = response.get("Plaintext")
-        if isinstance(key, bytes):
-            self._cache_set(key)
-            return key
-        return None
+        return key if isinstance(key, bytes) else None
 
     async def sign(self, key_id: str, data: bytes) -> bytes:  # noqa: ARG002
         if self._use_kms_signing:
@@ -194,6 +311,11 @@ class AwsKmsProvider(_CachedProvider):
             return b""
         return hmac.new(key, data, hashlib.sha256).digest()
 
+    async def sign_many(self, key_id: str, items: list[bytes]) -> list[bytes]:
+        if self._use_kms_signing:
+            return await super().sign_many(key_id, items)
+        return _hmac_many(await self.get_key(self._key_id), items)
+
     async def verify(self, key_id: str, data: bytes, signature: bytes) -> bool:  # noqa: ARG002
         if self._use_kms_signing:
             try:
@@ -231,8 +353,9 @@ class GcpKmsProvider(_CachedProvider):
         cache_ttl: int = 300,
         use_kms_signing: bool = True,
         client: object | None = None,
+        sign_concurrency: int = _SIGN_CONCURRENCY,
     ) -> None:
-        super().__init__(cache_ttl)
+        super().__init__(cache_ttl, sign_concurrency)
         self._key_id = key_id
         self._use_kms_signing = use_kms_signing
         if client is None:
@@ -276,8 +399,9 @@ class AzureKeyVaultProvider(_CachedProvider):
         client_id: str | None = None,
         use_kms_signing: bool = True,
         crypto_client: object | None = None,
+        sign_concurrency: int = _SIGN_CONCURRENCY,
     ) -> None:
-        super().__init__(cache_ttl)
+        super().__init__(cache_ttl, sign_concurrency)
         self._key_id = key_id
         self._use_kms_signing = use_kms_signing
         if crypto_client is None:
@@ -335,8 +459,9 @@ class VaultProvider(_CachedProvider):
         role_id: str | None = None,
         secret_id: str | None = None,
         cache_ttl: int = 300,
+        sign_concurrency: int = _SIGN_CONCURRENCY,
     ) -> None:
-        super().__init__(cache_ttl)
+        super().__init__(cache_ttl, sign_concurrency)
         hvac = importlib.import_module("hvac")
         self._client = hvac.Client(url=addr)
         self._key_name = key_name
@@ -402,6 +527,7 @@ def create_key_provider(config: TamperConfig) -> KeyProvider:
                 region=config.aws_region,
                 cache_ttl=config.key_cache_ttl_seconds,
                 use_kms_signing=config.use_kms_signing,
+                sign_concurrency=config.kms_sign_concurrency,
             )
         except ImportError as exc:
             raise ImportError(
@@ -413,6 +539,7 @@ def create_key_provider(config: TamperConfig) -> KeyProvider:
                 key_id=config.key_id,
                 cache_ttl=config.key_cache_ttl_seconds,
                 use_kms_signing=config.use_kms_signing,
+                sign_concurrency=config.kms_sign_concurrency,
             )
         except ImportError as exc:
             raise ImportError(
@@ -427,6 +554,7 @@ def create_key_provider(config: TamperConfig) -> KeyProvider:
                 tenant_id=config.azure_tenant_id,
                 client_id=config.azure_client_id,
                 use_kms_signing=config.use_kms_signing,
+                sign_concurrency=config.kms_sign_concurrency,
             )
         except ImportError as exc:
             raise ImportError(
@@ -442,6 +570,7 @@ def create_key_provider(config: TamperConfig) -> KeyProvider:
                 token=os.environ.get("VAULT_TOKEN"),
                 role_id=config.vault_role,
                 cache_ttl=config.key_cache_ttl_seconds,
+                sign_concurrency=config.kms_sign_concurrency,
             )
         except ImportError as exc:
             raise ImportError(
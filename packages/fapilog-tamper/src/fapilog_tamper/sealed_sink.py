@@ -13,10 +13,11 @@ import os
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Awaitable, Callable, Iterable
 
 from pydantic import BaseModel
 
+from fapilog.core.canonical import canonical_json
 from fapilog.plugins.sinks import BaseSink
 
 from .canonical import b64url_decode, b64url_encode
@@ -42,6 +43,9 @@ class FileMetadata:
     last_ts: str | None = None
     root_chain_hash: bytes | None = None
     continues_from: str | None = None
+    # Whole-file digest, known when the inner sink reports its rotations
+    content_sha256: str | None = None
+    content_bytes: int | None = None
 
 
 class ManifestGenerator:
@@ -78,6 +82,9 @@ class ManifestGenerator:
         }
         if metadata.continues_from is not None:
             manifest["continues_from"] = metadata.continues_from
+        if metadata.content_sha256 is not None:
+            manifest["content_sha256"] = metadata.content_sha256
+            manifest["content_bytes"] = metadata.content_bytes
 
         signature = self._sign_manifest(manifest)
         if signature:
@@ -96,11 +103,46 @@ class ManifestGenerator:
 
     @staticmethod
     def _canonical_manifest_payload(manifest: dict[str, Any]) -> bytes:
-        payload = {k: v for k, v in manifest.items() if k != "signature"}
-        serialized = json.dumps(
-            payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False
-        )
-        return serialized.encode("utf-8")
+        return canonical_json({k: v for k, v in manifest.items() if k != "signature"})
+
+
+class _GroupCommit:
+    """Coalesce concurrent durability requests into one sync per group.
+
+    Callers await ``commit()`` after their data reached the OS. A single
+    leader task runs the sync; callers arriving while it is in flight join
+    the *next* group, because the running sync may predate their write.
+    ``commit()`` returns only once a sync covering the caller has finished.
+    """
+
+    def __init__(
+        self, sync: Callable[[], Awaitable[None]], max_delay_seconds: float
+    ) -> None:
+        self._sync = sync
+        self._max_delay = max_delay_seconds
+        self._next: asyncio.Future[None] | None = None
+        self._leader: asyncio.Task[None] | None = None
+
+    async def commit(self) -> None:
+        if self._next is None:
+            self._next = asyncio.get_running_loop().create_future()
+        group = self._next
+        if self._leader is None or self._leader.done():
+            self._leader = asyncio.create_task(self._lead())
+        await asyncio.shield(group)
+
+    async def _lead(self) -> None:
+        while self._next is not None:
+            if self._max_delay > 0:
+                # Bounded latency window to let more writers join the group
+                await asyncio.sleep(self._max_delay)
+            group, self._next = self._next, None
+            try:
+                await self._sync()
+            except Exception as exc:  # pragma: no cover - sync is best effort
+                group.set_exception(exc)
+            else:
+                group.set_result(None)
 
 
 class SealedSink(BaseSink):
@@ -151,6 +193,7 @@ class SealedSink(BaseSink):
             "key_provider",
             "key_source",
             "fsync_on_write",
+            "fsync_max_delay_ms",
             "fsync_on_rotate",
             "compress_rotated",
             "use_kms_signing",
@@ -181,9 +224,21 @@ class SealedSink(BaseSink):
         self._previous_root: str | None = None
         self._manifest_generator: ManifestGenerator | None = None
         self._provider = provider
+        # Providers built in start() are closed in stop(); injected ones
+        # belong to the caller
+        self._owns_provider = provider is None
+        # Set when the inner sink exposes rotation hooks (RotatingFileSink)
+        self._follows_rotation = False
+        # Closed files awaiting their post-rotate hook, keyed by path; the
+        # inner sink finalizes rotated files in the background
+        self._rotating: dict[str, FileMetadata] = {}
+        self._group_commit = _GroupCommit(
+            self._fsync_current_file, self._config.fsync_max_delay_ms / 1000.0
+        )
 
     async def start(self) -> None:
         await self._maybe_call(self._inner, "start")
+        self._attach_rotation_hooks()
         if self._provider is None:
             self._provider = create_key_provider(self._config)
         await self._load_key_if_needed()
@@ -202,8 +257,120 @@ class SealedSink(BaseSink):
         if self._current_file and self._current_file.record_count > 0:
             await self._emit_manifest()
         await self._maybe_call(self._inner, "stop")
+        if self._owns_provider and self._provider is not None:
+            provider, self._provider = self._provider, None
+            await self._maybe_call(provider, "close")
 
     async def write(self, entry: dict[str, Any]) -> None:
+        if self._follows_rotation:
+            await self._write_following_rotation((entry,))
+        else:
+            self._ensure_current_file()
+            async with self._lock:
+                self._record_metadata((entry,))
+            await self._maybe_call(self._inner, "write", entry)
+
+        if self._config.fsync_on_write:
+            await self._group_commit.commit()
+
+    async def write_batch(self, entries: list[dict[str, Any]]) -> None:
+        """Write a batch with one metadata update and one group fsync.
+
+        Entries go to the inner sink's ``write_batch`` when it has one,
+        otherwise one by one in order. With ``fsync_on_write`` this returns
+        only after a sync covering the whole batch has completed, so callers
+        keep the per-record durability guarantee at one fsync per batch.
+        """
+        if not entries:
+            return
+        if self._follows_rotation:
+            await self._write_following_rotation(entries)
+        else:
+            self._ensure_current_file()
+            async with self._lock:
+                self._record_metadata(entries)
+            inner_batch = getattr(self._inner, "write_batch", None)
+            if inner_batch is not None:
+                await self._maybe_call(self._inner, "write_batch", entries)
+            else:
+                for entry in entries:
+                    await self._maybe_call(self._inner, "write", entry)
+
+        if self._config.fsync_on_write:
+            await self._group_commit.commit()
+
+    async def _write_following_rotation(
+        self, entries: Iterable[dict[str, Any]]
+    ) -> None:
+        """Write entries one by one, recording each after it lands.
+
+        The inner sink may rotate before any write, so metadata is only
+        attributed to a file once the entry has been written to it.
+        """
+        async with self._lock:
+            for entry in entries:
+                await self._maybe_call(self._inner, "write", entry)
+                self._ensure_current_file()
+                self._record_metadata((entry,))
+
+    def _attach_rotation_hooks(self) -> None:
+        inner = self._inner
+        if not (hasattr(inner, "on_pre_rotate") and hasattr(inner, "on_post_rotate")):
+            return
+        if self._config.compress_rotated and not self._enable_inner_compression():
+            # Driven the legacy way instead: this sink compresses after rotate()
+            self._warn(
+                "inner sink cannot compress rotated files; sealing without "
+                "rotation hooks",
+                sink=type(inner).__name__,
+            )
+            return
+        inner.on_pre_rotate = self._on_inner_pre_rotate
+        inner.on_post_rotate = self._on_inner_post_rotate
+        self._follows_rotation = True
+
+    def _enable_inner_compression(self) -> bool:
+        """Have the inner sink gzip in the same pass as its digest."""
+        if not hasattr(self._inner, "compress_rotated"):
+            return False
+        try:
+            self._inner.compress_rotated = True
+        except Exception:
+            return False
+        return True
+
+    def _warn(self, message: str, **fields: Any) -> None:
+        try:
+            from fapilog.core import diagnostics
+
+            diagnostics.warn("tamper", message, **fields)
+        except Exception:
+            pass
+
+    async def _on_inner_pre_rotate(self, path: Path) -> None:
+        """Detach the closing file's metadata; runs under ``self._lock``."""
+        if self._config.fsync_on_rotate:
+            await self._fsync_current_file()
+        current = self._current_file
+        self._current_file = None
+        if current is not None and current.record_count > 0:
+            current.filename = str(path)
+            self._rotating[current.filename] = current
+            # The next file's manifest continues from this one, which may
+            # be sealed only after it has started
+            if current.root_chain_hash:
+                self._previous_root = b64url_encode(current.root_chain_hash)
+
+    async def _on_inner_post_rotate(self, rotated: Any) -> None:
+        """Seal the rotated file using the digest from the inner sink's pass."""
+        metadata = self._rotating.pop(str(rotated.source), None)
+        if metadata is None:
+            return
+        metadata.content_sha256 = rotated.sha256
+        metadata.content_bytes = rotated.size
+        await self._emit_manifest(metadata, compress=False, advance_chain=False)
+
+    def _ensure_current_file(self) -> None:
         if self._current_file is None:
             self._current_file = FileMetadata(
                 filename=self._get_current_filename(),
@@ -213,32 +380,34 @@ class SealedSink(BaseSink):
                 else None,
             )
 
-        async with self._lock:
+    def _record_metadata(self, entries: Iterable[dict[str, Any]]) -> None:
+        """Fold entries into the current file's manifest bookkeeping."""
+        current = self._current_file
+        assert current is not None  # set by _ensure_current_file
+        last_chain_hash: Any = None
+        for entry in entries:
             integrity = entry.get("integrity", {}) if isinstance(entry, dict) else {}
             seq = integrity.get("seq")
-            chain_hash = integrity.get("chain_hash")
             ts = entry.get("timestamp") if isinstance(entry, dict) else None
-
-            if self._current_file.first_seq is None:
-                self._current_file.first_seq = seq
-                self._current_file.first_ts = ts
-
-            self._current_file.last_seq = seq
-            self._current_file.last_ts = ts
-            self._current_file.record_count += 1
-            if chain_hash:
-                try:
-                    self._current_file.root_chain_hash = b64url_decode(chain_hash)
-                except Exception:
-                    self._current_file.root_chain_hash = None
-
-        await self._maybe_call(self._inner, "write", entry)
-
-        if self._config.fsync_on_write:
-            await self._fsync_current_file()
+            if current.first_seq is None:
+                current.first_seq = seq
+                current.first_ts = ts
+            current.last_seq = seq
+            current.last_ts = ts
+            current.record_count += 1
+            last_chain_hash = integrity.get("chain_hash") or last_chain_hash
+        if last_chain_hash:
+            try:
+                current.root_chain_hash = b64url_decode(last_chain_hash)
+            except Exception:
+                current.root_chain_hash = None
 
     async def rotate(self) -> None:
         async with self._lock:
+            if self._follows_rotation:
+                # The hooks seal the closed file
+                await self._maybe_call(self._inner, "rotate")
+                return
             await self._emit_manifest()
             await self._maybe_call(self._inner, "rotate")
             self._current_file = FileMetadata(
@@ -249,8 +418,15 @@ class SealedSink(BaseSink):
                 else None,
             )
 
-    async def _emit_manifest(self) -> None:
-        if not self._current_file:  # pragma: no cover - defensive
+    async def _emit_manifest(
+        self,
+        metadata: FileMetadata | None = None,
+        *,
+        compress: bool = True,
+        advance_chain: bool = True,
+    ) -> None:
+        current = metadata or self._current_file
+        if not current:  # pragma: no cover - defensive
             return
         if self._manifest_generator is None:
             self._manifest_generator = ManifestGenerator(
@@ -258,7 +434,7 @@ class SealedSink(BaseSink):
             )
 
         manifest = self._manifest_generator.generate(
-            self._current_file,
+            current,
             closed_ts=datetime.now(timezone.utc),
         )
         if self._config.use_kms_signing and self._provider and self._sign_manifests:
@@ -267,7 +443,7 @@ class SealedSink(BaseSink):
             )
             signature = await self._provider.sign(self._config.key_id, payload)
             manifest["signature"] = b64url_encode(signature)
-        manifest_path = Path(self._current_file.filename + ".manifest.json")
+        manifest_path = Path(current.filename + ".manifest.json")
         if self._manifest_path:
             manifest_path = Path(self._manifest_path) / manifest_path.name
         manifest_path.parent.mkdir(parents=True, exist_ok=True)
@@ -278,10 +454,10 @@ class SealedSink(BaseSink):
         )
         # Update chain continuity tracker
         root_hash = manifest.get("root_chain_hash")
-        if root_hash:
+        if root_hash and advance_chain:
             self._previous_root = root_hash
-        if self._config.compress_rotated:
-            await self._compress_file(self._current_file.filename)
+        if compress and self._config.compress_rotated:
+            await self._compress_file(current.filename)
 
     async def _compress_file(self, filename: str) -> None:
         src = Path(filename)
@@ -314,9 +490,11 @@ class SealedSink(BaseSink):
             return
 
         def _do_fsync() -> None:
+            # fdatasync skips the inode metadata flush where the OS supports it
+            sync = getattr(os, "fdatasync", None) or os.fsync
             try:
                 with open(path, "rb") as f:
-                    os.fsync(f.fileno())
+                    sync(f.fileno())
             except Exception:  # pragma: no cover - fsync best effort
                 return
 
@@ -335,7 +513,7 @@ class SealedSink(BaseSink):
             return None
 
     def _get_current_filename(self) -> str:
-        for attr in ("path", "file_path", "filename", "name"):
+        for attr in ("active_path", "path", "file_path", "filename", "name"):
             if hasattr(self._inner, attr):
                 candidate = getattr(self._inner, attr)
                 if callable(candidate):
@@ -7,15 +7,26 @@ from __future__ import annotations
 import argparse
 import asyncio
 import base64
+import contextlib
 import hashlib
 import hmac
 import json
+import multiprocessing
+import os
+import pickle
 import time
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
 from dataclasses import asdict, dataclass, field
 from pathlib import Path
-from typing import Any, Iterable, Protocol
+from typing import Any, AsyncIterator, Iterator, Protocol
+
+import orjson
+
+from fapilog.core.jsonl import is_compressed, iter_lines, line_ranges
 
 from .canonical import b64url_decode, b64url_encode, canonicalize
+from .merkle import leaf_hash, root_from_path
 from .sealed_sink import ManifestGenerator
 
 try:  # Optional Ed25519 dependency
@@ -115,11 +126,28 @@ def _decode_key(raw: bytes) -> bytes | None:
     return None
 
 
+_DEFAULT_CHUNK_BYTES = 8 * 1024 * 1024
+
+
 class Verifier:
-    """Verification engine for tamper-evident logs."""
+    """Verification engine for tamper-evident logs.
 
-    def __init__(self, keys: KeyStore):
+    Files are verified as a stream: MAC checks run over byte-range chunks
+    (fanned out to a process pool when ``workers > 1``) while chain linkage
+    is checked in one sequential pass that keeps only the previous link.
+    """
+
+    def __init__(
+        self,
+        keys: KeyStore,
+        *,
+        workers: int = 1,
+        chunk_bytes: int = _DEFAULT_CHUNK_BYTES,
+    ):
         self._keys = keys
+        self._workers = max(1, workers)
+        self._chunk_bytes = max(1, chunk_bytes)
+        self._executor: Executor | None = None
 
     def verify_record(self, record: dict, key: bytes, algo: str) -> bool:
         """Verify MAC for a single record."""
@@ -131,6 +159,18 @@ class Verifier:
         payload = canonicalize(payload_record)
 
         stored_mac = b64url_decode(integrity.get("mac", ""))
+        if "merkle_path" in integrity:
+            # Batch-sealed record: the MAC covers the batch root, so fold the
+            # record's audit path back up to the root before checking it.
+            try:
+                payload = root_from_path(
+                    leaf_hash(payload),
+                    int(integrity.get("merkle_index", 0)),
+                    int(integrity.get("merkle_size", 0)),
+                    [b64url_decode(h) for h in integrity["merkle_path"]],
+                )
+            except (TypeError, ValueError):
+                return False
         if algo == "HMAC-SHA256":
             expected_mac = hmac.new(key, payload, hashlib.sha256).digest()
             return hmac.compare_digest(stored_mac, expected_mac)
@@ -150,41 +190,19 @@ class Verifier:
         expected_start_seq: int = 1,
     ) -> list[VerifyError]:
         """Verify chain linkage across records."""
-        errors: list[VerifyError] = []
-        prev_chain_hash = expected_first_prev or b64url_encode(b"\x00" * 32)
-        prev_seq = expected_start_seq - 1
-
+        cursor = _ChainCursor(expected_first_prev, start_seq=expected_start_seq)
+        links = []
         for record in records:
             integrity = record.get("integrity", {})
-            seq = integrity.get("seq", 0)
-            stored_prev = integrity.get("prev_chain_hash", "")
-
-            if seq != prev_seq + 1:
-                errors.append(
-                    VerifyError(
-                        seq=seq,
-                        error_type="seq_gap",
-                        expected=str(prev_seq + 1),
-                        actual=str(seq),
-                        message=f"Sequence gap: expected {prev_seq + 1}, got {seq}",
-                    )
+            links.append(
+                (
+                    integrity.get("seq", 0),
+                    integrity.get("prev_chain_hash", ""),
+                    integrity.get("chain_hash", ""),
                 )
-
-            if stored_prev != prev_chain_hash:
-                errors.append(
-                    VerifyError(
-                        seq=seq,
-                        error_type="chain_break",
-                        expected=prev_chain_hash,
-                        actual=stored_prev,
-                        message=f"Chain break at seq {seq}",
-                    )
-                )
-
-            prev_chain_hash = integrity.get("chain_hash", "")
-            prev_seq = seq
-
-        return errors
+            )
+        cursor.feed(links)
+        return cursor.errors
 
     async def verify_file(
         self,
@@ -192,67 +210,76 @@ class Verifier:
         manifest_path: Path | None = None,
     ) -> VerifyReport:
         """Verify a complete log file."""
-        start = time.monotonic()
-        records: list[dict] = []
-        errors: list[VerifyError] = []
-        records_valid = 0
-
-        for line_num, record in self._stream_records(path):
-            integrity = record.get("integrity", {})
-            key_id = integrity.get("key_id", "")
-            key = self._keys.get_key(key_id)
-            if not key:
-                errors.append(
-                    VerifyError(
-                        seq=integrity.get("seq", 0),
-                        error_type="missing_key",
-                        message=f"Key not found: {key_id}",
+        size = path.stat().st_size if path.exists() else 0
+        with self._parallel(enabled=size > self._chunk_bytes):
+            return await self._verify_file(path, manifest_path)
+
+    async def verify_files(self, paths: list[Path]) -> list[VerifyReport]:
+        """Verify several files concurrently, sharing one worker pool.
+
+        Each file is checked against its ``<file>.manifest.json`` sidecar when
+        present. Reports are returned in the order of ``paths``.
+        """
+        total = sum(p.stat().st_size for p in paths if p.exists())
+        with self._parallel(enabled=total > self._chunk_bytes):
+            limit = asyncio.Semaphore(self._workers)
+
+            async def _one(path: Path) -> VerifyReport:
+                manifest_path = _sidecar_manifest(path)
+                async with limit:
+                    return await self._verify_file(
+                        path, manifest_path if manifest_path.exists() else None
                     )
-                )
-                records.append(record)
-                continue
 
-            algo = integrity.get("algo", "HMAC-SHA256")
-            if self.verify_record(record, key, algo):
-                records_valid += 1
-            else:
-                errors.append(
-                    VerifyError(
-                        seq=integrity.get("seq", 0),
-                        error_type="mac_mismatch",
-                        message=f"MAC verification failed at line {line_num}",
-                    )
-                )
-            records.append(record)
+            return list(await asyncio.gather(*(_one(p) for p in paths)))
 
+    async def _verify_file(
+        self, path: Path, manifest_path: Path | None
+    ) -> VerifyReport:
+        start = time.monotonic()
         manifest_data: dict[str, Any] = {}
-        expected_prev = None
         if manifest_path and manifest_path.exists():
             try:
                 manifest_data = json.loads(manifest_path.read_text())
-                expected_prev = manifest_data.get("continues_from")
             except Exception:
                 manifest_data = {}
-        start_seq = records[0].get("integrity", {}).get("seq", 1) if records else 1
-        chain_errors = self.verify_chain(
-            records, expected_first_prev=expected_prev, expected_start_seq=start_seq
-        )
+
+        cursor = _ChainCursor(manifest_data.get("continues_from"))
+        errors: list[VerifyError] = []
+        records_checked = 0
+        records_valid = 0
+
+        async for chunk in self._verify_chunks(path):
+            for rel_line, seq, error_type, key_id in chunk.failures:
+                if error_type == "missing_key":
+                    message = f"Key not found: {key_id}"
+                else:
+                    line_num = records_checked + rel_line
+                    message = f"MAC verification failed at line {line_num}"
+                errors.append(
+                    VerifyError(seq=seq, error_type=error_type, message=message)
+                )
+            cursor.feed(chunk.links)
+            records_checked += chunk.lines
+            records_valid += chunk.valid
+
+        chain_errors = cursor.errors
         errors.extend(chain_errors)
 
         manifest_valid = None
         manifest_sig_valid = None
         if manifest_data:
-            manifest_valid, manifest_sig_valid = await self._verify_manifest(
-                manifest_path, records
+            manifest_valid, manifest_sig_valid = self._verify_manifest(
+                manifest_data, cursor.last_chain_hash, records_checked
             )
 
         duration = (time.monotonic() - start) * 1000
         return VerifyReport(
             valid=len(errors) == 0 and manifest_valid in (None, True),
             file_path=str(path),
-            records_checked=len(records),
+            records_checked=records_checked,
             records_valid=records_valid,
-            records_invalid=len(records) - records_valid,
+            records_invalid=records_checked - records_valid,
             first_invalid_seq=errors[0].seq if errors else None,
             chain_valid=not chain_errors,
             chain_breaks=[e.seq for e in chain_errors if e.error_type == "chain_break"],
@@ -262,17 +289,61 @@ class Verifier:
             duration_ms=duration,
         )
 
-    async def _verify_manifest(
-        self, manifest_path: Path, records: list[dict]
+    async def _verify_chunks(self, path: Path) -> AsyncIterator[_ChunkResult]:
+        """Yield per-chunk MAC results in file order.
+
+        With a pool, up to ``2 * workers`` chunks are in flight so memory stays
+        bounded regardless of file size.
+        """
+        executor = self._executor
+        if executor is None:
+            for begin, end in line_ranges(path, self._chunk_bytes):
+                yield _verify_range(str(path), begin, end, self._keys)
+            return
+        loop = asyncio.get_running_loop()
+        pending: deque[asyncio.Future[_ChunkResult]] = deque()
+        for begin, end in line_ranges(path, self._chunk_bytes):
+            pending.append(
+                loop.run_in_executor(executor, _verify_range, str(path), begin, end)
+            )
+            if len(pending) >= 2 * self._workers:
+                yield await pending.popleft()
+        while pending:
+            yield await pending.popleft()
+
+    @contextlib.contextmanager
+    def _parallel(self, *, enabled: bool) -> Iterator[None]:
+        """Provide a process pool for the duration of a verification run."""
+        if not enabled or self._workers <= 1 or self._executor is not None:
+            yield
+            return
+        try:
+            pickle.dumps(self._keys)
+        except Exception:
+            _warn("key store is not picklable; verifying serially")
+            yield
+            return
+        pool = ProcessPoolExecutor(
+            max_workers=self._workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(self._keys,),
+        )
+        self._executor = pool
+        try:
+            yield
+        finally:
+            self._executor = None
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    def _verify_manifest(
+        self, manifest: dict[str, Any], last_hash: str | None, record_count: int
     ) -> tuple[bool, bool]:
-        manifest = json.loads(manifest_path.read_text())
         sig = manifest.get("signature")
-        root_chain_hash = manifest.get("root_chain_hash")
-        record_count = manifest.get("record_count")
-
-        last = records[-1] if records else {}
-        last_hash = last.get("integrity", {}).get("chain_hash")
-        manifest_valid = root_chain_hash == last_hash and record_count == len(records)
+        manifest_valid = (
+            manifest.get("root_chain_hash") == last_hash
+            and manifest.get("record_count") == record_count
+        )
 
         sig_valid = False
         if sig:
@@ -283,13 +354,132 @@ class Verifier:
                 sig_valid = _verify_manifest_signature(manifest, key, algo)
         return manifest_valid, sig_valid
 
-    def _stream_records(self, path: Path) -> Iterable[tuple[int, dict]]:
-        with open(path, encoding="utf-8") as f:
-            for idx, line in enumerate(f, start=1):
-                try:
-                    yield idx, json.loads(line)
-                except Exception:
-                    yield idx, {}
+
+@dataclass
+class _ChunkResult:
+    """MAC results for one byte range, plus the chain links it contained."""
+
+    lines: int
+    valid: int
+    # (line within chunk, seq, error_type, key_id)
+    failures: list[tuple[int, int, str, str]]
+    # (seq, prev_chain_hash, chain_hash) in file order
+    links: list[tuple[int, str, str]]
+
+
+class _ChainCursor:
+    """Sequential chain check holding only the previous link."""
+
+    def __init__(
+        self, expected_first_prev: str | None, *, start_seq: int | None = None
+    ) -> None:
+        self._prev_chain_hash = expected_first_prev or b64url_encode(b"\x00" * 32)
+        # None means "take the first record's seq as the start"
+        self._prev_seq: int | None = None if start_seq is None else start_seq - 1
+        self.last_chain_hash: str | None = None
+        self.errors: list[VerifyError] = []
+
+    def feed(self, links: list[tuple[int, str, str]]) -> None:
+        for seq, stored_prev, chain_hash in links:
+            if self._prev_seq is None:
+                # Chains may start mid-stream (rotated files); trust the first seq
+                self._prev_seq = seq - 1
+            expected_seq = self._prev_seq + 1
+            if seq != expected_seq:
+                self.errors.append(
+                    VerifyError(
+                        seq=seq,
+                        error_type="seq_gap",
+                        expected=str(expected_seq),
+                        actual=str(seq),
+                        message=f"Sequence gap: expected {expected_seq}, got {seq}",
+                    )
+                )
+            if stored_prev != self._prev_chain_hash:
+                self.errors.append(
+                    VerifyError(
+                        seq=seq,
+                        error_type="chain_break",
+                        expected=self._prev_chain_hash,
+                        actual=stored_prev,
+                        message=f"Chain break at seq {seq}",
+                    )
+                )
+            self._prev_chain_hash = chain_hash
+            self._prev_seq = seq
+            self.last_chain_hash = chain_hash
+
+
+_worker_keys: KeyStore | None = None
+
+
+def _init_worker(keys: KeyStore) -> None:
+    global _worker_keys
+    _worker_keys = keys
+
+
+def _verify_range(
+    path: str, begin: int, end: int | None, keys: KeyStore | None = None
+) -> _ChunkResult:
+    """Verify MACs for the records in ``[begin, end)`` of ``path``.
+
+    Runs inside pool workers, so it reopens the file and only returns the
+    compact chain links rather than parsed records.
+    """
+    store = keys if keys is not None else _worker_keys
+    assert store is not None  # set by _init_worker in pool processes
+    verifier = Verifier(store)
+    key_cache: dict[str, bytes | None] = {}
+
+    valid = 0
+    idx = 0
+    failures: list[tuple[int, int, str, str]] = []
+    links: list[tuple[int, str, str]] = []
+    for idx, (_, line) in enumerate(iter_lines(path, begin, end), start=1):
+        try:
+            record = orjson.loads(line)
+        except orjson.JSONDecodeError:
+            record = {}
+        if not isinstance(record, dict):
+            record = {}
+        integrity = record.get("integrity")
+        if not isinstance(integrity, dict):
+            integrity = {}
+        seq = integrity.get("seq", 0)
+        links.append(
+            (seq, integrity.get("prev_chain_hash", ""), integrity.get("chain_hash", ""))
+        )
+
+        key_id = integrity.get("key_id", "")
+        if key_id not in key_cache:
+            key_cache[key_id] = store.get_key(key_id)
+        key = key_cache[key_id]
+        if not key:
+            failures.append((idx, seq, "missing_key", key_id))
+            continue
+        algo = integrity.get("algo", "HMAC-SHA256")
+        if verifier.verify_record(record, key, algo):
+            valid += 1
+        else:
+            failures.append((idx, seq, "mac_mismatch", key_id))
+    return _ChunkResult(lines=idx, valid=valid, failures=failures, links=links)
+
+
+def _sidecar_manifest(path: Path) -> Path:
+    manifest = Path(str(path) + ".manifest.json")
+    if is_compressed(path) and not manifest.exists():
+        # Compressed rotations keep the manifest of the original file
+        return Path(str(path)[: -len(".gz")] + ".manifest.json")
+    return manifest
+
+
+def _warn(message: str, **fields: Any) -> None:
+    try:
+        from fapilog.core import diagnostics
+
+        diagnostics.warn("tamper", message, **fields)
+    except Exception:
+        pass
 
 
 def _verify_manifest_signature(manifest: dict[str, Any], key: bytes, algo: str) -> bool:
@@ -376,9 +566,16 @@ def _resolve_continues_from(continues_from: dict | Path | None) -> str | None:
     return None
 
 
-async def verify_chain_across_files(files: list[Path], keys: KeyStore) -> VerifyReport:
-    """Verify chain continuity across multiple files (ordered)."""
-    verifier = Verifier(keys)
+async def verify_chain_across_files(
+    files: list[Path], keys: KeyStore, *, workers: int = 1
+) -> VerifyReport:
+    """Verify chain continuity across multiple files (ordered).
+
+    Files are verified concurrently; only their boundary hashes (manifest
+    ``root_chain_hash``/``continues_from``) are reconciled in order afterwards.
+    """
+    verifier = Verifier(keys, workers=workers)
+    reports = await verifier.verify_files(files)
     overall_errors: list[VerifyError] = []
     last_root: str | None = None
     manifest_valid = True
@@ -386,11 +583,8 @@ async def verify_chain_across_files(files: list[Path], keys: KeyStore) -> Verify
     records_checked = 0
     records_valid = 0
 
-    for path in files:
-        manifest_path = Path(str(path) + ".manifest.json")
-        report = await verifier.verify_file(
-            path, manifest_path if manifest_path.exists() else None
-        )
+    for path, report in zip(files, reports, strict=True):
+        manifest_path = _sidecar_manifest(path)
         records_checked += report.records_checked
         records_valid += report.records_valid
         overall_errors.extend(report.errors)
@@ -483,15 +677,21 @@ def _build_key_store(keys: Path | None, key_env: str | None) -> KeyStore:
     if keys:
         stores.append(FileKeyStore(keys))
 
-    class _Composite(KeyStore):
-        def get_key(self, key_id: str) -> bytes | None:
-            for store in stores:
-                key = store.get_key(key_id)
-                if key:
-                    return key
-            return None
+    return _CompositeKeyStore(stores)
+
 
-    return _Composite()
+class _CompositeKeyStore:
+    """First-match lookup across key stores (module level so it pickles)."""
+
+    def __init__(self, stores: list[KeyStore]) -> None:
+        self._stores = stores
+
+    def get_key(self, key_id: str) -> bytes | None:
+        for store in self._stores:
+            key = store.get_key(key_id)
+            if key:
+                return key
+        return None
 
 
 def _print_report(
@@ -512,8 +712,8 @@ def _print_report(
 def main(argv: list[str] | None = None) -> int:
     parser = argparse.ArgumentParser(prog="fapilog-tamper")
     sub = parser.add_subparsers(dest="command")
-    v = sub.add_parser("verify", help="Verify tamper-evident log file")
-    v.add_argument("path")
+    v = sub.add_parser("verify", help="Verify tamper-evident log file(s)")
+    v.add_argument("path", nargs="+", help="Log file(s); several are chain-linked")
     v.add_argument("--manifest")
     v.add_argument("--keys")
     v.add_argument("--key-env")
@@ -522,16 +722,28 @@ def main(argv: list[str] | None = None) -> int:
     )
     v.add_argument("--verbose", action="store_true")
     v.add_argument("--quiet", action="store_true")
+    v.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Processes used for MAC verification (default: CPU count)",
+    )
 
     args = parser.parse_args(argv)
     if args.command == "verify":
+        if args.manifest and len(args.path) > 1:
+            parser.error("--manifest applies to a single file")
         key_path = Path(args.keys) if args.keys else None
         key_store = _build_key_store(key_path, args.key_env)
-        verifier = Verifier(key_store)
-        manifest = Path(args.manifest) if args.manifest else None
-        report = asyncio.run(
-            verifier.verify_file(Path(args.path), manifest_path=manifest)
-        )
+        paths = [Path(p) for p in args.path]
+        if len(paths) > 1:
+            report = asyncio.run(
+                verify_chain_across_files(paths, key_store, workers=args.workers)
+            )
+        else:
+            verifier = Verifier(key_store, workers=args.workers)
+            manifest = Path(args.manifest) if args.manifest else None
+            report = asyncio.run(verifier.verify_file(paths[0], manifest_path=manifest))
         _print_report(
             report,
             output_format=args.output_format,
@@ -45,6 +45,13 @@ CORE_COVERAGE: dict[str, list[str]] = {
         "sink_circuit_breaker_failure_threshold",
         "sink_circuit_breaker_recovery_timeout_seconds",
         "sink_circuit_breaker_fallback_sink",
+        "sink_circuit_breaker_spill_directory",
+        "sink_circuit_breaker_spill_max_bytes",
+        "sink_circuit_breaker_spill_replay_rate",
+        "sink_circuit_breaker_failure_rate_threshold",
+        "sink_circuit_breaker_window_seconds",
+        "sink_circuit_breaker_minimum_events",
+        "sink_circuit_breaker_probe_size",
     ],
     "with_backpressure": ["backpressure_wait_ms", "drop_on_full"],
     "with_protected_levels": ["protected_levels"],
@@ -120,6 +127,9 @@ SINK_PARAM_MAPPINGS: dict[str, dict[str, str]] = {
         "endpoint_url": "endpoint_url",
         "batch_size": "batch_size",
         "batch_timeout": "batch_timeout_seconds",
+        "pipelined": "pipelined",
+        "max_in_flight_batches": "max_in_flight_batches",
+        "max_batch_bytes": "max_batch_bytes",
         "max_retries": "max_retries",
         "retry_delay": "retry_base_delay",
         "create_group": "create_log_group",
@@ -134,6 +144,9 @@ SINK_PARAM_MAPPINGS: dict[str, dict[str, str]] = {
         "label_keys": "label_keys",
         "batch_size": "batch_size",
         "batch_timeout": "batch_timeout_seconds",
+        "pipelined": "pipelined",
+        "max_in_flight_batches": "max_in_flight_batches",
+        "max_batch_bytes": "max_batch_bytes",
         "timeout": "timeout_seconds",
         "max_retries": "max_retries",
         "retry_delay": "retry_base_delay",
@@ -154,6 +167,8 @@ SINK_PARAM_MAPPINGS: dict[str, dict[str, str]] = {
         "schema": "schema_name",
         "batch_size": "batch_size",
         "batch_timeout": "batch_timeout_seconds",
+        "pipelined": "pipelined",
+        "max_in_flight_batches": "max_in_flight_batches",
         "max_retries": "max_retries",
         "retry_delay": "retry_base_delay",
         "min_pool": "min_pool_size",
@@ -32,6 +32,9 @@ SHORT_ALIAS_MAPPINGS: dict[str, str] = {
     "FAPILOG_CLOUDWATCH__ENDPOINT_URL": "FAPILOG_SINK_CONFIG__CLOUDWATCH__ENDPOINT_URL",
     "FAPILOG_CLOUDWATCH__BATCH_SIZE": "FAPILOG_SINK_CONFIG__CLOUDWATCH__BATCH_SIZE",
     "FAPILOG_CLOUDWATCH__BATCH_TIMEOUT_SECONDS": "FAPILOG_SINK_CONFIG__CLOUDWATCH__BATCH_TIMEOUT_SECONDS",
+    "FAPILOG_CLOUDWATCH__PIPELINED": "FAPILOG_SINK_CONFIG__CLOUDWATCH__PIPELINED",
+    "FAPILOG_CLOUDWATCH__MAX_IN_FLIGHT_BATCHES": "FAPILOG_SINK_CONFIG__CLOUDWATCH__MAX_IN_FLIGHT_BATCHES",
+    "FAPILOG_CLOUDWATCH__MAX_BATCH_BYTES": "FAPILOG_SINK_CONFIG__CLOUDWATCH__MAX_BATCH_BYTES",
     "FAPILOG_CLOUDWATCH__CREATE_LOG_GROUP": "FAPILOG_SINK_CONFIG__CLOUDWATCH__CREATE_LOG_GROUP",
     "FAPILOG_CLOUDWATCH__CREATE_LOG_STREAM": "FAPILOG_SINK_CONFIG__CLOUDWATCH__CREATE_LOG_STREAM",
     "FAPILOG_CLOUDWATCH__MAX_RETRIES": "FAPILOG_SINK_CONFIG__CLOUDWATCH__MAX_RETRIES",
@@ -45,6 +48,9 @@ SHORT_ALIAS_MAPPINGS: dict[str, str] = {
     "FAPILOG_LOKI__LABEL_KEYS": "FAPILOG_SINK_CONFIG__LOKI__LABEL_KEYS",
     "FAPILOG_LOKI__BATCH_SIZE": "FAPILOG_SINK_CONFIG__LOKI__BATCH_SIZE",
     "FAPILOG_LOKI__BATCH_TIMEOUT_SECONDS": "FAPILOG_SINK_CONFIG__LOKI__BATCH_TIMEOUT_SECONDS",
+    "FAPILOG_LOKI__PIPELINED": "FAPILOG_SINK_CONFIG__LOKI__PIPELINED",
+    "FAPILOG_LOKI__MAX_IN_FLIGHT_BATCHES": "FAPILOG_SINK_CONFIG__LOKI__MAX_IN_FLIGHT_BATCHES",
+    "FAPILOG_LOKI__MAX_BATCH_BYTES": "FAPILOG_SINK_CONFIG__LOKI__MAX_BATCH_BYTES",
     "FAPILOG_LOKI__TIMEOUT_SECONDS": "FAPILOG_SINK_CONFIG__LOKI__TIMEOUT_SECONDS",
     "FAPILOG_LOKI__MAX_RETRIES": "FAPILOG_SINK_CONFIG__LOKI__MAX_RETRIES",
     "FAPILOG_LOKI__RETRY_BASE_DELAY": "FAPILOG_SINK_CONFIG__LOKI__RETRY_BASE_DELAY",
@@ -70,6 +76,8 @@ SHORT_ALIAS_MAPPINGS: dict[str, str] = {
     "FAPILOG_POSTGRES__POOL_ACQUIRE_TIMEOUT": "FAPILOG_SINK_CONFIG__POSTGRES__POOL_ACQUIRE_TIMEOUT",
     "FAPILOG_POSTGRES__BATCH_SIZE": "FAPILOG_SINK_CONFIG__POSTGRES__BATCH_SIZE",
     "FAPILOG_POSTGRES__BATCH_TIMEOUT_SECONDS": "FAPILOG_SINK_CONFIG__POSTGRES__BATCH_TIMEOUT_SECONDS",
+    "FAPILOG_POSTGRES__PIPELINED": "FAPILOG_SINK_CONFIG__POSTGRES__PIPELINED",
+    "FAPILOG_POSTGRES__MAX_IN_FLIGHT_BATCHES": "FAPILOG_SINK_CONFIG__POSTGRES__MAX_IN_FLIGHT_BATCHES",
     "FAPILOG_POSTGRES__MAX_RETRIES": "FAPILOG_SINK_CONFIG__POSTGRES__MAX_RETRIES",
     "FAPILOG_POSTGRES__RETRY_BASE_DELAY": "FAPILOG_SINK_CONFIG__POSTGRES__RETRY_BASE_DELAY",
     "FAPILOG_POSTGRES__CIRCUIT_BREAKER_ENABLED": "FAPILOG_SINK_CONFIG__POSTGRES__CIRCUIT_BREAKER_ENABLED",
@@ -93,6 +101,9 @@ SHORT_ALIAS_MAPPINGS: dict[str, str] = {
     "FAPILOG_FILE__MAX_FILES": "__SPECIAL_FILE_SINK__",
     "FAPILOG_FILE__MAX_TOTAL_BYTES": "__SPECIAL_FILE_SINK__",
     "FAPILOG_FILE__COMPRESS_ROTATED": "__SPECIAL_FILE_SINK__",
+    "FAPILOG_FILE__DURABILITY": "__SPECIAL_FILE_SINK__",
+    "FAPILOG_FILE__FSYNC_INTERVAL_MS": "__SPECIAL_FILE_SINK__",
+    "FAPILOG_FILE__FSYNC_BYTES": "__SPECIAL_FILE_SINK__",
     # Runtime info enricher (special: reads from env directly in enricher)
     "FAPILOG_SERVICE": "__SPECIAL_ENRICHER__",
     "FAPILOG_ENV": "__SPECIAL_ENRICHER__",
@@ -427,7 +427,14 @@ def _configure_logger_common(
             enabled=True,
             failure_threshold=cfg_source.core.sink_circuit_breaker_failure_threshold,
             recovery_timeout_seconds=cfg_source.core.sink_circuit_breaker_recovery_timeout_seconds,
+            half_open_probe_size=cfg_source.core.sink_circuit_breaker_probe_size,
+            failure_rate_threshold=cfg_source.core.sink_circuit_breaker_failure_rate_threshold,
+            window_seconds=cfg_source.core.sink_circuit_breaker_window_seconds,
+            minimum_events=cfg_source.core.sink_circuit_breaker_minimum_events,
             fallback_sink=cfg_source.core.sink_circuit_breaker_fallback_sink,
+            spill_directory=cfg_source.core.sink_circuit_breaker_spill_directory,
+            spill_max_bytes=cfg_source.core.sink_circuit_breaker_spill_max_bytes,
+            spill_replay_rate=cfg_source.core.sink_circuit_breaker_spill_replay_rate,
         )
 
     sink_write, sink_write_serialized, circuit_breakers = _routing_or_fanout_writer(
@@ -168,6 +168,9 @@ class LoggerBuilder:
         interval: str | int | None = None,
         max_files: int | None = None,
         compress: bool = False,
+        durability: str | None = None,
+        fsync_interval_ms: int | None = None,
+        fsync_bytes: str | int | None = None,
     ) -> Self:
         """Add rotating file sink.
 
@@ -178,6 +181,11 @@ class LoggerBuilder:
             interval: Rotation interval (supports "daily", "1h" strings)
             max_files: Max rotated files to keep
             compress: Compress rotated files
+            durability: Fsync policy: "none", "interval", "bytes", "batch",
+                or "event"
+            fsync_interval_ms: Sync period for durability="interval"
+            fsync_bytes: Unsynced bytes that trigger a sync for
+                durability="bytes" (supports "1 MB" strings)
 
         Raises:
             ValueError: If directory is empty
@@ -199,6 +207,15 @@ class LoggerBuilder:
         if compress:
             file_config["compress_rotated"] = True
 
+        if durability is not None:
+            file_config["durability"] = durability
+
+        if fsync_interval_ms is not None:
+            file_config["fsync_interval_ms"] = fsync_interval_ms
+
+        if fsync_bytes is not None:
+            file_config["fsync_bytes"] = fsync_bytes
+
         self._sinks.append({"name": name, "config": file_config})
         return self
 
@@ -909,6 +926,13 @@ class LoggerBuilder:
         failure_threshold: int = 5,
         recovery_timeout: str | float = "30s",
         fallback_sink: str | None = None,
+        spill_directory: str | None = None,
+        spill_max_bytes: str | int | None = None,
+        spill_replay_rate: float | None = None,
+        failure_rate_threshold: float | None = None,
+        window: str | float | None = None,
+        minimum_events: int | None = None,
+        probe_size: int | None = None,
     ) -> Self:
         """Configure sink circuit breaker for fault isolation.
 
@@ -918,6 +942,16 @@ class LoggerBuilder:
             recovery_timeout: Time before probing failed sink ("30s" or 30.0)
             fallback_sink: Name of sink to route events to when circuit opens.
                 Must match a configured sink name. None means silent skip.
+            spill_directory: Directory for durable spill queues. Events for
+                an open circuit are written to disk and replayed on recovery.
+            spill_max_bytes: Disk budget per sink ("256 MB" or bytes)
+            spill_replay_rate: Events per second replayed after recovery
+            failure_rate_threshold: Open when this share of events failed over
+                the rolling window (e.g. 0.5) instead of on consecutive failures
+            window: Rolling window for the failure rate ("30s" or 30.0)
+            minimum_events: Events needed in the window before the rate applies
+            probe_size: Events sent as a half-open probe before the rest of a
+                batch
 
         Example:
             >>> builder.with_circuit_breaker(
@@ -934,6 +968,20 @@ class LoggerBuilder:
         )
         if fallback_sink is not None:
             core["sink_circuit_breaker_fallback_sink"] = fallback_sink
+        if spill_directory is not None:
+            core["sink_circuit_breaker_spill_directory"] = spill_directory
+        if spill_max_bytes is not None:
+            core["sink_circuit_breaker_spill_max_bytes"] = spill_max_bytes
+        if spill_replay_rate is not None:
+            core["sink_circuit_breaker_spill_replay_rate"] = spill_replay_rate
+        if failure_rate_threshold is not None:
+            core["sink_circuit_breaker_failure_rate_threshold"] = failure_rate_threshold
+        if window is not None:
+            core["sink_circuit_breaker_window_seconds"] = self._parse_duration(window)
+        if minimum_events is not None:
+            core["sink_circuit_breaker_minimum_events"] = minimum_events
+        if probe_size is not None:
+            core["sink_circuit_breaker_probe_size"] = probe_size
         return self
 
     def with_backpressure(
@@ -1361,6 +1409,9 @@ class LoggerBuilder:
         endpoint_url: str | None = None,
         batch_size: int = 100,
         batch_timeout: str | float = "5s",
+        pipelined: bool = False,
+        max_in_flight_batches: int = 4,
+        max_batch_bytes: int = 1_048_576,
         max_retries: int = 3,
         retry_delay: str | float = 0.5,
         create_group: bool = True,
@@ -1378,6 +1429,9 @@ class LoggerBuilder:
             endpoint_url: Custom endpoint (e.g., LocalStack)
             batch_size: Events per batch (default: 100)
             batch_timeout: Batch flush timeout ("5s" or 5.0)
+            pipelined: Send batches in the background (default: False)
+            max_in_flight_batches: Batches in flight when pipelined (default: 4)
+            max_batch_bytes: Flush before a batch exceeds this many bytes (default: 1 MB)
             max_retries: Max retries for PutLogEvents (default: 3)
             retry_delay: Base delay for backoff ("0.5s" or 0.5)
             create_group: Create log group if missing (default: True)
@@ -1392,6 +1446,9 @@ class LoggerBuilder:
             "log_group_name": log_group,
             "batch_size": batch_size,
             "batch_timeout_seconds": self._parse_duration(batch_timeout),
+            "pipelined": pipelined,
+            "max_in_flight_batches": max_in_flight_batches,
+            "max_batch_bytes": max_batch_bytes,
             "max_retries": max_retries,
             "retry_base_delay": self._parse_duration(retry_delay),
             "create_log_group": create_group,
@@ -1420,6 +1477,9 @@ class LoggerBuilder:
         label_keys: list[str] | None = None,
         batch_size: int = 100,
         batch_timeout: str | float = "5s",
+        pipelined: bool = False,
+        max_in_flight_batches: int = 4,
+        max_batch_bytes: int | None = None,
         timeout: str | float = "10s",
         max_retries: int = 3,
         retry_delay: str | float = 0.5,
@@ -1439,6 +1499,9 @@ class LoggerBuilder:
             label_keys: Event keys to promote to labels
             batch_size: Events per batch (default: 100)
             batch_timeout: Batch flush timeout ("5s" or 5.0)
+            pipelined: Send batches in the background (default: False)
+            max_in_flight_batches: Batches in flight when pipelined (default: 4)
+            max_batch_bytes: Flush before a batch exceeds this many bytes
             timeout: HTTP request timeout ("10s" or 10.0)
             max_retries: Max retries on failure (default: 3)
             retry_delay: Base delay for backoff (0.5 or float)
@@ -1455,6 +1518,8 @@ class LoggerBuilder:
             "url": url,
             "batch_size": batch_size,
             "batch_timeout_seconds": self._parse_duration(batch_timeout),
+            "pipelined": pipelined,
+            "max_in_flight_batches": max_in_flight_batches,
             "timeout_seconds": self._parse_duration(timeout),
             "max_retries": max_retries,
             "retry_base_delay": self._parse_duration(retry_delay),
@@ -1462,6 +1527,8 @@ class LoggerBuilder:
             "circuit_breaker_threshold": circuit_breaker_threshold,
         }
 
+        if max_batch_bytes is not None:
+            config["max_batch_bytes"] = max_batch_bytes
         if tenant_id is not None:
             config["tenant_id"] = tenant_id
         if labels is not None:
@@ -1492,6 +1559,8 @@ class LoggerBuilder:
         schema: str = "public",
         batch_size: int = 100,
         batch_timeout: str | float = "5s",
+        pipelined: bool = False,
+        max_in_flight_batches: int = 4,
         max_retries: int = 3,
         retry_delay: str | float = 0.5,
         min_pool: int = 2,
@@ -1518,6 +1587,8 @@ class LoggerBuilder:
             schema: Database schema (default: public)
             batch_size: Events per batch (default: 100)
             batch_timeout: Batch flush timeout ("5s" or 5.0)
+            pipelined: Send batches in the background (default: False)
+            max_in_flight_batches: Batches in flight when pipelined (default: 4)
             max_retries: Max retries on failure (default: 3)
             retry_delay: Base delay for backoff (0.5 or float)
             min_pool: Minimum pool connections (default: 2)
@@ -1543,6 +1614,8 @@ class LoggerBuilder:
             "schema_name": schema,
             "batch_size": batch_size,
             "batch_timeout_seconds": self._parse_duration(batch_timeout),
+            "pipelined": pipelined,
+            "max_in_flight_batches": max_in_flight_batches,
             "max_retries": max_retries,
             "retry_base_delay": self._parse_duration(retry_delay),
             "min_pool_size": min_pool,
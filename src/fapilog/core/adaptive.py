@@ -4,6 +4,9 @@ Adaptive processing utilities for dynamic batch sizing and backpressure
 Key components:
 - AdaptiveBatchSizer: Compute next batch size from latency vs. target
 - AdaptiveController: Combine latency/utilization for decisions
+- AimdWindow: Per-sink congestion window (additive increase/multiplicative
+  decrease) driven by delivery latency and congestion signals
+- ConcurrencyLimiter: Async gate admitting up to the window's size
 - process_with_adaptive_batches: Process a sequence using adaptive batches
 Design notes:
 - Async-first; callers supply async worker functions
@@ -12,8 +15,10 @@ Design notes:
 
 from __future__ import annotations
 
+import asyncio
 import math
-from dataclasses import dataclass
+from collections import deque
+from dataclasses import dataclass, field
 from typing import Awaitable, Callable, Sequence, TypeVar
 
 T = TypeVar("T")
@@ -84,6 +89,128 @@ class AdaptiveController:
         return utilization >= self.utilization_high_threshold
 
 
+@dataclass
+class AimdWindow:
+    """Congestion window for one sink's in-flight batches.
+
+    After each window's worth of deliveries the window grows by one if p95
+    latency is under target and the recent congestion ratio is low; it is
+    multiplied by ``decrease_factor`` on congestion (rate limiting, server
+    errors, timeouts) or when p95 latency exceeds the target. Setting
+    ``growth_enabled`` to False holds the window (e.g. while the pipeline is
+    under no pressure and extra concurrency would not help).
+    """
+
+    min_window: int = 1
+    max_window: int = 8
+    target_latency_ms: float = 500.0
+    max_congestion_ratio: float = 0.05
+    decrease_factor: float = 0.5
+    sample_size: int = 32
+    growth_enabled: bool = True
+
+    _size: int = field(init=False, default=0)
+    _latencies: deque[float] = field(init=False, repr=False)
+    _outcomes: deque[bool] = field(init=False, repr=False)
+    _successes: int = field(init=False, default=0)
+    _since_decrease: int = field(init=False, default=0)
+
+    def __post_init__(self) -> None:
+        self.min_window = max(1, self.min_window)
+        self.max_window = max(self.min_window, self.max_window)
+        self._size = self.min_window
+        self._latencies = deque(maxlen=self.sample_size)
+        self._outcomes = deque(maxlen=self.sample_size)
+        self._since_decrease = self.max_window
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def p95_latency_ms(self) -> float | None:
+        if not self._latencies:
+            return None
+        ordered = sorted(self._latencies)
+        return ordered[math.ceil(0.95 * len(ordered)) - 1]
+
+    def record(self, latency_ms: float, *, congested: bool) -> bool:
+        """Record one delivery; returns True if the window size changed."""
+        before = self._size
+        self._outcomes.append(congested)
+        self._since_decrease += 1
+        if congested:
+            self._decrease()
+            return self._size != before
+        self._latencies.append(latency_ms)
+        self._successes += 1
+        if self._successes >= self._size:
+            self._successes = 0
+            p95 = self.p95_latency_ms()
+            if p95 is not None and p95 > self.target_latency_ms:
+                self._decrease()
+            elif self.growth_enabled and self._size < self.max_window:
+                congestion = sum(self._outcomes) / len(self._outcomes)
+                if congestion <= self.max_congestion_ratio:
+                    self._size += 1
+        return self._size != before
+
+    def _decrease(self) -> None:
+        # Batches already in flight when the window was cut report late;
+        # allow one cut per window's worth of results
+        if self._since_decrease < self._size:
+            return
+        self._size = max(self.min_window, int(self._size * self.decrease_factor))
+        self._since_decrease = 0
+        self._successes = 0
+        self._latencies.clear()
+
+
+class ConcurrencyLimiter:
+    """Async gate admitting at most ``window.size`` concurrent operations.
+
+    Callers ``await acquire()`` before an operation and report its latency
+    and outcome with ``release()``, which feeds the window.
+    """
+
+    def __init__(self, window: AimdWindow) -> None:
+        self.window = window
+        self._in_flight = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    async def acquire(self) -> None:
+        while self._in_flight >= self.window.size:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                else:
+                    self._wake()  # pass on a wake-up we can no longer use
+                raise
+        self._in_flight += 1
+
+    def release(self, latency_ms: float, *, congested: bool = False) -> bool:
+        """Free a slot; returns True if the window size changed."""
+        self._in_flight -= 1
+        resized = self.window.record(latency_ms, congested=congested)
+        self._wake()
+        return resized
+
+    def _wake(self) -> None:
+        free = self.window.size - self._in_flight
+        while free > 0 and self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                free -= 1
+
+
 async def process_with_adaptive_batches(
     values: Sequence[T],
     worker: Callable[[Sequence[T]], Awaitable[list[R]]],
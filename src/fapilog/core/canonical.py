@@ -0,0 +1,110 @@
+"""
+Canonical JSON encoding for hashing and signing.
+
+Integrity features (tamper-evident chains, signed manifests, audit
+checksums) need the same value to always encode to the same bytes. The
+canonical form is:
+
+- object keys sorted by code point, compact ``,``/``:`` separators, UTF-8
+- strings escaped as ``json.dumps`` does; with ``ascii_only`` every
+  character outside printable ASCII becomes a ``\\uXXXX`` escape
+- integers in decimal; floats in Python's shortest round-trip ``repr``
+  (``1e-05``, ``1e+16``); NaN and infinities as ``null``
+- ``datetime``/``date``/``time`` as ``isoformat()`` strings, ``UUID`` as its
+  hyphenated string, ``Enum`` members as their value
+- any other type raises ``TypeError``
+
+This is byte-for-byte what ``json.dumps(sort_keys=True,
+separators=(",", ":"), ensure_ascii=...)`` produced for JSON-native input,
+so chains and signatures created with the stdlib still verify.
+:func:`canonical_json` encodes with orjson and falls back to
+:func:`canonical_json_reference`, the pure-Python definition, for inputs
+orjson rejects or formats differently.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import re
+from datetime import date, datetime, time
+from enum import Enum
+from typing import Any
+from uuid import UUID
+
+import orjson
+
+# orjson spells some floats differently from ``repr``: small magnitudes as
+# plain decimals (``0.00001`` vs ``1e-05``) and one-digit exponents
+# (``1e-7`` vs ``1e-07``). Output containing these shapes is re-encoded by
+# the reference encoder. Matches inside strings only cost a slower encode.
+_FLOAT_DIVERGENCE = re.compile(rb"0\.0000|e-[0-9](?![0-9])")
+
+# orjson leaves DEL and all non-ASCII characters unescaped
+_NON_ASCII = re.compile(r"[^\x00-\x7e]")
+
+# Route datetimes and dataclasses through ``_default`` so both encoders
+# share one definition for them
+_ORJSON_OPTIONS = (
+    orjson.OPT_SORT_KEYS
+    | orjson.OPT_PASSTHROUGH_DATETIME
+    | orjson.OPT_PASSTHROUGH_DATACLASS
+)
+
+
+def canonical_json(obj: Any, *, ascii_only: bool = False) -> bytes:
+    """Encode ``obj`` in canonical JSON form (see module docstring)."""
+    try:
+        data = orjson.dumps(obj, default=_default, option=_ORJSON_OPTIONS)
+    except TypeError:
+        return canonical_json_reference(obj, ascii_only=ascii_only)
+    # Substring probes are much cheaper than the regex and rarely match
+    if (b"e-" in data or b"0.0000" in data) and _FLOAT_DIVERGENCE.search(data):
+        return canonical_json_reference(obj, ascii_only=ascii_only)
+    if ascii_only and not (data.isascii() and b"\x7f" not in data):
+        return _NON_ASCII.sub(_escape, data.decode("utf-8")).encode("ascii")
+    return data
+
+
+def canonical_json_reference(obj: Any, *, ascii_only: bool = False) -> bytes:
+    """Pure-Python canonical encoder; the specification for canonical_json."""
+    return json.dumps(
+        _normalize(obj),
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=ascii_only,
+        allow_nan=False,
+        default=_default,
+    ).encode("utf-8")
+
+
+def _escape(match: re.Match[str]) -> str:
+    code = ord(match.group())
+    if code > 0xFFFF:
+        code -= 0x10000
+        return f"\\u{0xD800 | (code >> 10):04x}\\u{0xDC00 | (code & 0x3FF):04x}"
+    return f"\\u{code:04x}"
+
+
+def _normalize(obj: Any) -> Any:
+    # json.dumps has no hook for floats, so map non-finite values up front
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {k: _normalize(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_normalize(v) for v in obj]
+    return obj
+
+
+def _default(obj: Any) -> Any:
+    if isinstance(obj, (datetime, date, time)):
+        return obj.isoformat()
+    if isinstance(obj, UUID):
+        return str(obj)
+    if isinstance(obj, Enum):
+        return obj.value
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+__all__ = ["canonical_json", "canonical_json_reference"]
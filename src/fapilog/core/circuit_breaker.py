@@ -3,6 +3,12 @@ Lightweight circuit breaker utilities for sink protection.
 
 Only sink-level breakers are retained to isolate failing destinations without
 the heavier async breaker machinery that isn't used.
+
+Outcomes are recorded per batch (a single write is a batch of one). By
+default the circuit opens after ``failure_threshold`` failed events with no
+delivery in between; with ``failure_rate_threshold`` set it opens on the
+failed share of events over a rolling window instead, so a partial outage
+holds the circuit in one state rather than toggling it on every unlucky run.
 """
 
 from __future__ import annotations
@@ -30,7 +36,17 @@ class SinkCircuitBreakerConfig:
     failure_threshold: int = 5  # Open after N consecutive failures
     recovery_timeout_seconds: float = 30.0  # Wait before probing
     half_open_max_calls: int = 1  # Probes before closing
+    half_open_probe_size: int = 1  # Events per half-open probe batch
+    # Open on failed share of events over a rolling window (None = consecutive)
+    failure_rate_threshold: float | None = None
+    window_seconds: float = 30.0
+    window_buckets: int = 10
+    minimum_events: int = 20  # Below this, the consecutive threshold applies
     fallback_sink: str | None = None  # Name of fallback sink for open circuit
+    # Spill events to disk while open and replay them on recovery
+    spill_directory: str | None = None
+    spill_max_bytes: int = 256 * 1024 * 1024
+    spill_replay_rate: float | None = 1000.0  # records/second; None = unbounded
 
 
 class SinkCircuitBreaker:
@@ -61,6 +77,10 @@ class SinkCircuitBreaker:
         self._failure_count = 0
         self._last_failure_time: float | None = None
         self._half_open_calls = 0
+        buckets = max(1, config.window_buckets)
+        self._bucket_seconds = max(config.window_seconds, 1e-3) / buckets
+        # Rolling window: [bucket index, delivered, failed] per slot
+        self._buckets = [[-1, 0, 0] for _ in range(buckets)]
         self.on_state_change: Callable[[str, CircuitState], None] | None = None
 
     @property
@@ -71,12 +91,51 @@ class SinkCircuitBreaker:
     def is_open(self) -> bool:
         return self._state == CircuitState.OPEN
 
+    @property
+    def failure_threshold(self) -> int:
+        return self._config.failure_threshold
+
+    @property
+    def recovery_timeout_seconds(self) -> float:
+        return self._config.recovery_timeout_seconds
+
+    def add_state_listener(self, callback: Callable[[str, CircuitState], None]) -> None:
+        """Call ``callback`` on state changes after any existing handler.
+
+        ``on_state_change`` holds a single callable; this chains onto it so
+        several owners (pressure monitor, spill replay) can observe the same
+        breaker. A failing handler does not stop the next one.
+        """
+        previous = self.on_state_change
+        if previous is None:
+            self.on_state_change = callback
+            return
+
+        def _chained(name: str, state: CircuitState) -> None:
+            try:
+                previous(name, state)
+            finally:
+                callback(name, state)
+
+        self.on_state_change = _chained
+
     def should_allow(self) -> bool:
         """Return True if a call should be attempted."""
+        return self.admit(1) > 0
+
+    def admit(self, count: int) -> int:
+        """Return how many events of a ``count``-event batch may be sent.
+
+        All of them while closed and none while open. Once the recovery
+        timeout has elapsed, a half-open probe admits at most
+        ``half_open_probe_size`` events so a full batch is not risked; the
+        caller sends the rest only if the probe closes the circuit.
+        """
         with self._lock:
             if self._state == CircuitState.CLOSED:
-                return True
+                return count
 
+            probe = min(count, max(1, self._config.half_open_probe_size))
             if self._state == CircuitState.OPEN:
                 # Check if recovery timeout elapsed
                 if self._last_failure_time is not None:
@@ -84,39 +143,91 @@ class SinkCircuitBreaker:
                     if elapsed >= self._config.recovery_timeout_seconds:
                         self._state = CircuitState.HALF_OPEN
                         self._half_open_calls = 1  # Count this transition as first call
-                        return True
-                return False
+                        return probe
+                return 0
 
             # self._state == CircuitState.HALF_OPEN
             # Atomically check and increment call count
             if self._half_open_calls < self._config.half_open_max_calls:
                 self._half_open_calls += 1
-                return True
-            return False
+                return probe
+            return 0
 
     def record_success(self) -> None:
         """Record a successful call."""
-        with self._lock:
-            if self._state == CircuitState.HALF_OPEN:
-                # Recovery confirmed
-                self._state = CircuitState.CLOSED
-                self._emit_state_change("closed")
-            self._failure_count = 0
+        self.record_batch(1, 0)
 
     def record_failure(self) -> None:
         """Record a failed call."""
-        with self._lock:
-            self._failure_count += 1
-            self._last_failure_time = time.monotonic()
+        self.record_batch(0, 1)
+
+    def record_batch(self, delivered: int, failed: int) -> None:
+        """Record the outcome of a batch write.
 
+        A half-open probe closes the circuit only if every event was
+        delivered. While closed, any delivery resets the consecutive count,
+        so only batches that got nothing through accumulate toward
+        ``failure_threshold``.
+        """
+        with self._lock:
             if self._state == CircuitState.HALF_OPEN:
-                # Probe failed, back to open
-                self._state = CircuitState.OPEN
-                self._emit_state_change("open")
-            elif self._failure_count >= self._config.failure_threshold:
+                if failed:
+                    # Probe failed, back to open
+                    self._failure_count += failed
+                    self._last_failure_time = time.monotonic()
+                    self._state = CircuitState.OPEN
+                    self._emit_state_change("open")
+                elif delivered:
+                    # Recovery confirmed
+                    self._state = CircuitState.CLOSED
+                    self._failure_count = 0
+                    self._reset_window()
+                    self._emit_state_change("closed")
+                return
+
+            if delivered:
+                self._failure_count = 0
+            if failed:
+                self._failure_count += failed
+                self._last_failure_time = time.monotonic()
+            if self._config.failure_rate_threshold is not None:
+                total, failures = self._add_to_window(delivered, failed)
+                if total >= self._config.minimum_events:
+                    tripped = (
+                        failures > 0
+                        and failures / total >= self._config.failure_rate_threshold
+                    )
+                else:
+                    tripped = self._failure_count >= self._config.failure_threshold
+            else:
+                tripped = (
+                    failed > 0 and self._failure_count >= self._config.failure_threshold
+                )
+            if tripped and self._state == CircuitState.CLOSED:
                 self._state = CircuitState.OPEN
                 self._emit_state_change("open")
 
+    def _add_to_window(self, delivered: int, failed: int) -> tuple[int, int]:
+        """Add counts to the current bucket; return (events, failed) in window."""
+        index = int(time.monotonic() / self._bucket_seconds)
+        buckets = self._buckets
+        bucket = buckets[index % len(buckets)]
+        if bucket[0] != index:
+            bucket[0], bucket[1], bucket[2] = index, 0, 0
+        bucket[1] += delivered
+        bucket[2] += failed
+        oldest = index - len(buckets)
+        total = failures = 0
+        for idx, ok, bad in buckets:
+            if idx > oldest:
+                total += ok + bad
+                failures += bad
+        return total, failures
+
+    def _reset_window(self) -> None:
+        for bucket in self._buckets:
+            bucket[0], bucket[1], bucket[2] = -1, 0, 0
+
     def _emit_state_change(self, new_state: str) -> None:
         """Emit diagnostic and invoke external callback for state change."""
         try:
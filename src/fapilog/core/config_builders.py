@@ -69,6 +69,10 @@ def _sink_configs(settings: _Settings) -> dict[str, dict[str, _Any]]:
                 max_files=scfg.rotating_file.max_files,
                 max_total_bytes=scfg.rotating_file.max_total_bytes,
                 compress_rotated=scfg.rotating_file.compress_rotated,
+                durability=scfg.rotating_file.durability,
+                fsync_interval_ms=scfg.rotating_file.fsync_interval_ms,
+                fsync_bytes=scfg.rotating_file.fsync_bytes,
+                rotation_concurrency=scfg.rotating_file.rotation_concurrency,
             )
         },
         "http": {
@@ -86,6 +90,15 @@ def _sink_configs(settings: _Settings) -> dict[str, dict[str, _Any]]:
                 batch_timeout_seconds=settings.http.batch_timeout_seconds,
                 batch_format=settings.http.batch_format,
                 batch_wrapper_key=settings.http.batch_wrapper_key,
+                max_in_flight_batches=settings.http.max_in_flight_batches,
+                pipelined=settings.http.pipelined,
+                max_batch_bytes=settings.http.max_batch_bytes,
+                adaptive_concurrency=settings.http.adaptive_concurrency,
+                latency_target_ms=settings.http.latency_target_ms,
+                http2=settings.http.http2,
+                max_connections=settings.http.max_connections,
+                keepalive_expiry_seconds=settings.http.keepalive_expiry_seconds,
+                prewarm_connections=settings.http.prewarm_connections,
             )
         },
         "webhook": {
@@ -102,6 +115,15 @@ def _sink_configs(settings: _Settings) -> dict[str, dict[str, _Any]]:
                 timeout_seconds=scfg.webhook.timeout_seconds,
                 batch_size=scfg.webhook.batch_size,
                 batch_timeout_seconds=scfg.webhook.batch_timeout_seconds,
+                max_in_flight_batches=scfg.webhook.max_in_flight_batches,
+                pipelined=scfg.webhook.pipelined,
+                max_batch_bytes=scfg.webhook.max_batch_bytes,
+                adaptive_concurrency=scfg.webhook.adaptive_concurrency,
+                latency_target_ms=scfg.webhook.latency_target_ms,
+                http2=scfg.webhook.http2,
+                max_connections=scfg.webhook.max_connections,
+                keepalive_expiry_seconds=scfg.webhook.keepalive_expiry_seconds,
+                prewarm_connections=scfg.webhook.prewarm_connections,
             )
         },
         "loki": {
@@ -112,6 +134,9 @@ def _sink_configs(settings: _Settings) -> dict[str, dict[str, _Any]]:
                 "label_keys": scfg.loki.label_keys,
                 "batch_size": scfg.loki.batch_size,
                 "batch_timeout_seconds": scfg.loki.batch_timeout_seconds,
+                "pipelined": scfg.loki.pipelined,
+                "max_batch_bytes": scfg.loki.max_batch_bytes,
+                "max_in_flight_batches": scfg.loki.max_in_flight_batches,
                 "timeout_seconds": scfg.loki.timeout_seconds,
                 "max_retries": scfg.loki.max_retries,
                 "retry_base_delay": scfg.loki.retry_base_delay,
@@ -131,6 +156,9 @@ def _sink_configs(settings: _Settings) -> dict[str, dict[str, _Any]]:
                 create_log_stream=scfg.cloudwatch.create_log_stream,
                 batch_size=scfg.cloudwatch.batch_size,
                 batch_timeout_seconds=scfg.cloudwatch.batch_timeout_seconds,
+                pipelined=scfg.cloudwatch.pipelined,
+                max_batch_bytes=scfg.cloudwatch.max_batch_bytes,
+                max_in_flight_batches=scfg.cloudwatch.max_in_flight_batches,
                 endpoint_url=scfg.cloudwatch.endpoint_url,
                 max_retries=scfg.cloudwatch.max_retries,
                 retry_base_delay=scfg.cloudwatch.retry_base_delay,
@@ -154,6 +182,8 @@ def _sink_configs(settings: _Settings) -> dict[str, dict[str, _Any]]:
                 pool_acquire_timeout=scfg.postgres.pool_acquire_timeout,
                 batch_size=scfg.postgres.batch_size,
                 batch_timeout_seconds=scfg.postgres.batch_timeout_seconds,
+                pipelined=scfg.postgres.pipelined,
+                max_in_flight_batches=scfg.postgres.max_in_flight_batches,
                 max_retries=scfg.postgres.max_retries,
                 retry_base_delay=scfg.postgres.retry_base_delay,
                 circuit_breaker_enabled=scfg.postgres.circuit_breaker_enabled,
@@ -316,6 +346,9 @@ def _default_env_sink_cfg(name: str) -> dict[str, _Any]:
         if max_bytes_value is None:
             max_bytes_value = 10 * 1024 * 1024
         max_total_value = _parse_size(max_total_raw)
+        fsync_bytes_value = _parse_size(
+            _os.getenv("FAPILOG_FILE__FSYNC_BYTES", "1048576")
+        )
         return {
             "config": _RotatingFileSinkConfig(
                 directory=_Path(_os.getenv("FAPILOG_FILE__DIRECTORY", ".")),
@@ -333,6 +366,11 @@ def _default_env_sink_cfg(name: str) -> dict[str, _Any]:
                     "FAPILOG_FILE__COMPRESS_ROTATED", "false"
                 ).lower()
                 in {"1", "true", "yes"},
+                durability=_os.getenv("FAPILOG_FILE__DURABILITY", "none").lower(),
+                fsync_interval_ms=int(
+                    _os.getenv("FAPILOG_FILE__FSYNC_INTERVAL_MS", "1000")
+                ),
+                fsync_bytes=fsync_bytes_value or 1024 * 1024,
             )
         }
     return {}
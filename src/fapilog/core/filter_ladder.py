@@ -64,6 +64,7 @@ def _build_elevated_filters(
                     min_sample_rate=f._min_rate,
                     max_sample_rate=f._max_rate,
                     window_seconds=f._window,
+                    bucket_seconds=f._bucket_seconds,
                     always_pass_levels=sorted(f._always_pass | protected_levels),
                     smoothing_factor=f._smoothing,
                 )
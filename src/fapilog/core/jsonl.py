@@ -0,0 +1,125 @@
+"""
+Line-oriented reading of JSONL log files for offline tools.
+
+Verification, audit queries and chain checks are bound by reading and
+splitting files rather than by the work done per record. Plain files are
+memory-mapped and split with ``mmap.find`` (a ``memchr`` scan), handing out
+``memoryview`` slices of the mapping that orjson parses without copying.
+Rotated ``.gz`` files (``compress_rotated``) are streamed through
+:mod:`gzip` and yield the same shape, with offsets into the uncompressed
+stream.
+
+Line views are only valid while the iterator is running; copy one with
+``bytes(line)`` to keep it. :func:`line_ranges` splits a file into
+line-aligned byte ranges so callers can process ranges in parallel, each
+reading its own range with :func:`iter_lines`.
+"""
+
+from __future__ import annotations
+
+import gzip
+import mmap
+import os
+from collections.abc import Iterator
+from pathlib import Path
+
+
+def is_compressed(path: str | Path) -> bool:
+    """Return True for gzip-compressed rotated files."""
+    return str(path).endswith(".gz")
+
+
+def iter_lines(
+    path: str | Path,
+    start: int = 0,
+    stop: int | None = None,
+    *,
+    partial: bool = True,
+) -> Iterator[tuple[int, memoryview]]:
+    """Yield ``(offset, line)`` for each line starting in ``[start, stop)``.
+
+    ``line`` excludes the newline. A final line without a newline is an
+    in-progress write; it is yielded only when ``partial`` is True.
+    ``start`` must be a line boundary.
+    """
+    if is_compressed(path):
+        yield from _iter_gzip(path, start, stop, partial)
+    else:
+        yield from _iter_mapped(path, start, stop, partial)
+
+
+def line_ranges(path: str | Path, chunk_bytes: int) -> Iterator[tuple[int, int | None]]:
+    """Split a file into ``(start, stop)`` ranges that end on line boundaries.
+
+    Compressed files cannot be entered mid-stream, so they form a single
+    range with ``stop`` of None (read to the end).
+    """
+    if is_compressed(path):
+        yield 0, None
+        return
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            size = len(mm)
+            start = 0
+            while start < size:
+                newline = mm.find(b"\n", min(start + max(1, chunk_bytes), size) - 1)
+                stop = size if newline < 0 else newline + 1
+                yield start, stop
+                start = stop
+
+
+def _iter_mapped(
+    path: str | Path, start: int, stop: int | None, partial: bool
+) -> Iterator[tuple[int, memoryview]]:
+    with open(path, "rb") as f:
+        # mmap cannot map an empty file
+        if os.fstat(f.fileno()).st_size <= start:
+            return
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        size = len(mm)
+        end = size if stop is None else min(stop, size)
+        view = memoryview(mm)
+        try:
+            find = mm.find
+            pos = start
+            while pos < end:
+                newline = find(b"\n", pos)
+                if newline < 0:
+                    if partial:
+                        yield pos, view[pos:size]
+                    return
+                yield pos, view[pos:newline]
+                pos = newline + 1
+        finally:
+            view.release()
+    finally:
+        try:
+            mm.close()
+        except BufferError:
+            # A caller still holds a line view; the mapping closes once
+            # that view is garbage collected.
+            pass
+
+
+def _iter_gzip(
+    path: str | Path, start: int, stop: int | None, partial: bool
+) -> Iterator[tuple[int, memoryview]]:
+    pos = 0
+    with gzip.open(path, "rb") as f:
+        for line in f:
+            if stop is not None and pos >= stop:
+                return
+            length = len(line)
+            if pos >= start:
+                if line.endswith(b"\n"):
+                    yield pos, memoryview(line)[:-1]
+                elif partial:
+                    yield pos, memoryview(line)
+            pos += length
+
+
+__all__ = ["is_compressed", "iter_lines", "line_ranges"]
@@ -15,10 +15,11 @@ import warnings
 from collections import OrderedDict
 from collections.abc import Iterable
 from dataclasses import dataclass
-from typing import Any, cast
+from typing import Any, Callable, cast
 
 from ..metrics.metrics import MetricsCollector
 from ..plugins.enrichers import BaseEnricher
+from ..plugins.filters import compile_caller_prefilter
 from ..plugins.processors import BaseProcessor
 from ..plugins.redactors import BaseRedactor
 from .concurrency import DualQueue
@@ -173,7 +174,11 @@ class _LoggerMixin(_WorkerCountersMixin):
 
         # Cached component snapshots for worker access (Story 1.40)
         # Tuples are immutable and safe to read from worker thread
-        self._filters_snapshot: tuple[Any, ...] = tuple(self._filters)
+        self._filters_snapshot: tuple[Any, ...] = ()
+        # Leading caller-safe filters run before envelope construction
+        self._caller_prefilter: Callable[[str], bool] | None = None
+        self._caller_filters: tuple[Any, ...] = ()
+        self._invalidate_filters_cache()
         self._enrichers_snapshot: tuple[BaseEnricher, ...] = tuple(self._enrichers)
         self._redactors_snapshot: tuple[BaseRedactor, ...] = tuple(self._redactors)
         self._processors_snapshot: tuple[BaseProcessor, ...] = tuple(self._processors)
@@ -402,6 +407,10 @@ class _LoggerMixin(_WorkerCountersMixin):
                     asyncio.gather(*self._worker_tasks, return_exceptions=True)
                 )
             finally:
+                try:
+                    loop_local.run_until_complete(self._close_sink_writer())
+                except Exception:
+                    pass
                 # Cleanup: cancel pending tasks and close the loop
                 try:
                     pending = asyncio.all_tasks(loop_local)
@@ -428,6 +437,14 @@ class _LoggerMixin(_WorkerCountersMixin):
         # Wait for the thread to initialize before returning
         self._thread_ready.wait(timeout=2.0)
 
+    async def _close_sink_writer(self) -> None:
+        """Close the fan-out writer's spill queues once the workers finish."""
+        from .sink_writers import SinkWriterGroup
+
+        owner = getattr(self._sink_write, "__self__", None)
+        if isinstance(owner, SinkWriterGroup):
+            await owner.close()
+
     def _maybe_start_pressure_monitor(self, loop: asyncio.AbstractEventLoop) -> None:
         """Start PressureMonitor task if adaptive settings are enabled (Story 1.44)."""
         if not self._cached_adaptive_enabled or self._cached_adaptive_settings is None:
@@ -494,7 +511,7 @@ class _LoggerMixin(_WorkerCountersMixin):
 
             # Wire circuit breakers to pressure monitor (Story 4.73)
             for breaker in self._circuit_breakers:
-                breaker.on_state_change = monitor.on_circuit_state_change
+                breaker.add_state_listener(monitor.on_circuit_state_change)
 
             # Build adaptive filter ladder and register swap callback (Story 1.45)
             # Gated on filter_tightening toggle (Story 1.51)
@@ -502,8 +519,9 @@ class _LoggerMixin(_WorkerCountersMixin):
                 try:
                     from .filter_ladder import build_filter_ladder
 
+                    # Caller-side prefilters already ran; only ladder the rest
                     ladder = build_filter_ladder(
-                        base_filters=self._filters,
+                        base_filters=list(self._filters_snapshot),
                         protected_levels=self._protected_levels,
                     )
                     self._adaptive_filter_ladder = ladder
@@ -513,6 +531,9 @@ class _LoggerMixin(_WorkerCountersMixin):
                             self._filters_snapshot = self._adaptive_filter_ladder[
                                 new_level
                             ]
+                            self._set_caller_prefilter_active(
+                                new_level is not PressureLevel.CRITICAL
+                            )
                             monitor.record_filter_swap()
                             try:
                                 from .diagnostics import warn as _diag_warn
@@ -538,6 +559,19 @@ class _LoggerMixin(_WorkerCountersMixin):
                 except Exception:
                     pass  # Fail-open: ladder build failure shouldn't block monitor
 
+            # Only widen sink in-flight windows while the queue is backing up;
+            # at NORMAL pressure extra concurrency adds load without benefit
+            def _on_window_growth(old_level: Any, new_level: Any) -> None:
+                from .pressure import PressureLevel
+
+                for sink in list(self._sinks):
+                    window = getattr(sink, "concurrency_window", None)
+                    if window is not None:
+                        window.growth_enabled = new_level != PressureLevel.NORMAL
+
+            _on_window_growth(None, monitor.pressure_level)
+            monitor.on_level_change(_on_window_growth)
+
             # Build dynamic worker pool and register scaling callback (Story 1.46)
             self._maybe_start_worker_pool(monitor, loop, adaptive)
 
@@ -617,6 +651,9 @@ class _LoggerMixin(_WorkerCountersMixin):
             sink_write=self._sink_write,
             sink_write_serialized=self._sink_write_serialized,
             filters_getter=lambda: self._filters_snapshot,
+            caller_filters_getter=lambda: (
+                self._caller_filters if self._caller_prefilter is not None else ()
+            ),
             enrichers_getter=lambda: self._enrichers_snapshot,
             redactors_getter=lambda: self._redactors_snapshot,
             processors_getter=lambda: self._processors_snapshot,
@@ -661,8 +698,41 @@ class _LoggerMixin(_WorkerCountersMixin):
         )
 
     def _invalidate_filters_cache(self) -> None:
-        """Update filters snapshot after mutation."""
-        self._filters_snapshot = tuple(self._filters)
+        """Update filters snapshot after mutation.
+
+        Leading filters that declare themselves caller-safe are compiled into
+        ``_caller_prefilter`` and removed from the worker snapshot, so events
+        they reject never have an envelope built or touch the queue.
+        """
+        prefilter, worker_filters = compile_caller_prefilter(self._filters)
+        self._filters_snapshot = worker_filters
+        self._caller_prefilter = prefilter
+        hoisted = len(self._filters) - len(worker_filters)
+        self._caller_filters = tuple(self._filters[:hoisted])
+
+    def _set_caller_prefilter_active(self, active: bool) -> None:
+        """Re-enable or bypass the hoisted caller-side filters.
+
+        The CRITICAL rung of the adaptive ladder replaces the user's filters
+        outright, so the hoisted part of them must stop running too;
+        otherwise a user sampling filter could still drop protected levels.
+        """
+        self._caller_prefilter = (
+            compile_caller_prefilter(self._caller_filters)[0] if active else None
+        )
+
+    def _caller_rejects(self, level: str) -> bool:
+        """Return True when the level gate or caller prefilter drops ``level``.
+
+        Sampling prefilters are not idempotent, so callers that check this
+        up front must submit through ``_enqueue_admitted`` rather than
+        ``_enqueue`` to avoid applying them twice.
+        """
+        gate = self._level_gate
+        if gate is not None and get_level_priority(level) < gate:
+            return True
+        prefilter = self._caller_prefilter
+        return prefilter is not None and not prefilter(level)
 
     def _invalidate_enrichers_cache(self) -> None:
         """Update enrichers snapshot after mutation."""
@@ -1054,6 +1124,9 @@ class _LoggerMixin(_WorkerCountersMixin):
             sink_write_serialized=self._sink_write_serialized,
             # Return cached snapshots instead of creating new lists (Story 1.40)
             filters_getter=lambda: self._filters_snapshot,
+            caller_filters_getter=lambda: (
+                self._caller_filters if self._caller_prefilter is not None else ()
+            ),
             enrichers_getter=lambda: self._enrichers_snapshot,
             redactors_getter=lambda: self._redactors_snapshot,
             processors_getter=lambda: self._processors_snapshot,
@@ -1439,13 +1512,21 @@ class SyncLoggerFacade(_LoggerMixin):
             exc_info: Exception info tuple for traceback extraction.
             **metadata: Additional fields to include in the log event.
         """
-        gate = self._level_gate
-        if gate is not None:
-            priority = get_level_priority(level)
-            if priority < gate:
-                self._record_filtered(1)
-                return
+        if self._caller_rejects(level):
+            self._record_filtered(1)
+            return
+        self._enqueue_admitted(level, message, exc=exc, exc_info=exc_info, **metadata)
 
+    def _enqueue_admitted(
+        self,
+        level: str,
+        message: str,
+        *,
+        exc: BaseException | None = None,
+        exc_info: Any | None = None,
+        **metadata: Any,
+    ) -> None:
+        """Build and submit an event that already passed ``_caller_rejects``."""
         payload = self._prepare_payload(
             level,
             message,
@@ -1455,7 +1536,10 @@ class SyncLoggerFacade(_LoggerMixin):
         )
         if payload is None:
             return
+        self._submit_prepared(payload)
 
+    def _submit_prepared(self, payload: dict[str, Any]) -> None:
+        """Enqueue a payload built by ``_prepare_payload``."""
         self._record_submitted(1)
         self.start()
         if self._try_enqueue_with_metrics(payload):
@@ -1810,12 +1894,23 @@ class AsyncLoggerFacade(_LoggerMixin):
         exc_info: Any | None = None,
         **metadata: Any,
     ) -> None:
-        gate = self._level_gate
-        if gate is not None:
-            priority = get_level_priority(level)
-            if priority < gate:
-                await self._record_filtered_async(1)
-                return
+        if self._caller_rejects(level):
+            await self._record_filtered_async(1)
+            return
+        await self._enqueue_admitted(
+            level, message, exc=exc, exc_info=exc_info, **metadata
+        )
+
+    async def _enqueue_admitted(
+        self,
+        level: str,
+        message: str,
+        *,
+        exc: BaseException | None = None,
+        exc_info: Any | None = None,
+        **metadata: Any,
+    ) -> None:
+        """Build and submit an event that already passed ``_caller_rejects``."""
         payload = self._prepare_payload(
             level,
             message,
@@ -1825,7 +1920,10 @@ class AsyncLoggerFacade(_LoggerMixin):
         )
         if payload is None:
             return
+        await self._submit_prepared(payload)
 
+    async def _submit_prepared(self, payload: dict[str, Any]) -> None:
+        """Enqueue a payload built by ``_prepare_payload``."""
         await self._record_submitted_async(1)
         self.start()
         if self._try_enqueue_with_metrics(payload):
@@ -175,6 +175,7 @@ class PressureMonitor:
         self._stopped = False
         self._circuit_boost: float = 0.0
         self._circuit_boost_per_open: float = circuit_pressure_boost
+        self._open_circuits: set[str] = set()
         # Adaptive summary counters (Story 10.58)
         self._escalation_count = 0
         self._deescalation_count = 0
@@ -212,12 +213,13 @@ class PressureMonitor:
         # Import locally to avoid circular dependency at module level
         from .circuit_breaker import CircuitState
 
+        # Track open sinks by name: a failed half-open probe re-reports OPEN
+        # without an intervening CLOSED and must not stack another boost
         if new_state == CircuitState.OPEN:
-            self._circuit_boost += self._circuit_boost_per_open
+            self._open_circuits.add(sink_name)
         elif new_state == CircuitState.CLOSED:
-            self._circuit_boost = max(
-                0.0, self._circuit_boost - self._circuit_boost_per_open
-            )
+            self._open_circuits.discard(sink_name)
+        self._circuit_boost = len(self._open_circuits) * self._circuit_boost_per_open
 
     def stop(self) -> None:
         """Signal the monitor to stop after the current tick."""
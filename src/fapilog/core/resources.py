@@ -4,7 +4,7 @@ Async resource pooling and lifecycle-safe cleanup for external services.
 This module provides:
 - Generic `AsyncResourcePool[T]` with timeout-based acquisition and graceful
   degradation via BackpressureError when exhausted.
-- HTTP-specific `HttpClientPool` based on httpx.AsyncClient.
+- HTTP-specific `HttpClientPool` sharing one httpx.AsyncClient per endpoint.
 - `ResourceManager` to register and cleanup multiple pools (container- or
   plugin-scoped usage).
 
@@ -18,6 +18,7 @@ Design goals:
 from __future__ import annotations
 
 import asyncio
+import time
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from typing import Any, AsyncIterator, Awaitable, Callable, Generic, TypeVar
@@ -39,7 +40,11 @@ T = TypeVar("T")
 
 @dataclass
 class PoolStats:
-    """Snapshot of pool state for observability and tests."""
+    """Snapshot of pool state for observability and tests.
+
+    For ``HttpClientPool`` ``in_use`` counts in-flight requests and ``idle``
+    the request slots still free.
+    """
 
     name: str
     max_size: int
@@ -48,6 +53,9 @@ class PoolStats:
     idle: int
     timeouts: int
     errors: int
+    acquires: int = 0
+    acquire_wait_seconds: float = 0.0
+    max_acquire_wait_seconds: float = 0.0
 
 
 class AsyncResourcePool(Generic[T]):
@@ -85,6 +93,9 @@ class AsyncResourcePool(Generic[T]):
         self._created_count = 0
         self._timeouts = 0
         self._errors = 0
+        self._acquires = 0
+        self._acquire_wait = 0.0
+        self._max_acquire_wait = 0.0
         self._lock = asyncio.Lock()
         self._closed = False
         self._metrics = metrics
@@ -162,7 +173,12 @@ class AsyncResourcePool(Generic[T]):
     @asynccontextmanager
     async def acquire(self) -> AsyncIterator[T]:
         """Acquire a resource with automatic release using context manager."""
+        started = time.perf_counter()
         resource = await self._create_or_wait()
+        waited = time.perf_counter() - started
+        self._acquires += 1
+        self._acquire_wait += waited
+        self._max_acquire_wait = max(self._max_acquire_wait, waited)
         try:
             self._in_use_count += 1
             # Metrics: track acquisitions
@@ -265,14 +281,24 @@ class AsyncResourcePool(Generic[T]):
             idle=idle_size,
             timeouts=self._timeouts,
             errors=self._errors,
+            acquires=self._acquires,
+            acquire_wait_seconds=self._acquire_wait,
+            max_acquire_wait_seconds=self._max_acquire_wait,
         )
 
 
 class HttpClientPool(AsyncResourcePool[httpx.AsyncClient]):
-    """HTTPX AsyncClient pool for HTTP sinks and external APIs.
+    """Shared HTTPX AsyncClient for HTTP sinks and external APIs.
+
+    Every acquisition hands out the same client, so requests reuse one
+    connection pool (multiplexed over a single connection with ``http2``)
+    instead of each checkout opening its own. ``max_size`` bounds in-flight
+    requests; when all slots are taken, acquisition waits up to
+    ``acquire_timeout_seconds`` and then raises ``BackpressureError``.
 
-    Note: httpx.AsyncClient already provides connection pooling internally.
-    This pool ensures bounded client objects and unified lifecycle cleanup.
+    ``max_connections`` (defaults to ``max_size``) and ``keepalive_expiry``
+    tune ``httpx.Limits``. With ``warm_url`` set, ``start()`` opens up to
+    ``prewarm_connections`` connections by sending HEAD requests to it.
     """
 
     def __init__(
@@ -284,16 +310,39 @@ class HttpClientPool(AsyncResourcePool[httpx.AsyncClient]):
         acquire_timeout_seconds: float = 2.0,
         timeout: float = 10.0,
         verify_tls: bool = True,
+        http2: bool = False,
+        max_connections: int | None = None,
+        keepalive_expiry: float | None = 5.0,
+        warm_url: str | None = None,
+        prewarm_connections: int = 0,
     ) -> None:
+        connections = max_connections or max_size
+
         async def _create() -> httpx.AsyncClient:
-            return httpx.AsyncClient(
-                base_url=base_url or "",
-                timeout=timeout,
-                verify=verify_tls,
-                limits=httpx.Limits(
-                    max_connections=None, max_keepalive_connections=max_size
+            options: dict[str, Any] = {
+                "base_url": base_url or "",
+                "timeout": timeout,
+                "verify": verify_tls,
+                "limits": httpx.Limits(
+                    max_connections=connections,
+                    max_keepalive_connections=connections,
+                    keepalive_expiry=keepalive_expiry,
                 ),
-            )
+            }
+            if http2:
+                try:
+                    return httpx.AsyncClient(http2=True, **options)
+                except ImportError:
+                    from .diagnostics import warn
+
+                    warn(
+                        "resources",
+                        "http2 requested but the h2 package is not installed; "
+                        "using HTTP/1.1",
+                        pool=name,
+                        _rate_limit_key="http-pool-h2-missing",
+                    )
+            return httpx.AsyncClient(**options)
 
         async def _close(client: httpx.AsyncClient) -> None:
             # aclose is idempotent
@@ -306,6 +355,96 @@ class HttpClientPool(AsyncResourcePool[httpx.AsyncClient]):
             max_size=max_size,
             acquire_timeout_seconds=acquire_timeout_seconds,
         )
+        self._client: httpx.AsyncClient | None = None
+        self._slots = asyncio.Semaphore(self._max_size)
+        self._warm_url = warm_url
+        self._prewarm = min(max(prewarm_connections, 0), connections)
+
+    async def _shared_client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            async with self._lock:
+                if self._client is None:
+                    # Like the base pool, acquiring after cleanup() reopens it
+                    # lazily; the next cleanup() closes the new client again
+                    self._client = await self._create()
+                    self._created_count += 1
+                    self._closed = False
+        return self._client
+
+    def _exhausted(self) -> BackpressureError:
+        return BackpressureError(
+            f"Resource pool '{self._name}' exhausted (max_size={self._max_size})",
+            error_context=create_error_context(
+                ErrorCategory.SYSTEM,
+                ErrorSeverity.HIGH,
+            ),
+        )
+
+    async def _create_or_wait(self) -> httpx.AsyncClient:
+        """Take a request slot, waiting up to the acquire timeout."""
+        try:
+            await asyncio.wait_for(self._slots.acquire(), timeout=self._acquire_timeout)
+        except asyncio.TimeoutError as e:
+            self._timeouts += 1
+            raise self._exhausted() from e
+        try:
+            return await self._shared_client()
+        except BaseException:
+            self._slots.release()
+            raise
+
+    async def _release_impl(self, resource: httpx.AsyncClient) -> None:
+        self._slots.release()
+
+    async def acquire_nowait(self) -> httpx.AsyncClient:
+        """Acquire without waiting; raises BackpressureError if no slot is free."""
+        if self._slots.locked():
+            raise self._exhausted()
+        await self._slots.acquire()
+        self._in_use_count += 1
+        try:
+            return await self._shared_client()
+        except BaseException:
+            self._in_use_count -= 1
+            self._slots.release()
+            raise
+
+    async def start(self) -> None:
+        """Create the shared client and pre-warm connections if configured."""
+        await super().start()
+        client = await self._shared_client()
+        if self._warm_url is None or self._prewarm <= 0:
+            return
+
+        async def _warm() -> None:
+            try:
+                await client.head(self._warm_url or "")
+            except Exception:
+                # Warming is best effort; the first real request retries
+                pass
+
+        await asyncio.gather(*(_warm() for _ in range(self._prewarm)))
+
+    async def cleanup(self) -> None:
+        """Close the shared client; never raises.
+
+        Requests still in flight keep their reference; the next acquisition
+        creates a fresh client, which a later ``cleanup()`` closes in turn.
+        """
+        self._closed = True
+        client, self._client = self._client, None
+        if client is None:
+            return
+        try:
+            await client.aclose()
+        except Exception:
+            self._errors += 1
+
+    async def stats(self) -> PoolStats:
+        """Return a snapshot; ``in_use`` is the number of in-flight requests."""
+        stats = await super().stats()
+        stats.idle = max(self._max_size - self._in_use_count, 0)
+        return stats
 
 
 class CacheResourcePool(AsyncResourcePool[HighPerformanceLRUCache]):
@@ -2,11 +2,16 @@ from __future__ import annotations
 
 import asyncio
 from dataclasses import dataclass
-from typing import Any, Iterable
+from typing import Any, Iterable, Sequence
 
+from ..plugins.sinks import fallback as _fallback
 from ..plugins.utils import get_plugin_name, normalize_plugin_name
 from . import diagnostics
-from .circuit_breaker import SinkCircuitBreaker
+from .circuit_breaker import CircuitState, SinkCircuitBreaker
+
+# Raw level spellings remembered by the lookup cache; bounds memory when
+# events carry arbitrary level strings
+_LEVEL_CACHE_LIMIT = 256
 
 
 @dataclass
@@ -16,13 +21,16 @@ class _SinkEntry:
     write: Any
     write_serialized: Any
     breaker: SinkCircuitBreaker | None
+    accepts_serialized: bool = True
+    # Set when the sink takes a list of entry dicts in one call
+    write_batch: Any | None = None
 
 
 def _make_sink_entry(
     sink: Any,
     circuit_config: Any | None,
 ) -> _SinkEntry:
-    async def _write(entry: dict[str, Any]) -> bool | None:
+    async def _ensure_started() -> None:
         if hasattr(sink, "start") and not getattr(sink, "_started", False):
             try:
                 await sink.start()
@@ -36,9 +44,17 @@ def _make_sink_entry(
                     )
                 except Exception:
                     pass
+
+    async def _write(entry: dict[str, Any]) -> bool | None:
+        await _ensure_started()
         result: bool | None = await sink.write(entry)
         return result
 
+    async def _write_batch(entries: list[dict[str, Any]]) -> bool | None:
+        await _ensure_started()
+        result: bool | None = await sink.write_batch(entries)
+        return result
+
     async def _write_serialized(view: Any) -> bool | None:
         try:
             result: bool | None = await sink.write_serialized(view)
@@ -46,6 +62,7 @@ def _make_sink_entry(
         except AttributeError:
             return None
 
+    batch_capable = callable(getattr(sink, "write_batch", None))
     breaker = None
     if circuit_config is not None and getattr(circuit_config, "enabled", False):
         breaker = SinkCircuitBreaker(
@@ -59,6 +76,8 @@ def _make_sink_entry(
         write=_write,
         write_serialized=_write_serialized,
         breaker=breaker,
+        accepts_serialized=hasattr(sink, "write_serialized"),
+        write_batch=_write_batch if batch_capable else None,
     )
 
 
@@ -67,7 +86,15 @@ def _normalize_level(level: str) -> str:
 
 
 class RoutingSinkWriter:
-    """Route events to sinks based on log level."""
+    """Route events to sinks based on log level.
+
+    Rules are compiled into a table: each level maps to a row index and
+    each row is a tuple of sink indices, with row 0 holding the fallback
+    sinks. :meth:`write_routed_batch` partitions a whole flush batch with
+    one lookup per event into per-sink sub-batches. Sinks with a
+    ``write_batch(entries)`` method receive their sub-batch in one call;
+    others receive it event by event under one breaker check.
+    """
 
     def __init__(
         self,
@@ -122,6 +149,8 @@ class RoutingSinkWriter:
         )
         used_sink_names.update(entry.name for entry in self._fallback_entries)
 
+        self._compile()
+
         unmatched = set(self._sink_entries) - used_sink_names
         if unmatched:
             try:
@@ -145,9 +174,116 @@ class RoutingSinkWriter:
             return self._level_to_entries[norm]
         return self._fallback_entries
 
+    def _compile(self) -> None:
+        """Build the integer-indexed routing table from the current rules."""
+        self._entries: list[_SinkEntry] = list(self._sink_entries.values())
+        index = {id(e): i for i, e in enumerate(self._entries)}
+        self._rows: list[tuple[int, ...]] = [
+            tuple(index[id(e)] for e in self._fallback_entries)
+        ]
+        self._level_rows: dict[str, int] = {}
+        for level, targets in self._level_to_entries.items():
+            self._level_rows[level] = len(self._rows)
+            self._rows.append(tuple(index[id(e)] for e in targets))
+        self._cached_rows = dict(self._level_rows)
+
+    def _row_for(self, level: Any) -> tuple[int, ...]:
+        row = self._cached_rows.get(level)
+        if row is None:
+            row = self._level_rows.get(_normalize_level(str(level)), 0)
+            if len(self._cached_rows) < _LEVEL_CACHE_LIMIT:
+                self._cached_rows[level] = row
+        return self._rows[row]
+
+    async def write_routed_batch(
+        self, items: Sequence[tuple[dict[str, Any], Any]]
+    ) -> None:
+        """Route a flush batch of ``(entry, view)`` pairs in one pass.
+
+        ``view`` is the pre-serialized event or None. Batch-capable sinks
+        get entries; of the rest, sinks with a ``write_serialized`` method
+        get the view and others get the entry.
+        """
+        entries = self._entries
+        subs: list[list[tuple[Any, bool]] | None] = [None] * len(entries)
+        for entry, view in items:
+            for i in self._row_for(entry.get("level", "INFO")):
+                sub = subs[i]
+                if sub is None:
+                    sub = subs[i] = []
+                target = entries[i]
+                if (
+                    view is not None
+                    and target.accepts_serialized
+                    and target.write_batch is None
+                ):
+                    sub.append((view, True))
+                else:
+                    sub.append((entry, False))
+
+        jobs = [
+            self._write_many(entries[i], sub)
+            for i, sub in enumerate(subs)
+            if sub is not None
+        ]
+        if self._parallel and len(jobs) > 1:
+            await asyncio.gather(*jobs, return_exceptions=True)
+        else:
+            for job in jobs:
+                await job
+
+    async def _write_many(
+        self, target: _SinkEntry, items: list[tuple[Any, bool]]
+    ) -> None:
+        breaker = target.breaker
+        if breaker is None:
+            if target.write_batch is not None:
+                await self._deliver_all(target, items)
+                return
+            for payload, serialized in items:
+                await self._deliver(target, payload, serialized)
+            return
+        allowed = breaker.admit(len(items))
+        if allowed < len(items):
+            if not allowed:
+                return
+            # Half-open: probe with the oldest events; the rest follows only
+            # if the probe closes the circuit. A prefix rather than a spread
+            # sample keeps the sink's output in emit order, which ordered
+            # sinks (sealed chains, rotating files) rely on.
+            await self._deliver_batch(target, breaker, items[:allowed])
+            if breaker.state is not CircuitState.CLOSED:
+                await self._report_skipped(target, items[allowed:])
+                return
+            items = items[allowed:]
+        await self._deliver_batch(target, breaker, items)
+
+    async def _deliver_batch(
+        self,
+        target: _SinkEntry,
+        breaker: SinkCircuitBreaker,
+        items: list[tuple[Any, bool]],
+    ) -> None:
+        if target.write_batch is not None:
+            ok = await self._deliver_all(target, items)
+            breaker.record_batch(len(items) if ok else 0, 0 if ok else len(items))
+            return
+        delivered = failed = 0
+        for i, (payload, serialized) in enumerate(items):
+            if await self._deliver(target, payload, serialized):
+                delivered += 1
+                continue
+            failed += 1
+            # Stop feeding a sink that has not accepted anything this batch;
+            # the unsent rest goes to the fallback like any failed write
+            if not delivered and failed >= breaker.failure_threshold:
+                await self._report_skipped(target, items[i + 1 :])
+                break
+        breaker.record_batch(delivered, failed)
+
     async def write(self, entry: dict[str, Any]) -> None:
         level = entry.get("level", "INFO")
-        targets = self.get_sinks_for_level(str(level))
+        targets = [self._entries[i] for i in self._row_for(level)]
         if not targets:
             return
 
@@ -162,7 +298,7 @@ class RoutingSinkWriter:
 
     async def write_serialized(self, view: Any, *, level: str | None = None) -> None:
         lvl = level or getattr(view, "level", None) or "INFO"
-        targets = self.get_sinks_for_level(str(lvl))
+        targets = [self._entries[i] for i in self._row_for(lvl)]
         if not targets:
             return
 
@@ -185,43 +321,69 @@ class RoutingSinkWriter:
         breaker = target.breaker
         if breaker and not breaker.should_allow():
             return
-
+        delivered = await self._deliver(target, payload, serialized)
+        if breaker:
+            breaker.record_batch(int(delivered), int(not delivered))
+
+    async def _deliver(
+        self, target: _SinkEntry, payload: Any, serialized: bool
+    ) -> bool:
+        """Write one payload, containing errors; returns False on failure."""
         try:
             if serialized:
                 result = await target.write_serialized(payload)
             else:
                 result = await target.write(payload)
+        except Exception as exc:
+            error: Exception = exc
+        else:
             # False return signals failure (Story 4.41)
-            if result is False:
-                if breaker:
-                    breaker.record_failure()
-                try:
-                    from ..plugins.sinks.fallback import handle_sink_write_failure
-
-                    await handle_sink_write_failure(
-                        payload,
-                        sink=target.sink,
-                        error=RuntimeError("Sink returned False"),
-                        serialized=serialized,
-                    )
-                except Exception:
-                    pass
-            elif breaker:
-                breaker.record_success()
+            if result is not False:
+                return True
+            error = RuntimeError("Sink returned False")
+        await self._report_failure(target, payload, error, serialized)
+        return False
+
+    async def _deliver_all(
+        self, target: _SinkEntry, items: list[tuple[Any, bool]]
+    ) -> bool:
+        """Write a sub-batch in one ``write_batch`` call; False on failure."""
+        assert target.write_batch is not None
+        payloads = [payload for payload, _ in items]
+        try:
+            result = await target.write_batch(payloads)
         except Exception as exc:
-            if breaker:
-                breaker.record_failure()
-            try:
-                from ..plugins.sinks.fallback import handle_sink_write_failure
+            error: Exception = exc
+        else:
+            if result is not False:
+                return True
+            error = RuntimeError("Sink returned False")
+        for payload in payloads:
+            await self._report_failure(target, payload, error, False)
+        return False
+
+    async def _report_failure(
+        self, target: _SinkEntry, payload: Any, error: Exception, serialized: bool
+    ) -> None:
+        try:
+            await _fallback.handle_sink_write_failure(
+                payload,
+                sink=target.sink,
+                error=error,
+                serialized=serialized,
+            )
+        except Exception:
+            pass
 
-                await handle_sink_write_failure(
-                    payload,
-                    sink=target.sink,
-                    error=exc,
-                    serialized=serialized,
-                )
-            except Exception:
-                pass
+    async def _report_skipped(
+        self, target: _SinkEntry, items: list[tuple[Any, bool]]
+    ) -> None:
+        """Report events withheld from a failing sink as failed writes."""
+        if not items:
+            return
+        error = RuntimeError("Sink circuit open; write skipped")
+        for payload, serialized in items:
+            await self._report_failure(target, payload, error, serialized)
 
     def update_rules(
         self, rules: list[tuple[set[str], list[str]]], fallback_sink_names: list[str]
@@ -247,6 +409,7 @@ class RoutingSinkWriter:
                     self._level_to_entries.setdefault(norm_level, []).extend(resolved)
                 else:
                     self._level_to_entries.setdefault(norm_level, resolved)
+        self._compile()
 
 
 def build_routing_writer(
@@ -275,11 +438,5 @@ def build_routing_writer(
         circuit_config=circuit_config,
     )
 
-    async def _write(entry: dict[str, Any]) -> None:
-        await writer.write(entry)
-
-    async def _write_serialized(view: Any) -> None:
-        level = getattr(view, "level", None)
-        await writer.write_serialized(view, level=level)
-
-    return _write, _write_serialized, writer.breakers
+    # Bound methods let the worker find write_routed_batch via __self__
+    return writer.write, writer.write_serialized, writer.breakers
@@ -21,7 +21,7 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import (
     Any,
     Callable,
@@ -58,16 +58,37 @@ def _default(obj: Any) -> Any:
     raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
 
 
-@dataclass
+@dataclass(slots=True)
 class SerializedView:
-    """A lightweight container exposing zero-copy friendly views."""
+    """A lightweight container exposing zero-copy friendly views.
+
+    Besides the payload, a view carries event metadata captured when it was
+    serialized (see :func:`serialize_envelope`) so routing and sinks do not
+    need to re-parse the bytes. Metadata is None when unknown, e.g. for
+    payloads serialized by other means.
+
+    Attributes:
+        data: Serialized payload.
+        level: Log level, as given to the logger (e.g. ``"INFO"``).
+        ts_ns: Event timestamp in nanoseconds since the epoch.
+        routing_key: Optional key for routing or partitioning; the logger
+            name for envelopes.
+    """
 
     data: bytes
+    level: str | None = None
+    ts_ns: int | None = None
+    routing_key: str | None = None
 
     @property
     def view(self) -> memoryview:
         return memoryview(self.data)
 
+    @property
+    def nbytes(self) -> int:
+        """Payload size in bytes."""
+        return len(self.data)
+
     def __bytes__(self) -> bytes:  # convenience
         return self.data
 
@@ -249,7 +270,8 @@ def serialize_envelope(log: Mapping[str, Any]) -> SerializedView:
         raise ValueError("missing required fields in log payload")
 
     # Normalize timestamp
-    ts = ensure_rfc3339_utc(log["timestamp"])
+    raw_ts = log["timestamp"]
+    ts = ensure_rfc3339_utc(raw_ts)
 
     # Get context/diagnostics/data with defaults (trust upstream provides mappings)
     context = log.get("context")
@@ -272,4 +294,46 @@ def serialize_envelope(log: Mapping[str, Any]) -> SerializedView:
             norm_log[key] = log[key]
 
     envelope = {"schema_version": "1.1", "log": norm_log}
-    return serialize_mapping_to_json_bytes(envelope)
+    view = serialize_mapping_to_json_bytes(envelope)
+    return attach_view_metadata(view, log, normalized_ts=ts)
+
+
+def attach_view_metadata(
+    view: SerializedView,
+    log: Mapping[str, Any],
+    *,
+    normalized_ts: str | None = None,
+) -> SerializedView:
+    """Fill ``view``'s level, ts_ns and routing_key from the event ``log``.
+
+    Used by :func:`serialize_envelope` and by fallbacks that serialize an
+    event by other means, so routing still sees the real level. Fields that
+    are missing or malformed in ``log`` are left as None.
+    """
+    level = log.get("level")
+    view.level = str(level) if level is not None else None
+    raw_ts = log.get("timestamp")
+    view.ts_ns = None
+    if isinstance(raw_ts, (int, float, str)):
+        try:
+            if normalized_ts is None:
+                normalized_ts = ensure_rfc3339_utc(raw_ts)
+            view.ts_ns = _timestamp_ns(raw_ts, normalized_ts)
+        except Exception:
+            pass
+    logger_name = log.get("logger")
+    view.routing_key = logger_name if isinstance(logger_name, str) else None
+    return view
+
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def _timestamp_ns(raw: float | str, normalized: str) -> int:
+    """Nanoseconds since the epoch for an envelope timestamp."""
+    if isinstance(raw, (int, float)):
+        return int(raw * 1_000_000_000)
+    # fromisoformat only accepts a trailing "Z" from Python 3.11
+    dt = datetime.fromisoformat(normalized[:-1] + "+00:00")
+    return (dt - _EPOCH) // _MICROSECOND * 1000
@@ -189,6 +189,27 @@ class RotatingFileSettings(BaseModel):
     compress_rotated: bool = Field(
         default=False, description="Compress rotated log files with gzip"
     )
+    durability: Literal["none", "interval", "bytes", "batch", "event"] = Field(
+        default="none",
+        description=(
+            "When written data is fsynced: none, interval, bytes, batch, or event"
+        ),
+    )
+    fsync_interval_ms: int = Field(
+        default=1000,
+        ge=1,
+        description="Sync period in milliseconds for durability='interval'",
+    )
+    fsync_bytes: SizeField = Field(
+        default=1024 * 1024,
+        ge=1,
+        description="Unsynced bytes that trigger a sync for durability='bytes'. Accepts '1 MB' or 1048576",
+    )
+    rotation_concurrency: int = Field(
+        default=1,
+        ge=1,
+        description="Max rotated files compressed concurrently in the background",
+    )
 
 
 class WebhookSettings(BaseModel):
@@ -222,6 +243,48 @@ class WebhookSettings(BaseModel):
         gt=0.0,
         description="Max seconds before flushing a partial webhook batch. Accepts '5s' or 5.0",
     )
+    max_in_flight_batches: int = Field(
+        default=4,
+        ge=1,
+        description="Maximum webhook batches in flight at once",
+    )
+    pipelined: bool = Field(
+        default=False,
+        description="Send batches in the background while the next one fills",
+    )
+    max_batch_bytes: int | None = Field(
+        default=None,
+        ge=1,
+        description="Flush a batch before it exceeds this many serialized bytes",
+    )
+    adaptive_concurrency: bool = Field(
+        default=False,
+        description="Adapt the in-flight window to observed latency and congestion (AIMD)",
+    )
+    latency_target_ms: float = Field(
+        default=500.0,
+        gt=0.0,
+        description="Delivery latency (p95) above which the adaptive window shrinks",
+    )
+    http2: bool = Field(
+        default=False,
+        description="Multiplex requests over HTTP/2 (requires the h2 package: httpx[http2])",
+    )
+    max_connections: int | None = Field(
+        default=None,
+        ge=1,
+        description="Maximum open connections to the endpoint (defaults to max_in_flight_batches)",
+    )
+    keepalive_expiry_seconds: float = Field(
+        default=5.0,
+        ge=0.0,
+        description="Seconds an idle keep-alive connection is kept open",
+    )
+    prewarm_connections: int = Field(
+        default=0,
+        ge=0,
+        description="Connections to open with HEAD requests when the sink starts",
+    )
 
 
 class SealedSinkSettings(BaseModel):
@@ -289,6 +352,21 @@ class CloudWatchSinkSettings(BaseModel):
         gt=0,
         description="Max seconds before flushing a partial batch. Accepts '5s' or 5.0",
     )
+    pipelined: bool = Field(
+        default=False,
+        description="Send batches in the background while the next one fills",
+    )
+    max_in_flight_batches: int = Field(
+        default=4,
+        ge=1,
+        description="Maximum batches in flight at once when pipelined",
+    )
+    max_batch_bytes: int = Field(
+        default=1_048_576,
+        ge=1,
+        le=1_048_576,
+        description="Flush a batch before it exceeds this many bytes (PutLogEvents limit: 1 MB)",
+    )
     endpoint_url: str | None = Field(
         default=None, description="Custom endpoint (e.g., LocalStack)"
     )
@@ -333,6 +411,20 @@ class LokiSinkSettings(BaseModel):
         gt=0,
         description="Max seconds before flushing a partial batch. Accepts '5s' or 5.0",
     )
+    pipelined: bool = Field(
+        default=False,
+        description="Send batches in the background while the next one fills",
+    )
+    max_in_flight_batches: int = Field(
+        default=4,
+        ge=1,
+        description="Maximum batches in flight at once when pipelined",
+    )
+    max_batch_bytes: int | None = Field(
+        default=None,
+        ge=1,
+        description="Flush a batch before it exceeds this many serialized bytes",
+    )
     timeout_seconds: DurationField = Field(
         default=10.0,
         gt=0,
@@ -388,6 +480,15 @@ class PostgresSinkSettings(BaseModel):
         gt=0,
         description="Max seconds before flushing a partial batch. Accepts '5s' or 5.0",
     )
+    pipelined: bool = Field(
+        default=False,
+        description="Send batches in the background while the next one fills",
+    )
+    max_in_flight_batches: int = Field(
+        default=4,
+        ge=1,
+        description="Maximum batches in flight at once when pipelined",
+    )
     max_retries: int = Field(
         default=3, ge=0, description="Maximum retries for failed inserts"
     )
@@ -998,6 +1099,33 @@ class CoreSettings(BaseModel):
         gt=0.0,
         description=("Seconds to wait before probing a failed sink"),
     )
+    sink_circuit_breaker_failure_rate_threshold: float | None = Field(
+        default=None,
+        gt=0.0,
+        le=1.0,
+        description=(
+            "Open the circuit when this share of events failed over the rolling "
+            "window (e.g. 0.5). None uses the consecutive failure threshold only."
+        ),
+    )
+    sink_circuit_breaker_window_seconds: float = Field(
+        default=30.0,
+        gt=0.0,
+        description="Rolling window for the failure rate threshold",
+    )
+    sink_circuit_breaker_minimum_events: int = Field(
+        default=20,
+        ge=1,
+        description=(
+            "Events needed in the window before the failure rate applies; "
+            "below it the consecutive threshold is used"
+        ),
+    )
+    sink_circuit_breaker_probe_size: int = Field(
+        default=1,
+        ge=1,
+        description="Events sent as a half-open probe before the rest of a batch",
+    )
     sink_circuit_breaker_fallback_sink: str | None = Field(
         default=None,
         description=(
@@ -1005,6 +1133,29 @@ class CoreSettings(BaseModel):
             "Must match a configured sink name. None means silent skip (default)."
         ),
     )
+    sink_circuit_breaker_spill_directory: str | None = Field(
+        default=None,
+        description=(
+            "Directory for durable per-sink spill queues. While a circuit is "
+            "open, events are appended to disk and replayed once the sink "
+            "recovers (at-least-once). None disables spilling (default)."
+        ),
+    )
+    sink_circuit_breaker_spill_max_bytes: SizeField = Field(
+        default=256 * 1024 * 1024,
+        description=(
+            "Disk budget per sink spill queue; events beyond it are dropped "
+            "(accepts '256 MB')"
+        ),
+    )
+    sink_circuit_breaker_spill_replay_rate: float | None = Field(
+        default=1000.0,
+        gt=0.0,
+        description=(
+            "Events per second replayed from a spill queue after recovery. "
+            "None replays as fast as the sink accepts them."
+        ),
+    )
     sink_parallel_writes: bool = Field(
         default=False,
         description=("Write to multiple sinks in parallel instead of sequentially"),
@@ -1165,6 +1316,48 @@ class HttpSinkSettings(BaseModel):
         default="logs",
         description="Wrapper key when batch_format='wrapped'",
     )
+    max_in_flight_batches: int = Field(
+        default=4,
+        ge=1,
+        description="Maximum HTTP batches in flight at once",
+    )
+    pipelined: bool = Field(
+        default=False,
+        description="Send batches in the background while the next one fills",
+    )
+    max_batch_bytes: int | None = Field(
+        default=None,
+        ge=1,
+        description="Flush a batch before it exceeds this many serialized bytes",
+    )
+    adaptive_concurrency: bool = Field(
+        default=False,
+        description="Adapt the in-flight window to observed latency and congestion (AIMD)",
+    )
+    latency_target_ms: float = Field(
+        default=500.0,
+        gt=0.0,
+        description="Delivery latency (p95) above which the adaptive window shrinks",
+    )
+    http2: bool = Field(
+        default=False,
+        description="Multiplex requests over HTTP/2 (requires the h2 package: httpx[http2])",
+    )
+    max_connections: int | None = Field(
+        default=None,
+        ge=1,
+        description="Maximum open connections to the endpoint (defaults to max_in_flight_batches)",
+    )
+    keepalive_expiry_seconds: float = Field(
+        default=5.0,
+        ge=0.0,
+        description="Seconds an idle keep-alive connection is kept open",
+    )
+    prewarm_connections: int = Field(
+        default=0,
+        ge=0,
+        description="Connections to open with HEAD requests when the sink starts",
+    )
 
     @field_validator("headers_json")
     @classmethod
@@ -1457,6 +1650,15 @@ class Settings(BaseSettings):
                     "FAPILOG_CLOUDWATCH__BATCH_TIMEOUT_SECONDS",
                     EnvFieldType.DURATION,
                 ),
+                "pipelined": ("FAPILOG_CLOUDWATCH__PIPELINED", EnvFieldType.BOOL),
+                "max_in_flight_batches": (
+                    "FAPILOG_CLOUDWATCH__MAX_IN_FLIGHT_BATCHES",
+                    EnvFieldType.INT,
+                ),
+                "max_batch_bytes": (
+                    "FAPILOG_CLOUDWATCH__MAX_BATCH_BYTES",
+                    EnvFieldType.INT,
+                ),
                 "max_retries": ("FAPILOG_CLOUDWATCH__MAX_RETRIES", EnvFieldType.INT),
                 "retry_base_delay": (
                     "FAPILOG_CLOUDWATCH__RETRY_BASE_DELAY",
@@ -1502,6 +1704,15 @@ class Settings(BaseSettings):
                     "FAPILOG_LOKI__BATCH_TIMEOUT_SECONDS",
                     EnvFieldType.DURATION,
                 ),
+                "pipelined": ("FAPILOG_LOKI__PIPELINED", EnvFieldType.BOOL),
+                "max_in_flight_batches": (
+                    "FAPILOG_LOKI__MAX_IN_FLIGHT_BATCHES",
+                    EnvFieldType.INT,
+                ),
+                "max_batch_bytes": (
+                    "FAPILOG_LOKI__MAX_BATCH_BYTES",
+                    EnvFieldType.INT,
+                ),
                 "max_retries": ("FAPILOG_LOKI__MAX_RETRIES", EnvFieldType.INT),
                 "retry_base_delay": (
                     "FAPILOG_LOKI__RETRY_BASE_DELAY",
@@ -1546,6 +1757,11 @@ class Settings(BaseSettings):
                     "FAPILOG_POSTGRES__BATCH_TIMEOUT_SECONDS",
                     EnvFieldType.DURATION,
                 ),
+                "pipelined": ("FAPILOG_POSTGRES__PIPELINED", EnvFieldType.BOOL),
+                "max_in_flight_batches": (
+                    "FAPILOG_POSTGRES__MAX_IN_FLIGHT_BATCHES",
+                    EnvFieldType.INT,
+                ),
                 "max_retries": ("FAPILOG_POSTGRES__MAX_RETRIES", EnvFieldType.INT),
                 "retry_base_delay": (
                     "FAPILOG_POSTGRES__RETRY_BASE_DELAY",
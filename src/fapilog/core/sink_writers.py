@@ -15,11 +15,14 @@ Key improvements over closure-based approach:
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Sequence
 from typing import TYPE_CHECKING, Any, Literal
 
 from ..plugins.sinks.fallback import handle_sink_write_failure
+from .circuit_breaker import CircuitState
 
 if TYPE_CHECKING:
+    from ..plugins.sinks.spill_queue import DiskSpillQueue
     from .circuit_breaker import SinkCircuitBreaker, SinkCircuitBreakerConfig
 
 # Type alias for redact mode
@@ -36,6 +39,25 @@ def warn(component: str, message: str, **fields: Any) -> None:
         pass
 
 
+async def _ensure_started(sink: Any) -> None:
+    """Start a sink on its first write; start failures are reported, not raised."""
+    if hasattr(sink, "start") and not getattr(sink, "_started", False):
+        try:
+            await sink.start()
+            sink._started = True
+        except Exception:
+            try:
+                from .diagnostics import warn as _warn
+
+                _warn(
+                    "sink",
+                    "sink start failed",
+                    sink_type=type(sink).__name__,
+                )
+            except Exception:
+                pass
+
+
 def make_sink_writer(sink: Any) -> tuple[Any, Any]:
     """Create write functions for a single sink.
 
@@ -50,21 +72,7 @@ def make_sink_writer(sink: Any) -> tuple[Any, Any]:
     """
 
     async def _sink_write(entry: dict[str, Any]) -> bool | None:
-        if hasattr(sink, "start") and not getattr(sink, "_started", False):
-            try:
-                await sink.start()
-                sink._started = True
-            except Exception:
-                try:
-                    from .diagnostics import warn as _warn
-
-                    _warn(
-                        "sink",
-                        "sink start failed",
-                        sink_type=type(sink).__name__,
-                    )
-                except Exception:
-                    pass
+        await _ensure_started(sink)
         result: bool | None = await sink.write(entry)
         return result
 
@@ -90,6 +98,7 @@ class SinkWriterGroup:
         _breakers: Mapping from sink id to SinkCircuitBreaker instance.
         _fallback_writers: Mapping from sink id to (write, write_serialized) fallback fns.
         _fallback_write_count: Counter for fallback writes (metrics).
+        _spills: Mapping from sink id to DiskSpillQueue when spilling is on.
         _parallel: Whether to write to sinks in parallel.
         _redact_mode: Redaction mode for fallback output.
 
@@ -108,6 +117,8 @@ class SinkWriterGroup:
         "_breakers",
         "_fallback_writers",
         "_fallback_write_count",
+        "_spills",
+        "_replay_timers",
         "_parallel",
         "_redact_mode",
     )
@@ -148,11 +159,28 @@ class SinkWriterGroup:
                 name = getattr(sink, "name", type(sink).__name__)
                 self._breakers[id(sink)] = SinkCircuitBreaker(name, circuit_config)
 
+        # Disk spill queues absorb writes while a circuit is open
+        self._spills: dict[int, DiskSpillQueue] = {}
+        spill_directory = getattr(circuit_config, "spill_directory", None)
+        if self._breakers and spill_directory:
+            self._spills = _build_spill_queues(sinks, circuit_config)
+        self._replay_timers: dict[int, asyncio.TimerHandle] = {}
+        for idx, sink in enumerate(sinks):
+            spill = self._spills.get(id(sink))
+            if spill is not None:
+                breaker = self._breakers[id(sink)]
+                breaker.add_state_listener(self._replay_listener(idx, spill, breaker))
+
     @property
     def breakers(self) -> list[SinkCircuitBreaker]:
         """Return all circuit breaker instances (Story 4.73 wiring)."""
         return list(self._breakers.values())
 
+    @property
+    def spill_queues(self) -> list[DiskSpillQueue]:
+        """Return all disk spill queues (empty unless spilling is enabled)."""
+        return list(self._spills.values())
+
     async def write(self, entry: dict[str, Any]) -> None:
         """Write entry to all sinks (parallel or sequential based on config).
 
@@ -173,6 +201,81 @@ class SinkWriterGroup:
         for i, (_, write_s) in enumerate(self._writers):
             await self._write_one_serialized(i, write_s, view)
 
+    async def write_routed_batch(
+        self, items: Sequence[tuple[dict[str, Any], Any]]
+    ) -> None:
+        """Write a flush batch of ``(entry, view)`` pairs to every sink.
+
+        Sinks with a ``write_batch(entries)`` method get the batch's
+        entries in one call. Other sinks get each event in order, as
+        :meth:`write` and :meth:`write_serialized` would send it.
+        """
+        if not items:
+            return
+        jobs = [self._write_sink_batch(i, items) for i in range(len(self._sinks))]
+        if self._parallel and len(jobs) > 1:
+            await asyncio.gather(*jobs, return_exceptions=True)
+        else:
+            for job in jobs:
+                await job
+
+    async def _write_sink_batch(
+        self, idx: int, items: Sequence[tuple[dict[str, Any], Any]]
+    ) -> None:
+        """Write a flush batch to one sink."""
+        sink = self._sinks[idx]
+        write_batch = getattr(sink, "write_batch", None)
+        if not callable(write_batch):
+            write, write_s = self._writers[idx]
+            for entry, view in items:
+                if view is not None:
+                    await self._write_one_serialized(idx, write_s, view)
+                else:
+                    await self._write_one(idx, write, entry)
+            return
+
+        entries = [entry for entry, _ in items]
+        breaker = self._breakers.get(id(sink))
+        spill = self._spills.get(id(sink))
+        if breaker and not breaker.should_allow():
+            fallback = self._fallback_writers.get(id(sink))
+            for entry in entries:
+                if spill is not None:
+                    await self._spill_or_fallback(sink, spill, entry)
+                elif fallback is not None:
+                    await self._write_fallback(sink, fallback[0], entry)
+            return
+
+        error: Exception | None = None
+        try:
+            await _ensure_started(sink)
+            if await write_batch(entries) is False:
+                error = RuntimeError("Sink returned False")
+        except Exception as exc:
+            error = exc
+        if error is None:
+            if breaker:
+                breaker.record_batch(len(entries), 0)
+                if spill is not None and spill.has_backlog:
+                    self._start_replay(idx, spill, breaker)
+            return
+
+        if breaker:
+            breaker.record_batch(0, len(entries))
+        for entry in entries:
+            if spill is not None and await self._spill(spill, entry):
+                continue
+            try:
+                await handle_sink_write_failure(
+                    entry,
+                    sink=sink,
+                    error=error,
+                    serialized=False,
+                    redact_mode=self._redact_mode,
+                )
+            except Exception:
+                pass
+
     async def _write_sequential(self, entry: dict[str, Any]) -> None:
         """Write to sinks sequentially."""
         for i, (write, _) in enumerate(self._writers):
@@ -192,6 +295,10 @@ class SinkWriterGroup:
             breaker = self._breakers.get(id(sink))
 
             if breaker and not breaker.should_allow():
+                spill = self._spills.get(id(sink))
+                if spill is not None:
+                    tasks.append(self._spill_or_fallback(sink, spill, entry))
+                    continue
                 # Circuit is open — try fallback (Story 4.72)
                 fallback = self._fallback_writers.get(id(sink))
                 if fallback is not None:
@@ -274,6 +381,88 @@ class SinkWriterGroup:
             except Exception:
                 pass
 
+    async def _spill_or_fallback(
+        self, sink: object, spill: DiskSpillQueue, entry: dict[str, Any]
+    ) -> None:
+        """Spill an entry for an open circuit; use the fallback if it is full."""
+        if await self._spill(spill, entry):
+            return
+        fallback = self._fallback_writers.get(id(sink))
+        if fallback is not None:
+            await self._write_fallback(sink, fallback[0], entry)
+
+    async def _spill(
+        self, spill: DiskSpillQueue, payload: Any, *, serialized: bool = False
+    ) -> bool:
+        """Append to the sink's spill queue; False if full or failing."""
+        try:
+            if serialized:
+                return await spill.put_serialized(payload)
+            return await spill.put_entry(payload)
+        except Exception as exc:
+            warn("sink", "spill write failed", error=type(exc).__name__)
+            return False
+
+    async def close(self) -> None:
+        """Stop pending replays and close every spill queue."""
+        for handle in self._replay_timers.values():
+            handle.cancel()
+        self._replay_timers.clear()
+        for spill in self._spills.values():
+            try:
+                await spill.close()
+            except Exception as exc:
+                warn("sink", "spill close failed", error=type(exc).__name__)
+
+    def _replay_listener(
+        self, idx: int, spill: DiskSpillQueue, breaker: SinkCircuitBreaker
+    ) -> Any:
+        """Build the breaker callback that drives spill replay.
+
+        Closing the circuit starts replay at once. Opening it schedules a
+        replay attempt for when the recovery timeout elapses, so the first
+        backlog record can serve as the half-open probe without waiting for
+        live traffic.
+        """
+
+        def _on_state_change(_name: str, state: CircuitState) -> None:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                return
+            timer = self._replay_timers.pop(idx, None)
+            if timer is not None:
+                timer.cancel()
+            if state is CircuitState.CLOSED:
+                if spill.has_backlog:
+                    self._start_replay(idx, spill, breaker)
+            elif state is CircuitState.OPEN:
+                self._replay_timers[idx] = loop.call_later(
+                    breaker.recovery_timeout_seconds,
+                    self._start_replay,
+                    idx,
+                    spill,
+                    breaker,
+                )
+
+        return _on_state_change
+
+    def _start_replay(
+        self, idx: int, spill: DiskSpillQueue, breaker: SinkCircuitBreaker
+    ) -> None:
+        """Drain the spill backlog now that the sink accepts writes again."""
+        write, write_serialized = self._writers[idx]
+
+        def _record(ok: bool) -> None:
+            if ok:
+                breaker.record_success()
+            else:
+                breaker.record_failure()
+
+        spill.start_replay(
+            write, write_serialized, allow=breaker.should_allow, on_result=_record
+        )
+
     async def _write_one(
         self,
         idx: int,
@@ -290,7 +479,11 @@ class SinkWriterGroup:
         sink = self._sinks[idx]
         breaker = self._breakers.get(id(sink))
 
+        spill = self._spills.get(id(sink))
         if breaker and not breaker.should_allow():
+            if spill is not None:
+                await self._spill_or_fallback(sink, spill, entry)
+                return
             # Circuit is open — try fallback (Story 4.72)
             fallback = self._fallback_writers.get(id(sink))
             if fallback is not None:
@@ -303,6 +496,8 @@ class SinkWriterGroup:
             if result is False:
                 if breaker:
                     breaker.record_failure()
+                if spill is not None and await self._spill(spill, entry):
+                    return
                 try:
                     await handle_sink_write_failure(
                         entry,
@@ -315,9 +510,13 @@ class SinkWriterGroup:
                     pass
             elif breaker:
                 breaker.record_success()
+                if spill is not None and spill.has_backlog:
+                    self._start_replay(idx, spill, breaker)
         except Exception as exc:
             if breaker:
                 breaker.record_failure()
+            if spill is not None and await self._spill(spill, entry):
+                return
             try:
                 await handle_sink_write_failure(
                     entry,
@@ -346,7 +545,10 @@ class SinkWriterGroup:
         sink = self._sinks[idx]
         breaker = self._breakers.get(id(sink))
 
+        spill = self._spills.get(id(sink))
         if breaker and not breaker.should_allow():
+            if spill is not None and await self._spill(spill, view, serialized=True):
+                return
             # Circuit is open — try fallback (Story 4.72)
             fallback = self._fallback_writers.get(id(sink))
             if fallback is not None:
@@ -359,6 +561,10 @@ class SinkWriterGroup:
             if result is False:
                 if breaker:
                     breaker.record_failure()
+                if spill is not None and await self._spill(
+                    spill, view, serialized=True
+                ):
+                    return
                 try:
                     await handle_sink_write_failure(
                         view,
@@ -371,9 +577,13 @@ class SinkWriterGroup:
                     pass
             elif breaker:
                 breaker.record_success()
+                if spill is not None and spill.has_backlog:
+                    self._start_replay(idx, spill, breaker)
         except Exception as exc:
             if breaker:
                 breaker.record_failure()
+            if spill is not None and await self._spill(spill, view, serialized=True):
+                return
             try:
                 await handle_sink_write_failure(
                     view,
@@ -387,9 +597,41 @@ class SinkWriterGroup:
             # Contain errors
 
 
+def _build_spill_queues(
+    sinks: list[object], circuit_config: Any
+) -> dict[int, DiskSpillQueue]:
+    """Create one spill queue per sink under the configured directory.
+
+    Directories are named after the sink (suffixed on duplicates) so a
+    restarted process finds the backlog left by the previous one.
+    """
+    from pathlib import Path
+
+    from ..plugins.sinks.spill_queue import DiskSpillQueue, SpillQueueConfig
+
+    root = Path(circuit_config.spill_directory)
+    queues: dict[int, DiskSpillQueue] = {}
+    seen: dict[str, int] = {}
+    for sink in sinks:
+        name = str(getattr(sink, "name", type(sink).__name__))
+        count = seen.get(name, 0)
+        seen[name] = count + 1
+        directory = root / (name if count == 0 else f"{name}-{count}")
+        queues[id(sink)] = DiskSpillQueue(
+            SpillQueueConfig(
+                directory=directory,
+                max_total_bytes=circuit_config.spill_max_bytes,
+                replay_rate_per_second=circuit_config.spill_replay_rate,
+            )
+        )
+    return queues
+
+
 # Mark as referenced for static analyzers (vulture)
 _VULTURE_USED: tuple[object, ...] = (
     SinkWriterGroup,
     SinkWriterGroup.breakers,
+    SinkWriterGroup.spill_queues,
+    SinkWriterGroup.close,
     make_sink_writer,
 )
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import asyncio
+import contextvars
 import logging
 import threading
+from collections import deque
 from typing import Any, Iterable
 
 _STD_ATTRS: set[str] = {
@@ -169,10 +171,29 @@ class _BridgeLoopManager:
 _bridge_loop_manager = _BridgeLoopManager()
 
 
+def _level_name(levelno: int) -> str:
+    if levelno >= logging.CRITICAL:
+        return "CRITICAL"
+    if levelno >= logging.ERROR:
+        return "ERROR"
+    if levelno >= logging.WARNING:
+        return "WARNING"
+    if levelno >= logging.INFO:
+        return "INFO"
+    return "DEBUG"
+
+
 class StdlibBridgeHandler(logging.Handler):
     """Bridge stdlib LogRecord into fapilog's async pipeline.
 
     Non-blocking: emit() delegates immediately to the facade enqueue path.
+
+    With ``batched=True``, emit() only appends the record to an in-memory
+    buffer and a single drain task on the shared bridge loop converts the
+    backlog. For fapilog facades the drain applies the level gate and
+    caller-side filters first, so ``getMessage()`` and extras extraction
+    only run for records that will actually be enqueued, and async facades
+    cost one task per burst instead of one per record.
     """
 
     def __init__(
@@ -184,6 +205,8 @@ class StdlibBridgeHandler(logging.Handler):
         force_sync: bool = False,
         loop_thread_name: str = "fapilog-stdlib-bridge",
         startup_timeout: float = 2.0,
+        batched: bool = False,
+        max_buffered: int = 10_000,
     ) -> None:
         super().__init__(level)
         self._fl = fapilog_logger
@@ -191,40 +214,31 @@ class StdlibBridgeHandler(logging.Handler):
         self._force_sync = bool(force_sync)
         self._loop_thread_name = loop_thread_name
         self._startup_timeout = float(startup_timeout)
+        self._batched = bool(batched)
+        self._max_buffered = max(1, int(max_buffered))
+        # Each record keeps the context it was emitted in so request_id and
+        # bound fields survive the hop to the bridge loop thread
+        self._buffer: deque[tuple[logging.LogRecord, contextvars.Context]] = deque()
+        # Emitting threads append and set the drain flag while the bridge loop
+        # thread clears it; the bound check, counters and flag share one lock
+        self._drain_lock = threading.Lock()
+        self._drain_pending = False
+        self._buffer_dropped = 0
+
+    @property
+    def buffer_dropped(self) -> int:
+        """Records dropped because the batched buffer was full."""
+        return self._buffer_dropped
 
     def emit(self, record: logging.LogRecord) -> None:  # noqa: D401
         try:
             # Loop prevention: ignore records originating from fapilog
             if record.name.startswith(self._prefix):
                 return
-            message = record.getMessage()
-            extras = _extract_extras(record)
-
-            # Level mapping
-            lvl = record.levelno
-            method = self._fl.debug
-            if lvl >= logging.CRITICAL:
-                method = self._fl.critical
-            elif lvl >= logging.ERROR:
-                method = self._fl.error
-            elif lvl >= logging.WARNING:
-                method = self._fl.warning
-            elif lvl >= logging.INFO:
-                method = self._fl.info
-
-            # Exception propagation
-            exc_info = record.exc_info
-            stack_info = record.stack_info
-            if stack_info and "error.stack" not in extras:
-                extras["stack_info"] = stack_info
-
-            # Mark log as originating from stdlib bridge (Story 10.48)
-            extras["_origin"] = "stdlib"
-
-            if exc_info:
-                result = method(message, exc_info=exc_info, **extras)
-            else:
-                result = method(message, **extras)
+            if self._batched:
+                self._buffer_record(record)
+                return
+            result = self._forward(record)
 
             # If the target logger method is async, schedule it safely
             if asyncio.iscoroutine(result):
@@ -244,6 +258,112 @@ class StdlibBridgeHandler(logging.Handler):
             # Bridge must never raise
             return
 
+    def _forward(self, record: logging.LogRecord) -> Any:
+        """Convert a record and call the matching facade method."""
+        level = _level_name(record.levelno)
+        method = getattr(self._fl, level.lower())
+        return method(record.getMessage(), **self._record_kwargs(record))
+
+    def _record_kwargs(self, record: logging.LogRecord) -> dict[str, Any]:
+        extras = _extract_extras(record)
+
+        # Exception propagation
+        stack_info = record.stack_info
+        if stack_info and "error.stack" not in extras:
+            extras["stack_info"] = stack_info
+
+        # Mark log as originating from stdlib bridge (Story 10.48)
+        extras["_origin"] = "stdlib"
+
+        if record.exc_info:
+            extras["exc_info"] = record.exc_info
+        return extras
+
+    def _buffer_record(self, record: logging.LogRecord) -> None:
+        ctx = contextvars.copy_context()
+        buffer = self._buffer
+        with self._drain_lock:
+            if len(buffer) >= self._max_buffered:
+                self._buffer_dropped += 1
+                return
+            buffer.append((record, ctx))
+            if self._drain_pending:
+                return
+            self._drain_pending = True
+        if not _bridge_loop_manager.submit(
+            self._drain(),
+            thread_name=self._loop_thread_name,
+            timeout=self._startup_timeout,
+        ):
+            with self._drain_lock:
+                self._drain_pending = False
+
+    async def _drain(self) -> None:
+        # Clear the flag before popping so records appended while draining
+        # either get popped here or schedule a fresh drain.
+        with self._drain_lock:
+            self._drain_pending = False
+        fl = self._fl
+        fast = self._is_facade(fl)
+        buffer = self._buffer
+        while True:
+            try:
+                record, ctx = buffer.popleft()
+            except IndexError:
+                return
+            try:
+                if fast:
+                    level = _level_name(record.levelno)
+                    if fl._caller_rejects(level):
+                        fl._record_filtered(1)
+                        continue
+                    # The payload reads request/bound context, so build it in
+                    # the emitting thread's context; queueing it does not
+                    payload = ctx.run(
+                        fl._prepare_payload,
+                        level,
+                        record.getMessage(),
+                        **self._record_kwargs(record),
+                    )
+                    if payload is None:
+                        continue
+                    result = fl._submit_prepared(payload)
+                else:
+                    result = ctx.run(self._forward, record)
+                    if asyncio.iscoroutine(result):
+                        # Run the coroutine in a task that inherits ``ctx``
+                        result = ctx.run(asyncio.ensure_future, result)
+                if asyncio.iscoroutine(result) or asyncio.isfuture(result):
+                    await result
+            except Exception:
+                # Bridge must never raise
+                continue
+
+    @staticmethod
+    def _is_facade(fl: Any) -> bool:
+        from .logger import _LoggerMixin
+
+        return isinstance(fl, _LoggerMixin)
+
+    def flush(self) -> None:
+        """Wait (bounded by ``startup_timeout``) for buffered records to drain."""
+        if not self._batched:
+            return
+        # An empty buffer is not enough: a running drain may have popped the
+        # last record without handing it off yet, so round-trip the loop
+        if not self._buffer and not _bridge_loop_manager.is_running:
+            return
+        loop = _bridge_loop_manager.start(
+            thread_name=self._loop_thread_name, timeout=self._startup_timeout
+        )
+        if loop is None:
+            return
+        try:
+            fut = asyncio.run_coroutine_threadsafe(self._drain(), loop)
+            fut.result(timeout=self._startup_timeout)
+        except Exception:
+            return
+
 
 def enable_stdlib_bridge(
     logger: Any,
@@ -256,11 +376,14 @@ def enable_stdlib_bridge(
     force_sync: bool = False,
     loop_thread_name: str = "fapilog-stdlib-bridge",
     startup_timeout: float = 2.0,
+    batched: bool = False,
+    max_buffered: int = 10_000,
 ) -> None:
     """Enable stdlib logging bridge.
 
     Installs a handler on the root (or provided target loggers) that forwards
-    stdlib logs into the fapilog pipeline.
+    stdlib logs into the fapilog pipeline. ``batched=True`` buffers records
+    and hands them off in bulk (see ``StdlibBridgeHandler``).
     """
     handler = StdlibBridgeHandler(
         logger,
@@ -269,6 +392,8 @@ def enable_stdlib_bridge(
         force_sync=force_sync,
         loop_thread_name=loop_thread_name,
         startup_timeout=startup_timeout,
+        batched=batched,
+        max_buffered=max_buffered,
     )
     targets: list[logging.Logger]
     if target_loggers is not None:
@@ -9,11 +9,12 @@ from __future__ import annotations
 import asyncio
 import time
 from collections.abc import Sequence
+from dataclasses import replace
 from typing import Any, Awaitable, Callable, Literal
 
 from ..metrics.metrics import MetricsCollector, plugin_timer
-from ..plugins.enrichers import BaseEnricher, enrich_parallel
-from ..plugins.filters import filter_in_order
+from ..plugins.enrichers import BaseEnricher, enrich_batch, enrich_parallel
+from ..plugins.filters import filter_in_order, record_filter_metrics
 from ..plugins.processors import BaseProcessor
 from ..plugins.redactors import BaseRedactor, redact_in_order
 from .adaptive import AdaptiveController
@@ -21,6 +22,7 @@ from .concurrency import DualQueue, NonBlockingRingQueue, PriorityAwareQueue
 from .diagnostics import warn
 from .serialization import (
     SerializedView,
+    attach_view_metadata,
     serialize_envelope,
     serialize_mapping_to_json_bytes,
 )
@@ -90,6 +92,7 @@ class LoggerWorker:
         sink_write: Callable[[dict[str, Any]], Awaitable[None]],
         sink_write_serialized: Callable[[SerializedView], Awaitable[None]] | None,
         filters_getter: Callable[[], Sequence[Any]] | None = None,
+        caller_filters_getter: Callable[[], Sequence[Any]] | None = None,
         enrichers_getter: Callable[[], Sequence[BaseEnricher]],
         redactors_getter: Callable[[], Sequence[BaseRedactor]],
         processors_getter: Callable[[], Sequence[BaseProcessor]] | None = None,
@@ -120,6 +123,7 @@ class LoggerWorker:
         self._sink_write = sink_write
         self._sink_write_serialized = sink_write_serialized
         self._filters_getter = filters_getter or (lambda: [])
+        self._caller_filters_getter = caller_filters_getter or (lambda: [])
         self._enrichers_getter = enrichers_getter
         self._redactors_getter = redactors_getter
         self._processors_getter = processors_getter or (lambda: [])
@@ -139,6 +143,21 @@ class LoggerWorker:
         self._enqueue_event = enqueue_event
         self._sink_concurrency = max(1, sink_concurrency)
         self._sink_semaphore = asyncio.Semaphore(self._sink_concurrency)
+        # Writers that route a whole batch of (entry, view) pairs declare
+        # write_routed_batch and get one call per flush. Sinks' own
+        # write_batch methods take entry dicts and are reached through the
+        # writer, never directly. Per-event concurrency needs the per-event
+        # path.
+        self._sink_write_batch: (
+            Callable[
+                [list[tuple[dict[str, Any], SerializedView | None]]], Awaitable[None]
+            ]
+            | None
+        ) = None
+        if self._sink_concurrency == 1:
+            self._sink_write_batch = getattr(
+                getattr(sink_write, "__self__", None), "write_routed_batch", None
+            )
 
     async def run(self, *, in_thread_mode: bool = False) -> None:
         batch: list[dict[str, Any]] = []
@@ -239,7 +258,7 @@ class LoggerWorker:
            serialized bytes when serialize_in_flush is enabled.
 
         5. SINK: Final stage writes to destination (concurrent when
-           sink_concurrency > 1).
+           sink_concurrency > 1; one batched call for batch-aware writers).
 
         Error Handling:
         - Stages 1-4: Errors contained; original event passed through
@@ -254,41 +273,55 @@ class LoggerWorker:
         processed_in_batch = 0
         dropped_in_batch = 0
 
-        # Phase 1: Prepare (sequential — fast, CPU-bound per event)
-        write_tasks: list[tuple[dict[str, Any], SerializedView | None]] = []
-        for entry in batch:
-            # Stage 1: FILTERS - drop unwanted events early
-            filtered = await self._apply_filters(entry)
-            if filtered is None:
-                continue
-            # Stage 2: ENRICHERS - add contextual data
-            entry = await self._apply_enrichers(filtered)
-            # Stage 3: REDACTORS - mask sensitive data (including enriched fields)
-            redacted = await self._apply_redactors(entry)
-            if redacted is None:
-                # Event dropped by fail-closed mode
-                dropped_in_batch += 1
-                if self._metrics is not None:
-                    await self._metrics.record_events_dropped(1)
-                continue
-            entry = redacted
-            if self._serialize_in_flush and self._sink_write_serialized is not None:
-                view, drop_entry = await self._try_serialize(entry)
-                if drop_entry:
+        self._begin_filter_batch()
+        try:
+            await self._record_caller_filter_metrics()
+            # Stages 1-2 run batch-wide when an enricher can seal/enrich a whole
+            # batch at once (e.g. tamper-evident chaining); otherwise per event.
+            staged = await self._filter_and_enrich_batch(batch)
+
+            # Phase 1: Prepare (sequential — fast, CPU-bound per event)
+            write_tasks: list[tuple[dict[str, Any], SerializedView | None]] = []
+            for entry in batch if staged is None else staged:
+                if staged is None:
+                    # Stage 1: FILTERS - drop unwanted events early
+                    filtered = await self._apply_filters(entry)
+                    if filtered is None:
+                        continue
+                    # Stage 2: ENRICHERS - add contextual data
+                    entry = await self._apply_enrichers(filtered)
+                # Stage 3: REDACTORS - mask sensitive data (including enriched fields)
+                redacted = await self._apply_redactors(entry)
+                if redacted is None:
+                    # Event dropped by fail-closed mode
                     dropped_in_batch += 1
                     if self._metrics is not None:
                         await self._metrics.record_events_dropped(1)
                     continue
-                if view is not None:
-                    # Stage 4: PROCESSORS - transform serialized bytes
-                    view = await self._apply_processors(view)
-                    write_tasks.append((entry, view))
-                    continue
-            write_tasks.append((entry, None))
+                entry = redacted
+                if self._serialize_in_flush and self._sink_write_serialized is not None:
+                    view, drop_entry = await self._try_serialize(entry)
+                    if drop_entry:
+                        dropped_in_batch += 1
+                        if self._metrics is not None:
+                            await self._metrics.record_events_dropped(1)
+                        continue
+                    if view is not None:
+                        # Stage 4: PROCESSORS - transform serialized bytes
+                        view = await self._apply_processors(view)
+                        write_tasks.append((entry, view))
+                        continue
+                write_tasks.append((entry, None))
+        finally:
+            self._end_filter_batch()
 
-        # Phase 2: Sink write (concurrent, bounded by semaphore)
+        # Phase 2: Sink write (batched fan-out, or concurrent per event
+        # bounded by semaphore)
         if write_tasks:
-            processed, dropped = await self._write_concurrent(write_tasks)
+            if self._sink_write_batch is not None:
+                processed, dropped = await self._write_batched(write_tasks)
+            else:
+                processed, dropped = await self._write_concurrent(write_tasks)
             processed_in_batch += processed
             dropped_in_batch += dropped
 
@@ -351,6 +384,21 @@ class LoggerWorker:
         dropped = len(results) - processed
         return processed, dropped
 
+    async def _write_batched(
+        self,
+        tasks: list[tuple[dict[str, Any], SerializedView | None]],
+    ) -> tuple[int, int]:
+        """Hand the prepared batch to a batch-aware writer in one call."""
+        assert self._sink_write_batch is not None
+        try:
+            await self._sink_write_batch(tasks)
+        except Exception as exc:
+            if self._metrics is not None:
+                await self._record_sink_error()
+            self._emit_sink_flush_error(exc)
+            return 0, len(tasks)
+        return len(tasks), 0
+
     def _drain_queue(self, batch: list[dict[str, Any]]) -> None:
         queue = self._queue
         if isinstance(queue, DualQueue):
@@ -384,6 +432,79 @@ class LoggerWorker:
                     pass
             return entry
 
+    async def _filter_and_enrich_batch(
+        self, batch: list[dict[str, Any]]
+    ) -> list[dict[str, Any]] | None:
+        """Filter and enrich the whole batch when a batch enricher is configured.
+
+        Returns None when no enricher defines ``enrich_batch`` so the caller
+        keeps the per-event path. Filters still run first on every event;
+        only the survivors are handed to the enrichers.
+        """
+        enrichers = self._enrichers_getter()
+        if not any(callable(getattr(e, "enrich_batch", None)) for e in enrichers):
+            return None
+        kept: list[dict[str, Any]] = []
+        for entry in batch:
+            filtered = await self._apply_filters(entry)
+            if filtered is not None:
+                kept.append(filtered)
+        if not kept:
+            return kept
+        try:
+            return await enrich_batch(kept, enrichers, metrics=self._metrics)
+        except Exception:
+            if self._emit_enricher_diagnostics:
+                try:
+                    warn("enricher", "enrichment error", _rate_limit_key="enrich")
+                except Exception:
+                    pass
+            return kept
+
+    def _begin_filter_batch(self) -> None:
+        """Notify filters that a batch is starting.
+
+        Filters may define an optional ``begin_batch()`` to do per-batch work
+        once (e.g. sample the clock) instead of per event. Errors are
+        contained so a misbehaving filter cannot stall the flush.
+        """
+        for f in self._filters_getter():
+            hook = getattr(f, "begin_batch", None)
+            if hook is None:
+                continue
+            try:
+                hook()
+            except Exception:
+                pass
+
+    async def _record_caller_filter_metrics(self) -> None:
+        """Refresh gauges for filters hoisted to the caller side.
+
+        Those filters never pass through ``filter_in_order``, so their
+        sample-rate/EPS gauges are published once per flush instead.
+        """
+        if self._metrics is None:
+            return
+        for f in self._caller_filters_getter():
+            name = getattr(f, "name", type(f).__name__)
+            await record_filter_metrics(self._metrics, f, name)
+
+    def _end_filter_batch(self) -> None:
+        """Notify filters that the batch's filtering is over.
+
+        Filters with a ``begin_batch()`` hook may define ``end_batch()`` to
+        drop per-batch state (e.g. the sampled clock) so later calls made
+        outside a flush see fresh values.
+        """
+        for f in self._filters_getter():
+            hook = getattr(f, "end_batch", None)
+            if hook is None:
+                continue
+            try:
+                hook()
+            except Exception:
+                pass
+
     async def _apply_filters(self, entry: dict[str, Any]) -> dict[str, Any] | None:
         """Apply filters to drop unwanted events early in the pipeline.
 
@@ -504,7 +625,8 @@ class LoggerWorker:
         if current_view is base_view:
             return view
         try:
-            return SerializedView(data=current_view.tobytes())
+            # Keep the metadata captured at serialization for routing
+            return replace(view, data=current_view.tobytes())
         except Exception:
             return view
 
@@ -549,7 +671,8 @@ class LoggerWorker:
                 return None, True
             # Best-effort fallback for edge cases
             try:
-                return serialize_mapping_to_json_bytes(entry), False
+                view = serialize_mapping_to_json_bytes(entry)
+                return attach_view_metadata(view, entry), False
             except Exception:
                 return None, False
 
@@ -117,6 +117,7 @@ class MetricsCollector:
         self._c_sink_errors: Any | None = None
         self._g_queue_high_watermark: Any | None = None
         self._g_filter_sample_rate: Any | None = None
+        self._g_filter_observed_eps: Any | None = None
         self._g_rate_limit_keys: Any | None = None
         self._c_size_guard_truncated: Any | None = None
         self._c_size_guard_dropped: Any | None = None
@@ -134,6 +135,7 @@ class MetricsCollector:
         self._g_pressure_level: Any | None = None
         # Queue depth gauges (Story 1.52)
         self._g_queue_depth: Any | None = None
+        self._g_sink_concurrency_window: Any | None = None
         # Circuit breaker fallback routing (Story 4.72)
         self._c_fallback_writes: Any | None = None
         self._fallback_write_count: int = 0
@@ -256,6 +258,12 @@ class MetricsCollector:
                 ["filter"],
                 registry=self._registry,
             )
+            self._g_filter_observed_eps = Gauge(
+                "fapilog_filter_observed_eps",
+                "Observed events per second reported by adaptive filters",
+                ["filter"],
+                registry=self._registry,
+            )
             self._g_rate_limit_keys = Gauge(
                 "fapilog_rate_limit_keys_tracked",
                 "Number of unique rate limit keys currently tracked",
@@ -317,6 +325,13 @@ class MetricsCollector:
                 ["queue"],
                 registry=self._registry,
             )
+            # Per-sink in-flight batch windows
+            self._g_sink_concurrency_window = Gauge(
+                "fapilog_sink_concurrency_window",
+                "Current in-flight batch window per sink",
+                ["sink"],
+                registry=self._registry,
+            )
             # Circuit breaker fallback routing (Story 4.72)
             self._c_fallback_writes = Counter(
                 "fapilog_circuit_breaker_fallback_writes_total",
@@ -393,6 +408,12 @@ class MetricsCollector:
         if self._g_filter_sample_rate is not None:
             self._g_filter_sample_rate.labels(filter=filter_name).set(rate)
 
+    async def record_filter_observed_eps(self, filter_name: str, eps: float) -> None:
+        if not self._enabled:
+            return
+        if self._g_filter_observed_eps is not None:
+            self._g_filter_observed_eps.labels(filter=filter_name).set(eps)
+
     async def record_rate_limit_keys_tracked(self, count: int) -> None:
         if not self._enabled:
             return
@@ -422,6 +443,18 @@ class MetricsCollector:
         if self._g_queue_depth is not None:
             self._g_queue_depth.labels(queue=queue_label).set(depth)
 
+    async def set_sink_concurrency_window(self, sink: str, window: int) -> None:
+        """Set the in-flight batch window gauge for a sink.
+
+        Args:
+            sink: Sink name.
+            window: Number of batches the sink may have in flight.
+        """
+        if not self._enabled:
+            return
+        if self._g_sink_concurrency_window is not None:
+            self._g_sink_concurrency_window.labels(sink=sink).set(window)
+
     async def record_fallback_writes(
         self, *, primary_sink: str, fallback_sink: str, count: int = 1
     ) -> None:
@@ -140,6 +140,71 @@ async def enrich_parallel(
     return merged
 
 
+async def enrich_batch(
+    events: list[dict],
+    enrichers: Iterable[BaseEnricher],
+    *,
+    concurrency: int = 5,
+    metrics: MetricsCollector | None = None,
+) -> list[dict]:
+    """Enrich a whole flush batch, letting batch-capable enrichers see it at once.
+
+    Enrichers may define an optional ``enrich_batch(events) -> list[dict]``
+    returning one mapping per input event. Those are called once with shallow
+    copies of every event; the rest run per event via ``enrich_parallel``.
+    Batch results are deep-merged after the per-event ones, so batch enrichers
+    should target keys no other enricher writes.
+
+    A failing batch enricher (or one returning the wrong number of results)
+    is skipped for the whole batch, mirroring per-event error containment.
+    """
+    enricher_list: list[BaseEnricher] = list(enrichers)
+    batch_enrichers = [
+        e for e in enricher_list if callable(getattr(e, "enrich_batch", None))
+    ]
+    per_event = [e for e in enricher_list if e not in batch_enrichers]
+
+    merged: list[dict] = []
+    for event in events:
+        if per_event:
+            merged.append(
+                await enrich_parallel(
+                    event, per_event, concurrency=concurrency, metrics=metrics
+                )
+            )
+        else:
+            merged.append(dict(event))
+
+    for e in batch_enrichers:
+        try:
+            async with plugin_timer(metrics, e.__class__.__name__):
+                results = await e.enrich_batch(  # type: ignore[attr-defined]
+                    [dict(event) for event in events]
+                )
+            if len(results) != len(events):
+                raise ValueError("enrich_batch returned wrong number of results")
+        except Exception as exc:
+            if metrics is not None and metrics.is_enabled:
+                await metrics.record_plugin_error(
+                    plugin_name=getattr(type(exc), "__name__", "enricher_error")
+                )
+            try:
+                from ...core import diagnostics as _diag
+
+                _diag.warn(
+                    "enricher",
+                    "enrichment error",
+                    error_type=type(exc).__name__,
+                    _rate_limit_key="enrich",
+                )
+            except Exception:
+                pass
+            continue
+        for idx, res in enumerate(results):
+            merged[idx] = _deep_merge(merged[idx], res)
+    return merged
+
+
 # Register built-ins with alias support (hyphen/underscore)
 register_builtin(
     "fapilog.enrichers",
@@ -164,6 +229,7 @@ __all__ = [
     "BaseEnricher",
     "_deep_merge",
     "enrich_parallel",
+    "enrich_batch",
     "RuntimeInfoEnricher",
     "ContextVarsEnricher",
     "KubernetesEnricher",
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import random
-from typing import Any, Iterable, Protocol, runtime_checkable
+from typing import Any, Callable, Iterable, Protocol, Sequence, runtime_checkable
 
 from ...core import diagnostics
 from ...metrics.metrics import MetricsCollector, plugin_timer
@@ -59,7 +59,7 @@ async def filter_in_order(
                 pass
             continue
         if metrics is not None:
-            await _record_filter_metrics(metrics, f, name)
+            await record_filter_metrics(metrics, f, name)
 
         if result is None:
             if metrics is not None:
@@ -69,9 +69,58 @@ async def filter_in_order(
     return current
 
 
-async def _record_filter_metrics(
+def compile_caller_prefilter(
+    filters: Sequence[Any],
+) -> tuple[Callable[[str], bool] | None, tuple[Any, ...]]:
+    """Hoist leading caller-safe filters into one level decision function.
+
+    Filters opt in by setting ``caller_safe = True`` and implementing a
+    synchronous, thread-safe ``precheck(level: str) -> bool`` that mirrors
+    what ``filter()`` would decide for an envelope of that level. Only the
+    leading run of such filters is hoisted so the relative order of filters
+    is preserved; everything from the first non-caller-safe filter onward
+    still runs in the worker.
+
+    Returns the decision function (``None`` when nothing can be hoisted) and
+    the filters that remain for the worker. Exceptions from a precheck are
+    contained and treated as "keep", matching ``filter_in_order``.
+    """
+    checks: list[Callable[[str], bool]] = []
+    for f in filters:
+        if getattr(f, "caller_safe", False) is not True:
+            break
+        precheck = getattr(f, "precheck", None)
+        if not callable(precheck):
+            break
+        checks.append(precheck)
+
+    remaining = tuple(filters[len(checks) :])
+    if not checks:
+        return None, remaining
+
+    compiled = tuple(checks)
+
+    def _decide(level: str) -> bool:
+        for check in compiled:
+            try:
+                if not check(level):
+                    return False
+            except Exception:
+                continue
+        return True
+
+    return _decide, remaining
+
+
+async def record_filter_metrics(
     metrics: MetricsCollector, filter_plugin: BaseFilter, name: str
 ) -> None:
+    """Publish a filter's sample-rate, observed-EPS and tracked-key gauges.
+
+    Reads the optional ``current_sample_rate``, ``current_eps`` and
+    ``tracked_key_count`` attributes (values or callables); missing or
+    failing ones are skipped.
+    """
     try:
         rate_val = getattr(filter_plugin, "current_sample_rate", None)
         rate = rate_val() if callable(rate_val) else rate_val
@@ -79,6 +128,13 @@ async def _record_filter_metrics(
             await metrics.record_sample_rate(name, float(rate))
     except Exception:
         pass
+    try:
+        eps_val = getattr(filter_plugin, "current_eps", None)
+        eps = eps_val() if callable(eps_val) else eps_val
+        if eps is not None:
+            await metrics.record_filter_observed_eps(name, float(eps))
+    except Exception:
+        pass
     try:
         tracked_keys_val = getattr(filter_plugin, "tracked_key_count", None)
         tracked = tracked_keys_val() if callable(tracked_keys_val) else tracked_keys_val
@@ -111,6 +167,8 @@ _ = random.random
 __all__ = [
     "BaseFilter",
     "filter_in_order",
+    "compile_caller_prefilter",
+    "record_filter_metrics",
     "LevelFilter",
     "SamplingFilter",
     "RateLimitFilter",
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
+import math
 import random
 import time
-from collections import deque
 from typing import Any
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
@@ -19,6 +19,7 @@ class AdaptiveSamplingConfig(BaseModel):
     min_sample_rate: float = Field(default=0.01, ge=0.0, le=1.0)
     max_sample_rate: float = Field(default=1.0, ge=0.0, le=1.0)
     window_seconds: float = Field(default=10.0, gt=0.0)
+    bucket_seconds: float = Field(default=0.1, gt=0.0)
     always_pass_levels: list[str] = Field(
         default_factory=lambda: ["ERROR", "CRITICAL", "FATAL"]
     )
@@ -28,11 +29,21 @@ class AdaptiveSamplingConfig(BaseModel):
     def _validate_ranges(self) -> AdaptiveSamplingConfig:
         if self.max_sample_rate < self.min_sample_rate:
             raise ValueError("max_sample_rate must be >= min_sample_rate")
+        if self.bucket_seconds > self.window_seconds:
+            raise ValueError("bucket_seconds must be <= window_seconds")
         return self
 
 
 class AdaptiveSamplingFilter:
-    """Dynamically adjusts sampling based on recent throughput."""
+    """Dynamically adjusts sampling based on recent throughput.
+
+    Throughput is tracked in a fixed ring of per-interval counters
+    (``bucket_seconds`` wide, covering ``window_seconds``), so memory is
+    constant regardless of event rate and recording an event is O(1).
+    The sample rate is only recomputed when the clock crosses into a new
+    bucket (and at most once per second), so events arriving together in
+    a worker batch share the same sampling decision inputs.
+    """
 
     name = "adaptive_sampling"
 
@@ -46,15 +57,21 @@ class AdaptiveSamplingFilter:
         self._window = cfg.window_seconds
         self._always_pass = {level.upper() for level in cfg.always_pass_levels}
         self._smoothing = cfg.smoothing_factor
+        self._bucket_seconds = cfg.bucket_seconds
+        self._bucket_count = max(1, math.ceil(self._window / self._bucket_seconds))
 
         self._current_rate = 1.0
-        self._timestamps: deque[float] = deque()
-        self._last_adjustment = time.monotonic()
+        self._current_eps = 0.0
+        self._buckets: list[int] = [0] * self._bucket_count
+        self._window_total = 0
+        self._reset_ticks(time.monotonic())
 
     async def start(self) -> None:
-        self._timestamps.clear()
+        self._buckets = [0] * self._bucket_count
+        self._window_total = 0
         self._current_rate = 1.0
-        self._last_adjustment = time.monotonic()
+        self._current_eps = 0.0
+        self._reset_ticks(time.monotonic())
 
     async def stop(self) -> None:
         return None
@@ -70,28 +87,57 @@ class AdaptiveSamplingFilter:
             return None
 
         self._record_event()
-        self._maybe_adjust_rate()
         return event
 
-    def _record_event(self) -> None:
-        now = time.monotonic()
-        self._timestamps.append(now)
-        cutoff = now - self._window
-        while self._timestamps and self._timestamps[0] < cutoff:
-            self._timestamps.popleft()
+    def _reset_ticks(self, now: float) -> None:
+        tick = int(now / self._bucket_seconds)
+        self._tick = tick
+        self._first_tick = tick
+        self._last_adjustment = now
 
-    def _maybe_adjust_rate(self) -> None:
+    def _record_event(self) -> None:
         now = time.monotonic()
+        tick = int(now / self._bucket_seconds)
+        if tick != self._tick:
+            self._advance(tick)
+            self._maybe_adjust_rate(now)
+        self._buckets[tick % self._bucket_count] += 1
+        self._window_total += 1
+
+    def _advance(self, tick: int) -> None:
+        """Rotate the ring forward to ``tick``, expiring buckets that left the window."""
+        steps = tick - self._tick
+        if steps <= 0:
+            return
+        if steps >= self._bucket_count:
+            self._buckets = [0] * self._bucket_count
+            self._window_total = 0
+        else:
+            buckets = self._buckets
+            count = self._bucket_count
+            for offset in range(1, steps + 1):
+                idx = (self._tick + offset) % count
+                self._window_total -= buckets[idx]
+                buckets[idx] = 0
+        self._tick = tick
+
+    def _observed_eps(self) -> float:
+        # Only count the part of the window we have actually observed so a
+        # freshly started filter does not under-report its rate.
+        covered = min(self._bucket_count, self._tick - self._first_tick + 1)
+        return self._window_total / (covered * self._bucket_seconds)
+
+    def _maybe_adjust_rate(self, now: float | None = None) -> None:
+        if now is None:
+            now = time.monotonic()
         if now - self._last_adjustment < 1.0:
             return
 
         self._last_adjustment = now
+        self._advance(int(now / self._bucket_seconds))
 
-        if not self._timestamps:
-            current_eps = 0.0
-        else:
-            elapsed = max(now - self._timestamps[0], 0.001)
-            current_eps = len(self._timestamps) / elapsed
+        current_eps = self._observed_eps()
+        self._current_eps = current_eps
 
         if current_eps <= 0:
             ideal_rate = self._max_rate
@@ -107,6 +153,11 @@ class AdaptiveSamplingFilter:
     def current_sample_rate(self) -> float:
         return self._current_rate
 
+    @property
+    def current_eps(self) -> float:
+        """Observed events/second as of the last rate adjustment."""
+        return self._current_eps
+
     async def health_check(self) -> bool:
         return True
 
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+import math
 import random
 import time
 from collections import OrderedDict
-from typing import Any
+from typing import Any, Literal
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -19,10 +20,110 @@ class FirstOccurrenceConfig(BaseModel):
     window_seconds: float = Field(default=60.0, ge=0.0)
     max_keys: int = Field(default=10000, ge=1)
     subsequent_sample_rate: float = Field(default=0.0, ge=0.0, le=1.0)
+    # "exact" keeps an ordered map of keys; "bloom" uses fixed memory sized
+    # from max_keys and false_positive_rate.
+    backend: Literal["exact", "bloom"] = "exact"
+    false_positive_rate: float = Field(default=0.01, gt=0.0, lt=1.0)
+
+
+class _RotatingBloom:
+    """Pair of Bloom filters rotated every window for approximate dedupe.
+
+    Keys are inserted into the current generation and looked up in both. A
+    generation is retired after ``window`` seconds or once it has absorbed
+    ``capacity`` keys, whichever is first, so each generation stays within
+    its sized false-positive rate. A key is therefore remembered for at
+    least one window (unless capacity forces early rotation) and at most
+    two. Memory is fixed at two bit arrays of
+    ``ceil(-capacity * ln(p) / ln(2)^2)`` bits each.
+    """
+
+    __slots__ = (
+        "_bits",
+        "_hashes",
+        "_capacity",
+        "_window",
+        "_current",
+        "_previous",
+        "_count",
+        "_started",
+    )
+
+    def __init__(
+        self, capacity: int, false_positive_rate: float, window: float, now: float
+    ) -> None:
+        ln2 = math.log(2)
+        bits = math.ceil(-capacity * math.log(false_positive_rate) / (ln2 * ln2))
+        self._bits = max(8, bits)
+        self._hashes = max(1, round(self._bits / capacity * ln2))
+        self._capacity = capacity
+        self._window = window
+        self._current = bytearray((self._bits + 7) // 8)
+        self._previous = bytearray(len(self._current))
+        self._count = 0
+        self._started = now
+
+    @property
+    def memory_bytes(self) -> int:
+        return len(self._current) + len(self._previous)
+
+    def reset(self, now: float) -> None:
+        self._current = bytearray(len(self._current))
+        self._previous = bytearray(len(self._current))
+        self._count = 0
+        self._started = now
+
+    def _rotate(self, now: float) -> None:
+        self._previous = self._current
+        self._current = bytearray(len(self._previous))
+        self._count = 0
+        self._started = now
+
+    def check_and_add(self, key_hash: int, now: float) -> bool:
+        """Return True if the key was (probably) seen; record it otherwise."""
+        elapsed = now - self._started
+        if elapsed >= 2 * self._window and elapsed > 0:
+            # Idle for two windows: both generations have expired
+            self.reset(now)
+        elif elapsed >= self._window or self._count >= self._capacity:
+            self._rotate(now)
+
+        # Kirsch-Mitzenmacher double hashing from one 64-bit key hash
+        h1 = key_hash & 0xFFFFFFFF
+        h2 = ((key_hash >> 32) & 0xFFFFFFFF) | 1
+        bits = self._bits
+        current = self._current
+        previous = self._previous
+        in_current = True
+        in_previous = True
+        positions = []
+        for i in range(self._hashes):
+            pos = (h1 + i * h2) % bits
+            positions.append(pos)
+            mask = 1 << (pos & 7)
+            byte = pos >> 3
+            if not current[byte] & mask:
+                in_current = False
+            if not previous[byte] & mask:
+                in_previous = False
+        if in_current or in_previous:
+            return True
+        for pos in positions:
+            current[pos >> 3] |= 1 << (pos & 7)
+        self._count += 1
+        return False
 
 
 class FirstOccurrenceFilter:
-    """First occurrence of a unique key always passes."""
+    """First occurrence of a unique key always passes.
+
+    With ``backend="bloom"`` keys are hashed straight from the key field
+    values (no joined string) into a rotating pair of Bloom filters. Memory
+    is fixed by ``max_keys`` and ``false_positive_rate``; a false positive
+    treats a genuinely new key as a repeat, so it is dropped or sampled at
+    ``subsequent_sample_rate``. Field values compare by value rather than by
+    their string form.
+    """
 
     name = "first_occurrence"
 
@@ -35,24 +136,35 @@ class FirstOccurrenceFilter:
         self._max_keys = cfg.max_keys
         self._subsequent_rate = cfg.subsequent_sample_rate
         self._seen: OrderedDict[str, float] = OrderedDict()
+        self._bloom: _RotatingBloom | None = None
+        if cfg.backend == "bloom":
+            self._bloom = _RotatingBloom(
+                cfg.max_keys, cfg.false_positive_rate, self._window, time.monotonic()
+            )
 
     async def start(self) -> None:
         self._seen.clear()
+        if self._bloom is not None:
+            self._bloom.reset(time.monotonic())
 
     async def stop(self) -> None:
         return None
 
     async def filter(self, event: dict) -> dict | None:
-        key = self._make_key(event)
         now = time.monotonic()
-        self._prune_expired(now)
-
-        if key not in self._seen:
-            self._seen[key] = now
-            self._seen.move_to_end(key)
-            while len(self._seen) > self._max_keys:
-                self._seen.popitem(last=False)
-            return event
+        if self._bloom is not None:
+            if not self._bloom.check_and_add(self._hash_key(event), now):
+                return event
+        else:
+            key = self._make_key(event)
+            self._prune_expired(now)
+
+            if key not in self._seen:
+                self._seen[key] = now
+                self._seen.move_to_end(key)
+                while len(self._seen) > self._max_keys:
+                    self._seen.popitem(last=False)
+                return event
 
         if self._subsequent_rate <= 0.0:
             return None
@@ -61,6 +173,19 @@ class FirstOccurrenceFilter:
             return event
         return None
 
+    def _hash_key(self, event: dict) -> int:
+        values = tuple(event.get(field, "") for field in self._key_fields)
+        try:
+            return hash(values)
+        except TypeError:
+            # Unhashable values (dicts, lists) fall back to their string form
+            return hash(tuple(str(v) for v in values))
+
+    @property
+    def memory_bytes(self) -> int | None:
+        """Fixed sketch size for the bloom backend; None for the exact map."""
+        return self._bloom.memory_bytes if self._bloom is not None else None
+
     def _make_key(self, event: dict) -> str:
         parts = [str(event.get(field, "")) for field in (self._key_fields or [])]
         return "|".join(parts)
@@ -31,6 +31,8 @@ class LevelFilter:
     """Filter events by log level threshold."""
 
     name = "level"
+    # Decision depends only on the level, so it can run on the caller thread
+    caller_safe = True
 
     def __init__(
         self, *, config: LevelFilterConfig | dict | None = None, **kwargs: Any
@@ -46,12 +48,15 @@ class LevelFilter:
         return None
 
     async def filter(self, event: dict) -> dict | None:
-        level = str(event.get("level", "INFO")).upper()
-        priority = get_level_priority(level)
-        if self._drop_below and priority < self._min_priority:
+        if not self.precheck(str(event.get("level", "INFO"))):
             return None
         return event
 
+    def precheck(self, level: str) -> bool:
+        return not (
+            self._drop_below and get_level_priority(level.upper()) < self._min_priority
+        )
+
     async def health_check(self) -> bool:
         return True
 
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import time
-from collections import OrderedDict
 from typing import Any
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator
@@ -18,6 +17,12 @@ class RateLimitFilterConfig(BaseModel):
     key_field: str | None = None  # event key used to partition buckets
     max_keys: int = Field(default=10000, ge=1)  # Max buckets to track
     overflow_action: str = Field(default="drop")  # "drop" or "mark"
+    shards: int = Field(default=16, ge=1)  # Upper bound on bucket table shards
+    # Admit keys into a full table only once a count-min sketch sees them as
+    # heavy hitters; lighter keys pass without evicting tracked buckets.
+    heavy_hitter_sketch: bool = False
+    sketch_width: int = Field(default=4096, ge=16)
+    sketch_depth: int = Field(default=4, ge=1, le=16)
 
     @field_validator("overflow_action")
     @classmethod
@@ -28,8 +33,100 @@ class RateLimitFilterConfig(BaseModel):
         return normalized
 
 
+# Smallest shard worth splitting off; small tables stay in a single shard so
+# CLOCK eviction behaves like plain LRU for low max_keys.
+_MIN_SHARD_SLOTS = 256
+
+
+class _BucketShard:
+    """Fixed-size token bucket table evicted with the CLOCK algorithm.
+
+    Buckets live in parallel arrays indexed by slot; ``index`` maps keys to
+    slots. A hit sets the slot's reference bit, and eviction sweeps the hand
+    clearing bits until it finds an unreferenced slot, which approximates LRU
+    without reordering anything on the hot path.
+    """
+
+    __slots__ = ("index", "keys", "tokens", "stamps", "ref", "hand")
+
+    def __init__(self, size: int) -> None:
+        self.index: dict[str, int] = {}
+        self.keys: list[str | None] = [None] * size
+        self.tokens: list[float] = [0.0] * size
+        self.stamps: list[float] = [0.0] * size
+        self.ref = bytearray(size)
+        self.hand = 0
+
+    def is_full(self) -> bool:
+        return len(self.index) >= len(self.keys)
+
+    def insert(self, key: str, tokens: float, stamp: float) -> tuple[int, bool]:
+        """Place ``key`` in a slot; returns (slot, evicted_existing)."""
+        size = len(self.keys)
+        evicted = False
+        if len(self.index) < size:
+            # Slots are only vacated by eviction, so they fill in order
+            slot = len(self.index)
+        else:
+            ref = self.ref
+            hand = self.hand
+            while ref[hand]:
+                ref[hand] = 0
+                hand = (hand + 1) % size
+            slot = hand
+            self.hand = (hand + 1) % size
+            old = self.keys[slot]
+            if old is not None:
+                del self.index[old]
+                evicted = True
+        self.index[key] = slot
+        self.keys[slot] = key
+        self.tokens[slot] = tokens
+        self.stamps[slot] = stamp
+        self.ref[slot] = 0
+        return slot, evicted
+
+
+class _CountMinSketch:
+    """Count-min sketch with halving decay for heavy-hitter admission.
+
+    Estimates never undercount, so a key whose estimate is below the bucket
+    capacity cannot have exhausted a full bucket since the last decay.
+    """
+
+    __slots__ = ("_width", "_rows")
+
+    def __init__(self, width: int, depth: int) -> None:
+        self._width = width
+        self._rows = [[0] * width for _ in range(depth)]
+
+    def add(self, key: str) -> int:
+        """Count one occurrence of ``key`` and return its new estimate."""
+        width = self._width
+        estimate = -1
+        for seed, row in enumerate(self._rows):
+            idx = hash((seed, key)) % width
+            value = row[idx] + 1
+            row[idx] = value
+            if estimate < 0 or value < estimate:
+                estimate = value
+        return estimate
+
+    def decay(self) -> None:
+        for row in self._rows:
+            row[:] = [count >> 1 for count in row]
+
+
 class RateLimitFilter:
-    """Token-bucket rate limiter."""
+    """Token-bucket rate limiter.
+
+    Buckets are kept in a hash-sharded, fixed-size table with CLOCK eviction
+    so high key cardinality never reorders a shared structure per event.
+    The worker calls ``begin_batch()`` once per flush to sample the clock and
+    run housekeeping (capacity warnings, sketch decay); events in the batch
+    then reuse that timestamp until ``end_batch()``. Outside a batch the
+    clock is read per event.
+    """
 
     name = "rate_limit"
 
@@ -42,30 +139,89 @@ class RateLimitFilter:
         self._key_field = cfg.key_field
         self._max_keys = cfg.max_keys
         self._overflow_action = cfg.overflow_action
-        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+        self._shard_count = max(1, min(cfg.shards, cfg.max_keys // _MIN_SHARD_SLOTS))
+        self._use_sketch = cfg.heavy_hitter_sketch
+        self._sketch_width = cfg.sketch_width
+        self._sketch_depth = cfg.sketch_depth
+        # Sketch counts are halved once per full-bucket refill period
+        self._sketch_decay_seconds = (
+            self._capacity / self._refill_rate if self._refill_rate > 0 else None
+        )
         self._warned_capacity = False
+        self._reset()
+
+    def _reset(self) -> None:
+        count = self._shard_count
+        base, extra = divmod(self._max_keys, count)
+        self._shards = [
+            _BucketShard(base + (1 if i < extra else 0)) for i in range(count)
+        ]
+        self._tracked = 0
+        self._sketch = (
+            _CountMinSketch(self._sketch_width, self._sketch_depth)
+            if self._use_sketch
+            else None
+        )
+        self._batch_now: float | None = None
+        self._last_decay = time.monotonic()
 
     async def start(self) -> None:
-        return None
+        self._reset()
 
     async def stop(self) -> None:
         return None
 
+    def begin_batch(self) -> None:
+        """Sample the clock once for the upcoming batch and do housekeeping."""
+        now = time.monotonic()
+        self._batch_now = now
+        if (
+            self._sketch is not None
+            and self._sketch_decay_seconds is not None
+            and now - self._last_decay >= self._sketch_decay_seconds
+        ):
+            self._sketch.decay()
+            self._last_decay = now
+        self._check_capacity_warn()
+
+    def end_batch(self) -> None:
+        """Drop the batch timestamp so later events read the clock again."""
+        self._batch_now = None
+
     async def filter(self, event: dict) -> dict | None:
         key = self._resolve_key(event)
-        now = time.monotonic()
-        if key not in self._buckets and len(self._buckets) >= self._max_keys:
-            self._evict_oldest()
-        tokens, last = self._buckets.get(key, (self._capacity, now))
-        # Refill
-        elapsed = max(0.0, now - last)
-        tokens = min(self._capacity, tokens + elapsed * self._refill_rate)
+        now = self._batch_now
+        if now is None:
+            now = time.monotonic()
+        count = self._shard_count
+        shard = self._shards[hash(key) % count] if count > 1 else self._shards[0]
+        capacity = self._capacity
+
+        slot = shard.index.get(key)
+        if slot is None:
+            tokens = float(capacity)
+            if self._sketch is not None and shard.is_full():
+                estimate = self._sketch.add(key)
+                if estimate < capacity:
+                    # Light key: it cannot have drained a full bucket yet
+                    return event
+                # Heavy hitter: track it exactly, crediting what it has used
+                tokens = max(0.0, capacity - (estimate - 1.0))
+            slot, evicted = shard.insert(key, tokens, now)
+            if not evicted:
+                self._tracked += 1
+        else:
+            shard.ref[slot] = 1
+            tokens = shard.tokens[slot]
+            elapsed = now - shard.stamps[slot]
+            if elapsed > 0.0:
+                tokens = min(capacity, tokens + elapsed * self._refill_rate)
+
         allowed = tokens >= 1.0
         if allowed:
             tokens -= 1.0
-        self._buckets[key] = (tokens, now)
-        self._buckets.move_to_end(key)
-        self._check_capacity_warn()
+        shard.tokens[slot] = tokens
+        shard.stamps[slot] = now
         if not allowed:
             if self._overflow_action == "mark":
                 cloned = dict(event)
@@ -79,14 +235,8 @@ class RateLimitFilter:
             return "global"
         return str(event.get(self._key_field, "global"))
 
-    def _evict_oldest(self) -> None:
-        try:
-            self._buckets.popitem(last=False)
-        except Exception:
-            return
-
     def _check_capacity_warn(self) -> None:
-        size = len(self._buckets)
+        size = self._tracked
         threshold = int(self._max_keys * 0.9)
         if size >= threshold:
             if not self._warned_capacity:
@@ -106,10 +256,10 @@ class RateLimitFilter:
 
     @property
     def tracked_key_count(self) -> int:
-        return len(self._buckets)
+        return self._tracked
 
     async def health_check(self) -> bool:
-        if len(self._buckets) > self._max_keys * 0.9:
+        if self._tracked > self._max_keys * 0.9:
             self._check_capacity_warn()
             return False
         return True
@@ -19,6 +19,8 @@ class SamplingFilter:
     """Probabilistic sampling filter."""
 
     name = "sampling"
+    # random.Random is safe to share across threads; decision ignores the event
+    caller_safe = True
 
     def __init__(
         self, *, config: SamplingFilterConfig | dict | None = None, **kwargs: Any
@@ -34,11 +36,14 @@ class SamplingFilter:
         return None
 
     async def filter(self, event: dict) -> dict | None:
+        return event if self.precheck(str(event.get("level", "INFO"))) else None
+
+    def precheck(self, level: str) -> bool:
         if self._rate >= 1.0:
-            return event
+            return True
         if self._rate <= 0.0:
-            return None
-        return event if self._rng.random() < self._rate else None
+            return False
+        return self._rng.random() < self._rate
 
     @property
     def current_sample_rate(self) -> float:
@@ -6,8 +6,12 @@ from typing import Any
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from ...core.schema import LogEnvelopeV1
 from ..utils import parse_plugin_config
 
+# Top-level keys of envelopes produced by build_envelope()
+_ENVELOPE_FIELDS = frozenset(LogEnvelopeV1.__annotations__)
+
 
 class TraceSamplingConfig(BaseModel):
     """Configuration for trace-aware sampling."""
@@ -38,6 +42,18 @@ class TraceSamplingFilter:
     async def stop(self) -> None:
         return None
 
+    @property
+    def caller_safe(self) -> bool:
+        # Envelopes only carry trace IDs under ``context``, so unless the trace
+        # field names a top-level envelope key the worker-side decision never
+        # sees one and reduces to level + random, which is safe to hoist.
+        return self._trace_field not in _ENVELOPE_FIELDS
+
+    def precheck(self, level: str) -> bool:
+        if level.upper() in self._always_pass:
+            return True
+        return random.random() <= self._rate
+
     async def filter(self, event: dict) -> dict | None:
         level = str(event.get("level", "INFO")).upper()
         if level in self._always_pass:
@@ -10,6 +10,7 @@ from .http_client import HttpSink
 from .mmap_persistence import MemoryMappedPersistence, PersistenceStats
 from .rotating_file import RotatingFileSink
 from .routing import RoutingSink
+from .spill_queue import DiskSpillQueue, SpillQueueConfig, SpillStats
 from .stdout_json import StdoutJsonSink
 from .stdout_pretty import StdoutPrettySink
 from .webhook import WebhookSink
@@ -90,6 +91,9 @@ __all__ = [
     "BaseSink",
     "MemoryMappedPersistence",
     "PersistenceStats",
+    "DiskSpillQueue",
+    "SpillQueueConfig",
+    "SpillStats",
     "CloudWatchSink",
     "LokiSink",
     "PostgresSink",
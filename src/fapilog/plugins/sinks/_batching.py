@@ -2,76 +2,269 @@ from __future__ import annotations
 
 import asyncio
 import time
+from collections.abc import Awaitable, Callable
 from typing import Any
 
+import orjson
+
+from ...core.adaptive import AimdWindow, ConcurrencyLimiter
+from ...core.circuit_breaker import CircuitState, SinkCircuitBreaker
+
+
+class SizedBatch(list[dict[str, Any]]):
+    """Batch of entries carrying the serialized bytes accumulated into it.
+
+    ``nbytes`` sums the sizes given to ``_enqueue_for_batch``; it is 0 when
+    the sink neither reports sizes nor sets a byte budget. Slices are plain
+    lists.
+    """
+
+    nbytes: int = 0
+
+
+def _entry_nbytes(entry: dict[str, Any]) -> int:
+    try:
+        return len(orjson.dumps(entry, default=str))
+    except TypeError:
+        return 0
+
 
 class BatchingMixin:
-    """Mixin providing batch accumulation with size/timeout triggers."""
+    """Mixin providing batch accumulation with size/timeout triggers.
 
-    _batch: list[dict[str, Any]]
+    With ``max_batch_bytes`` set, a batch is also flushed before it would
+    exceed that many serialized bytes; an entry larger than the budget is
+    sent on its own.
+
+    By default a full batch is sent inline by the writer that filled it. With
+    ``pipeline_depth`` set, flushed batches are handed to background tasks
+    (at most ``pipeline_depth`` at once) while the next batch accumulates, so
+    writers only wait when every slot is taken.
+    """
+
+    _batch: SizedBatch
     _batch_lock: asyncio.Lock
     _batch_first_time: float | None
+    _batch_pending: asyncio.Event
+    _batch_stopping: asyncio.Event
     _flush_task: asyncio.Task[None] | None
     _batch_size: int
     _batch_timeout_seconds: float
+    _max_batch_bytes: int | None
+    _limiter: ConcurrencyLimiter | None
+    _pipeline_slots: asyncio.Semaphore | None
+    _pipeline_tasks: set[asyncio.Task[None]]
 
-    def _init_batching(self, batch_size: int, batch_timeout_seconds: float) -> None:
-        self._batch = []
+    def _init_batching(
+        self,
+        batch_size: int,
+        batch_timeout_seconds: float,
+        *,
+        concurrency: AimdWindow | None = None,
+        pipeline_depth: int = 0,
+        max_batch_bytes: int | None = None,
+    ) -> None:
+        self._batch = SizedBatch()
         self._batch_lock = asyncio.Lock()
         self._batch_first_time: float | None = None
+        self._batch_pending = asyncio.Event()
+        self._batch_stopping = asyncio.Event()
         self._flush_task = None
         self._batch_size = max(1, int(batch_size))
         self._batch_timeout_seconds = float(batch_timeout_seconds)
+        self._max_batch_bytes = max_batch_bytes
+        self._limiter = (
+            ConcurrencyLimiter(concurrency) if concurrency is not None else None
+        )
+        self._pipeline_slots = (
+            asyncio.Semaphore(pipeline_depth) if pipeline_depth > 0 else None
+        )
+        self._pipeline_tasks = set()
+
+    @property
+    def concurrency_window(self) -> AimdWindow | None:
+        """In-flight batch window, or None when sends are not limited."""
+        return self._limiter.window if self._limiter is not None else None
+
+    async def _report_window(self, size: int) -> None:
+        metrics = getattr(self, "_metrics", None)
+        if metrics is None:
+            return
+        try:
+            await metrics.set_sink_concurrency_window(
+                getattr(self, "name", type(self).__name__), size
+            )
+        except Exception:
+            pass
+
+    async def _dispatch_batch(self, batch: list[dict[str, Any]]) -> None:
+        """Send a batch within the in-flight window.
+
+        An exception or a False return from ``_send_batch`` counts as
+        congestion and shrinks the window; latency above the window's target
+        does too.
+        """
+        limiter = self._limiter
+        if limiter is None:
+            await self._send_batch(batch)
+            return
+        await limiter.acquire()
+        started = time.perf_counter()
+        congested = True
+        try:
+            congested = await self._send_batch(batch) is False
+        finally:
+            latency_ms = (time.perf_counter() - started) * 1000.0
+            if limiter.release(latency_ms, congested=congested):
+                await self._report_window(limiter.window.size)
+
+    async def _send_admitted(
+        self,
+        breaker: SinkCircuitBreaker | None,
+        batch: list[dict[str, Any]],
+        send: Callable[[list[dict[str, Any]]], Awaitable[None]],
+    ) -> int:
+        """Send as much of ``batch`` as ``breaker`` admits; return events skipped.
+
+        A half-open breaker admits a small probe first. The rest of the batch
+        is sent only if the probe closes the circuit.
+        """
+        if breaker is None:
+            await send(batch)
+            return 0
+        allowed = breaker.admit(len(batch))
+        if allowed < len(batch):
+            if not allowed:
+                return len(batch)
+            await send(batch[:allowed])
+            if breaker.state is not CircuitState.CLOSED:
+                return len(batch) - allowed
+            batch = batch[allowed:]
+        await send(batch)
+        return 0
+
+    async def _submit_batch(self, batch: list[dict[str, Any]]) -> None:
+        """Send ``batch`` inline, or in the background when pipelined."""
+        slots = self._pipeline_slots
+        if slots is None:
+            await self._dispatch_batch(batch)
+            return
+        await slots.acquire()
+        task = asyncio.create_task(self._dispatch_pipelined(batch, slots))
+        self._pipeline_tasks.add(task)
+        task.add_done_callback(self._pipeline_tasks.discard)
+
+    async def _dispatch_pipelined(
+        self, batch: list[dict[str, Any]], slots: asyncio.Semaphore
+    ) -> None:
+        try:
+            await self._dispatch_batch(batch)
+        except Exception:
+            # No caller to report to; sinks record their own failures
+            pass
+        finally:
+            slots.release()
+
+    async def _wait_in_flight(self) -> None:
+        """Wait for every pipelined batch handed off so far."""
+        while self._pipeline_tasks:
+            await asyncio.gather(*self._pipeline_tasks, return_exceptions=True)
 
     async def _start_batching(self) -> None:
+        self._batch_stopping.clear()
         if self._batch_size > 1:
             self._flush_task = asyncio.create_task(self._flush_loop())
 
     async def _stop_batching(self) -> None:
         if self._flush_task:
-            self._flush_task.cancel()
+            # Stop cooperatively: cancelling the loop while it waits for a
+            # send slot would drop the batch it has already taken
+            self._batch_stopping.set()
+            self._batch_pending.set()
             try:
                 await self._flush_task
             except asyncio.CancelledError:
                 pass
             self._flush_task = None
         await self._flush_batch()
+        await self._wait_in_flight()
+
+    async def _enqueue_for_batch(
+        self, entry: dict[str, Any], nbytes: int | None = None
+    ) -> None:
+        """Add ``entry`` to the current batch, flushing on count or bytes.
 
-    async def _enqueue_for_batch(self, entry: dict[str, Any]) -> None:
+        ``nbytes`` is the entry's serialized size when the sink already knows
+        it; with a byte budget and no size given, it is measured here once.
+        """
+        budget = self._max_batch_bytes
+        if nbytes is None:
+            nbytes = _entry_nbytes(entry) if budget is not None else 0
         if self._batch_size <= 1:
-            await self._send_batch([entry])
+            single = SizedBatch((entry,))
+            single.nbytes = nbytes
+            await self._submit_batch(single)
             return
 
-        flush_now = False
+        ready: list[SizedBatch] = []
         async with self._batch_lock:
+            if (
+                budget is not None
+                and self._batch
+                and self._batch.nbytes + nbytes > budget
+            ):
+                ready.append(self._take_batch())
             if not self._batch:
                 self._batch_first_time = time.monotonic()
+                self._batch_pending.set()
             self._batch.append(entry)
-            if len(self._batch) >= self._batch_size:
-                flush_now = True
+            self._batch.nbytes += nbytes
+            if len(self._batch) >= self._batch_size or (
+                budget is not None and self._batch.nbytes >= budget
+            ):
+                ready.append(self._take_batch())
 
-        if flush_now:
-            await self._flush_batch()
+        for batch in ready:
+            await self._submit_batch(batch)
+
+    def _take_batch(self) -> SizedBatch:
+        """Swap out the accumulating batch; call with ``_batch_lock`` held."""
+        batch, self._batch = self._batch, SizedBatch()
+        self._batch_first_time = None
+        self._batch_pending.clear()
+        return batch
 
     async def _flush_loop(self) -> None:
+        """Flush a partial batch ``batch_timeout_seconds`` after its first entry."""
+        stopping = self._batch_stopping
         try:
             while True:
-                await asyncio.sleep(self._batch_timeout_seconds / 2)
-                batch: list[dict[str, Any]] | None = None
+                await self._batch_pending.wait()
+                if stopping.is_set():
+                    # _stop_batching flushes whatever is still accumulating
+                    return
                 async with self._batch_lock:
-                    if not self._batch or self._batch_first_time is None:
+                    first = self._batch_first_time
+                    if first is None:
+                        self._batch_pending.clear()
                         continue
-                    elapsed = time.monotonic() - self._batch_first_time
-                    if elapsed >= self._batch_timeout_seconds:
-                        batch = self._batch[:]
-                        self._batch = []
-                        self._batch_first_time = None
-                if batch:
+                delay = first + self._batch_timeout_seconds - time.monotonic()
+                if delay > 0:
+                    # The batch may be flushed by size meanwhile; re-check
                     try:
-                        await self._send_batch(batch)
-                    except Exception:
-                        # Contain errors to keep flush loop alive
+                        await asyncio.wait_for(stopping.wait(), timeout=delay)
+                    except asyncio.TimeoutError:
                         pass
+                    continue
+                async with self._batch_lock:
+                    if self._batch_first_time != first:
+                        continue
+                    batch = self._take_batch()
+                try:
+                    await self._submit_batch(batch)
+                except Exception:
+                    # Contain errors to keep flush loop alive
+                    pass
         except asyncio.CancelledError:
             return
 
@@ -79,12 +272,10 @@ class BatchingMixin:
         async with self._batch_lock:
             if not self._batch:
                 return
-            batch = self._batch[:]
-            self._batch = []
-            self._batch_first_time = None
-        await self._send_batch(batch)
+            batch = self._take_batch()
+        await self._submit_batch(batch)
 
     async def _send_batch(
         self, batch: list[dict[str, Any]]
-    ) -> None:  # pragma: no cover - abstract
+    ) -> bool | None:  # pragma: no cover - abstract
         raise NotImplementedError
@@ -0,0 +1,90 @@
+"""Configuration and wiring shared by the HTTP-based sinks.
+
+``HttpSink`` and ``WebhookSink`` post batches to an endpoint through a shared
+``HttpClientPool`` with the same batching, pipelining and adaptive in-flight
+window options. Keeping those pieces here stops the two sinks drifting apart.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Mapping
+
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+from ...core.adaptive import AimdWindow
+from ...core.resources import HttpClientPool
+from ...core.retry import RetryCallable, RetryConfig
+
+
+class HttpTransportConfig(BaseModel):
+    """Endpoint, batching and connection settings common to HTTP sinks."""
+
+    model_config = ConfigDict(frozen=True, extra="forbid", validate_default=True, arbitrary_types_allowed=True)  # fmt: skip
+
+    endpoint: str
+    headers: dict[str, str] = Field(default_factory=dict)
+    retry: RetryCallable | RetryConfig | None = None
+    timeout_seconds: float = Field(default=5.0, gt=0.0)
+    batch_size: int = Field(default=1, ge=1)
+    batch_timeout_seconds: float = Field(default=5.0, ge=0.0)
+    max_in_flight_batches: int = Field(default=4, ge=1)
+    pipelined: bool = False
+    max_batch_bytes: int | None = Field(default=None, ge=1)
+    adaptive_concurrency: bool = False
+    latency_target_ms: float = Field(default=500.0, gt=0.0)
+    http2: bool = False
+    max_connections: int | None = Field(default=None, ge=1)
+    keepalive_expiry_seconds: float = Field(default=5.0, ge=0.0)
+    prewarm_connections: int = Field(default=0, ge=0)
+
+    @field_validator("headers", mode="before")
+    @classmethod
+    def _coerce_headers(cls, value: Mapping[str, str] | None) -> dict[str, str]:
+        if value is None:
+            return {}
+        return dict(value)
+
+
+def build_client_pool(cfg: HttpTransportConfig, *, name: str) -> HttpClientPool:
+    """Create the sink's shared client pool, sized to its in-flight batches."""
+    return HttpClientPool(
+        name=name,
+        max_size=cfg.max_in_flight_batches,
+        timeout=cfg.timeout_seconds,
+        acquire_timeout_seconds=2.0,
+        http2=cfg.http2,
+        max_connections=cfg.max_connections,
+        keepalive_expiry=cfg.keepalive_expiry_seconds,
+        warm_url=cfg.endpoint,
+        prewarm_connections=cfg.prewarm_connections,
+    )
+
+
+def batching_options(cfg: HttpTransportConfig) -> dict[str, Any]:
+    """Keyword arguments for ``BatchingMixin._init_batching``.
+
+    Without ``adaptive_concurrency`` the window is pinned at
+    ``max_in_flight_batches``; with it, the window may shrink to one batch.
+    """
+    return {
+        "concurrency": AimdWindow(
+            min_window=1 if cfg.adaptive_concurrency else cfg.max_in_flight_batches,
+            max_window=cfg.max_in_flight_batches,
+            target_latency_ms=cfg.latency_target_ms,
+        ),
+        "pipeline_depth": cfg.max_in_flight_batches if cfg.pipelined else 0,
+        "max_batch_bytes": cfg.max_batch_bytes,
+    }
+
+
+def congestion_result(status_code: int) -> bool | None:
+    """``_send_batch`` result for a failed response.
+
+    Rate limiting and server errors signal congestion and shrink the window;
+    other client errors do not.
+    """
+    return False if status_code == 429 or status_code >= 500 else None
+
+
+# Mark Pydantic validators as used for vulture
+_VULTURE_USED: tuple[object, ...] = (HttpTransportConfig._coerce_headers,)
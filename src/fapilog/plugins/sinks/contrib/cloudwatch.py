@@ -25,7 +25,7 @@ from ....core import diagnostics
 from ....core.circuit_breaker import SinkCircuitBreaker, SinkCircuitBreakerConfig
 from ....core.serialization import SerializedView
 from ...utils import parse_plugin_config
-from .._batching import BatchingMixin
+from .._batching import BatchingMixin, SizedBatch
 
 try:  # Optional dependency
     import boto3
@@ -66,6 +66,9 @@ class CloudWatchSinkConfig(BaseModel):
     create_log_stream: bool = True
     batch_size: int = Field(default=100, ge=1)
     batch_timeout_seconds: float = Field(default=5.0, gt=0.0)
+    pipelined: bool = False
+    max_in_flight_batches: int = Field(default=4, ge=1)
+    max_batch_bytes: int = Field(default=MAX_BATCH_BYTES, ge=1, le=MAX_BATCH_BYTES)
     max_retries: int = Field(default=3, ge=0)
     retry_base_delay: float = Field(default=0.5, ge=0.0)
     endpoint_url: str | None = None  # For LocalStack/testing
@@ -97,7 +100,12 @@ class CloudWatchSink(BatchingMixin):
         self._client: Any = None
         self._sequence_token: str | None = None
         self._circuit_breaker: SinkCircuitBreaker | None = None
-        self._init_batching(cfg.batch_size, cfg.batch_timeout_seconds)
+        self._init_batching(
+            cfg.batch_size,
+            cfg.batch_timeout_seconds,
+            pipeline_depth=cfg.max_in_flight_batches if cfg.pipelined else 0,
+            max_batch_bytes=cfg.max_batch_bytes,
+        )
 
     async def start(self) -> None:
         """Initialize boto3 client and ensure log group/stream exist."""
@@ -135,9 +143,9 @@ class CloudWatchSink(BatchingMixin):
 
     async def write(self, entry: dict[str, Any]) -> None:
         """Write a single log entry, formatting and enqueueing for batch."""
-        event = self._format_event(entry)
-        if event is not None:
-            await self._enqueue_for_batch(event)
+        encoded = self._encode_event(entry)
+        if encoded is not None:
+            await self._enqueue_for_batch(*encoded)
 
     async def write_serialized(self, view: SerializedView) -> None:
         """Fast path for pre-serialized payloads."""
@@ -158,25 +166,33 @@ class CloudWatchSink(BatchingMixin):
                 sink_name=self.name,
                 cause=exc,
             ) from exc
-        if len(message.encode("utf-8")) > MAX_EVENT_SIZE_BYTES:
-            self._emit_dropped(message_size=len(message.encode("utf-8")))
+        # Valid UTF-8 round-trips, so the payload size is the message size
+        if view.nbytes > MAX_EVENT_SIZE_BYTES:
+            self._emit_dropped(message_size=view.nbytes)
             return
-        event = {"timestamp": int(time.time() * 1000), "message": message}
-        await self._enqueue_for_batch(event)
+        if view.ts_ns is not None:
+            timestamp_ms = view.ts_ns // 1_000_000
+        else:
+            timestamp_ms = int(time.time() * 1000)
+        event = {"timestamp": timestamp_ms, "message": message}
+        await self._enqueue_for_batch(event, view.nbytes)
 
     async def _send_batch(self, batch: list[dict[str, Any]]) -> None:
         """Send a batch of events to CloudWatch, chunking as needed."""
         if not batch:
             return
-        if self._circuit_breaker and not self._circuit_breaker.should_allow():
+        skipped = await self._send_admitted(
+            self._circuit_breaker, batch, self._put_batch
+        )
+        if skipped:
             diagnostics.warn(
                 "sink",
                 "cloudwatch circuit open, dropping batch",
-                batch_size=len(batch),
+                batch_size=skipped,
                 _rate_limit_key="cloudwatch-open",
             )
-            return
 
+    async def _put_batch(self, batch: list[dict[str, Any]]) -> None:
         log_events: list[dict[str, Any]] = []
         for item in batch:
             if "timestamp" in item and "message" in item:
@@ -191,6 +207,16 @@ class CloudWatchSink(BatchingMixin):
 
         log_events.sort(key=lambda x: x["timestamp"])
 
+        # Batches packed to the byte budget carry their size; only re-measure
+        # events when the batch might not fit in one call
+        nbytes = batch.nbytes if isinstance(batch, SizedBatch) else None
+        if (
+            nbytes is not None
+            and 0 < nbytes <= MAX_BATCH_BYTES
+            and len(log_events) == len(batch) <= MAX_BATCH_SIZE
+        ):
+            await self._put_log_events_with_retry(log_events)
+            return
         for chunk in self._chunk_events(log_events):
             await self._put_log_events_with_retry(chunk)
 
@@ -389,6 +415,11 @@ class CloudWatchSink(BatchingMixin):
             CloudWatch event dict with timestamp and message, or None if
             the entry cannot be serialized or exceeds size limits.
         """
+        encoded = self._encode_event(entry)
+        return encoded[0] if encoded is not None else None
+
+    def _encode_event(self, entry: dict[str, Any]) -> tuple[dict[str, Any], int] | None:
+        """Like :meth:`_format_event`, also returning the message size in bytes."""
         try:
             message = json.dumps(entry, default=str)
         except Exception:
@@ -399,7 +430,7 @@ class CloudWatchSink(BatchingMixin):
             self._emit_dropped(message_size=size_bytes)
             return None
 
-        return {"timestamp": int(time.time() * 1000), "message": message}
+        return {"timestamp": int(time.time() * 1000), "message": message}, size_bytes
 
     def _emit_dropped(self, *, message_size: int) -> None:
         """Emit a diagnostic warning when an event is dropped due to size.
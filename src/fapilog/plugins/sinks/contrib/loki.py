@@ -33,6 +33,9 @@ class LokiSinkConfig(BaseModel):
     label_keys: list[str] = Field(default_factory=lambda: ["level"])
     batch_size: int = Field(default=100, ge=1)
     batch_timeout_seconds: float = Field(default=5.0, gt=0.0)
+    pipelined: bool = False
+    max_in_flight_batches: int = Field(default=4, ge=1)
+    max_batch_bytes: int | None = Field(default=None, ge=1)
     timeout_seconds: float = Field(default=10.0, gt=0.0)
     max_retries: int = Field(default=3, ge=0)
     retry_base_delay: float = Field(default=0.5, ge=0.0)
@@ -60,7 +63,12 @@ class LokiSink(BatchingMixin):
         self._client: httpx.AsyncClient | None = None
         self._circuit_breaker: SinkCircuitBreaker | None = None
         self._push_url = f"{self._config.url.rstrip('/')}/loki/api/v1/push"
-        self._init_batching(cfg.batch_size, cfg.batch_timeout_seconds)
+        self._init_batching(
+            cfg.batch_size,
+            cfg.batch_timeout_seconds,
+            pipeline_depth=cfg.max_in_flight_batches if cfg.pipelined else 0,
+            max_batch_bytes=cfg.max_batch_bytes,
+        )
 
     async def start(self) -> None:
         headers: dict[str, str] = {"Content-Type": "application/json"}
@@ -118,20 +126,28 @@ class LokiSink(BatchingMixin):
                 sink_name=self.name,
                 cause=exc,
             ) from exc
-        await self.write({"_raw": log_line, "level": "INFO"})
+        # Labels and timestamp come from the view's metadata; older views
+        # without it fall back to INFO and arrival time
+        await self._enqueue_for_batch(
+            {"_raw": log_line, "level": view.level or "INFO", "_ts_ns": view.ts_ns},
+            view.nbytes,
+        )
 
     async def _send_batch(self, batch: list[dict[str, Any]]) -> None:
         if not batch or self._client is None:
             return
-        if self._circuit_breaker and not self._circuit_breaker.should_allow():
+        skipped = await self._send_admitted(
+            self._circuit_breaker, batch, self._push_batch
+        )
+        if skipped:
             diagnostics.warn(
                 "sink",
                 "loki circuit open, dropping batch",
-                batch_size=len(batch),
+                batch_size=skipped,
                 _rate_limit_key="loki-open",
             )
-            return
 
+    async def _push_batch(self, batch: list[dict[str, Any]]) -> None:
         streams = self._group_by_labels(batch)
         if not streams:
             return
@@ -157,7 +173,9 @@ class LokiSink(BatchingMixin):
                     log_line = str(entry)
 
             ts = entry.get("timestamp")
-            if isinstance(ts, (int, float)):
+            if entry.get("_ts_ns") is not None:
+                ts_ns = str(entry["_ts_ns"])
+            elif isinstance(ts, (int, float)):
                 ts_ns = str(int(ts * 1_000_000_000))
             else:
                 ts_ns = str(int(time.time() * 1_000_000_000))
@@ -106,6 +106,8 @@ class PostgresSinkConfig(BaseModel):
     # Batching settings
     batch_size: int = Field(default=100, ge=1)
     batch_timeout_seconds: float = Field(default=5.0, gt=0.0)
+    pipelined: bool = False
+    max_in_flight_batches: int = Field(default=4, ge=1)
 
     # Reliability settings
     max_retries: int = Field(default=3, ge=0)
@@ -150,7 +152,11 @@ class PostgresSink(BatchingMixin):
         self._circuit_breaker: SinkCircuitBreaker | None = None
         self._table_created = False
         self._insert_columns = self._build_insert_columns(cfg.extract_fields)
-        self._init_batching(cfg.batch_size, cfg.batch_timeout_seconds)
+        self._init_batching(
+            cfg.batch_size,
+            cfg.batch_timeout_seconds,
+            pipeline_depth=cfg.max_in_flight_batches if cfg.pipelined else 0,
+        )
         self._warn_unrecognized_fields(cfg.extract_fields)
 
     def _warn_unrecognized_fields(self, fields: list[str]) -> None:
@@ -245,16 +251,16 @@ class PostgresSink(BatchingMixin):
         if not batch or self._pool is None:
             return
 
-        if self._circuit_breaker and not self._circuit_breaker.should_allow():
+        skipped = await self._send_admitted(
+            self._circuit_breaker, batch, self._insert_batch_with_retry
+        )
+        if skipped:
             diagnostics.warn(
                 "postgres-sink",
                 "circuit breaker open, dropping batch",
-                batch_size=len(batch),
+                batch_size=skipped,
                 _rate_limit_key="postgres-circuit-open",
             )
-            return
-
-        await self._insert_batch_with_retry(batch)
 
     async def _insert_batch_with_retry(self, batch: list[dict[str, Any]]) -> None:
         attempts = max(1, int(self._config.max_retries))
@@ -479,6 +485,7 @@ class PostgresSink(BatchingMixin):
     async def flush(self) -> None:
         """Flush any pending batched events."""
         await self._flush_batch()
+        await self._wait_in_flight()
 
 
 PLUGIN_METADATA = {
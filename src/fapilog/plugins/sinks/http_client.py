@@ -1,5 +1,5 @@
 """
-HTTP sink utilities using a pooled httpx.AsyncClient for efficiency.
+HTTP sink utilities using a shared httpx.AsyncClient for efficiency.
 Provides a simple async HTTP sender that leverages `HttpClientPool` for
 connection reuse and bounded concurrency.
 """
@@ -11,13 +11,19 @@ from enum import Enum
 from typing import Any, Mapping
 
 import httpx
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import Field
 
 from ...core.resources import HttpClientPool
 from ...core.retry import AsyncRetrier, RetryCallable, RetryConfig
 from ...core.serialization import SerializedView
 from ..utils import parse_plugin_config
 from ._batching import BatchingMixin
+from ._http import (
+    HttpTransportConfig,
+    batching_options,
+    build_client_pool,
+    congestion_result,
+)
 
 __all__ = ["HttpSink", "HttpSinkConfig", "AsyncHttpSender", "BatchFormat"]
 
@@ -91,25 +97,10 @@ class BatchFormat(str, Enum):
     WRAPPED = "wrapped"
 
 
-class HttpSinkConfig(BaseModel):
-    model_config = ConfigDict(frozen=True, extra="forbid", validate_default=True, arbitrary_types_allowed=True)  # fmt: skip
-
-    endpoint: str
-    headers: dict[str, str] = Field(default_factory=dict)
-    retry: RetryCallable | RetryConfig | None = None
-    timeout_seconds: float = Field(default=5.0, gt=0.0)
-    batch_size: int = Field(default=1, ge=1)
-    batch_timeout_seconds: float = Field(default=5.0, ge=0.0)
+class HttpSinkConfig(HttpTransportConfig):
     batch_format: BatchFormat = Field(default=BatchFormat.ARRAY)
     batch_wrapper_key: str = "logs"
 
-    @field_validator("headers", mode="before")
-    @classmethod
-    def _coerce_headers(cls, value: Mapping[str, str] | None) -> dict[str, str]:
-        if value is None:
-            return {}
-        return dict(value)
-
 
 class HttpSink(BatchingMixin):
     """Async HTTP sink that POSTs JSON to a configured endpoint."""
@@ -127,11 +118,7 @@ class HttpSink(BatchingMixin):
     ) -> None:
         cfg = parse_plugin_config(HttpSinkConfig, config, **kwargs)
         self._config = cfg
-        self._pool = pool or HttpClientPool(
-            max_size=4,
-            timeout=cfg.timeout_seconds,
-            acquire_timeout_seconds=2.0,
-        )
+        self._pool = pool or build_client_pool(cfg, name="http")
         self._sender = sender or AsyncHttpSender(
             pool=self._pool,
             default_headers=cfg.headers,
@@ -140,7 +127,9 @@ class HttpSink(BatchingMixin):
         self._metrics = metrics
         self._last_status: int | None = None
         self._last_error: str | None = None
-        self._init_batching(cfg.batch_size, cfg.batch_timeout_seconds)
+        self._init_batching(
+            cfg.batch_size, cfg.batch_timeout_seconds, **batching_options(cfg)
+        )
 
     async def start(self) -> None:
         await self._pool.start()
@@ -173,9 +162,9 @@ class HttpSink(BatchingMixin):
                 sink_name=self.name,
                 cause=exc,
             ) from exc
-        await self.write(data)
+        await self._enqueue_for_batch(data, view.nbytes)
 
-    async def _send_batch(self, batch: list[dict[str, Any]]) -> None:
+    async def _send_batch(self, batch: list[dict[str, Any]]) -> bool | None:
         try:
             payload, content_type = self._format_batch(batch)
             headers = dict(self._config.headers)
@@ -201,11 +190,12 @@ class HttpSink(BatchingMixin):
                 )
                 if self._metrics is not None:
                     await self._metrics.record_events_dropped(len(batch))
-                return
+                return congestion_result(response.status_code)
 
             if self._metrics is not None:
                 for _ in batch:
                     await self._metrics.record_event_processed()
+            return None
 
         except Exception as exc:
             self._last_error = str(exc)
@@ -227,6 +217,7 @@ class HttpSink(BatchingMixin):
                     await self._metrics.record_events_dropped(len(batch))
                 except Exception:
                     pass
+            return False
 
     def _format_batch(self, batch: list[dict[str, Any]]) -> tuple[Any, str]:
         fmt = self._config.batch_format
@@ -259,6 +250,3 @@ PLUGIN_METADATA = {
     "compatibility": {"min_fapilog_version": "0.3.0"},
     "api_version": "1.0",
 }
-
-# Mark Pydantic validators as used for vulture
-_VULTURE_USED: tuple[object, ...] = (HttpSinkConfig._coerce_headers,)
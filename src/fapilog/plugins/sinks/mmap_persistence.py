@@ -100,10 +100,11 @@ class MemoryMappedPersistence:
     def is_open(self) -> bool:
         return not self._closed
 
-    async def open(self) -> None:
+    async def open(self, *, offset: int = 0) -> None:
         """Create directories, open file descriptor, and map memory.
 
-        Idempotent: safe to call if already open.
+        Idempotent: safe to call if already open. ``offset`` resumes
+        appending after data already in the file (e.g. on restart).
         """
         if self.is_open:
             return
@@ -122,7 +123,7 @@ class MemoryMappedPersistence:
                 fd = os.open(self._path, flags, 0o644)
                 try:
                     current_size = os.path.getsize(self._path)
-                    target_size = max(current_size, self._initial_size)
+                    target_size = max(current_size, self._initial_size, offset)
                     if current_size < target_size:
                         os.ftruncate(fd, target_size)
                     return fd, target_size
@@ -139,7 +140,7 @@ class MemoryMappedPersistence:
             assert self._fd is not None
             fd_local = self._fd
             self._mmap = await asyncio.to_thread(_map, fd_local, self._size)
-            self._offset = 0
+            self._offset = offset
             self._closed = False
         except Exception as e:  # pragma: no cover - rare path aggregation
             context = create_error_context(
@@ -0,0 +1,433 @@
+"""
+Durable per-sink spill queue for riding out sink outages.
+
+While a sink's circuit breaker is open, events are appended to segment
+files on disk instead of going to stderr or being dropped. Once the sink
+accepts writes again, a background replayer drains the backlog at a
+bounded rate.
+
+Layout (one directory per sink)::
+
+    seg-0000000001.spill   append log (MemoryMappedPersistence)
+    seg-0000000002.spill
+    spill.header           JSON read/write positions, replaced atomically
+
+Each record is framed as ``kind (u8) | length (u32) | crc32 (u32) |
+payload``. A serialized view's payload starts with ``meta length (u32) |
+meta JSON`` holding its level, timestamp and routing key. Segments are preallocated and zero-filled, so a zero kind marks
+the end of written data; a CRC mismatch marks a torn write after a crash.
+On open, the write position is recovered by scanning from the header's last
+known write offset. Delivery is at-least-once: the read position is
+committed after each replayed batch, so a crash mid-batch replays it again.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import struct
+import zlib
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import orjson
+
+from ...core import diagnostics
+from ...core.serialization import SerializedView
+from .mmap_persistence import MemoryMappedPersistence
+
+# Record kinds; 0 is reserved for the zero-filled tail of a segment
+KIND_ENTRY = 1
+KIND_SERIALIZED = 2
+KIND_VIEW = 3
+
+_FRAME = struct.Struct("<BII")
+_VIEW_META = struct.Struct("<I")
+_VIEW_FIELDS = ("level", "ts_ns", "routing_key")
+_HEADER_FILE = "spill.header"
+_SEGMENT_GLOB = "seg-*.spill"
+
+
+@dataclass
+class SpillQueueConfig:
+    """Configuration for :class:`DiskSpillQueue`.
+
+    Attributes:
+        directory: Directory holding this queue's segments and header.
+        max_segment_bytes: Start a new segment once one reaches this size.
+        max_total_bytes: Cap on spilled bytes on disk; further events are
+            dropped (and counted) until the backlog drains.
+        replay_batch_size: Records replayed between position commits.
+        replay_rate_per_second: Upper bound on replayed records per second;
+            None replays as fast as the sink accepts them.
+    """
+
+    directory: Path
+    max_segment_bytes: int = 16 * 1024 * 1024
+    max_total_bytes: int = 256 * 1024 * 1024
+    replay_batch_size: int = 256
+    replay_rate_per_second: float | None = 1000.0
+
+
+@dataclass
+class SpillStats:
+    """Snapshot of spill queue counters."""
+
+    pending_bytes: int
+    spilled: int
+    replayed: int
+    dropped: int
+
+
+@dataclass
+class _Position:
+    segment: int
+    offset: int
+
+
+class DiskSpillQueue:
+    """Segmented on-disk FIFO of log events for one sink."""
+
+    def __init__(self, config: SpillQueueConfig) -> None:
+        self._cfg = config
+        self._dir = Path(config.directory)
+        self._lock = asyncio.Lock()
+        self._opened = False
+        self._read = _Position(1, 0)
+        self._write = _Position(1, 0)
+        self._writer: MemoryMappedPersistence | None = None
+        self._pending_bytes = 0
+        self._replay_task: asyncio.Task[None] | None = None
+        self.spilled = 0
+        self.replayed = 0
+        self.dropped = 0
+
+    @property
+    def has_backlog(self) -> bool:
+        """True when spilled events may be waiting (unknown before open)."""
+        return not self._opened or self._read != self._write
+
+    def stats(self) -> SpillStats:
+        return SpillStats(
+            pending_bytes=self._pending_bytes,
+            spilled=self.spilled,
+            replayed=self.replayed,
+            dropped=self.dropped,
+        )
+
+    async def put_entry(self, entry: dict[str, Any]) -> bool:
+        """Spill a log entry; returns False when dropped by the size cap."""
+        payload = orjson.dumps(entry, default=str)
+        return await self._append(KIND_ENTRY, payload)
+
+    async def put_serialized(self, view: object) -> bool:
+        """Spill a pre-serialized payload (``SerializedView`` or bytes).
+
+        View metadata is stored with the payload so replay hands the sink
+        the same level, timestamp and routing key it would have seen live.
+        """
+        data = bytes(getattr(view, "data", view))  # type: ignore[call-overload]
+        meta = {
+            name: value
+            for name in _VIEW_FIELDS
+            if (value := getattr(view, name, None)) is not None
+        }
+        if not meta:
+            return await self._append(KIND_SERIALIZED, data)
+        header = orjson.dumps(meta)
+        return await self._append(
+            KIND_VIEW, _VIEW_META.pack(len(header)) + header + data
+        )
+
+    def start_replay(
+        self,
+        write: Callable[[dict[str, Any]], Awaitable[Any]],
+        write_serialized: Callable[[object], Awaitable[Any]],
+        *,
+        allow: Callable[[], bool] | None = None,
+        on_result: Callable[[bool], None] | None = None,
+    ) -> None:
+        """Drain the backlog in the background unless already draining.
+
+        ``allow`` is consulted before each record (e.g. the sink's circuit
+        breaker); ``on_result`` reports each delivery outcome back to it.
+        Replay stops at the first failure and resumes on the next call.
+        """
+        if self._replay_task is not None and not self._replay_task.done():
+            return
+        self._replay_task = asyncio.get_running_loop().create_task(
+            self._replay(write, write_serialized, allow, on_result)
+        )
+
+    async def close(self) -> None:
+        task = self._replay_task
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except (asyncio.CancelledError, Exception):
+                pass
+        async with self._lock:
+            if self._writer is not None:
+                await self._writer.close()
+                self._writer = None
+            if self._opened:
+                await asyncio.to_thread(self._save_header)
+
+    # Internal helpers
+    async def _open(self) -> None:
+        if self._opened:
+            return
+        await asyncio.to_thread(self._recover)
+        self._opened = True
+
+    def _recover(self) -> None:
+        self._dir.mkdir(parents=True, exist_ok=True)
+        segments = self._segments()
+        header: dict[str, int] = {}
+        try:
+            header = json.loads((self._dir / _HEADER_FILE).read_text("utf-8"))
+        except (OSError, ValueError):
+            header = {}
+        first = segments[0] if segments else 1
+        last = segments[-1] if segments else 1
+        read = _Position(
+            int(header.get("read_segment", first)), int(header.get("read_offset", 0))
+        )
+        if read.segment < first:
+            read = _Position(first, 0)
+        hint = 0
+        if int(header.get("write_segment", 0)) == last:
+            hint = int(header.get("write_offset", 0))
+        end = _scan_end(self._segment_path(last), hint)
+        self._read = read
+        self._write = _Position(last, end)
+        self._pending_bytes = max(
+            0,
+            sum(self._segment_path(n).stat().st_size for n in segments if n != last)
+            + end
+            - read.offset,
+        )
+
+    def _segments(self) -> list[int]:
+        numbers = []
+        for path in self._dir.glob(_SEGMENT_GLOB):
+            try:
+                numbers.append(int(path.stem.split("-", 1)[1]))
+            except ValueError:
+                continue
+        return sorted(numbers)
+
+    def _segment_path(self, number: int) -> Path:
+        return self._dir / f"seg-{number:010d}.spill"
+
+    def _save_header(self) -> None:
+        body = {
+            "read_segment": self._read.segment,
+            "read_offset": self._read.offset,
+            "write_segment": self._write.segment,
+            "write_offset": self._write.offset,
+        }
+        tmp = self._dir / (_HEADER_FILE + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(body, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self._dir / _HEADER_FILE)
+
+    async def _append(self, kind: int, payload: bytes) -> bool:
+        frame = (
+            _FRAME.pack(kind, len(payload), zlib.crc32(payload) & 0xFFFFFFFF) + payload
+        )
+        async with self._lock:
+            await self._open()
+            if self._pending_bytes + len(frame) > self._cfg.max_total_bytes:
+                self.dropped += 1
+                if self.dropped == 1 or self.dropped % 1000 == 0:
+                    diagnostics.warn(
+                        "sink",
+                        "spill queue full; dropping events",
+                        directory=str(self._dir),
+                        dropped=self.dropped,
+                    )
+                return False
+            if (
+                self._write.offset > 0
+                and self._write.offset + len(frame) > self._cfg.max_segment_bytes
+            ):
+                await self._roll_segment()
+            writer = await self._ensure_writer()
+            await writer.append(frame)
+            self._write.offset += len(frame)
+            self._pending_bytes += len(frame)
+            self.spilled += 1
+            return True
+
+    async def _ensure_writer(self) -> MemoryMappedPersistence:
+        if self._writer is None:
+            self._writer = MemoryMappedPersistence(
+                self._segment_path(self._write.segment),
+                initial_size_bytes=min(1024 * 1024, self._cfg.max_segment_bytes),
+                growth_chunk_bytes=min(1024 * 1024, self._cfg.max_segment_bytes),
+            )
+            await self._writer.open(offset=self._write.offset)
+        return self._writer
+
+    async def _roll_segment(self) -> None:
+        if self._writer is not None:
+            # close() trims the preallocated tail
+            await self._writer.close()
+            self._writer = None
+        self._write = _Position(self._write.segment + 1, 0)
+        await asyncio.to_thread(self._save_header)
+
+    async def _replay(
+        self,
+        write: Callable[[dict[str, Any]], Awaitable[Any]],
+        write_serialized: Callable[[object], Awaitable[Any]],
+        allow: Callable[[], bool] | None,
+        on_result: Callable[[bool], None] | None,
+    ) -> None:
+        async with self._lock:
+            await self._open()
+        rate = self._cfg.replay_rate_per_second
+        while True:
+            async with self._lock:
+                batch = await asyncio.to_thread(self._read_batch)
+                if not batch:
+                    # Caught up (or only a torn tail remains): skip to the
+                    # write position so consumed segments are removed
+                    if self._read != self._write:
+                        await asyncio.to_thread(
+                            self._commit, _Position(**vars(self._write)), 0
+                        )
+                    return
+            delivered: _Position | None = None
+            count = 0
+            for kind, payload, end in batch:
+                if allow is not None and not allow():
+                    break
+                try:
+                    if kind == KIND_ENTRY:
+                        result = await write(orjson.loads(payload))
+                    elif kind == KIND_VIEW:
+                        result = await write_serialized(_decode_view(payload))
+                    else:
+                        result = await write_serialized(SerializedView(data=payload))
+                    ok = result is not False
+                except Exception:
+                    ok = False
+                if on_result is not None:
+                    on_result(ok)
+                if not ok:
+                    break
+                delivered = end
+                count += 1
+            if delivered is not None:
+                async with self._lock:
+                    await asyncio.to_thread(self._commit, delivered, count)
+            if count < len(batch):
+                return
+            if rate:
+                await asyncio.sleep(len(batch) / rate)
+
+    def _read_batch(self) -> list[tuple[int, bytes, _Position]]:
+        """Read up to ``replay_batch_size`` records from the read position.
+
+        Each record carries the position just past it, for committing.
+        """
+        batch: list[tuple[int, bytes, _Position]] = []
+        segment, offset = self._read.segment, self._read.offset
+        while len(batch) < self._cfg.replay_batch_size:
+            # Never read past what this process has appended to the active
+            # segment; the mapping may hold a record still being copied in
+            stop = self._write.offset if segment == self._write.segment else None
+            want = self._cfg.replay_batch_size - len(batch)
+            for kind, payload, end in _read_frames(
+                self._segment_path(segment), offset, stop, want
+            ):
+                batch.append((kind, payload, _Position(segment, end)))
+            if len(batch) >= self._cfg.replay_batch_size:
+                break
+            if segment >= self._write.segment:
+                break
+            segment, offset = segment + 1, 0
+        return batch
+
+    def _commit(self, position: _Position, count: int) -> None:
+        """Advance the read position and drop fully consumed segments."""
+        for number in range(self._read.segment, position.segment):
+            path = self._segment_path(number)
+            try:
+                self._pending_bytes -= path.stat().st_size - (
+                    self._read.offset if number == self._read.segment else 0
+                )
+                path.unlink()
+            except OSError:
+                pass
+        base = self._read.offset if position.segment == self._read.segment else 0
+        self._pending_bytes = max(0, self._pending_bytes - (position.offset - base))
+        self._read = position
+        self.replayed += count
+        self._save_header()
+
+
+def _decode_view(payload: bytes) -> SerializedView:
+    """Rebuild a view from a ``KIND_VIEW`` payload."""
+    (size,) = _VIEW_META.unpack_from(payload)
+    start = _VIEW_META.size
+    meta = orjson.loads(payload[start : start + size])
+    return SerializedView(data=payload[start + size :], **meta)
+
+
+def _read_frames(
+    path: Path, start: int, stop: int | None, max_records: int
+) -> list[tuple[int, bytes, int]]:
+    """Return ``(kind, payload, end_offset)`` for intact records from ``start``."""
+    records: list[tuple[int, bytes, int]] = []
+    try:
+        f = open(path, "rb", buffering=1024 * 1024)
+    except OSError:
+        return records
+    with f:
+        f.seek(start)
+        pos = start
+        while len(records) < max_records:
+            if stop is not None and pos >= stop:
+                break
+            head = f.read(_FRAME.size)
+            if len(head) < _FRAME.size:
+                break
+            kind, length, crc = _FRAME.unpack(head)
+            if kind == 0:
+                break
+            payload = f.read(length)
+            if len(payload) < length or zlib.crc32(payload) != crc:
+                break  # torn write from a crash
+            pos += _FRAME.size + length
+            records.append((kind, payload, pos))
+    return records
+
+
+def _scan_end(path: Path, start: int) -> int:
+    """Offset just past the last intact record at or after ``start``."""
+    if not path.exists():
+        return 0
+    if start > path.stat().st_size:
+        start = 0
+    pos = start
+    while True:
+        records = _read_frames(path, pos, None, 1024)
+        if not records:
+            return pos
+        pos = records[-1][2]
+
+
+__all__ = [
+    "DiskSpillQueue",
+    "SpillQueueConfig",
+    "SpillStats",
+]
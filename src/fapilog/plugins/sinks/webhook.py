@@ -13,10 +13,10 @@ import json
 import time
 import warnings
 from enum import Enum
-from typing import Any, Mapping
+from typing import Any
 
 import httpx
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import Field
 
 from ...core.resources import HttpClientPool
 from ...core.retry import AsyncRetrier, RetryCallable, RetryConfig
@@ -24,6 +24,12 @@ from ...core.serialization import SerializedView
 from ...metrics.metrics import MetricsCollector
 from ..utils import parse_plugin_config
 from ._batching import BatchingMixin
+from ._http import (
+    HttpTransportConfig,
+    batching_options,
+    build_client_pool,
+    congestion_result,
+)
 
 __all__ = ["SignatureMode", "WebhookSink", "WebhookSinkConfig"]
 
@@ -35,10 +41,7 @@ class SignatureMode(str, Enum):
     HMAC = "hmac"  # Recommended: X-Fapilog-Signature-256
 
 
-class WebhookSinkConfig(BaseModel):
-    model_config = ConfigDict(frozen=True, extra="forbid", validate_default=True, arbitrary_types_allowed=True)  # fmt: skip
-
-    endpoint: str
+class WebhookSinkConfig(HttpTransportConfig):
     secret: str | None = None
     signature_mode: SignatureMode = Field(
         default=SignatureMode.HMAC,
@@ -49,18 +52,6 @@ class WebhookSinkConfig(BaseModel):
         ge=0,
         description="Recommended replay tolerance for receivers (5 minutes). Receivers should reject requests with timestamps outside this window.",
     )
-    headers: dict[str, str] = Field(default_factory=dict)
-    retry: RetryCallable | RetryConfig | None = None
-    timeout_seconds: float = Field(default=5.0, gt=0.0)
-    batch_size: int = Field(default=1, ge=1)
-    batch_timeout_seconds: float = Field(default=5.0, ge=0.0)
-
-    @field_validator("headers", mode="before")
-    @classmethod
-    def _coerce_headers(cls, value: Mapping[str, str] | None) -> dict[str, str]:
-        if value is None:
-            return {}
-        return dict(value)
 
 
 class WebhookSink(BatchingMixin):
@@ -79,12 +70,7 @@ class WebhookSink(BatchingMixin):
         cfg = parse_plugin_config(WebhookSinkConfig, config, **kwargs)
         self._config = cfg
         self._metrics = metrics
-        self._pool = pool or HttpClientPool(
-            name="webhook",
-            max_size=4,
-            timeout=cfg.timeout_seconds,
-            acquire_timeout_seconds=2.0,
-        )
+        self._pool = pool or build_client_pool(cfg, name="webhook")
         if cfg.retry is None:
             self._retrier: RetryCallable | None = None
         elif isinstance(cfg.retry, RetryConfig):
@@ -93,7 +79,9 @@ class WebhookSink(BatchingMixin):
             self._retrier = cfg.retry
         self._last_status: int | None = None
         self._last_error: str | None = None
-        self._init_batching(cfg.batch_size, cfg.batch_timeout_seconds)
+        self._init_batching(
+            cfg.batch_size, cfg.batch_timeout_seconds, **batching_options(cfg)
+        )
 
     async def start(self) -> None:
         await self._pool.start()
@@ -161,9 +149,9 @@ class WebhookSink(BatchingMixin):
                 sink_name=self.name,
                 cause=exc,
             ) from exc
-        await self.write(data)
+        await self._enqueue_for_batch(data, view.nbytes)
 
-    async def _send_batch(self, batch: list[dict[str, Any]]) -> None:
+    async def _send_batch(self, batch: list[dict[str, Any]]) -> bool | None:
         payload: Any
         if self._config.batch_size <= 1:
             payload = batch[0] if batch else {}
@@ -191,10 +179,11 @@ class WebhookSink(BatchingMixin):
                 )
                 if self._metrics is not None:
                     await self._metrics.record_events_dropped(len(batch))
-                return
+                return congestion_result(resp.status_code)
             if self._metrics is not None:
                 for _ in batch:
                     await self._metrics.record_event_processed()
+            return None
         except Exception as exc:
             self._last_error = str(exc)
             self._last_status = None
@@ -214,6 +203,7 @@ class WebhookSink(BatchingMixin):
                     await self._metrics.record_events_dropped(len(batch))
                 except Exception:
                     pass
+            return False
 
     async def health_check(self) -> bool:
         return (
@@ -240,6 +230,5 @@ PLUGIN_METADATA = {
 
 # Mark Pydantic validators as used for vulture
 _VULTURE_USED: tuple[object, ...] = (
-    WebhookSinkConfig._coerce_headers,
     SignatureMode.HEADER,  # Used for backward compatibility
 )
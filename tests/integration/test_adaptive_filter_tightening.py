@@ -93,8 +93,12 @@ class TestFilterSwapOnPressureChange:
         logger.start()
         original_snapshot = logger._filters_snapshot
 
-        # Verify NORMAL snapshot matches user filters
-        assert user_filter in original_snapshot
+        # Level filter is caller-safe, so it is hoisted out of the worker
+        # snapshot into the caller-side prefilter
+        assert user_filter not in original_snapshot
+        prefilter = logger._caller_prefilter
+        assert prefilter is not None  # noqa: WA003
+        assert prefilter("DEBUG") is False
 
         # Simulate pressure escalation by calling the registered callback
         monitor = logger._pressure_monitor
@@ -178,6 +182,37 @@ class TestDeescalationRestoresFilters:
 
         await logger.stop_and_drain()
 
+    @pytest.mark.asyncio
+    async def test_critical_bypasses_hoisted_user_filters(self) -> None:
+        """CRITICAL drops the caller prefilter; leaving CRITICAL restores it."""
+        from fapilog.core.settings import AdaptiveSettings
+        from fapilog.plugins.filters.sampling import SamplingFilter
+
+        sampling = SamplingFilter(config={"sample_rate": 0.0})
+        logger = _make_logger(filters=[sampling])
+        logger._cached_adaptive_enabled = True
+        logger._cached_adaptive_settings = AdaptiveSettings(
+            enabled=True, check_interval_seconds=0.01, cooldown_seconds=0.0
+        )
+
+        logger.start()
+        assert logger._caller_rejects("ERROR") is True
+
+        monitor = logger._pressure_monitor
+        assert isinstance(monitor, PressureMonitor)
+
+        # CRITICAL replaces user filters, so protected levels must get through
+        for cb in monitor._callbacks:
+            cb(PressureLevel.HIGH, PressureLevel.CRITICAL)
+        assert logger._caller_prefilter is None
+        assert logger._caller_rejects("ERROR") is False
+
+        for cb in monitor._callbacks:
+            cb(PressureLevel.CRITICAL, PressureLevel.HIGH)
+        assert logger._caller_rejects("ERROR") is True
+
+        await logger.stop_and_drain()
+
 
 class TestDiagnosticOnFilterSwap:
     """AC8: Diagnostic emitted on filter swap."""
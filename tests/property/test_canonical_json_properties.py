@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from hypothesis import given
+from hypothesis import strategies as st
+
+from fapilog.core.canonical import canonical_json, canonical_json_reference
+
+pytestmark = pytest.mark.property
+
+# Full unicode (minus lone surrogates, which UTF-8 cannot encode) so key
+# ordering, escaping and the ascii_only path see astral characters too
+_text = st.text(st.characters(blacklist_categories=("Cs",)), max_size=20)
+
+_finite_primitives = st.one_of(
+    st.none(),
+    st.booleans(),
+    st.integers(),  # includes values beyond 64 bits (orjson fallback)
+    st.floats(allow_nan=False, allow_infinity=False),
+    _text,
+)
+
+_json_native = st.recursive(
+    _finite_primitives,
+    lambda children: st.one_of(
+        st.lists(children, max_size=5),
+        st.dictionaries(_text, children, max_size=5),
+    ),
+    max_leaves=25,
+)
+
+
+def _legacy(obj: object, *, ascii_only: bool) -> bytes:
+    """The stdlib encoding the tamper and audit add-ons used before."""
+    return json.dumps(
+        obj, sort_keys=True, separators=(",", ":"), ensure_ascii=ascii_only
+    ).encode("utf-8")
+
+
+@given(payload=_json_native, ascii_only=st.booleans())
+def test_matches_legacy_stdlib_bytes(payload: object, ascii_only: bool) -> None:
+    expected = _legacy(payload, ascii_only=ascii_only)
+    assert canonical_json(payload, ascii_only=ascii_only) == expected
+    assert canonical_json_reference(payload, ascii_only=ascii_only) == expected
+
+
+@given(
+    payload=st.dictionaries(
+        _text,
+        st.one_of(
+            st.floats(),
+            st.datetimes(
+                timezones=st.one_of(
+                    st.none(),
+                    st.builds(
+                        timezone,
+                        st.timedeltas(
+                            min_value=timedelta(hours=-23),
+                            max_value=timedelta(hours=23),
+                        ),
+                    ),
+                )
+            ),
+            st.uuids(),
+            st.lists(st.floats(), max_size=3),
+        ),
+        max_size=6,
+    ),
+    ascii_only=st.booleans(),
+)
+def test_fast_path_matches_reference_for_extended_types(
+    payload: dict, ascii_only: bool
+) -> None:
+    assert canonical_json(payload, ascii_only=ascii_only) == canonical_json_reference(
+        payload, ascii_only=ascii_only
+    )
+
+
+def test_non_finite_floats_encode_as_null() -> None:
+    payload = {"a": float("nan"), "b": [float("inf"), 1e-05]}
+    assert canonical_json(payload) == b'{"a":null,"b":[null,1e-05]}'
+
+
+def test_datetime_uses_isoformat() -> None:
+    stamp = datetime(2025, 1, 2, 3, 4, 5, 600, tzinfo=timezone.utc)
+    assert canonical_json({"t": stamp}) == b'{"t":"2025-01-02T03:04:05.000600+00:00"}'
+
+
+def test_unsupported_type_raises() -> None:
+    with pytest.raises(TypeError):
+        canonical_json({"x": object()})
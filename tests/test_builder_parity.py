@@ -66,6 +66,13 @@ BUILDER_TO_CORE_FIELDS: dict[str, list[str]] = {
         "sink_circuit_breaker_failure_threshold",
         "sink_circuit_breaker_recovery_timeout_seconds",
         "sink_circuit_breaker_fallback_sink",
+        "sink_circuit_breaker_spill_directory",
+        "sink_circuit_breaker_spill_max_bytes",
+        "sink_circuit_breaker_spill_replay_rate",
+        "sink_circuit_breaker_failure_rate_threshold",
+        "sink_circuit_breaker_window_seconds",
+        "sink_circuit_breaker_minimum_events",
+        "sink_circuit_breaker_probe_size",
     ],
     "with_backpressure": ["backpressure_wait_ms", "drop_on_full"],
     "with_workers": ["worker_count"],
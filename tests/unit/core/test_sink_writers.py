@@ -511,3 +511,68 @@ class TestSinkWriterGroupRedactMode:
 
             call_kwargs = mock_handler.call_args.kwargs
             assert call_kwargs["redact_mode"] == "inherit"
+
+
+class BatchSink(MockSink):
+    """Mock sink that also accepts a whole batch of entries."""
+
+    def __init__(self, name: str = "batch_sink") -> None:
+        super().__init__(name)
+        self.write_batch = AsyncMock(return_value=None)
+
+
+class TestSinkWriterGroupWriteRoutedBatch:
+    """Test flush batches handed to the group in one call."""
+
+    @pytest.mark.asyncio
+    async def test_batch_sink_gets_one_write_batch_call(self) -> None:
+        """Sinks with write_batch receive every entry in a single call."""
+        from fapilog.core.sink_writers import SinkWriterGroup
+
+        sink = BatchSink()
+        group = SinkWriterGroup([sink])
+        entries = [{"message": f"m{i}"} for i in range(3)]
+
+        await group.write_routed_batch([(e, MagicMock()) for e in entries])
+
+        sink.write_batch.assert_awaited_once_with(entries)
+        sink.write.assert_not_called()
+        sink.write_serialized.assert_not_called()
+        assert sink._started is True
+
+    @pytest.mark.asyncio
+    async def test_plain_sink_gets_per_event_writes(self) -> None:
+        """Sinks without write_batch keep the per-event paths."""
+        from fapilog.core.sink_writers import SinkWriterGroup
+
+        sink = MockSink()
+        group = SinkWriterGroup([sink])
+        view = MagicMock()
+
+        await group.write_routed_batch(
+            [({"message": "a"}, view), ({"message": "b"}, None)]
+        )
+
+        sink.write_serialized.assert_awaited_once_with(view)
+        sink.write.assert_awaited_once_with({"message": "b"})
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_reports_each_entry(self) -> None:
+        """A failing write_batch records the failures and reports every entry."""
+        from fapilog.core.sink_writers import SinkWriterGroup
+
+        sink = BatchSink()
+        sink.write_batch.side_effect = RuntimeError("batch failed")
+        group = SinkWriterGroup(
+            [sink], circuit_config=SinkCircuitBreakerConfig(enabled=True)
+        )
+        entries = [{"message": f"m{i}"} for i in range(2)]
+
+        with patch(
+            "fapilog.core.sink_writers.handle_sink_write_failure",
+            new_callable=AsyncMock,
+        ) as mock_handler:
+            await group.write_routed_batch([(e, None) for e in entries])
+
+        assert [c.args[0] for c in mock_handler.call_args_list] == entries
+        assert group.breakers[0]._failure_count == len(entries)
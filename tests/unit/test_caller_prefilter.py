@@ -0,0 +1,185 @@
+"""
+Tests for the caller-side prefilter compiled from caller-safe filters.
+
+Scope:
+- Hoisting only the leading run of caller-safe filters
+- Fail-open behavior when a precheck raises
+- Built-in filters' precheck parity with filter()
+- Logger facades rejecting events before envelope construction
+- Gauges still published for hoisted filters
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from fapilog.core.logger import AsyncLoggerFacade, SyncLoggerFacade
+from fapilog.metrics.metrics import MetricsCollector
+from fapilog.plugins.filters import compile_caller_prefilter
+from fapilog.plugins.filters.level import LevelFilter
+from fapilog.plugins.filters.rate_limit import RateLimitFilter
+from fapilog.plugins.filters.sampling import SamplingFilter
+from fapilog.plugins.filters.trace_sampling import TraceSamplingFilter
+
+
+class _RaisingPrecheck:
+    name = "raising"
+    caller_safe = True
+
+    def precheck(self, level: str) -> bool:
+        raise RuntimeError("boom")
+
+    async def filter(self, event: dict) -> dict | None:
+        return event
+
+
+class TestCompileCallerPrefilter:
+    def test_no_caller_safe_filters_returns_none(self) -> None:
+        rate_limit = RateLimitFilter()
+        prefilter, remaining = compile_caller_prefilter([rate_limit])
+        assert prefilter is None
+        assert remaining == (rate_limit,)
+
+    def test_hoists_only_leading_caller_safe_filters(self) -> None:
+        level = LevelFilter(config={"min_level": "INFO"})
+        rate_limit = RateLimitFilter()
+        sampling = SamplingFilter(config={"sample_rate": 0.0})
+
+        prefilter, remaining = compile_caller_prefilter([level, rate_limit, sampling])
+
+        assert remaining == (rate_limit, sampling)
+        assert prefilter is not None  # noqa: WA003
+        assert prefilter("DEBUG") is False
+        # Sampling is behind rate_limit, so it must not be applied caller-side
+        assert prefilter("INFO") is True
+
+    def test_combines_all_hoisted_checks(self) -> None:
+        level = LevelFilter(config={"min_level": "INFO"})
+        sampling = SamplingFilter(config={"sample_rate": 0.0})
+
+        prefilter, remaining = compile_caller_prefilter([level, sampling])
+
+        assert remaining == ()
+        assert prefilter is not None  # noqa: WA003
+        assert prefilter("ERROR") is False
+
+    def test_precheck_exception_fails_open(self) -> None:
+        prefilter, _ = compile_caller_prefilter([_RaisingPrecheck()])
+        assert prefilter is not None  # noqa: WA003
+        assert prefilter("INFO") is True
+
+    def test_trace_sampling_not_hoisted_for_top_level_field(self) -> None:
+        by_context = TraceSamplingFilter(config={"sample_rate": 0.5})
+        by_envelope_key = TraceSamplingFilter(
+            config={"sample_rate": 0.5, "trace_id_field": "message"}
+        )
+        assert by_context.caller_safe is True
+        assert by_envelope_key.caller_safe is False
+
+
+@pytest.mark.asyncio
+async def test_sampling_precheck_matches_filter() -> None:
+    keep_all = SamplingFilter(config={"sample_rate": 1.0})
+    drop_all = SamplingFilter(config={"sample_rate": 0.0})
+
+    assert keep_all.precheck("INFO") is True
+    assert await keep_all.filter({"level": "INFO"}) == {"level": "INFO"}
+    assert drop_all.precheck("INFO") is False
+    assert await drop_all.filter({"level": "INFO"}) is None
+
+
+def _make_sync_logger(out: list[dict[str, Any]], filters: list[Any]) -> Any:
+    async def sink(event: dict[str, Any]) -> None:
+        out.append(event)
+
+    logger = SyncLoggerFacade(
+        name="prefilter-test",
+        queue_capacity=64,
+        batch_max_size=8,
+        batch_timeout_seconds=0.01,
+        backpressure_wait_ms=1,
+        drop_on_full=True,
+        sink_write=sink,
+        filters=filters,
+    )
+    return logger
+
+
+@pytest.mark.asyncio
+async def test_sync_logger_rejects_before_envelope() -> None:
+    out: list[dict[str, Any]] = []
+    logger = _make_sync_logger(out, [LevelFilter(config={"min_level": "WARNING"})])
+    logger.start()
+
+    for i in range(10):
+        logger.info(f"info {i}")
+    logger.warning("kept")
+
+    result = await logger.stop_and_drain()
+
+    assert result.submitted == 1
+    assert [e["message"] for e in out] == ["kept"]
+
+
+@pytest.mark.asyncio
+async def test_async_logger_rejects_before_envelope() -> None:
+    out: list[dict[str, Any]] = []
+
+    async def sink(event: dict[str, Any]) -> None:
+        out.append(event)
+
+    logger = AsyncLoggerFacade(
+        name="prefilter-async-test",
+        queue_capacity=64,
+        batch_max_size=8,
+        batch_timeout_seconds=0.01,
+        backpressure_wait_ms=1,
+        drop_on_full=True,
+        sink_write=sink,
+        filters=[SamplingFilter(config={"sample_rate": 0.0})],
+    )
+    await logger.start_async()
+
+    for i in range(10):
+        await logger.info(f"info {i}")
+
+    result = await logger.drain()
+
+    assert result.submitted == 0
+    assert out == []
+
+
+@pytest.mark.asyncio
+async def test_hoisted_filter_gauges_are_recorded() -> None:
+    out: list[dict[str, Any]] = []
+
+    async def sink(event: dict[str, Any]) -> None:
+        out.append(event)
+
+    metrics = MetricsCollector(enabled=True)
+    sampling = SamplingFilter(config={"sample_rate": 0.25, "seed": 7})
+    logger = SyncLoggerFacade(
+        name="prefilter-gauge-test",
+        queue_capacity=64,
+        batch_max_size=8,
+        batch_timeout_seconds=0.01,
+        backpressure_wait_ms=1,
+        drop_on_full=True,
+        sink_write=sink,
+        filters=[sampling],
+        metrics=metrics,
+    )
+    logger.start()
+    assert logger._filters_snapshot == ()
+
+    for i in range(40):
+        logger.error(f"error {i}")
+    await logger.stop_and_drain()
+
+    assert metrics.registry is not None  # noqa: WA003
+    rate = metrics.registry.get_sample_value(
+        "fapilog_filter_sample_rate", {"filter": sampling.name}
+    )
+    assert rate == 0.25
@@ -159,6 +159,32 @@ class TestPressureMonitorCircuitBoost:
         assert monitor.pressure_level == PressureLevel.NORMAL
 
 
+class TestCircuitBoostReopen:
+    def test_failed_probe_does_not_stack_boost(self) -> None:
+        """Repeated OPEN reports for one sink count once."""
+        queue = _make_queue(qsize=30, capacity=100)
+        monitor = PressureMonitor(
+            queue=queue, cooldown_seconds=0.0, circuit_pressure_boost=0.20
+        )
+        config = SinkCircuitBreakerConfig(
+            failure_threshold=1, recovery_timeout_seconds=0.0
+        )
+        breaker = SinkCircuitBreaker("http", config)
+        breaker.on_state_change = monitor.on_circuit_state_change
+
+        breaker.record_failure()
+        for _ in range(3):
+            breaker.should_allow()  # half-open probe
+            breaker.record_failure()  # probe fails, OPEN again
+        # 30% + one 20% boost = 50% < 60%
+        monitor._tick()
+        assert monitor.pressure_level == PressureLevel.NORMAL
+
+        breaker.should_allow()
+        breaker.record_success()
+        assert monitor._circuit_boost == 0.0
+
+
 class TestAdaptiveSettingsCircuitBoost:
     def test_default_circuit_pressure_boost(self) -> None:
         """Default boost is 0.20."""
@@ -147,6 +147,28 @@ async def test_write_serialized_fast_path(fake_client: FakeCloudWatchClient) ->
     assert log_events[0]["message"] == '{"message":"hi"}'
 
 
+@pytest.mark.asyncio
+async def test_write_serialized_uses_view_timestamp(
+    fake_client: FakeCloudWatchClient,
+) -> None:
+    sink = CloudWatchSink(
+        CloudWatchSinkConfig(
+            log_group_name="/app/test",
+            log_stream_name="stream-a",
+            batch_size=1,
+            region="us-east-1",
+        )
+    )
+    await sink.start()
+
+    view = SerializedView(data=b'{"message":"hi"}', ts_ns=1_700_000_000_123_456_789)
+    await sink.write_serialized(view)
+    await sink.stop()
+
+    log_events = fake_client.put_calls[0]["logEvents"]
+    assert log_events[0]["timestamp"] == 1_700_000_000_123
+
+
 @pytest.mark.asyncio
 async def test_invalid_sequence_token_retry(
     fake_client: FakeCloudWatchClient,
@@ -25,6 +25,7 @@ async def test_adaptive_sampling_adjusts_rates(monkeypatch: pytest.MonkeyPatch)
 
     clock = _FakeClock()
     monkeypatch.setattr(module, "time", clock)
+    monkeypatch.setattr(module.random, "random", lambda: 0.0)
 
     filt = AdaptiveSamplingFilter(
         config=AdaptiveSamplingConfig(
@@ -35,26 +36,24 @@ async def test_adaptive_sampling_adjusts_rates(monkeypatch: pytest.MonkeyPatch)
             smoothing_factor=1.0,
         )
     )
+    await filt.start()
 
     # High throughput should drive the rate down but stay above the minimum
-    clock.now = 5.0
-    filt._timestamps.extend([4.5, 4.55, 4.6, 4.65, 4.7])
-    filt._last_adjustment = 3.0
-    filt._current_rate = 1.0
-    filt._maybe_adjust_rate()
+    for _ in range(50):
+        await filt.filter({"level": "INFO"})
+        clock.advance(0.05)
     rate_after_high = filt.current_sample_rate
     assert rate_after_high < 1.0
     assert rate_after_high >= 0.05
+    assert filt.current_eps > 2.0
 
     # Low throughput should allow the rate to move back up toward max
-    filt._timestamps.clear()
-    filt._timestamps.extend([19.0])
-    clock.now = 20.0
-    filt._last_adjustment = 18.0
-    filt._current_rate = 0.1
-    filt._maybe_adjust_rate()
+    clock.advance(20.0)
+    await filt.filter({"level": "INFO"})
+    clock.advance(1.5)
+    await filt.filter({"level": "INFO"})
     rate_after_low = filt.current_sample_rate
-    assert rate_after_low > 0.1
+    assert rate_after_low > rate_after_high
     assert rate_after_low <= 1.0
 
 
@@ -77,8 +76,40 @@ async def test_adaptive_sampling_prunes_window(monkeypatch: pytest.MonkeyPatch)
     clock.advance(10.0)
     await filt.filter({"level": "INFO"})
 
-    assert len(filt._timestamps) == 1
-    assert filt._timestamps[0] >= clock.now - filt._window
+    assert filt._window_total == 1
+    assert sum(filt._buckets) == 1
+
+
+@pytest.mark.asyncio
+async def test_adaptive_sampling_memory_is_bounded(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from fapilog.plugins.filters import adaptive_sampling as module
+
+    clock = _FakeClock()
+    monkeypatch.setattr(module, "time", clock)
+    monkeypatch.setattr(module.random, "random", lambda: 0.0)
+
+    filt = AdaptiveSamplingFilter(
+        config=AdaptiveSamplingConfig(
+            window_seconds=2.0, bucket_seconds=0.5, smoothing_factor=1.0
+        )
+    )
+    await filt.start()
+
+    for _ in range(10_000):
+        await filt.filter({"level": "INFO"})
+        clock.advance(0.001)
+
+    assert len(filt._buckets) == 4
+    # 10s of traffic at 1000 eps; only the last 2s window is retained
+    assert filt._window_total <= 2_500
+    assert filt.current_eps == pytest.approx(1000.0, rel=0.3)
+
+
+def test_adaptive_sampling_rejects_bucket_larger_than_window() -> None:
+    with pytest.raises(ValueError, match="bucket_seconds"):
+        AdaptiveSamplingConfig(window_seconds=1.0, bucket_seconds=2.0)
 
 
 @pytest.mark.asyncio
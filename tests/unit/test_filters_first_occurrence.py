@@ -79,3 +79,74 @@ async def test_first_occurrence_lru_eviction(monkeypatch: pytest.MonkeyPatch) ->
     await filt.filter({"message": "c"})
 
     assert set(filt._seen.keys()) == {"b", "c"}
+
+
+@pytest.mark.asyncio
+async def test_first_occurrence_bloom_backend_dedupes(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from fapilog.plugins.filters import first_occurrence as module
+
+    clock = _FakeClock()
+    monkeypatch.setattr(module, "time", clock)
+
+    filt = FirstOccurrenceFilter(
+        config=FirstOccurrenceConfig(
+            backend="bloom",
+            key_fields=["message", "code"],
+            window_seconds=10.0,
+            subsequent_sample_rate=0.0,
+        )
+    )
+    await filt.start()
+
+    evt = {"message": "hello", "code": 1}
+    assert await filt.filter(evt) == evt
+    assert await filt.filter(dict(evt)) is None
+    other = {"message": "hello", "code": 2}
+    assert await filt.filter(other) == other
+
+    # Remembered for at least one window, forgotten after two
+    clock.advance(9.0)
+    assert await filt.filter(evt) is None
+    clock.advance(21.0)
+    assert await filt.filter(evt) == evt
+
+
+@pytest.mark.asyncio
+async def test_first_occurrence_bloom_memory_is_fixed() -> None:
+    filt = FirstOccurrenceFilter(
+        config=FirstOccurrenceConfig(
+            backend="bloom", max_keys=10_000, false_positive_rate=0.01
+        )
+    )
+    await filt.start()
+    before = filt.memory_bytes
+
+    passed = 0
+    for i in range(50_000):
+        if await filt.filter({"message": f"m{i}"}) is not None:
+            passed += 1
+
+    assert filt.memory_bytes == before
+    # ~9.6 bits per key per generation at 1% FP, two generations
+    assert before is not None and before < 30_000
+    # Capacity-driven rotation keeps false positives near the sized rate
+    assert passed >= 50_000 * 0.95
+
+
+@pytest.mark.asyncio
+async def test_first_occurrence_bloom_handles_unhashable_values() -> None:
+    filt = FirstOccurrenceFilter(
+        config=FirstOccurrenceConfig(backend="bloom", key_fields=["data"])
+    )
+    await filt.start()
+
+    evt = {"data": {"nested": [1, 2]}}
+    assert await filt.filter(evt) == evt
+    assert await filt.filter({"data": {"nested": [1, 2]}}) is None
+
+
+def test_first_occurrence_exact_backend_reports_no_sketch_memory() -> None:
+    filt = FirstOccurrenceFilter()
+    assert filt.memory_bytes is None
@@ -1,10 +1,16 @@
 from __future__ import annotations
 
+import asyncio
+
 import pytest
 
 from fapilog.plugins.filters.rate_limit import RateLimitFilter, RateLimitFilterConfig
 
 
+def _tracked_keys(filt: RateLimitFilter) -> set[str]:
+    return {key for shard in filt._shards for key in shard.index}
+
+
 @pytest.mark.asyncio
 async def test_rate_limit_lru_eviction_and_isolation() -> None:
     filt = RateLimitFilter(
@@ -19,10 +25,11 @@ async def test_rate_limit_lru_eviction_and_isolation() -> None:
     await filt.start()
     await filt.filter({"user": "a"})
     await filt.filter({"user": "b"})
-    assert set(filt._buckets.keys()) == {"a", "b"}
+    assert _tracked_keys(filt) == {"a", "b"}
 
     await filt.filter({"user": "c"})
-    assert set(filt._buckets.keys()) == {"b", "c"}
+    assert _tracked_keys(filt) == {"b", "c"}
+    assert filt.tracked_key_count == 2
 
 
 @pytest.mark.asyncio
@@ -61,3 +68,141 @@ async def test_rate_limit_health_check_warns_near_capacity() -> None:
         await filt.filter({"user": f"u{i}"})
 
     assert await filt.health_check() is False
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_clock_eviction_keeps_recently_used_keys() -> None:
+    filt = RateLimitFilter(
+        config=RateLimitFilterConfig(capacity=5, key_field="user", max_keys=3)
+    )
+
+    await filt.start()
+    for user in ("a", "b", "c"):
+        await filt.filter({"user": user})
+    # Touch "a" so its reference bit protects it from the next sweep
+    await filt.filter({"user": "a"})
+    await filt.filter({"user": "d"})
+
+    assert _tracked_keys(filt) == {"a", "c", "d"}
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_shards_high_cardinality_tables() -> None:
+    filt = RateLimitFilter(
+        config=RateLimitFilterConfig(key_field="tenant", max_keys=4096, shards=8)
+    )
+
+    await filt.start()
+    for i in range(10_000):
+        await filt.filter({"tenant": f"t{i}"})
+
+    assert len(filt._shards) == 8
+    assert sum(len(shard.keys) for shard in filt._shards) == 4096
+    assert filt.tracked_key_count == 4096
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_begin_batch_reuses_clock(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from fapilog.plugins.filters import rate_limit as module
+
+    calls = 0
+
+    def fake_monotonic() -> float:
+        nonlocal calls
+        calls += 1
+        return 100.0
+
+    filt = RateLimitFilter(config=RateLimitFilterConfig(capacity=2))
+    await filt.start()
+    monkeypatch.setattr(module.time, "monotonic", fake_monotonic)
+
+    filt.begin_batch()
+    results = [await filt.filter({"n": i}) for i in range(3)]
+
+    assert calls == 1
+    assert [r is not None for r in results] == [True, True, False]
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_refills_after_end_batch() -> None:
+    filt = RateLimitFilter(
+        config=RateLimitFilterConfig(capacity=1, refill_rate_per_sec=100.0)
+    )
+    await filt.start()
+
+    filt.begin_batch()
+    assert await filt.filter({"n": 0}) == {"n": 0}
+    filt.end_batch()
+    await asyncio.sleep(0.2)
+
+    assert await filt.filter({"n": 1}) == {"n": 1}
+
+
+@pytest.mark.asyncio
+async def test_worker_ends_filter_batch_after_flush() -> None:
+    from fapilog.core.concurrency import NonBlockingRingQueue
+    from fapilog.core.worker import LoggerWorker, strict_envelope_mode_enabled
+
+    filt = RateLimitFilter(
+        config=RateLimitFilterConfig(capacity=1, refill_rate_per_sec=100.0)
+    )
+    await filt.start()
+    written: list[dict] = []
+
+    async def _write(entry: dict) -> None:
+        written.append(entry)
+
+    worker = LoggerWorker(
+        queue=NonBlockingRingQueue(capacity=4),
+        batch_max_size=4,
+        batch_timeout_seconds=0.01,
+        sink_write=_write,
+        sink_write_serialized=None,
+        filters_getter=lambda: [filt],
+        enrichers_getter=lambda: [],
+        redactors_getter=lambda: [],
+        metrics=None,
+        serialize_in_flush=False,
+        strict_envelope_mode_provider=strict_envelope_mode_enabled,
+        stop_flag=lambda: False,
+        drained_event=None,
+        flush_event=None,
+        flush_done_event=None,
+        emit_enricher_diagnostics=False,
+        emit_redactor_diagnostics=False,
+        counters={"processed": 0, "dropped": 0},
+    )
+    await worker.flush_batch([{"message": "m"}])
+    assert filt._batch_now is None
+
+    await asyncio.sleep(0.2)
+    assert await filt.filter({"message": "later"}) == {"message": "later"}
+    assert len(written) == 1
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_sketch_admits_only_heavy_hitters() -> None:
+    filt = RateLimitFilter(
+        config=RateLimitFilterConfig(
+            capacity=3,
+            refill_rate_per_sec=0.0,
+            key_field="tenant",
+            max_keys=2,
+            heavy_hitter_sketch=True,
+        )
+    )
+
+    await filt.start()
+    await filt.filter({"tenant": "a"})
+    await filt.filter({"tenant": "b"})
+
+    # Table is full: a one-off key passes without evicting tracked buckets
+    assert await filt.filter({"tenant": "light"}) == {"tenant": "light"}
+    assert _tracked_keys(filt) == {"a", "b"}
+
+    # A key that keeps coming is admitted once it could have drained a bucket
+    results = [await filt.filter({"tenant": "heavy"}) for _ in range(4)]
+    assert "heavy" in _tracked_keys(filt)
+    assert results[-1] is None
@@ -412,3 +412,155 @@ def test_sink_and_enricher_helpers(
     log_path.write_text("{}\n")
     exit_code = cli_main(["verify", str(log_path), "--format", "json"])
     assert exit_code in (0, 1, 2)
+
+
+def _batch_config(tmp_path: Path, **overrides: Any) -> Any:
+    from fapilog_tamper.config import TamperConfig
+
+    return TamperConfig(
+        enabled=True,
+        key_source="env",
+        key_env_var="TAMPER_KEY_ENV",
+        key_id="kid",
+        state_dir=str(tmp_path),
+        **overrides,
+    )
+
+
+@pytest.mark.asyncio
+async def test_enrich_batch_matches_per_event_sealing(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Batch sealing must produce exactly the per-event integrity fields."""
+    monkeypatch.setenv("TAMPER_KEY_ENV", _b64url(b"C" * 32))
+
+    from fapilog_tamper.enricher import IntegrityEnricher
+
+    events = [
+        _fixed_event({"timestamp": f"2025-03-01T00:00:0{i}Z", "n": i}) for i in range(5)
+    ]
+
+    single = IntegrityEnricher(_batch_config(tmp_path / "a"))
+    await single.start()
+    expected = [await single.enrich(dict(e)) for e in events]
+    await single.stop()
+
+    batched = IntegrityEnricher(_batch_config(tmp_path / "b"))
+    await batched.start()
+    first = await batched.enrich_batch([dict(e) for e in events[:2]])
+    rest = await batched.enrich_batch([dict(e) for e in events[2:]])
+    await batched.stop()
+
+    assert first + rest == expected
+
+
+@pytest.mark.asyncio
+async def test_merkle_batch_records_verify_individually(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Merkle mode signs one root per batch yet each record verifies alone."""
+    monkeypatch.setenv("TAMPER_KEY_ENV", _b64url(b"M" * 32))
+
+    from fapilog_tamper.enricher import IntegrityEnricher
+    from fapilog_tamper.verify import Verifier
+
+    enricher = IntegrityEnricher(_batch_config(tmp_path, merkle_batch=True))
+    await enricher.start()
+    events = [
+        _fixed_event({"timestamp": f"2025-03-01T00:00:0{i}Z", "n": i}) for i in range(5)
+    ]
+    sealed = await enricher.enrich_batch([dict(e) for e in events])
+    await enricher.stop()
+
+    records = [{**e, **s} for e, s in zip(events, sealed, strict=True)]
+    assert len({r["integrity"]["mac"] for r in records}) == 1
+    assert [r["integrity"]["merkle_index"] for r in records] == [0, 1, 2, 3, 4]
+
+    verifier = Verifier(keys=None)  # type: ignore[arg-type]
+    for record in records:
+        assert verifier.verify_record(record, b"M" * 32, "HMAC-SHA256") is True
+    assert verifier.verify_chain(records) == []
+
+    tampered = {**records[3], "user": "mallory"}
+    assert verifier.verify_record(tampered, b"M" * 32, "HMAC-SHA256") is False
+    truncated = {
+        **records[3],
+        "integrity": {**records[3]["integrity"], "merkle_path": []},
+    }
+    assert verifier.verify_record(truncated, b"M" * 32, "HMAC-SHA256") is False
+
+
+@pytest.mark.asyncio
+async def test_worker_hands_whole_batch_to_batch_enricher(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """The worker should seal a flush batch with one enrich_batch call."""
+    monkeypatch.setenv("TAMPER_KEY_ENV", _b64url(b"W" * 32))
+
+    from fapilog_tamper.enricher import IntegrityEnricher
+
+    enricher = IntegrityEnricher(_batch_config(tmp_path))
+    await enricher.start()
+    calls: list[int] = []
+    original = enricher.enrich_batch
+
+    async def _spy(events: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        calls.append(len(events))
+        return await original(events)
+
+    enricher.enrich_batch = _spy  # type: ignore[method-assign]
+
+    written: list[dict[str, Any]] = []
+
+    async def _sink(entry: dict[str, Any]) -> None:
+        written.append(entry)
+
+    worker = _make_worker(_sink, enrichers=[enricher])
+    await worker.flush_batch([_fixed_event({"n": i}) for i in range(4)])
+    await enricher.stop()
+
+    assert calls == [4]
+    assert [e["integrity"]["seq"] for e in written] == [1, 2, 3, 4]
+
+
+def _make_worker(sink: Any, *, enrichers: list[Any]) -> Any:
+    from fapilog.core.concurrency import NonBlockingRingQueue
+    from fapilog.core.worker import LoggerWorker
+
+    return LoggerWorker(
+        queue=NonBlockingRingQueue(capacity=16),
+        batch_max_size=16,
+        batch_timeout_seconds=0.01,
+        sink_write=sink,
+        sink_write_serialized=None,
+        filters_getter=lambda: [],
+        enrichers_getter=lambda: enrichers,
+        redactors_getter=lambda: [],
+        processors_getter=lambda: [],
+        metrics=None,
+        serialize_in_flush=False,
+        strict_envelope_mode_provider=lambda: False,
+        stop_flag=lambda: False,
+        drained_event=None,
+        flush_event=None,
+        flush_done_event=None,
+        emit_filter_diagnostics=False,
+        emit_enricher_diagnostics=False,
+        emit_redactor_diagnostics=False,
+        emit_processor_diagnostics=False,
+        counters={"processed": 0, "dropped": 0},
+    )
+
+
+def test_canonicalize_matches_stdlib_float_spelling() -> None:
+    """orjson fast path must not change bytes relative to json.dumps."""
+    import json
+
+    from fapilog_tamper.canonical import canonicalize
+
+    for value in (1e-05, -3e-07, 9.9e-05, 0.1, 1e16, 2**70, "0.0000 text"):
+        event = {"b": value, "a": [value, {"z": value}]}
+        expected = json.dumps(
+            event, sort_keys=True, separators=(",", ":"), ensure_ascii=False
+        ).encode("utf-8")
+        assert canonicalize(event) == expected
@@ -0,0 +1,83 @@
+"""Tests for the shared mmap/gzip JSONL reader."""
+
+from __future__ import annotations
+
+import gzip
+from pathlib import Path
+
+import orjson
+import pytest
+
+from fapilog.core.jsonl import is_compressed, iter_lines, line_ranges
+
+_DATA = b'{"a":1}\n\n{"b":[1,2]}\n{"c":"x"}\n{"torn":'
+
+
+@pytest.fixture(params=["plain", "gzip"])
+def log_file(request: pytest.FixtureRequest, tmp_path: Path) -> Path:
+    if request.param == "plain":
+        path = tmp_path / "app.jsonl"
+        path.write_bytes(_DATA)
+    else:
+        path = tmp_path / "app.jsonl.gz"
+        path.write_bytes(gzip.compress(_DATA))
+    return path
+
+
+def test_lines_and_offsets_match_plain_split(log_file: Path) -> None:
+    lines = [(offset, bytes(line)) for offset, line in iter_lines(log_file)]
+    assert lines == [
+        (0, b'{"a":1}'),
+        (8, b""),
+        (9, b'{"b":[1,2]}'),
+        (21, b'{"c":"x"}'),
+        (31, b'{"torn":'),
+    ]
+    complete = [offset for offset, _ in iter_lines(log_file, partial=False)]
+    assert complete == [0, 8, 9, 21]
+
+
+def test_start_and_stop_select_lines_by_offset(log_file: Path) -> None:
+    lines = [bytes(line) for _, line in iter_lines(log_file, 9, 22)]
+    assert lines == [b'{"b":[1,2]}', b'{"c":"x"}']
+
+
+def test_views_parse_with_orjson(log_file: Path) -> None:
+    records = [
+        orjson.loads(line) for _, line in iter_lines(log_file, partial=False) if line
+    ]
+    assert records == [{"a": 1}, {"b": [1, 2]}, {"c": "x"}]
+
+
+def test_ranges_align_to_lines_and_cover_file(tmp_path: Path) -> None:
+    path = tmp_path / "app.jsonl"
+    path.write_bytes(_DATA)
+
+    ranges = list(line_ranges(path, 10))
+    assert ranges == [(0, 21), (21, 31), (31, len(_DATA))]
+    chunked = [
+        bytes(line)
+        for start, stop in ranges
+        for _, line in iter_lines(path, start, stop)
+    ]
+    assert chunked == [bytes(line) for _, line in iter_lines(path)]
+
+
+def test_compressed_file_is_a_single_range(tmp_path: Path) -> None:
+    path = tmp_path / "app.jsonl.gz"
+    path.write_bytes(gzip.compress(_DATA))
+    assert is_compressed(path)
+    assert list(line_ranges(path, 10)) == [(0, None)]
+
+
+def test_empty_file_and_retained_view(tmp_path: Path) -> None:
+    empty = tmp_path / "empty.jsonl"
+    empty.write_bytes(b"")
+    assert list(iter_lines(empty)) == []
+    assert list(line_ranges(empty, 10)) == []
+
+    path = tmp_path / "app.jsonl"
+    path.write_bytes(_DATA)
+    # Holding a view past the end of iteration must not break closing the map
+    kept = [line for _, line in iter_lines(path)]
+    assert bytes(kept[0]) == b'{"a":1}'
@@ -440,3 +440,223 @@ async def test_vault_provider_auth_and_sign(
     provider_k8s = create_key_provider(cfg_k8s)
     sig2 = await provider_k8s.sign("id", b"vaultdata2")
     assert await provider_k8s.verify("id", b"vaultdata2", sig2)
+
+
+@pytest.mark.asyncio
+async def test_cached_provider_refreshes_ahead_in_background(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Keys are refreshed before expiry without blocking the caller."""
+    import asyncio
+
+    from fapilog_tamper.providers import _CachedProvider
+
+    now = {"value": 1000.0}
+    monkeypatch.setattr(
+        "fapilog_tamper.providers.time", SimpleNamespace(time=lambda: now["value"])
+    )
+    release = asyncio.Event()
+
+    class _SlowSource(_CachedProvider):
+        def __init__(self) -> None:
+            super().__init__(cache_ttl=100)
+            self.fetches = 0
+
+        async def _fetch_key(self, key_id: str) -> bytes | None:
+            self.fetches += 1
+            if self.fetches > 1:
+                await release.wait()
+            return bytes([self.fetches]) * 32
+
+    provider = _SlowSource()
+    first, same = await asyncio.gather(
+        provider._get_cached("k"), provider._get_cached("k")
+    )
+    assert first == same == b"\x01" * 32
+    assert provider.fetches == 1  # concurrent cold lookups share one fetch
+
+    # Refresh point is jittered into 75-90% of the TTL
+    assert 1075.0 <= provider._refresh_at <= 1090.0
+
+    now["value"] += 91
+    assert await provider._get_cached("k") == first
+    await asyncio.sleep(0)
+    assert provider.fetches == 2
+
+    # Past the TTL the old key is still served while the refresh is in flight
+    now["value"] += 20
+    assert await provider._get_cached("k") == first
+    assert provider.fetches == 2
+
+    release.set()
+    await provider._refresh_task
+    assert await provider._get_cached("k") == b"\x02" * 32
+
+
+@pytest.mark.asyncio
+async def test_cached_provider_keeps_key_when_refresh_fails(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from fapilog_tamper.providers import _CachedProvider
+
+    now = {"value": 1000.0}
+    monkeypatch.setattr(
+        "fapilog_tamper.providers.time", SimpleNamespace(time=lambda: now["value"])
+    )
+
+    class _FlakySource(_CachedProvider):
+        async def _fetch_key(self, key_id: str) -> bytes | None:
+            if self._cached_key:
+                raise RuntimeError("kms unavailable")
+            return b"K" * 32
+
+    provider = _FlakySource(cache_ttl=100)
+    await provider._get_cached("k")
+    now["value"] += 95
+    assert await provider._get_cached("k") == b"K" * 32
+    await provider._refresh_task
+    assert provider._cached_key == b"K" * 32
+    assert provider._refresh_at == now["value"] + 5.0  # back-off before retrying
+
+
+@pytest.mark.asyncio
+async def test_sign_many_matches_sign(monkeypatch: pytest.MonkeyPatch) -> None:
+    from fapilog_tamper.providers import EnvKeyProvider, GcpKmsProvider
+
+    monkeypatch.setenv("ENV_KMS_KEY", base64.urlsafe_b64encode(b"A" * 32).decode())
+    provider = EnvKeyProvider(env_var="ENV_KMS_KEY")
+    items = [b"one", b"two", b"three"]
+
+    batch = await provider.sign_many("ignored", items)
+    assert batch == [await provider.sign("ignored", item) for item in items]
+
+    client = SimpleNamespace(
+        mac_sign=lambda request: SimpleNamespace(mac=request["data"][::-1])
+    )
+    remote = GcpKmsProvider(key_id="projects/p/keys/k", client=client)
+    assert await remote.sign_many("k", items) == [b"eno", b"owt", b"eerht"]
+
+
+@pytest.mark.asyncio
+async def test_enricher_uses_bulk_signing(tmp_path: Path) -> None:
+    from fapilog_tamper.config import TamperConfig
+    from fapilog_tamper.enricher import IntegrityEnricher
+
+    class _BulkProvider(_FakeProvider):
+        def __init__(self) -> None:
+            super().__init__()
+            self.batches: list[int] = []
+
+        async def sign_many(self, key_id: str, items: list[bytes]) -> list[bytes]:
+            self.batches.append(len(items))
+            return [b"S" * 32 for _ in items]
+
+    provider = _BulkProvider()
+    cfg = TamperConfig(
+        enabled=True,
+        key_source="aws-kms",
+        key_id="alias/test",
+        use_kms_signing=True,
+        state_dir=str(tmp_path),
+    )
+    enricher = IntegrityEnricher(cfg, provider=provider)
+    await enricher.start()
+    await enricher._compute_macs([b"a", b"b", b"c"])
+    await enricher.stop()
+
+    assert provider.batches == [3]
+    assert provider.sign_calls == 0
+
+
+@pytest.mark.asyncio
+async def test_sign_many_bounds_remote_calls_in_flight() -> None:
+    import asyncio
+
+    from fapilog_tamper.providers import _CachedProvider
+
+    class _SlowRemote(_CachedProvider):
+        def __init__(self) -> None:
+            super().__init__(cache_ttl=300, sign_concurrency=3)
+            self.active = 0
+            self.peak = 0
+
+        async def sign(self, key_id: str, data: bytes) -> bytes:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            await asyncio.sleep(0.01)
+            self.active -= 1
+            return data.upper()
+
+    provider = _SlowRemote()
+    items = [f"item-{i}".encode() for i in range(10)]
+    signed = await provider.sign_many("k", items)
+
+    assert signed == [item.upper() for item in items]
+    assert provider.peak == 3
+
+
+def test_factory_passes_sign_concurrency(monkeypatch: pytest.MonkeyPatch) -> None:
+    from fapilog_tamper.config import TamperConfig, coerce_tamper_config
+    from fapilog_tamper.providers import create_key_provider
+
+    fake_gcp_mod = SimpleNamespace(KeyManagementServiceClient=SimpleNamespace)
+    monkeypatch.setitem(sys.modules, "google.cloud.kms_v1", fake_gcp_mod)
+    cfg = coerce_tamper_config(
+        {"key_source": "gcp-kms", "key_id": "k", "kms_sign_concurrency": 2}
+    )
+    assert isinstance(cfg, TamperConfig)
+    provider = create_key_provider(cfg)
+
+    assert provider._sign_slots._value == 2  # type: ignore[attr-defined]
+
+
+@pytest.mark.asyncio
+async def test_owned_provider_refresh_is_cancelled_on_stop(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import asyncio
+
+    from fapilog_tamper.config import TamperConfig
+    from fapilog_tamper.enricher import IntegrityEnricher
+    from fapilog_tamper.sealed_sink import SealedSink
+
+    monkeypatch.setenv(
+        "FAPILOG_TAMPER_KEY", base64.urlsafe_b64encode(b"A" * 32).decode()
+    )
+    cfg = TamperConfig(enabled=True, state_dir=str(tmp_path))
+    blocker = asyncio.Event()
+
+    for owner in (
+        IntegrityEnricher(cfg),
+        SealedSink(_DummySink(tmp_path / "out.jsonl"), cfg),
+    ):
+        await owner.start()
+        provider = owner._provider
+        provider._refresh_task = asyncio.get_running_loop().create_task(blocker.wait())
+        task = provider._refresh_task
+        await owner.stop()
+
+        assert task.cancelled()
+        assert owner._provider is None
+
+
+@pytest.mark.asyncio
+async def test_injected_provider_is_not_closed(tmp_path: Path) -> None:
+    from fapilog_tamper.config import TamperConfig
+    from fapilog_tamper.enricher import IntegrityEnricher
+
+    closed: list[bool] = []
+
+    class _ClosingProvider(_FakeProvider):
+        async def close(self) -> None:
+            closed.append(True)
+
+    provider = _ClosingProvider()
+    enricher = IntegrityEnricher(
+        TamperConfig(enabled=True, state_dir=str(tmp_path)), provider=provider
+    )
+    await enricher.start()
+    await enricher.stop()
+
+    assert closed == []
+    assert enricher._provider is provider
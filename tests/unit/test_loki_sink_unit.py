@@ -108,6 +108,23 @@ async def test_write_serialized_fast_path(fake_client: FakeAsyncClient) -> None:
     assert any("hi" in entry[1] for entry in values)
 
 
+@pytest.mark.asyncio
+async def test_write_serialized_uses_view_level_and_timestamp(
+    fake_client: FakeAsyncClient,
+) -> None:
+    sink = LokiSink(LokiSinkConfig(url="http://loki", batch_size=1))
+    await sink.start()
+    view = loki.SerializedView(
+        data=b'{"msg":"bad"}', level="ERROR", ts_ns=1_700_000_000_123_000_000
+    )
+    await sink.write_serialized(view)
+    await sink.stop()
+
+    stream = fake_client.posts[0]["json"]["streams"][0]
+    assert stream["stream"]["level"] == "ERROR"
+    assert stream["values"] == [("1700000000123000000", '{"msg":"bad"}')]
+
+
 @pytest.mark.asyncio
 async def test_rate_limit_retries(fake_client: FakeAsyncClient, monkeypatch) -> None:
     fake_client.queue_post_response(FakeResponse(429, headers={"Retry-After": "0.01"}))
@@ -143,6 +160,25 @@ async def test_circuit_breaker_blocks_when_open(fake_client: FakeAsyncClient) ->
     assert fake_client.posts == []
 
 
+@pytest.mark.asyncio
+async def test_half_open_probes_before_sending_batch(
+    fake_client: FakeAsyncClient,
+) -> None:
+    sink = LokiSink(LokiSinkConfig(url="http://loki", batch_size=10))
+    await sink.start()
+    breaker = sink._circuit_breaker  # noqa: SLF001
+    assert breaker is not None and breaker.state is CircuitState.CLOSED
+    breaker._state = CircuitState.OPEN  # noqa: SLF001
+    breaker._last_failure_time = 0.0  # noqa: SLF001  # recovery timeout elapsed
+
+    await sink._send_batch([{"message": str(n)} for n in range(3)])  # noqa: SLF001
+    await sink.stop()
+
+    sizes = [len(p["json"]["streams"][0]["values"]) for p in fake_client.posts]
+    assert sizes == [1, 2]
+    assert breaker.state is CircuitState.CLOSED
+
+
 def test_settings_env_aliases(monkeypatch) -> None:
     monkeypatch.setenv("FAPILOG_LOKI__URL", "http://env-loki")
     monkeypatch.setenv("FAPILOG_LOKI__TENANT_ID", "tenant-x")
@@ -4,6 +4,7 @@ import pytest
 
 from fapilog.core.concurrency import NonBlockingRingQueue
 from fapilog.core.events import LogEvent
+from fapilog.core.serialization import SerializedView
 from fapilog.core.worker import LoggerWorker, strict_envelope_mode_enabled
 from fapilog.metrics.metrics import MetricsCollector
 from fapilog.plugins.processors import BaseProcessor
@@ -99,6 +100,52 @@ async def test_worker_applies_processors_in_order() -> None:
     assert serialized[0].endswith(b"12")
 
 
+@pytest.mark.asyncio
+async def test_processed_view_keeps_routing_metadata() -> None:
+    views = []
+
+    async def sink_write_serialized(view):
+        views.append(view)
+
+    async def sink_write(entry):
+        pass
+
+    worker = _make_worker(
+        sink_write_serialized=sink_write_serialized,
+        sink_write=sink_write,
+        processors_getter=lambda: [_AppendProcessor(b"!")],
+    )
+    batch = [LogEvent(level="WARNING", message="hello").to_mapping()]
+    await worker.flush_batch(batch)
+
+    assert views[0].data.endswith(b"!")
+    assert views[0].level == "WARNING"
+    assert isinstance(views[0].ts_ns, int)
+    assert views[0].ts_ns > 0
+
+
+@pytest.mark.asyncio
+async def test_best_effort_fallback_view_keeps_routing_metadata() -> None:
+    async def _noop(_: object) -> None:
+        pass
+
+    worker = _make_worker(
+        sink_write_serialized=_noop, sink_write=_noop, processors_getter=lambda: []
+    )
+    # No message, so serialize_envelope() rejects it and the fallback runs
+    entry = {"level": "ERROR", "timestamp": 1.5, "logger": "payments"}
+
+    view, drop = await worker._try_serialize(entry)
+
+    assert drop is False
+    assert isinstance(view, SerializedView)
+    assert (view.level, view.ts_ns, view.routing_key) == (
+        "ERROR",
+        1_500_000_000,
+        "payments",
+    )
+
+
 @pytest.mark.asyncio
 async def test_worker_contains_processor_errors_and_records_metrics(
     monkeypatch,
@@ -255,18 +255,128 @@ async def test_http_client_pool_cleanup_calls_aclose(monkeypatch):
     monkeypatch.setattr(res.httpx, "AsyncClient", FakeClient)
 
     pool = res.HttpClientPool(max_size=2, acquire_timeout_seconds=0.1)
-    # Create two distinct clients by holding the first while acquiring the
-    # second
+    # Concurrent acquisitions share one client
     cm1 = pool.acquire()
-    await cm1.__aenter__()
+    first = await cm1.__aenter__()
     cm2 = pool.acquire()
-    await cm2.__aenter__()
+    second = await cm2.__aenter__()
+    assert first is second
     # Release both
     await cm2.__aexit__(None, None, None)
     await cm1.__aexit__(None, None, None)
 
     await pool.cleanup()
-    assert closed["count"] >= 2
+    assert closed["count"] == 1
+
+
+class _RecordingClient:
+    """Stand-in for httpx.AsyncClient capturing options and HEAD requests."""
+
+    instances: list["_RecordingClient"] = []
+
+    def __init__(self, **kwargs: object) -> None:
+        if kwargs.get("http2"):
+            raise ImportError("h2 is not installed")
+        self.kwargs = kwargs
+        self.heads: list[str] = []
+        _RecordingClient.instances.append(self)
+
+    async def head(self, url: str) -> None:
+        self.heads.append(url)
+        if len(self.heads) > 1:
+            raise OSError("connection refused")
+
+    async def aclose(self) -> None:
+        pass
+
+
+@pytest.mark.asyncio
+async def test_http_client_pool_limits_in_flight_and_reports_waits(monkeypatch):
+    import fapilog.core.resources as res
+
+    monkeypatch.setattr(res.httpx, "AsyncClient", _RecordingClient)
+    pool = res.HttpClientPool(max_size=1, acquire_timeout_seconds=0.05)
+
+    async def hold() -> None:
+        async with pool.acquire():
+            await asyncio.sleep(0.02)
+
+    await asyncio.gather(hold(), hold())
+    stats = await pool.stats()
+    assert (stats.created, stats.acquires, stats.in_use, stats.idle) == (1, 2, 0, 1)
+    assert stats.max_acquire_wait_seconds >= 0.01
+    assert stats.acquire_wait_seconds >= stats.max_acquire_wait_seconds
+
+    async with pool.acquire():
+        with pytest.raises(BackpressureError):
+            await pool.acquire_nowait()
+        with pytest.raises(BackpressureError):
+            async with pool.acquire():
+                pass
+    assert (await pool.stats()).timeouts == 1
+    await pool.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_http_client_pool_limits_prewarm_and_http2_fallback(monkeypatch):
+    import fapilog.core.resources as res
+
+    monkeypatch.setattr(res.httpx, "AsyncClient", _RecordingClient)
+    _RecordingClient.instances.clear()
+    pool = res.HttpClientPool(
+        max_size=4,
+        http2=True,
+        keepalive_expiry=30.0,
+        warm_url="https://logs.example/ingest",
+        prewarm_connections=8,
+    )
+    # Warm-up failures are swallowed
+    await pool.start()
+
+    (client,) = _RecordingClient.instances
+    limits = client.kwargs["limits"]
+    assert (limits.max_connections, limits.keepalive_expiry) == (4, 30.0)
+    # Without h2 the pool falls back to HTTP/1.1; warming is capped by
+    # the connection limit
+    assert "http2" not in client.kwargs
+    assert client.heads == ["https://logs.example/ingest"] * 4
+    await pool.stop()
+
+
+@pytest.mark.asyncio
+async def test_http_client_pool_recreates_client_after_cleanup(monkeypatch):
+    import fapilog.core.resources as res
+
+    closed: list[_RecordingClient] = []
+
+    class _ClosingClient(_RecordingClient):
+        async def aclose(self) -> None:
+            closed.append(self)
+
+    monkeypatch.setattr(res.httpx, "AsyncClient", _ClosingClient)
+    _RecordingClient.instances.clear()
+    pool = res.HttpClientPool(max_size=1, acquire_timeout_seconds=0.5)
+
+    async def hold_then_cleanup() -> None:
+        async with pool.acquire():
+            await asyncio.sleep(0.02)
+            await pool.cleanup()
+
+    async def wait_for_slot() -> None:
+        await asyncio.sleep(0.01)
+        async with pool.acquire():
+            pass
+
+    # A waiter woken after cleanup() gets a fresh client, as the base pool
+    # recreates resources lazily
+    await asyncio.gather(hold_then_cleanup(), wait_for_slot())
+    first, second = _RecordingClient.instances
+    assert closed == [first]
+
+    # ...and the next cleanup closes that client too
+    await pool.cleanup()
+    assert closed == [first, second]
+    assert (await pool.stats()).created == 2
 
 
 @pytest.mark.asyncio
@@ -0,0 +1,157 @@
+"""
+Tests for RotatingFileSink background rotation work.
+
+Scope:
+- Writes do not wait for post-rotate work
+- Bounded compression concurrency with ordered hooks
+- Retention from the in-memory index without rescans
+- Index seeded from files left by a previous run
+"""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+from pathlib import Path
+
+import pytest
+
+from fapilog.plugins.sinks.rotating_file import (
+    RotatedFile,
+    RotatingFileSink,
+    RotatingFileSinkConfig,
+)
+
+
+def _sink(tmp_path: Path, **kwargs: object) -> RotatingFileSink:
+    cfg = RotatingFileSinkConfig(directory=tmp_path, filename_prefix="bg", **kwargs)  # type: ignore[arg-type]
+    return RotatingFileSink(cfg)
+
+
+@pytest.mark.asyncio
+async def test_write_does_not_wait_for_post_rotate_work(tmp_path: Path) -> None:
+    sink = _sink(tmp_path, max_bytes=60)
+    release = asyncio.Event()
+    rotated: list[RotatedFile] = []
+
+    async def _post(info: RotatedFile) -> None:
+        await release.wait()
+        rotated.append(info)
+
+    sink.on_post_rotate = _post
+    await sink.start()
+    await sink.write({"message": "x" * 20})
+    # Crosses max_bytes; must return while the hook is still blocked
+    await asyncio.wait_for(sink.write({"message": "y" * 20}), timeout=1.0)
+    assert rotated == []
+
+    release.set()
+    await sink.stop()
+    assert len(rotated) == 1
+    assert rotated[0].size > 0
+
+
+@pytest.mark.asyncio
+async def test_compression_is_bounded_and_hooks_stay_ordered(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    sink = _sink(tmp_path, max_bytes=60, compress_rotated=True, rotation_concurrency=2)
+    original = sink._compress_file
+    active = 0
+    peak = 0
+
+    async def _slow_compress(path: Path) -> RotatedFile | None:
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        try:
+            await asyncio.sleep(0.02)
+            return await original(path)
+        finally:
+            active -= 1
+
+    monkeypatch.setattr(sink, "_compress_file", _slow_compress)
+    sources: list[Path] = []
+    closed: list[Path] = []
+
+    async def _pre(path: Path) -> None:
+        closed.append(path)
+
+    async def _post(info: RotatedFile) -> None:
+        sources.append(info.source)
+
+    sink.on_pre_rotate = _pre
+    sink.on_post_rotate = _post
+    await sink.start()
+    for i in range(6):
+        await sink.write({"i": i, "message": "x" * 30})
+    await sink.stop()
+
+    assert len(closed) == 5
+    assert sources == closed
+    assert peak == 2
+    gz_files = sorted(tmp_path.glob("bg-*.jsonl.gz"))
+    assert len(gz_files) == 5
+    with gzip.open(gz_files[0], "rb") as f:
+        assert f.read().startswith(b"{")
+
+
+@pytest.mark.asyncio
+async def test_retention_uses_index_without_rescanning(tmp_path: Path) -> None:
+    sink = _sink(tmp_path, max_bytes=60, max_files=2)
+    await sink.start()
+    scans = 0
+    listed = sink._list_rotated_files
+
+    def _counting_list() -> list[Path]:
+        nonlocal scans
+        scans += 1
+        return listed()
+
+    sink._list_rotated_files = _counting_list  # type: ignore[method-assign]
+    for i in range(8):
+        await sink.write({"i": i, "message": "x" * 30})
+        await sink.rotate()
+    active = sink.active_path
+    await sink.stop()
+
+    assert scans == 0
+    remaining = sorted(p for p in tmp_path.iterdir() if p.is_file())
+    # The final active file is indexed on stop, so two files are kept
+    assert len(remaining) == 2
+    assert active in remaining
+
+
+@pytest.mark.asyncio
+async def test_index_seeded_from_previous_run(tmp_path: Path) -> None:
+    stale = [tmp_path / f"bg-20200101-00000{i}.jsonl" for i in range(3)]
+    for path in stale:
+        path.write_text('{"old": true}\n')
+    unrelated = tmp_path / "other.txt"
+    unrelated.write_text("keep")
+
+    sink = _sink(tmp_path, max_files=1)
+    await sink.start()
+    await sink.write({"message": "new"})
+    await sink.rotate()
+    await sink.stop()
+
+    assert not any(path.exists() for path in stale)
+    assert unrelated.exists()
+    assert len(list(tmp_path.glob("bg-*.jsonl"))) == 1
+
+
+@pytest.mark.asyncio
+async def test_max_total_bytes_counts_compressed_size(tmp_path: Path) -> None:
+    sink = _sink(
+        tmp_path, max_bytes=4096, compress_rotated=True, max_total_bytes=10_000
+    )
+    await sink.start()
+    for _ in range(5):
+        for _ in range(20):
+            await sink.write({"message": "a" * 150})
+        await sink.rotate()
+    await sink.stop()
+
+    # Each ~3 KB file compresses to well under 1 KB, so none are dropped
+    assert len(list(tmp_path.glob("bg-*.jsonl.gz"))) == 5
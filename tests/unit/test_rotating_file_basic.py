@@ -292,3 +292,60 @@ async def test_interval_rotation_negative_interval(tmp_path: Path) -> None:
         assert sink._next_rotation_deadline is None
     finally:
         await sink.stop()
+
+
+@pytest.mark.asyncio
+async def test_rotation_hooks_receive_paths_and_single_pass_digest(
+    tmp_path: Path,
+) -> None:
+    import gzip
+    import hashlib
+
+    cfg = RotatingFileSinkConfig(
+        directory=tmp_path, filename_prefix="hooked", compress_rotated=True
+    )
+    sink = RotatingFileSink(cfg)
+    seen: list[tuple[str, object]] = []
+
+    async def _pre(path: Path) -> None:
+        # Data is flushed and the file still exists uncompressed
+        seen.append(("pre", path.read_bytes()))
+
+    async def _post(rotated: object) -> None:
+        seen.append(("post", rotated))
+
+    sink.on_pre_rotate = _pre
+    sink.on_post_rotate = _post
+    await sink.start()
+    first = sink.active_path
+    await sink.write({"i": 1})
+    await sink.rotate()
+    await sink.stop()
+
+    (stage, content), (post_stage, rotated) = seen
+    assert (stage, post_stage) == ("pre", "post")
+    assert content == b'{"i":1}\n'
+    assert rotated.source == first
+    assert rotated.path == first.with_suffix(".jsonl.gz")
+    assert gzip.decompress(rotated.path.read_bytes()) == content
+    assert rotated.size == len(content)
+    assert rotated.sha256 == hashlib.sha256(content).hexdigest()
+
+
+@pytest.mark.asyncio
+async def test_failing_rotation_hook_does_not_block_rotation(tmp_path: Path) -> None:
+    sink = RotatingFileSink(RotatingFileSinkConfig(directory=tmp_path))
+
+    async def _boom(_: object) -> None:
+        raise RuntimeError("hook failed")
+
+    sink.on_pre_rotate = _boom
+    sink.on_post_rotate = _boom
+    await sink.start()
+    await sink.write({"i": 1})
+    await sink.rotate()
+    await sink.write({"i": 2})
+    await sink.stop()
+
+    files = sorted(p.read_text() for p in tmp_path.glob("*.jsonl"))
+    assert files == ['{"i":1}\n', '{"i":2}\n']
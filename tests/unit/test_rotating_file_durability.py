@@ -0,0 +1,267 @@
+"""
+Tests for RotatingFileSink durability policies.
+
+Scope:
+- none/event/bytes/batch/interval fsync policies
+- Coalescing of concurrent syncs
+- Sync before rotation and close
+- Durability stats for health checks
+- Settings and builder wiring
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from pathlib import Path
+
+import pytest
+
+from fapilog.core.errors import SinkWriteError
+from fapilog.plugins.sinks import rotating_file
+from fapilog.plugins.sinks.rotating_file import (
+    RotatingFileSink,
+    RotatingFileSinkConfig,
+)
+
+
+class _RecordingSync:
+    """Stand-in for fdatasync that records calls and can be slowed down."""
+
+    def __init__(self, delay: float = 0.0, fail: bool = False) -> None:
+        self.calls = 0
+        self.delay = delay
+        self.fail = fail
+
+    def __call__(self, fd: int) -> None:
+        self.calls += 1
+        if self.delay:
+            time.sleep(self.delay)
+        if self.fail:
+            raise OSError(5, "I/O error")
+
+
+@pytest.fixture
+def datasync(monkeypatch: pytest.MonkeyPatch) -> _RecordingSync:
+    recorder = _RecordingSync()
+    monkeypatch.setattr(rotating_file, "_datasync", recorder)
+    return recorder
+
+
+def _sink(tmp_path: Path, **kwargs: object) -> RotatingFileSink:
+    cfg = RotatingFileSinkConfig(directory=tmp_path, filename_prefix="dur", **kwargs)  # type: ignore[arg-type]
+    return RotatingFileSink(cfg)
+
+
+@pytest.mark.asyncio
+async def test_none_policy_never_syncs(
+    tmp_path: Path, datasync: _RecordingSync
+) -> None:
+    sink = _sink(tmp_path)
+    await sink.start()
+    for i in range(5):
+        await sink.write({"i": i})
+    stats = sink.durability_stats()
+    await sink.stop()
+
+    assert datasync.calls == 0
+    assert stats.policy == "none"
+    assert stats.bytes_since_durable > 0
+    assert 0.0 < stats.seconds_since_durable < 60.0
+    assert stats.fsyncs == 0
+
+
+@pytest.mark.asyncio
+async def test_event_policy_syncs_each_write(
+    tmp_path: Path, datasync: _RecordingSync
+) -> None:
+    sink = _sink(tmp_path, durability="event")
+    await sink.start()
+    for i in range(3):
+        await sink.write({"i": i})
+        stats = sink.durability_stats()
+        assert stats.bytes_since_durable == 0
+        assert stats.seconds_since_durable == 0.0
+    await sink.stop()
+
+    assert datasync.calls == 3
+
+
+@pytest.mark.asyncio
+async def test_concurrent_event_writers_share_syncs(
+    tmp_path: Path, datasync: _RecordingSync
+) -> None:
+    datasync.delay = 0.05
+    sink = _sink(tmp_path, durability="event")
+    await sink.start()
+    await asyncio.gather(*(sink.write({"i": i}) for i in range(20)))
+    stats = sink.durability_stats()
+    await sink.stop()
+
+    assert stats.bytes_since_durable == 0
+    # Writers that land while a sync runs are covered by the next one
+    assert datasync.calls < 20
+    assert stats.fsyncs == datasync.calls
+
+
+@pytest.mark.asyncio
+async def test_bytes_policy_syncs_at_threshold(
+    tmp_path: Path, datasync: _RecordingSync
+) -> None:
+    sink = _sink(tmp_path, durability="bytes", fsync_bytes=200)
+    await sink.start()
+    await sink.write({"message": "x" * 50})
+    assert datasync.calls == 0
+    assert sink.durability_stats().bytes_since_durable > 0
+
+    await sink.write({"message": "x" * 200})
+    assert datasync.calls == 1
+    assert sink.durability_stats().bytes_since_durable == 0
+    await sink.stop()
+
+
+@pytest.mark.asyncio
+async def test_batch_policy_syncs_once_per_burst(
+    tmp_path: Path, datasync: _RecordingSync
+) -> None:
+    sink = _sink(tmp_path, durability="batch")
+    await sink.start()
+    await asyncio.gather(*(sink.write({"i": i}) for i in range(10)))
+    await asyncio.sleep(0.05)
+    stats = sink.durability_stats()
+    await sink.stop()
+
+    assert stats.bytes_since_durable == 0
+    assert datasync.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_interval_policy_syncs_in_background(
+    tmp_path: Path, datasync: _RecordingSync
+) -> None:
+    sink = _sink(tmp_path, durability="interval", fsync_interval_ms=20)
+    await sink.start()
+    await sink.write({"message": "hello"})
+    assert sink.durability_stats().bytes_since_durable > 0
+
+    await asyncio.sleep(0.1)
+    stats = sink.durability_stats()
+    await sink.stop()
+
+    assert stats.bytes_since_durable == 0
+    assert datasync.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_stop_syncs_pending_data(
+    tmp_path: Path, datasync: _RecordingSync
+) -> None:
+    sink = _sink(tmp_path, durability="interval", fsync_interval_ms=60_000)
+    await sink.start()
+    await sink.write({"message": "hello"})
+    await sink.stop()
+
+    assert datasync.calls == 1
+    assert sink.durability_stats().bytes_since_durable == 0
+
+
+@pytest.mark.asyncio
+async def test_rotation_syncs_before_pre_rotate_hook(
+    tmp_path: Path, datasync: _RecordingSync
+) -> None:
+    sink = _sink(tmp_path, durability="bytes", fsync_bytes=1024 * 1024)
+    seen: list[int] = []
+
+    async def _pre_rotate(path: Path) -> None:
+        seen.append(sink.durability_stats().bytes_since_durable)
+
+    sink.on_pre_rotate = _pre_rotate
+    await sink.start()
+    await sink.write({"message": "hello"})
+    await sink.rotate()
+    await sink.stop()
+
+    assert seen == [0]
+    assert datasync.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_flush_syncs_under_none_policy(
+    tmp_path: Path, datasync: _RecordingSync
+) -> None:
+    sink = _sink(tmp_path)
+    await sink.start()
+    await sink.write({"message": "hello"})
+    await sink.flush()
+    stats = sink.durability_stats()
+    await sink.stop()
+
+    assert datasync.calls == 1
+    assert stats.bytes_since_durable == 0
+    assert stats.fsyncs == 1
+
+
+@pytest.mark.asyncio
+async def test_event_policy_sync_failure_raises(
+    tmp_path: Path, datasync: _RecordingSync
+) -> None:
+    datasync.fail = True
+    sink = _sink(tmp_path, durability="event")
+    await sink.start()
+    with pytest.raises(SinkWriteError):
+        await sink.write({"message": "hello"})
+    assert sink.durability_stats().bytes_since_durable > 0
+    await sink.stop()
+
+
+def test_unknown_policy_rejected(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="durability"):
+        _sink(tmp_path, durability="sometimes")
+
+
+def test_settings_wire_durability_into_sink_config() -> None:
+    from fapilog.core.config_builders import _sink_configs
+    from fapilog.core.settings import Settings
+
+    settings = Settings(
+        sink_config={
+            "rotating_file": {
+                "directory": "/tmp/logs",
+                "durability": "bytes",
+                "fsync_interval_ms": 250,
+                "fsync_bytes": "2 MB",
+            }
+        }
+    )
+    cfg = _sink_configs(settings)["rotating_file"]["config"]
+
+    assert cfg.durability == "bytes"
+    assert cfg.fsync_interval_ms == 250
+    assert cfg.fsync_bytes == 2 * 1024 * 1024
+
+
+def test_env_file_sink_reads_durability(monkeypatch: pytest.MonkeyPatch) -> None:
+    from fapilog.core.config_builders import _default_env_sink_cfg
+
+    monkeypatch.setenv("FAPILOG_FILE__DIRECTORY", "/tmp/logs")
+    monkeypatch.setenv("FAPILOG_FILE__DURABILITY", "Interval")
+    monkeypatch.setenv("FAPILOG_FILE__FSYNC_INTERVAL_MS", "500")
+    monkeypatch.setenv("FAPILOG_FILE__FSYNC_BYTES", "64 KB")
+    cfg = _default_env_sink_cfg("rotating_file")["config"]
+
+    assert cfg.durability == "interval"
+    assert cfg.fsync_interval_ms == 500
+    assert cfg.fsync_bytes == 64 * 1024
+
+
+def test_builder_add_file_durability() -> None:
+    from fapilog import LoggerBuilder
+
+    builder = LoggerBuilder().add_file(
+        "/tmp/logs", durability="interval", fsync_interval_ms=200, fsync_bytes="1 MB"
+    )
+    config = builder._sinks[-1]["config"]
+
+    assert config["durability"] == "interval"
+    assert config["fsync_interval_ms"] == 200
+    assert config["fsync_bytes"] == "1 MB"
@@ -360,3 +360,282 @@ async def test_defensive_paths_in_helpers(
 
     monkeypatch.setattr("os.fsync", _fsync_fail)
     await sink._fsync_current_file()
+
+
+def _count_syncs(monkeypatch: pytest.MonkeyPatch) -> dict[str, int]:
+    import os
+
+    calls = {"count": 0}
+
+    def _sync(fd: int) -> None:
+        calls["count"] += 1
+
+    monkeypatch.setattr("os.fsync", _sync)
+    if hasattr(os, "fdatasync"):
+        monkeypatch.setattr("os.fdatasync", _sync)
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_write_batch_updates_metadata_and_syncs_once(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A batch is forwarded in order with one fsync covering all of it."""
+    from fapilog_tamper.config import TamperConfig
+    from fapilog_tamper.sealed_sink import SealedSink
+
+    path = tmp_path / "events.jsonl"
+    inner = _DummySink(path)
+    syncs = _count_syncs(monkeypatch)
+    sink = SealedSink(
+        inner,
+        TamperConfig(enabled=True, fsync_on_write=True, state_dir=str(tmp_path)),
+        key=b"K" * 32,
+    )
+    await sink.start()
+
+    batch = [_event(i, f"2025-01-01T00:00:{i:02d}Z", f"h{i}") for i in range(1, 6)]
+    await sink.write_batch(batch)
+
+    assert syncs["count"] == 1
+    assert [e["message"] for e in inner.entries] == [e["message"] for e in batch]
+    await sink.stop()
+    manifest = json.loads(path.with_suffix(path.suffix + ".manifest.json").read_text())
+    assert (manifest["first_seq"], manifest["last_seq"]) == (1, 5)
+    assert manifest["record_count"] == 5
+    assert manifest["first_ts"] == "2025-01-01T00:00:01Z"
+    assert manifest["last_ts"] == "2025-01-01T00:00:05Z"
+
+
+@pytest.mark.asyncio
+async def test_worker_flush_reaches_write_batch(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """The default fan-out hands a worker flush to write_batch in one call."""
+    from fapilog_tamper.config import TamperConfig
+    from fapilog_tamper.sealed_sink import SealedSink
+
+    from fapilog.core.concurrency import NonBlockingRingQueue
+    from fapilog.core.sink_writers import SinkWriterGroup
+    from fapilog.core.worker import LoggerWorker, strict_envelope_mode_enabled
+
+    path = tmp_path / "events.jsonl"
+    inner = _DummySink(path)
+    syncs = _count_syncs(monkeypatch)
+    sink = SealedSink(
+        inner,
+        TamperConfig(enabled=True, fsync_on_write=True, state_dir=str(tmp_path)),
+        key=b"K" * 32,
+    )
+    group = SinkWriterGroup([sink])
+    worker = LoggerWorker(
+        queue=NonBlockingRingQueue(capacity=8),
+        batch_max_size=8,
+        batch_timeout_seconds=0.01,
+        sink_write=group.write,
+        sink_write_serialized=group.write_serialized,
+        enrichers_getter=lambda: [],
+        redactors_getter=lambda: [],
+        metrics=None,
+        serialize_in_flush=False,
+        strict_envelope_mode_provider=strict_envelope_mode_enabled,
+        stop_flag=lambda: False,
+        drained_event=None,
+        flush_event=None,
+        flush_done_event=None,
+        emit_enricher_diagnostics=False,
+        emit_redactor_diagnostics=False,
+        counters={"processed": 0, "dropped": 0},
+    )
+
+    batch = [_event(i, f"2025-01-01T00:00:{i:02d}Z", f"h{i}") for i in range(1, 6)]
+    expected = [e["message"] for e in batch]
+    await worker.flush_batch(batch)
+
+    assert syncs["count"] == 1
+    assert [e["message"] for e in inner.entries] == expected
+    await sink.stop()
+    manifest = json.loads(path.with_suffix(path.suffix + ".manifest.json").read_text())
+    assert (manifest["first_seq"], manifest["last_seq"]) == (1, 5)
+    assert manifest["record_count"] == 5
+
+
+@pytest.mark.asyncio
+async def test_concurrent_writes_share_group_fsync(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Writers arriving together are acknowledged by a shared fsync."""
+    from fapilog_tamper.config import TamperConfig
+    from fapilog_tamper.sealed_sink import SealedSink
+
+    path = tmp_path / "events.jsonl"
+    syncs = _count_syncs(monkeypatch)
+    sink = SealedSink(
+        _DummySink(path),
+        TamperConfig(
+            enabled=True,
+            fsync_on_write=True,
+            fsync_max_delay_ms=5,
+            state_dir=str(tmp_path),
+        ),
+        key=b"K" * 32,
+    )
+    await sink.start()
+
+    await asyncio.gather(
+        *(
+            sink.write(_event(i, f"2025-01-01T00:00:{i:02d}Z", f"h{i}"))
+            for i in range(1, 21)
+        )
+    )
+    assert 1 <= syncs["count"] < 20
+
+    # A write after the group completed still gets its own sync before returning
+    before = syncs["count"]
+    await sink.write(_event(21, "2025-01-01T00:00:21Z", "h21"))
+    assert syncs["count"] == before + 1
+
+
+@pytest.mark.asyncio
+async def test_compress_rotated_is_pushed_to_the_inner_sink(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """The inner sink compresses in its digest pass; no second read runs."""
+    from fapilog_tamper.config import TamperConfig
+    from fapilog_tamper.sealed_sink import SealedSink
+
+    from fapilog.plugins.sinks.rotating_file import (
+        RotatingFileSink,
+        RotatingFileSinkConfig,
+    )
+
+    inner = RotatingFileSink(
+        RotatingFileSinkConfig(directory=tmp_path, filename_prefix="push")
+    )
+    cfg = TamperConfig(
+        enabled=True, state_dir=str(tmp_path / "state"), compress_rotated=True
+    )
+    sink = SealedSink(inner, cfg, key=b"K" * 32)
+    extra_passes: list[str] = []
+
+    async def _no_second_pass(filename: str) -> None:
+        extra_passes.append(filename)
+
+    monkeypatch.setattr(sink, "_compress_file", _no_second_pass)
+    await sink.start()
+    assert inner.compress_rotated is True
+
+    for seq in (1, 2):
+        await sink.write(_event(seq, f"2025-01-01T00:00:0{seq}Z", f"h{seq}"))
+        await sink.rotate()
+    await sink.stop()
+
+    assert extra_passes == []
+    archives = sorted(tmp_path.glob("push-*.jsonl.gz"))
+    assert len(archives) == 2
+    for archive in archives:
+        source = Path(str(archive)[: -len(".gz")])
+        manifest = json.loads(Path(str(source) + ".manifest.json").read_text())
+        assert manifest["record_count"] == 1
+        assert not source.exists()
+
+
+@pytest.mark.asyncio
+async def test_inner_sink_without_compression_setting_warns(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from fapilog_tamper.config import TamperConfig
+    from fapilog_tamper.sealed_sink import SealedSink
+
+    import fapilog.core.diagnostics as diagnostics
+
+    class _HookedSink(_DummySink):
+        on_pre_rotate = None
+        on_post_rotate = None
+
+    warnings: list[tuple[str, str]] = []
+    monkeypatch.setattr(
+        diagnostics,
+        "warn",
+        lambda component, message, **_fields: warnings.append((component, message)),
+    )
+    inner = _HookedSink(tmp_path / "hooked.jsonl")
+    cfg = TamperConfig(
+        enabled=True, state_dir=str(tmp_path / "state"), compress_rotated=True
+    )
+    sink = SealedSink(inner, cfg, key=b"K" * 32)
+    await sink.start()
+    await sink.stop()
+
+    assert inner.on_pre_rotate is None
+    assert sink._follows_rotation is False
+    assert warnings == [
+        (
+            "tamper",
+            "inner sink cannot compress rotated files; sealing without rotation hooks",
+        )
+    ]
+
+
+@pytest.mark.asyncio
+async def test_seals_rotating_file_sink_through_rotation_hooks(
+    tmp_path: Path,
+) -> None:
+    """Each rotated file gets its own manifest, digest and single compression."""
+    import hashlib
+
+    from fapilog_tamper.canonical import b64url_encode
+    from fapilog_tamper.config import TamperConfig
+    from fapilog_tamper.sealed_sink import SealedSink
+
+    from fapilog.plugins.sinks.rotating_file import (
+        RotatingFileSink,
+        RotatingFileSinkConfig,
+    )
+
+    inner = RotatingFileSink(
+        RotatingFileSinkConfig(
+            directory=tmp_path,
+            filename_prefix="sealed",
+            max_bytes=600,
+            compress_rotated=True,
+        )
+    )
+    cfg = TamperConfig(
+        enabled=True, key_id="kid", state_dir=str(tmp_path), rotate_chain=False
+    )
+    sink = SealedSink(inner, cfg, key=b"K" * 32)
+    await sink.start()
+    await sink.write_batch(
+        [
+            _event(seq, f"2025-01-01T00:00:{seq:02d}Z", b64url_encode(b"root%d" % seq))
+            for seq in range(1, 9)
+        ]
+    )
+    await sink.stop()
+
+    sealed = []
+    for archive in tmp_path.glob("*.jsonl.gz"):
+        manifest_path = Path(str(archive)[: -len(".gz")] + ".manifest.json")
+        manifest = json.loads(manifest_path.read_text())
+        sealed.append((manifest["first_seq"], manifest, archive))
+    assert sealed
+    sealed_seqs: list[int] = []
+    previous_root = None
+    for _, manifest, archive in sorted(sealed, key=lambda item: item[0]):
+        content = gzip.decompress(archive.read_bytes())
+        records = [json.loads(line) for line in content.splitlines()]
+        assert manifest["record_count"] == len(records)
+        assert manifest["first_seq"] == records[0]["integrity"]["seq"]
+        assert manifest["last_seq"] == records[-1]["integrity"]["seq"]
+        assert manifest["content_sha256"] == hashlib.sha256(content).hexdigest()
+        assert manifest.get("continues_from") == previous_root
+        previous_root = manifest["root_chain_hash"]
+        sealed_seqs.extend(r["integrity"]["seq"] for r in records)
+
+    # The active file at stop is sealed too, and the chain continues across files
+    (active,) = tmp_path.glob("*.jsonl")
+    last = json.loads(Path(str(active) + ".manifest.json").read_text())
+    assert last["continues_from"] == previous_root
+    assert sealed_seqs + [last["first_seq"]] == list(range(1, last["first_seq"] + 1))
+    assert last["last_seq"] == 8
@@ -11,6 +11,7 @@ from fapilog.core.serialization import (
     SerializedView,
     convert_json_bytes_to_jsonl,
     serialize_custom_fapilog_v1,
+    serialize_envelope,
     serialize_mapping_to_json_bytes,
     serialize_protobuf_like,
 )
@@ -110,3 +111,31 @@ def test_serialize_custom_fapilog_v1_length_prefixed() -> None:
     length = int.from_bytes(data[:4], byteorder="big", signed=False)
     assert length == len(json_view.data)
     assert data[4:] == json_view.data
+
+
+def test_serialize_envelope_carries_routing_metadata() -> None:
+    view = serialize_envelope(
+        {
+            "timestamp": "2024-05-01T12:30:45.123Z",
+            "level": "ERROR",
+            "message": "boom",
+            "logger": "payments",
+        }
+    )
+    assert view.level == "ERROR"
+    assert view.ts_ns == 1714566645123000000
+    assert view.routing_key == "payments"
+    assert view.nbytes == len(view.data)
+    assert json.loads(view.data)["log"]["level"] == "ERROR"
+
+
+def test_serialize_envelope_numeric_timestamp_and_missing_logger() -> None:
+    view = serialize_envelope({"timestamp": 1.5, "level": "INFO", "message": "m"})
+    assert view.ts_ns == 1_500_000_000
+    assert view.routing_key is None
+
+
+def test_serialized_view_metadata_defaults_to_unknown() -> None:
+    view = SerializedView(data=b"{}")
+    assert (view.level, view.ts_ns, view.routing_key) == (None, None, None)
+    assert not hasattr(view, "__dict__")
@@ -580,3 +580,24 @@ class TestApplyEnvAliasesMultipleFields:
         assert model.name == "multi-test"
         assert model.count == 100
         assert model.enabled is True
+
+
+def test_pipelining_env_aliases_reach_sink_configs(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("FAPILOG_LOKI__PIPELINED", "true")
+    monkeypatch.setenv("FAPILOG_LOKI__MAX_IN_FLIGHT_BATCHES", "6")
+    monkeypatch.setenv("FAPILOG_CLOUDWATCH__PIPELINED", "true")
+    monkeypatch.setenv("FAPILOG_POSTGRES__MAX_IN_FLIGHT_BATCHES", "2")
+
+    sinks = Settings().sink_config
+
+    assert (sinks.loki.pipelined, sinks.loki.max_in_flight_batches) == (True, 6)
+    assert (sinks.cloudwatch.pipelined, sinks.cloudwatch.max_in_flight_batches) == (
+        True,
+        4,
+    )
+    assert (sinks.postgres.pipelined, sinks.postgres.max_in_flight_batches) == (
+        False,
+        2,
+    )
@@ -0,0 +1,78 @@
+"""Tests for byte-budgeted batching and sizes carried to ``_send_batch``."""
+
+from __future__ import annotations
+
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from fapilog.core.serialization import SerializedView
+from fapilog.plugins.sinks._batching import BatchingMixin, SizedBatch
+from fapilog.plugins.sinks.contrib.cloudwatch import CloudWatchSink
+
+
+class RecordingSink(BatchingMixin):
+    """Batching sink recording each batch and its carried size."""
+
+    name = "recording"
+
+    def __init__(self, *, batch_size: int = 100, max_batch_bytes: int | None) -> None:
+        self.sent: list[tuple[list[int], int]] = []
+        self._init_batching(batch_size, 5.0, max_batch_bytes=max_batch_bytes)
+
+    async def _send_batch(self, batch: list[dict[str, Any]]) -> None:
+        assert isinstance(batch, SizedBatch)
+        self.sent.append(([e["n"] for e in batch], batch.nbytes))
+
+
+@pytest.mark.asyncio
+async def test_batches_pack_up_to_the_byte_budget() -> None:
+    sink = RecordingSink(max_batch_bytes=100)
+    for n, size in enumerate([40, 40, 30, 60, 40]):
+        await sink._enqueue_for_batch({"n": n}, size)
+    await sink._flush_batch()
+
+    # 40+40+30 would overflow, so 30 starts a new batch; 30+60+40 likewise.
+    # Reaching the budget exactly flushes at once.
+    assert sink.sent == [([0, 1], 80), ([2, 3], 90), ([4], 40)]
+
+
+@pytest.mark.asyncio
+async def test_oversized_entry_goes_alone_and_count_still_applies() -> None:
+    sink = RecordingSink(batch_size=2, max_batch_bytes=100)
+    await sink._enqueue_for_batch({"n": 0}, 10)
+    await sink._enqueue_for_batch({"n": 1}, 500)
+    await sink._enqueue_for_batch({"n": 2}, 10)
+    await sink._enqueue_for_batch({"n": 3}, 10)
+    assert sink.sent == [([0], 10), ([1], 500), ([2, 3], 20)]
+
+
+@pytest.mark.asyncio
+async def test_unsized_entries_are_measured_only_with_a_budget() -> None:
+    measured = RecordingSink(max_batch_bytes=1000)
+    await measured._enqueue_for_batch({"n": 1})
+    await measured._flush_batch()
+    assert measured.sent == [([1], len(b'{"n":1}'))]
+
+    unmeasured = RecordingSink(max_batch_bytes=None)
+    await unmeasured._enqueue_for_batch({"n": 1})
+    await unmeasured._flush_batch()
+    assert unmeasured.sent == [([1], 0)]
+
+
+@pytest.mark.asyncio
+async def test_cloudwatch_packs_by_bytes_and_sends_in_one_call() -> None:
+    sink = CloudWatchSink(batch_size=1000, max_batch_bytes=64)
+    client = MagicMock()
+    client.put_log_events.return_value = {}
+    sink._client = client
+    sink._log_stream_name = "stream"
+
+    payload = b'{"message":"' + b"x" * 16 + b'"}'  # 30 bytes
+    for _ in range(3):
+        await sink.write_serialized(SerializedView(data=payload))
+    await sink._flush_batch()
+
+    calls = client.put_log_events.call_args_list
+    assert [len(c.kwargs["logEvents"]) for c in calls] == [2, 1]
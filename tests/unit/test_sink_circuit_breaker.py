@@ -189,6 +189,110 @@ class TestSinkCircuitBreaker:
         assert not breaker.should_allow()
 
 
+class TestBatchOutcomes:
+    """Batch-level recording, failure rate window and sampled probes."""
+
+    def test_partial_batch_resets_consecutive_count(self):
+        from fapilog.core.circuit_breaker import (
+            SinkCircuitBreaker,
+            SinkCircuitBreakerConfig,
+        )
+
+        breaker = SinkCircuitBreaker(
+            "test_sink", SinkCircuitBreakerConfig(failure_threshold=5)
+        )
+        breaker.record_batch(0, 4)
+        breaker.record_batch(6, 3)  # sink is taking events
+        assert breaker._failure_count == 3
+        breaker.record_batch(0, 2)
+        assert breaker.state == CircuitState.OPEN
+
+    def test_failure_rate_holds_state_through_partial_outage(self):
+        from fapilog.core.circuit_breaker import (
+            SinkCircuitBreaker,
+            SinkCircuitBreakerConfig,
+        )
+
+        config = SinkCircuitBreakerConfig(
+            failure_threshold=3,
+            failure_rate_threshold=0.5,
+            minimum_events=10,
+        )
+        breaker = SinkCircuitBreaker("test_sink", config)
+        transitions: list[CircuitState] = []
+        breaker.on_state_change = lambda _name, state: transitions.append(state)
+
+        # 30% of single writes fail, in runs longer than failure_threshold
+        for _ in range(10):
+            for _ in range(7):
+                breaker.record_success()
+            for _ in range(3):
+                breaker.record_failure()
+        assert transitions == []
+
+        breaker.record_batch(10, 100)
+        assert transitions == [CircuitState.OPEN]
+
+    def test_consecutive_threshold_applies_below_minimum_events(self):
+        from fapilog.core.circuit_breaker import (
+            SinkCircuitBreaker,
+            SinkCircuitBreakerConfig,
+        )
+
+        config = SinkCircuitBreakerConfig(
+            failure_threshold=3, failure_rate_threshold=0.9, minimum_events=100
+        )
+        breaker = SinkCircuitBreaker("test_sink", config)
+        breaker.record_batch(0, 3)
+        assert breaker.state == CircuitState.OPEN
+
+    def test_window_expires_old_buckets(self):
+        from fapilog.core.circuit_breaker import (
+            SinkCircuitBreaker,
+            SinkCircuitBreakerConfig,
+        )
+
+        config = SinkCircuitBreakerConfig(
+            failure_threshold=1000,
+            failure_rate_threshold=0.5,
+            window_seconds=10.0,
+            window_buckets=10,
+            minimum_events=10,
+        )
+        breaker = SinkCircuitBreaker("test_sink", config)
+        with patch("fapilog.core.circuit_breaker.time.monotonic") as clock:
+            clock.return_value = 1000.0
+            breaker.record_batch(0, 9)  # below minimum_events
+            clock.return_value = 1011.0  # the failures have aged out
+            breaker.record_batch(10, 1)
+            assert breaker.state == CircuitState.CLOSED
+
+    def test_half_open_admits_probe_sample(self):
+        from fapilog.core.circuit_breaker import (
+            SinkCircuitBreaker,
+            SinkCircuitBreakerConfig,
+        )
+
+        config = SinkCircuitBreakerConfig(
+            failure_threshold=1,
+            recovery_timeout_seconds=0.0,
+            half_open_probe_size=5,
+        )
+        breaker = SinkCircuitBreaker("test_sink", config)
+        assert breaker.admit(100) == 100
+        breaker.record_failure()
+
+        assert breaker.admit(100) == 5
+        assert breaker.state == CircuitState.HALF_OPEN
+        assert breaker.admit(100) == 0  # one probe at a time
+
+        breaker.record_batch(4, 1)  # any failure reopens
+        assert breaker.state == CircuitState.OPEN
+        assert breaker.admit(3) == 3
+        breaker.record_batch(3, 0)
+        assert breaker.state == CircuitState.CLOSED
+
+
 # -----------------------------------------------------------------------------
 # Tests for Parallel Fanout Writer
 # -----------------------------------------------------------------------------
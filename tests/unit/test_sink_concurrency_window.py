@@ -0,0 +1,157 @@
+"""Tests for AIMD in-flight windows and their BatchingMixin/HttpSink wiring."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import httpx
+import pytest
+
+from fapilog.core.adaptive import AimdWindow, ConcurrencyLimiter
+from fapilog.metrics.metrics import MetricsCollector
+from fapilog.plugins.sinks._http import congestion_result
+from fapilog.plugins.sinks.http_client import HttpSink, HttpSinkConfig
+from fapilog.plugins.sinks.webhook import WebhookSink, WebhookSinkConfig
+
+
+def _fill(window: AimdWindow, count: int, latency_ms: float = 10.0) -> None:
+    for _ in range(count):
+        window.record(latency_ms, congested=False)
+
+
+def test_window_grows_by_one_per_window_of_successes() -> None:
+    window = AimdWindow(min_window=1, max_window=4)
+    sizes = []
+    for _ in range(4):
+        _fill(window, window.size)
+        sizes.append(window.size)
+    assert sizes == [2, 3, 4, 4]
+
+
+def test_congestion_halves_once_per_window() -> None:
+    window = AimdWindow(min_window=1, max_window=8)
+    for _ in range(7):
+        _fill(window, window.size)
+    assert window.size == 8
+
+    assert window.record(10.0, congested=True) is True
+    assert window.size == 4
+    # Batches sent under the old window report late; they must not cut again
+    assert window.record(10.0, congested=True) is False
+    assert window.size == 4
+
+
+def test_latency_over_target_shrinks_window() -> None:
+    window = AimdWindow(min_window=1, max_window=8, target_latency_ms=100.0)
+    for _ in range(3):
+        _fill(window, window.size)
+    assert window.size == 4
+    _fill(window, window.size, latency_ms=400.0)
+    assert window.size == 2
+    assert window.p95_latency_ms() is None  # samples reset after a cut
+
+
+def test_growth_can_be_held_and_fixed_window_never_moves() -> None:
+    held = AimdWindow(min_window=1, max_window=4, growth_enabled=False)
+    _fill(held, 16)
+    assert held.size == 1
+
+    fixed = AimdWindow(min_window=3, max_window=3)
+    fixed.record(10.0, congested=True)
+    assert fixed.size == 3
+
+
+@pytest.mark.asyncio
+async def test_limiter_caps_concurrency_at_window_size() -> None:
+    limiter = ConcurrencyLimiter(AimdWindow(min_window=2, max_window=2))
+    peak = 0
+
+    async def task() -> None:
+        nonlocal peak
+        await limiter.acquire()
+        peak = max(peak, limiter.in_flight)
+        await asyncio.sleep(0.005)
+        limiter.release(5.0)
+
+    await asyncio.gather(*(task() for _ in range(6)))
+    assert peak == 2
+    assert limiter.in_flight == 0
+
+
+class _StatusPool:
+    """Stub pool answering each POST with the next status code."""
+
+    def __init__(self, statuses: list[int]) -> None:
+        self._statuses = statuses
+
+    def acquire(self) -> _StatusPool:
+        return self
+
+    async def __aenter__(self) -> _StatusPool:
+        return self
+
+    async def __aexit__(self, *exc: Any) -> bool:
+        return False
+
+    async def post(self, url: str, **_: Any) -> httpx.Response:
+        status = self._statuses.pop(0) if self._statuses else 200
+        return httpx.Response(status, request=httpx.Request("POST", url))
+
+
+@pytest.mark.asyncio
+async def test_http_sink_window_follows_delivery_outcomes() -> None:
+    metrics = MetricsCollector(enabled=True)
+    sink = HttpSink(
+        HttpSinkConfig(
+            endpoint="http://example.com",
+            max_in_flight_batches=4,
+            adaptive_concurrency=True,
+        ),
+        metrics=metrics,
+        pool=_StatusPool([200, 200, 200, 400, 200, 429]),  # type: ignore[arg-type]
+    )
+    window = sink.concurrency_window
+    assert window is not None and window.size == 1
+
+    for n in range(3):
+        await sink.write({"n": n})
+    assert window.size == 3
+
+    await sink.write({"n": 3})  # other client errors are not congestion
+    await sink.write({"n": 4})
+    assert window.size == 3
+
+    await sink.write({"n": 5})  # 429 signals congestion
+    assert window.size == 1
+    registry = metrics.registry
+    assert (
+        registry is not None
+        and registry.get_sample_value(
+            "fapilog_sink_concurrency_window", {"sink": "http"}
+        )
+        == 1.0
+    )
+
+
+def test_http_sink_window_is_fixed_unless_adaptive() -> None:
+    sink = HttpSink(HttpSinkConfig(endpoint="http://example.com"))
+    window = sink.concurrency_window
+    assert window is not None and (window.min_window, window.max_window) == (4, 4)
+
+
+def test_webhook_sink_shares_http_sink_window_wiring() -> None:
+    options = {"max_in_flight_batches": 3, "adaptive_concurrency": True}
+    http = HttpSink(HttpSinkConfig(endpoint="http://example.com", **options))
+    hook = WebhookSink(WebhookSinkConfig(endpoint="http://example.com", **options))
+    windows = [sink.concurrency_window for sink in (http, hook)]
+    assert [(w.min_window, w.max_window) for w in windows if w] == [(1, 3), (1, 3)]
+
+
+def test_only_rate_limits_and_server_errors_signal_congestion() -> None:
+    assert [congestion_result(code) for code in (400, 429, 500, 503)] == [
+        None,
+        False,
+        False,
+        False,
+    ]
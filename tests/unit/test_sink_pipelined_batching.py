@@ -0,0 +1,133 @@
+"""Tests for pipelined BatchingMixin sends and the partial-batch timer."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any
+
+import pytest
+
+from fapilog.plugins.sinks._batching import BatchingMixin
+from fapilog.plugins.sinks.contrib.loki import LokiSink
+
+
+class SlowSink(BatchingMixin):
+    """Batching sink whose sends take ``delay`` seconds."""
+
+    name = "slow"
+
+    def __init__(
+        self,
+        *,
+        batch_size: int = 2,
+        batch_timeout_seconds: float = 5.0,
+        pipeline_depth: int = 0,
+        delay: float = 0.05,
+    ) -> None:
+        self.delay = delay
+        self.sent: list[list[int]] = []
+        self.active = 0
+        self.peak = 0
+        self._init_batching(
+            batch_size, batch_timeout_seconds, pipeline_depth=pipeline_depth
+        )
+
+    async def write(self, entry: dict[str, Any]) -> None:
+        await self._enqueue_for_batch(entry)
+
+    async def _send_batch(self, batch: list[dict[str, Any]]) -> None:
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(self.delay)
+        self.active -= 1
+        self.sent.append([e["n"] for e in batch])
+
+
+@pytest.mark.asyncio
+async def test_inline_by_default_waits_for_the_send() -> None:
+    sink = SlowSink(delay=0.01)
+    await sink._start_batching()
+    await sink.write({"n": 0})
+    await sink.write({"n": 1})
+    assert sink.sent == [[0, 1]]
+    await sink._stop_batching()
+
+
+@pytest.mark.asyncio
+async def test_pipelined_writes_overlap_sends_up_to_depth() -> None:
+    sink = SlowSink(pipeline_depth=2)
+    await sink._start_batching()
+
+    started = time.perf_counter()
+    for n in range(4):
+        await sink.write({"n": n})
+    # Both batches were handed off without waiting for the network
+    assert time.perf_counter() - started < sink.delay
+    assert sink.sent == []
+
+    for n in range(4, 6):
+        await sink.write({"n": n})  # third batch waits for a free slot
+    await sink._stop_batching()
+
+    assert sorted(sink.sent) == [[0, 1], [2, 3], [4, 5]]
+    assert sink.peak == 2
+    assert sink._pipeline_tasks == set()
+
+
+@pytest.mark.asyncio
+async def test_pipelined_send_errors_are_contained() -> None:
+    class FailingSink(SlowSink):
+        async def _send_batch(self, batch: list[dict[str, Any]]) -> None:
+            raise RuntimeError("down")
+
+    sink = FailingSink(pipeline_depth=1)
+    for n in range(4):
+        await sink.write({"n": n})
+    await sink._stop_batching()
+    assert sink._pipeline_slots is not None and not sink._pipeline_slots.locked()
+
+
+@pytest.mark.asyncio
+async def test_stop_while_every_slot_is_busy_keeps_timer_batch() -> None:
+    sink = SlowSink(
+        batch_size=10, batch_timeout_seconds=0.01, pipeline_depth=1, delay=0.1
+    )
+    await sink._start_batching()
+    for n in range(10):
+        await sink.write({"n": n})  # full batch takes the only slot
+    for n in range(10, 13):
+        await sink.write({"n": n})
+    # The timer has taken the partial batch and is waiting for the slot
+    await asyncio.sleep(0.03)
+    assert sink._batch == []
+
+    await sink._stop_batching()
+
+    assert sorted(n for batch in sink.sent for n in batch) == list(range(13))
+
+
+@pytest.mark.asyncio
+async def test_partial_batch_flushes_at_its_deadline() -> None:
+    sink = SlowSink(batch_size=10, batch_timeout_seconds=0.05, delay=0.0)
+    await sink._start_batching()
+
+    await sink.write({"n": 0})
+    await asyncio.sleep(0.03)
+    await sink.write({"n": 1})
+    assert sink.sent == []
+    # Due 50ms after the first entry, not on a half-timeout poll tick
+    await asyncio.sleep(0.05)
+    assert sink.sent == [[0, 1]]
+
+    # The timer re-arms for the next batch
+    await sink.write({"n": 2})
+    await asyncio.sleep(0.08)
+    assert sink.sent == [[0, 1], [2]]
+    await sink._stop_batching()
+
+
+def test_loki_pipelining_is_opt_in() -> None:
+    assert LokiSink()._pipeline_slots is None
+    sink = LokiSink(pipelined=True, max_in_flight_batches=3)
+    assert sink._pipeline_slots is not None and sink._pipeline_slots._value == 3
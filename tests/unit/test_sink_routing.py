@@ -368,6 +368,32 @@ async def test_routing_writer_write_serialized() -> None:
     info_sink.write_serialized.assert_not_awaited()
 
 
+@pytest.mark.asyncio
+async def test_routing_writer_routes_serialized_envelopes_by_level() -> None:
+    """Envelopes from serialize_envelope route on their level, not INFO."""
+    from fapilog.core.serialization import serialize_envelope
+
+    error_sink = FakeSink("error")
+    info_sink = FakeSink("info")
+    _, sink_write_serialized, _ = _build_writer(
+        sinks=[error_sink, info_sink],
+        routing_cfg=SimpleNamespace(
+            rules=[
+                SimpleNamespace(levels=["ERROR"], sinks=["error"]),
+                SimpleNamespace(levels=["INFO"], sinks=["info"]),
+            ],
+            fallback_sinks=[],
+            overlap=True,
+        ),
+    )
+
+    view = serialize_envelope({"timestamp": 0.0, "level": "ERROR", "message": "failed"})
+    await sink_write_serialized(view)
+
+    error_sink.write_serialized.assert_awaited_once_with(view)
+    info_sink.write_serialized.assert_not_awaited()
+
+
 @pytest.mark.asyncio
 async def test_routing_drops_when_no_match_and_no_fallback() -> None:
     """Verify events are silently dropped when no rule matches and no fallback."""
@@ -911,3 +937,343 @@ async def test_routing_sink_plugin_no_matching_level(monkeypatch: pytest.MonkeyP
     await sink.write({"level": "INFO", "message": "test"})
 
     assert child.write_count == 0  # Should not be called
+
+
+# --- Batched fan-out (write_routed_batch) ---
+
+
+class CountingSink:
+    """Sink recording payloads, optionally failing every write."""
+
+    def __init__(self, name: str, *, fail: bool = False) -> None:
+        self.name = name
+        self.fail = fail
+        self.entries: list[dict[str, Any]] = []
+
+    async def write(self, entry: dict[str, Any]) -> None:
+        if self.fail:
+            raise RuntimeError("down")
+        self.entries.append(entry)
+
+
+def _three_way_writer(*sinks: Any, circuit_config: Any = None) -> Any:
+    from fapilog.core.routing import RoutingSinkWriter
+
+    return RoutingSinkWriter(
+        sinks=list(sinks),
+        rules=[({"ERROR"}, ["pager"]), ({"AUDIT"}, ["audit"]), ({"*"}, ["file"])],
+        fallback_sink_names=[],
+        circuit_config=circuit_config,
+    )
+
+
+@pytest.mark.asyncio
+async def test_write_routed_batch_partitions_by_level() -> None:
+    pager, audit, file = FakeSink("pager"), FakeSink("audit"), FakeSink("file")
+    writer = _three_way_writer(pager, audit, file)
+
+    events = [
+        {"level": "error", "message": "e1"},
+        {"level": "INFO", "message": "i1"},
+        {"level": "AUDIT", "message": "a1"},
+        {"level": "ERROR", "message": "e2"},
+    ]
+    await writer.write_routed_batch([(e, None) for e in events])
+
+    assert [c.args[0]["message"] for c in pager.write.await_args_list] == ["e1", "e2"]
+    assert [c.args[0]["message"] for c in audit.write.await_args_list] == ["a1"]
+    assert [c.args[0]["message"] for c in file.write.await_args_list] == ["i1"]
+
+
+@pytest.mark.asyncio
+async def test_write_routed_batch_sends_views_only_to_serialized_sinks() -> None:
+    from fapilog.core.routing import RoutingSinkWriter
+    from fapilog.core.serialization import SerializedView
+
+    bytes_sink = FakeSink("bytes")
+    dict_sink = CountingSink("dicts")
+    writer = RoutingSinkWriter(
+        sinks=[bytes_sink, dict_sink],
+        rules=[({"INFO"}, ["bytes", "dicts"])],
+        fallback_sink_names=[],
+    )
+    entry = {"level": "INFO", "message": "m"}
+    view = SerializedView(data=b"{}", level="INFO")
+    await writer.write_routed_batch([(entry, view)])
+
+    bytes_sink.write_serialized.assert_awaited_once_with(view)
+    assert dict_sink.entries == [entry]
+
+
+@pytest.mark.asyncio
+async def test_write_routed_batch_checks_breaker_once_per_sub_batch() -> None:
+    from fapilog.core.circuit_breaker import CircuitState, SinkCircuitBreakerConfig
+
+    pager = CountingSink("pager", fail=True)
+    file = CountingSink("file")
+    writer = _three_way_writer(
+        pager,
+        CountingSink("audit"),
+        file,
+        circuit_config=SinkCircuitBreakerConfig(enabled=True, failure_threshold=2),
+    )
+    pager_breaker = writer._sink_entries["pager"].breaker
+    calls: list[None] = []
+    original = pager_breaker.admit
+
+    def counting_admit(count: int) -> int:
+        calls.append(None)
+        return original(count)
+
+    pager_breaker.admit = counting_admit
+
+    events = [{"level": "ERROR", "message": str(n)} for n in range(10)]
+    events.append({"level": "INFO", "message": "ok"})
+    await writer.write_routed_batch([(e, None) for e in events])
+
+    # One check for the sub-batch; writes stop once the circuit opens
+    assert len(calls) == 1
+    assert pager_breaker.state is CircuitState.OPEN
+    assert pager_breaker._failure_count == 2
+    assert [e["message"] for e in file.entries] == ["ok"]
+
+    # While open, the next batch skips the sink entirely
+    await writer.write_routed_batch([(events[0], None)])
+    assert pager_breaker._failure_count == 2
+
+
+@pytest.mark.asyncio
+async def test_write_routed_batch_half_open_probes_with_a_sample() -> None:
+    from fapilog.core.circuit_breaker import CircuitState, SinkCircuitBreakerConfig
+
+    pager = CountingSink("pager", fail=True)
+    writer = _three_way_writer(
+        pager,
+        CountingSink("audit"),
+        CountingSink("file"),
+        circuit_config=SinkCircuitBreakerConfig(
+            enabled=True,
+            failure_threshold=1,
+            recovery_timeout_seconds=0.0,
+            half_open_probe_size=2,
+        ),
+    )
+    breaker = writer._sink_entries["pager"].breaker
+    events = [{"level": "ERROR", "message": str(n)} for n in range(6)]
+
+    await writer.write_routed_batch([(events[0], None)])
+    assert breaker.state is CircuitState.OPEN
+
+    # The probe fails: nothing past the sample is risked, and the sample
+    # itself stops at failure_threshold
+    attempts: list[str] = []
+    original = pager.write
+
+    async def counting_write(entry: dict[str, Any]) -> None:
+        attempts.append(entry["message"])
+        await original(entry)
+
+    pager.write = counting_write  # type: ignore[method-assign]
+    await writer.write_routed_batch([(e, None) for e in events])
+    assert attempts == ["0"]
+    assert breaker.state is CircuitState.OPEN
+
+    # The probe succeeds: the rest of the batch follows
+    pager.fail = False
+    await writer.write_routed_batch([(e, None) for e in events])
+    assert [e["message"] for e in pager.entries] == [str(n) for n in range(6)]
+    assert breaker.state is CircuitState.CLOSED
+
+
+@pytest.mark.asyncio
+async def test_write_routed_batch_reports_events_withheld_from_a_failing_sink(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from fapilog.core.circuit_breaker import SinkCircuitBreakerConfig
+    from fapilog.plugins.sinks import fallback
+
+    failures: list[Any] = []
+
+    async def _record(payload: Any, **kwargs: Any) -> None:
+        failures.append(payload)
+
+    monkeypatch.setattr(fallback, "handle_sink_write_failure", _record)
+    pager = CountingSink("pager", fail=True)
+    writer = _three_way_writer(
+        pager,
+        CountingSink("audit"),
+        CountingSink("file"),
+        circuit_config=SinkCircuitBreakerConfig(
+            enabled=True,
+            failure_threshold=2,
+            recovery_timeout_seconds=0.0,
+            half_open_probe_size=2,
+        ),
+    )
+    events = [{"level": "ERROR", "message": str(n)} for n in range(5)]
+
+    # Writes stop at failure_threshold; the rest still reach the fallback
+    await writer.write_routed_batch([(e, None) for e in events])
+    assert failures == events
+
+    # A failed half-open probe reports the events it held back
+    failures.clear()
+    await writer.write_routed_batch([(e, None) for e in events])
+    assert failures == events
+
+
+@pytest.mark.asyncio
+async def test_write_routed_batch_follows_update_rules() -> None:
+    pager, audit, file = FakeSink("pager"), FakeSink("audit"), FakeSink("file")
+    writer = _three_way_writer(pager, audit, file)
+    await writer.write_routed_batch([({"level": "error"}, None)])
+    writer.update_rules([({"ERROR"}, ["audit"])], ["file"])
+    await writer.write_routed_batch(
+        [({"level": "error"}, None), ({"level": "INFO"}, None)]
+    )
+
+    assert pager.write.await_count == 1
+    assert audit.write.await_count == 1
+    assert file.write.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_worker_hands_routed_batches_to_write_routed_batch() -> None:
+    from fapilog.core.concurrency import NonBlockingRingQueue
+    from fapilog.core.events import LogEvent
+    from fapilog.core.worker import LoggerWorker, strict_envelope_mode_enabled
+
+    pager, audit, file = FakeSink("pager"), FakeSink("audit"), FakeSink("file")
+    write, write_serialized, _ = _build_writer(
+        sinks=[pager, audit, file],
+        routing_cfg=SimpleNamespace(
+            rules=[
+                SimpleNamespace(levels=["ERROR"], sinks=["pager"]),
+                SimpleNamespace(levels=["*"], sinks=["file"]),
+            ],
+            fallback_sinks=[],
+            overlap=True,
+        ),
+    )
+    router = write.__self__
+    router.write_routed_batch = AsyncMock(wraps=router.write_routed_batch)
+    worker = LoggerWorker(
+        queue=NonBlockingRingQueue(capacity=4),
+        batch_max_size=4,
+        batch_timeout_seconds=0.01,
+        sink_write=write,
+        sink_write_serialized=write_serialized,
+        enrichers_getter=lambda: [],
+        redactors_getter=lambda: [],
+        metrics=None,
+        serialize_in_flush=False,
+        strict_envelope_mode_provider=strict_envelope_mode_enabled,
+        stop_flag=lambda: False,
+        drained_event=None,
+        flush_event=None,
+        flush_done_event=None,
+        emit_enricher_diagnostics=False,
+        emit_redactor_diagnostics=False,
+        counters={"processed": 0, "dropped": 0},
+    )
+    batch = [
+        LogEvent(level="ERROR", message="e").to_mapping(),
+        LogEvent(level="INFO", message="i").to_mapping(),
+    ]
+    await worker.flush_batch(batch)
+
+    router.write_routed_batch.assert_awaited_once()
+    assert pager.write.await_count == 1
+    assert file.write.await_count == 1
+    assert worker._counters["processed"] == 2
+
+
+class BatchSink(CountingSink):
+    """Sink that also accepts a list of entries in one call."""
+
+    def __init__(self, name: str, *, fail: bool = False) -> None:
+        super().__init__(name, fail=fail)
+        self.batches: list[list[dict[str, Any]]] = []
+
+    async def write_batch(self, entries: list[dict[str, Any]]) -> None:
+        if self.fail:
+            raise RuntimeError("down")
+        self.batches.append(list(entries))
+
+
+@pytest.mark.asyncio
+async def test_write_routed_batch_calls_sink_write_batch_once() -> None:
+    from fapilog.core.serialization import SerializedView
+
+    pager, audit, file = BatchSink("pager"), BatchSink("audit"), BatchSink("file")
+    writer = _three_way_writer(pager, audit, file)
+    events = [{"level": "ERROR", "message": str(n)} for n in range(3)]
+    view = SerializedView(data=b"{}", level="ERROR")
+    await writer.write_routed_batch([(e, view) for e in events])
+
+    # Batch sinks get the entry dicts, not views, in a single call
+    assert pager.batches == [events]
+    assert pager.entries == []
+    assert audit.batches == []
+
+
+@pytest.mark.asyncio
+async def test_write_routed_batch_reports_failed_sink_batch(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from fapilog.core.circuit_breaker import SinkCircuitBreakerConfig
+    from fapilog.plugins.sinks import fallback
+
+    failures: list[Any] = []
+
+    async def _record(payload: Any, **kwargs: Any) -> None:
+        failures.append(payload)
+
+    monkeypatch.setattr(fallback, "handle_sink_write_failure", _record)
+    pager = BatchSink("pager", fail=True)
+    writer = _three_way_writer(
+        pager,
+        BatchSink("audit"),
+        BatchSink("file"),
+        circuit_config=SinkCircuitBreakerConfig(enabled=True, failure_threshold=5),
+    )
+    events = [{"level": "ERROR", "message": str(n)} for n in range(3)]
+    await writer.write_routed_batch([(e, None) for e in events])
+
+    assert failures == events
+    assert writer._sink_entries["pager"].breaker._failure_count == len(events)
+
+
+@pytest.mark.asyncio
+async def test_worker_ignores_write_batch_on_a_plain_sink() -> None:
+    from fapilog.core.concurrency import NonBlockingRingQueue
+    from fapilog.core.events import LogEvent
+    from fapilog.core.worker import LoggerWorker, strict_envelope_mode_enabled
+
+    sink = BatchSink("sealed")
+    worker = LoggerWorker(
+        queue=NonBlockingRingQueue(capacity=4),
+        batch_max_size=4,
+        batch_timeout_seconds=0.01,
+        sink_write=sink.write,
+        sink_write_serialized=None,
+        enrichers_getter=lambda: [],
+        redactors_getter=lambda: [],
+        metrics=None,
+        serialize_in_flush=False,
+        strict_envelope_mode_provider=strict_envelope_mode_enabled,
+        stop_flag=lambda: False,
+        drained_event=None,
+        flush_event=None,
+        flush_done_event=None,
+        emit_enricher_diagnostics=False,
+        emit_redactor_diagnostics=False,
+        counters={"processed": 0, "dropped": 0},
+    )
+    entry = LogEvent(level="INFO", message="m").to_mapping()
+    await worker.flush_batch([entry])
+
+    # The sink's write_batch takes dicts; the worker must not hand it
+    # (entry, view) tuples
+    assert sink.batches == []
+    assert sink.entries == [entry]
@@ -0,0 +1,345 @@
+"""Tests for the durable disk spill queue and its SinkWriterGroup wiring."""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from fapilog.core.circuit_breaker import CircuitState, SinkCircuitBreakerConfig
+from fapilog.core.serialization import SerializedView
+from fapilog.core.sink_writers import SinkWriterGroup
+from fapilog.plugins.sinks.mmap_persistence import MemoryMappedPersistence
+from fapilog.plugins.sinks.spill_queue import DiskSpillQueue, SpillQueueConfig
+
+
+class Collector:
+    """Replay target recording entries and serialized payloads."""
+
+    def __init__(self, fail_after: int | None = None) -> None:
+        self.entries: list[dict[str, Any]] = []
+        self.payloads: list[bytes] = []
+        self.fail_after = fail_after
+
+    def _check(self) -> None:
+        if self.fail_after is not None and self.delivered >= self.fail_after:
+            raise RuntimeError("sink down")
+
+    @property
+    def delivered(self) -> int:
+        return len(self.entries) + len(self.payloads)
+
+    async def write(self, entry: dict[str, Any]) -> None:
+        self._check()
+        self.entries.append(entry)
+
+    async def write_serialized(self, view: object) -> None:
+        self._check()
+        assert isinstance(view, SerializedView)
+        self.payloads.append(view.data)
+
+
+def _config(tmp_path: Path, **kwargs: Any) -> SpillQueueConfig:
+    kwargs.setdefault("replay_rate_per_second", None)
+    return SpillQueueConfig(directory=tmp_path / "spill", **kwargs)
+
+
+async def _drain(queue: DiskSpillQueue, target: Collector, **kwargs: Any) -> None:
+    queue.start_replay(target.write, target.write_serialized, **kwargs)
+    task = queue._replay_task
+    assert isinstance(task, asyncio.Task)
+    await task
+
+
+@pytest.mark.asyncio
+async def test_entries_and_serialized_replay_in_order(tmp_path: Path) -> None:
+    queue = DiskSpillQueue(_config(tmp_path))
+    assert await queue.put_entry({"n": 1})
+    assert await queue.put_serialized(SerializedView(data=b'{"n":2}'))
+    assert await queue.put_entry({"n": 3})
+    assert queue.has_backlog
+
+    target = Collector()
+    await _drain(queue, target)
+
+    assert target.entries == [{"n": 1}, {"n": 3}]
+    assert target.payloads == [b'{"n":2}']
+    assert not queue.has_backlog
+    stats = queue.stats()
+    assert (stats.spilled, stats.replayed, stats.pending_bytes) == (3, 3, 0)
+    await queue.close()
+
+
+@pytest.mark.asyncio
+async def test_serialized_view_metadata_survives_replay(tmp_path: Path) -> None:
+    view = SerializedView(
+        data=b'{"n":1}',
+        level="ERROR",
+        ts_ns=1_700_000_000_000_000_000,
+        routing_key="app",
+    )
+    queue = DiskSpillQueue(_config(tmp_path))
+    assert await queue.put_serialized(view)
+    await queue.close()
+
+    # Reopen so the view is rebuilt from disk, not from memory
+    reopened = DiskSpillQueue(_config(tmp_path))
+    views: list[SerializedView] = []
+
+    async def _capture(replayed: object) -> None:
+        assert isinstance(replayed, SerializedView)
+        views.append(replayed)
+
+    reopened.start_replay(Collector().write, _capture)
+    task = reopened._replay_task
+    assert isinstance(task, asyncio.Task)
+    await task
+
+    assert views == [view]
+    await reopened.close()
+
+
+@pytest.mark.asyncio
+async def test_backlog_survives_reopen(tmp_path: Path) -> None:
+    queue = DiskSpillQueue(_config(tmp_path))
+    for n in range(5):
+        await queue.put_entry({"n": n})
+    await queue.close()
+
+    reopened = DiskSpillQueue(_config(tmp_path))
+    target = Collector()
+    await _drain(reopened, target)
+    assert [e["n"] for e in target.entries] == [0, 1, 2, 3, 4]
+    await reopened.close()
+
+
+@pytest.mark.asyncio
+async def test_crash_without_close_recovers_and_ignores_torn_tail(
+    tmp_path: Path,
+) -> None:
+    queue = DiskSpillQueue(_config(tmp_path))
+    for n in range(3):
+        await queue.put_entry({"n": n})
+    # Simulate a crash: release the mapping without trimming or a final
+    # header, then tear a partially written record onto the end
+    writer = queue._writer
+    assert isinstance(writer, MemoryMappedPersistence)
+    end = queue._write.offset
+    await writer.close()
+    segment = tmp_path / "spill" / "seg-0000000001.spill"
+    with open(segment, "r+b") as f:
+        f.seek(end)
+        f.write(b"\x01\x40\x00\x00\x00\xde\xad\xbe\xef{partial")
+    (tmp_path / "spill" / "spill.header").unlink(missing_ok=True)
+
+    reopened = DiskSpillQueue(_config(tmp_path))
+    await reopened.put_entry({"n": 3})
+    target = Collector()
+    await _drain(reopened, target)
+    assert [e["n"] for e in target.entries] == [0, 1, 2, 3]
+    await reopened.close()
+
+
+@pytest.mark.asyncio
+async def test_size_cap_drops_and_counts(tmp_path: Path) -> None:
+    queue = DiskSpillQueue(_config(tmp_path, max_total_bytes=120))
+    results = [await queue.put_entry({"msg": "x" * 20}) for _ in range(5)]
+    assert results == [True, True, True, False, False]
+    stats = queue.stats()
+    assert (stats.spilled, stats.dropped) == (3, 2)
+    assert stats.pending_bytes <= 120
+
+    # Draining frees the budget again
+    await _drain(queue, Collector())
+    assert await queue.put_entry({"msg": "again"})
+    await queue.close()
+
+
+@pytest.mark.asyncio
+async def test_segments_roll_and_are_deleted_once_replayed(tmp_path: Path) -> None:
+    queue = DiskSpillQueue(_config(tmp_path, max_segment_bytes=64))
+    for n in range(10):
+        await queue.put_entry({"n": n, "pad": "y" * 20})
+    directory = tmp_path / "spill"
+    assert len(list(directory.glob("seg-*.spill"))) == 10
+
+    target = Collector()
+    await _drain(queue, target)
+    assert [e["n"] for e in target.entries] == list(range(10))
+    assert [p.name for p in directory.glob("seg-*.spill")] == ["seg-0000000010.spill"]
+    await queue.close()
+
+
+@pytest.mark.asyncio
+async def test_replay_stops_on_failure_and_resumes(tmp_path: Path) -> None:
+    queue = DiskSpillQueue(_config(tmp_path, replay_batch_size=2))
+    for n in range(5):
+        await queue.put_entry({"n": n})
+
+    outcomes: list[bool] = []
+    failing = Collector(fail_after=3)
+    await _drain(queue, failing, on_result=outcomes.append)
+    assert [e["n"] for e in failing.entries] == [0, 1, 2]
+    assert outcomes == [True, True, True, False]
+    assert queue.has_backlog
+
+    healthy = Collector()
+    await _drain(queue, healthy)
+    assert [e["n"] for e in healthy.entries] == [3, 4]
+    await queue.close()
+
+
+@pytest.mark.asyncio
+async def test_replay_waits_for_allow(tmp_path: Path) -> None:
+    queue = DiskSpillQueue(_config(tmp_path))
+    await queue.put_entry({"n": 1})
+    target = Collector()
+    await _drain(queue, target, allow=lambda: False)
+    assert target.entries == []
+    assert queue.has_backlog
+    await queue.close()
+
+
+class FlakySink:
+    """Sink whose availability is toggled by the test."""
+
+    def __init__(self, name: str = "remote") -> None:
+        self.name = name
+        self.up = False
+        self.received: list[dict[str, Any]] = []
+
+    async def write(self, entry: dict[str, Any]) -> None:
+        if not self.up:
+            raise RuntimeError("unavailable")
+        self.received.append(entry)
+
+
+@pytest.mark.asyncio
+async def test_writer_group_spills_while_open_and_replays(tmp_path: Path) -> None:
+    sink = FlakySink()
+    config = SinkCircuitBreakerConfig(
+        enabled=True,
+        failure_threshold=2,
+        recovery_timeout_seconds=0.01,
+        spill_directory=str(tmp_path),
+        spill_replay_rate=None,
+    )
+    group = SinkWriterGroup([sink], circuit_config=config)
+    (queue,) = group.spill_queues
+    assert queue._dir == tmp_path / "remote"
+
+    for n in range(4):
+        await group.write({"n": n})
+    assert group.breakers[0].state == CircuitState.OPEN
+    assert queue.stats().spilled == 4
+
+    # Once the recovery timeout passes, replay probes the sink itself; no
+    # live write is needed to drain the backlog
+    sink.up = True
+    await asyncio.sleep(0.05)
+    task = queue._replay_task
+    assert isinstance(task, asyncio.Task)
+    await task
+
+    assert [e["n"] for e in sink.received] == [0, 1, 2, 3]
+    assert group.breakers[0].state == CircuitState.CLOSED
+    assert not queue.has_backlog
+    await group.write({"n": 4})
+    assert sink.received[-1] == {"n": 4}
+    await group.close()
+
+
+@pytest.mark.asyncio
+async def test_writer_group_retries_replay_while_sink_stays_down(
+    tmp_path: Path,
+) -> None:
+    sink = FlakySink()
+    config = SinkCircuitBreakerConfig(
+        enabled=True,
+        failure_threshold=1,
+        recovery_timeout_seconds=0.01,
+        spill_directory=str(tmp_path),
+        spill_replay_rate=None,
+    )
+    group = SinkWriterGroup([sink], circuit_config=config)
+    (queue,) = group.spill_queues
+    await group.write({"n": 0})
+    await group.write({"n": 1})
+
+    # Failed probes reopen the circuit and schedule another attempt
+    await asyncio.sleep(0.05)
+    assert sink.received == []
+    assert queue.has_backlog
+    sink.up = True
+    await asyncio.sleep(0.05)
+    assert [e["n"] for e in sink.received] == [0, 1]
+    await group.close()
+
+
+@pytest.mark.asyncio
+async def test_writer_group_close_closes_spill_queues(tmp_path: Path) -> None:
+    config = SinkCircuitBreakerConfig(
+        enabled=True,
+        failure_threshold=1,
+        recovery_timeout_seconds=60.0,
+        spill_directory=str(tmp_path),
+    )
+    group = SinkWriterGroup([FlakySink()], circuit_config=config)
+    (queue,) = group.spill_queues
+    await group.write({"n": 0})
+    await group.write({"n": 1})
+    assert queue.stats().spilled == 2
+    assert group._replay_timers
+
+    await group.close()
+
+    assert queue._writer is None
+    assert group._replay_timers == {}
+    reopened = DiskSpillQueue(
+        SpillQueueConfig(directory=tmp_path / "remote", replay_rate_per_second=None)
+    )
+    target = Collector()
+    await _drain(reopened, target)
+    assert [e["n"] for e in target.entries] == [0, 1]
+    await reopened.close()
+
+
+def test_duplicate_sink_names_get_separate_directories(tmp_path: Path) -> None:
+    config = SinkCircuitBreakerConfig(enabled=True, spill_directory=str(tmp_path))
+    group = SinkWriterGroup([FlakySink(), FlakySink()], circuit_config=config)
+    assert [q._dir.name for q in group.spill_queues] == ["remote", "remote-1"]
+
+
+def test_spilling_is_off_by_default() -> None:
+    group = SinkWriterGroup(
+        [FlakySink()], circuit_config=SinkCircuitBreakerConfig(enabled=True)
+    )
+    assert group.spill_queues == []
+
+
+@pytest.mark.asyncio
+async def test_logger_drain_closes_spill_queues(tmp_path: Path) -> None:
+    from fapilog import get_async_logger
+    from fapilog.core.settings import Settings
+
+    settings = Settings(
+        core={
+            "sink_circuit_breaker_enabled": True,
+            "sink_circuit_breaker_failure_threshold": 1,
+            "sink_circuit_breaker_spill_directory": str(tmp_path),
+        }
+    )
+    logger = await get_async_logger(
+        "spill-close", settings=settings, sinks=[FlakySink()], reuse=False
+    )
+    group = logger._sink_write.__self__
+    assert isinstance(group, SinkWriterGroup)
+    for n in range(3):
+        await logger.info("event", n=n)
+    await logger.drain()
+
+    (queue,) = group.spill_queues
+    assert queue.stats().spilled == 3
+    assert queue._writer is None
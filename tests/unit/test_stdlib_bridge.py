@@ -3,6 +3,7 @@ import logging
 import sys
 import threading
 import time
+from typing import Any
 
 import pytest
 
@@ -636,3 +637,179 @@ def test_background_bridge_stress_low_overhead() -> None:
     assert processed == target
     assert bridge._bridge_loop_manager.is_running is True
     assert (time.perf_counter() - start) < 5.0
+
+
+def _make_record(
+    msg: str, *args: object, level: int = logging.INFO
+) -> logging.LogRecord:
+    return logging.LogRecord(
+        name="thirdparty",
+        level=level,
+        pathname=__file__,
+        lineno=10,
+        msg=msg,
+        args=args,
+        exc_info=None,
+    )
+
+
+def test_batched_emit_hands_off_in_bulk() -> None:
+    done = threading.Event()
+    received: list[str] = []
+
+    class AsyncLogger:
+        async def info(self, message: str, **_extras: object) -> None:
+            received.append(message)
+            if len(received) == 50:
+                done.set()
+
+    handler = bridge.StdlibBridgeHandler(AsyncLogger(), batched=True)
+    for i in range(50):
+        handler.emit(_make_record("item %d", i))
+
+    assert done.wait(timeout=2.0)
+    assert received == [f"item {i}" for i in range(50)]
+
+
+def test_batched_emit_from_many_threads_never_strands_records() -> None:
+    received: list[str] = []
+    lock = threading.Lock()
+
+    class SyncLogger:
+        def info(self, message: str, **_extras: object) -> None:
+            with lock:
+                received.append(message)
+
+    handler = bridge.StdlibBridgeHandler(SyncLogger(), batched=True)
+
+    def _emit_many(worker: int) -> None:
+        for i in range(200):
+            handler.emit(_make_record("w%d-%d", worker, i))
+
+    threads = [threading.Thread(target=_emit_many, args=(w,)) for w in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    handler.flush()
+
+    assert len(received) == 8 * 200
+    assert handler._drain_pending is False
+    assert len(handler._buffer) == 0
+
+
+def test_batched_emit_drops_when_buffer_full() -> None:
+    class SyncLogger:
+        def info(self, message: str, **_extras: object) -> None:
+            _ = message
+
+    handler = bridge.StdlibBridgeHandler(SyncLogger(), batched=True, max_buffered=1)
+    # Hold the drain back so the buffer cannot empty between emits
+    handler._drain_pending = True
+    handler.emit(_make_record("first"))
+    handler.emit(_make_record("second"))
+
+    assert handler.buffer_dropped == 1
+    assert len(handler._buffer) == 1
+
+
+def test_batched_buffer_bound_holds_under_concurrent_emits() -> None:
+    class SyncLogger:
+        def info(self, message: str, **_extras: object) -> None:
+            _ = message
+
+    handler = bridge.StdlibBridgeHandler(SyncLogger(), batched=True, max_buffered=50)
+    handler._drain_pending = True
+
+    def _emit_many() -> None:
+        for _ in range(100):
+            handler.emit(_make_record("x"))
+
+    threads = [threading.Thread(target=_emit_many) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(handler._buffer) == 50
+    assert handler.buffer_dropped == 750
+
+
+@pytest.mark.asyncio
+async def test_batched_drain_defers_formatting_until_admitted() -> None:
+    from fapilog.core.logger import SyncLoggerFacade
+    from fapilog.plugins.filters.level import LevelFilter
+
+    out: list[dict[str, object]] = []
+
+    async def sink(event: dict[str, object]) -> None:
+        out.append(event)
+
+    logger = SyncLoggerFacade(
+        name="bridge-batched",
+        queue_capacity=64,
+        batch_max_size=8,
+        batch_timeout_seconds=0.01,
+        backpressure_wait_ms=1,
+        drop_on_full=True,
+        sink_write=sink,
+        filters=[LevelFilter(config={"min_level": "WARNING"})],
+    )
+    logger.start()
+
+    class ExplodingArg:
+        def __str__(self) -> str:
+            raise AssertionError("rejected record was formatted")
+
+    handler = bridge.StdlibBridgeHandler(logger, batched=True)
+    handler.emit(_make_record("dropped %s", ExplodingArg()))
+    handler.emit(_make_record("kept %s", "ok", level=logging.WARNING))
+    handler.flush()
+
+    result = await logger.stop_and_drain()
+
+    assert result.submitted == 1
+    assert [e["message"] for e in out] == ["kept ok"]
+
+
+@pytest.mark.asyncio
+async def test_batched_drain_keeps_each_emitters_request_context() -> None:
+    from fapilog.core.context import request_id_var
+    from fapilog.core.logger import SyncLoggerFacade
+
+    out: list[dict[str, Any]] = []
+
+    async def sink(event: dict[str, Any]) -> None:
+        out.append(event)
+
+    logger = SyncLoggerFacade(
+        name="bridge-batched-context",
+        queue_capacity=256,
+        batch_max_size=16,
+        batch_timeout_seconds=0.01,
+        backpressure_wait_ms=1,
+        drop_on_full=False,
+        sink_write=sink,
+    )
+    logger.start()
+    handler = bridge.StdlibBridgeHandler(logger, batched=True)
+
+    def _emit(worker: int) -> None:
+        request_id_var.set(f"req-{worker}")
+        logger.bind(worker=worker)
+        for i in range(5):
+            handler.emit(_make_record("w%d-%d", worker, i))
+
+    threads = [threading.Thread(target=_emit, args=(w,)) for w in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    handler.flush()
+    await logger.stop_and_drain()
+
+    assert len(out) == 40
+    for event in out:
+        worker = int(event["message"].split("-")[0][1:])
+        assert event["context"]["correlation_id"] == f"req-{worker}"
+        assert event["data"]["worker"] == worker
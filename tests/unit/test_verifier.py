@@ -287,3 +287,107 @@ async def test_self_checker_emits_warning(tmp_path: Path) -> None:
     diagnostics.set_writer_for_tests(lambda p: messages.append(p))
     await run_self_check([log_path], verifier)
     assert messages  # warning emitted for missing MAC/chain issues
+
+
+def _write_chain(path: Path, count: int, key: bytes, *, start: int = 1) -> list[dict]:
+    records: list[dict] = []
+    for seq in range(start, start + count):
+        rec, _ = _build_record(seq, f"2025-01-01T00:00:{seq % 60:02d}Z", key, "KID_ENV")
+        records.append(rec)
+    with open(path, "w", encoding="utf-8") as f:
+        for rec in records:
+            f.write(json.dumps(rec) + "\n")
+    return records
+
+
+@pytest.mark.asyncio
+async def test_verify_file_streams_in_chunks(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Chunked verification must keep absolute line numbers and chain state."""
+    from fapilog_tamper.verify import EnvKeyStore, Verifier
+
+    key = _hmac_key()
+    monkeypatch.setenv("KID_ENV", b64url_encode(key))
+    _build_record.prev_hash = b"\x00" * 32  # type: ignore[attr-defined]
+    log_path = tmp_path / "audit.jsonl"
+    records = _write_chain(log_path, 40, key)
+
+    # ~3 records per chunk so chain links cross many chunk boundaries
+    verifier = Verifier(EnvKeyStore(), chunk_bytes=1024)
+    report = await verifier.verify_file(log_path)
+    assert report.valid is True
+    assert report.records_checked == 40
+    assert report.records_valid == 40
+
+    lines = log_path.read_text().splitlines()
+    tampered = dict(records[29])
+    tampered["msg"] = "altered"
+    lines[29] = json.dumps(tampered)
+    del lines[34]
+    log_path.write_text("\n".join(lines) + "\n")
+
+    bad = await verifier.verify_file(log_path)
+    assert bad.valid is False
+    assert [e.message for e in bad.errors if e.error_type == "mac_mismatch"] == [
+        "MAC verification failed at line 30"
+    ]
+    assert [e.seq for e in bad.errors if e.error_type == "seq_gap"] == [36]
+    assert bad.chain_breaks == [36]
+
+
+@pytest.mark.asyncio
+async def test_verify_compressed_rotation_uses_original_manifest(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Rotated .gz files verify like the plain file they were compressed from."""
+    import gzip
+
+    from fapilog_tamper.verify import EnvKeyStore, Verifier, write_manifest
+
+    key = _hmac_key()
+    monkeypatch.setenv("KID_ENV", b64url_encode(key))
+    _build_record.prev_hash = b"\x00" * 32  # type: ignore[attr-defined]
+    log_path = tmp_path / "audit.jsonl"
+    records = _write_chain(log_path, 12, key)
+    write_manifest(log_path, records, key, "KID_ENV")
+    gz_path = tmp_path / "audit.jsonl.gz"
+    gz_path.write_bytes(gzip.compress(log_path.read_bytes()))
+    log_path.unlink()
+
+    reports = await Verifier(EnvKeyStore(), chunk_bytes=256).verify_files([gz_path])
+    assert reports[0].valid is True
+    assert reports[0].records_checked == 12
+    assert reports[0].manifest_valid is True
+
+
+@pytest.mark.asyncio
+async def test_verify_chain_across_files_with_worker_pool(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Files verified in a process pool reconcile only boundary hashes."""
+    from fapilog_tamper.verify import (
+        EnvKeyStore,
+        Verifier,
+        verify_chain_across_files,
+        write_manifest,
+    )
+
+    key = _hmac_key()
+    monkeypatch.setenv("KID_ENV", b64url_encode(key))
+    _build_record.prev_hash = b"\x00" * 32  # type: ignore[attr-defined]
+    path1 = tmp_path / "f1.jsonl"
+    records1 = _write_chain(path1, 30, key)
+    manifest1 = write_manifest(path1, records1, key, "KID_ENV")
+    path2 = tmp_path / "f2.jsonl"
+    records2 = _write_chain(path2, 30, key, start=31)
+    write_manifest(path2, records2, key, "KID_ENV", continues_from=manifest1)
+
+    verifier = Verifier(EnvKeyStore(), workers=2, chunk_bytes=2048)
+    reports = await verifier.verify_files([path1, path2])
+    assert [r.records_valid for r in reports] == [30, 30]
+    assert all(r.manifest_valid for r in reports)
+
+    combined = await verify_chain_across_files([path1, path2], EnvKeyStore())
+    assert combined.valid is True
+    assert combined.records_checked == 60